@@ -0,0 +1,33 @@
+"""attendance offline sync mutation log
+
+Revision ID: attendance_sync_mutations
+Revises: attendance_tables
+Create Date: 2026-10-19
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = 'attendance_sync_mutations'
+down_revision = 'attendance_tables'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    op.create_table(
+        'attendance_sync_mutations',
+        sa.Column('mutation_id', postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column('user_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('users.id'), nullable=False),
+        sa.Column('session_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('attendance_sessions.id', ondelete='CASCADE'), nullable=True),
+        sa.Column('student_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('students.id'), nullable=False),
+        sa.Column('outcome', sa.String(20), nullable=False),
+        sa.Column('code', sa.String(40), nullable=True),
+        sa.Column('version', sa.Integer(), nullable=True),
+        sa.Column('client_ts', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
+    )
+
+def downgrade():
+    op.drop_table('attendance_sync_mutations')
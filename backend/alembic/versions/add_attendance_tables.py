@@ -0,0 +1,60 @@
+"""attendance sessions and marks
+
+Revision ID: attendance_tables
+Revises: search_columns
+Create Date: 2026-10-19
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = 'attendance_tables'
+down_revision = 'search_columns'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    op.create_table(
+        'attendance_sessions',
+        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column('classroom_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('classrooms.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('academic_year_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('academic_years.id'), nullable=False),
+        sa.Column('session_date', sa.Date(), nullable=False),
+        sa.Column('created_by', postgresql.UUID(as_uuid=True), sa.ForeignKey('users.id'), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
+        sa.UniqueConstraint('classroom_id', 'session_date', name='uq_attendance_sessions_classroom_date'),
+    )
+
+    op.create_table(
+        'attendance_marks',
+        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column('session_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('attendance_sessions.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('student_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('students.id'), nullable=False),
+        sa.Column('academic_year_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('academic_years.id'), nullable=False),
+        sa.Column('status', sa.String(20), nullable=False, server_default='PRESENT'),
+        sa.Column('minutes_late', sa.Integer(), nullable=True),
+        sa.Column('note_internal', sa.Text(), nullable=True),
+        sa.Column('note_shareable', sa.Text(), nullable=True),
+        sa.Column('shared_with_parent', sa.Boolean(), nullable=False, server_default=sa.text('false')),
+        sa.Column('recorded_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
+        sa.Column('recorded_by', postgresql.UUID(as_uuid=True), sa.ForeignKey('users.id'), nullable=True),
+        sa.Column('edited_reason', sa.Text(), nullable=True),
+        sa.Column('source', sa.String(20), nullable=False, server_default='TEACHER_UI'),
+        sa.Column('version', sa.Integer(), nullable=False, server_default='1'),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
+        sa.UniqueConstraint('session_id', 'student_id', name='uq_attendance_marks_session_student'),
+        sa.CheckConstraint(
+            "status IN ('PRESENT', 'ABSENT_EXCUSED', 'ABSENT_UNEXCUSED', 'TARDY_EXCUSED', 'TARDY_UNEXCUSED')",
+            name='ck_attendance_marks_status',
+        ),
+    )
+    op.create_index('ix_attendance_marks_student_recorded', 'attendance_marks', ['student_id', 'recorded_at'])
+
+def downgrade():
+    op.drop_index('ix_attendance_marks_student_recorded', table_name='attendance_marks')
+    op.drop_table('attendance_marks')
+    op.drop_table('attendance_sessions')
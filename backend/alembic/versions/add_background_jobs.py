@@ -0,0 +1,52 @@
+"""persistent background jobs
+
+Revision ID: background_jobs
+Revises: room_bookings
+Create Date: 2026-10-19
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = 'background_jobs'
+down_revision = 'room_bookings'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    op.create_table(
+        'background_jobs',
+        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column('kind', sa.String(50), nullable=False),
+        sa.Column('status', sa.String(10), nullable=False, server_default='PENDING'),
+        sa.Column('params', postgresql.JSONB(), nullable=False, server_default=sa.text("'{}'::jsonb")),
+        sa.Column('done', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('total', sa.Integer(), nullable=True),
+        sa.Column('message', sa.Text(), nullable=True),
+        sa.Column('result', postgresql.JSONB(), nullable=True),
+        sa.Column('error', sa.Text(), nullable=True),
+        sa.Column('cancel_requested', sa.Boolean(), nullable=False, server_default=sa.text('false')),
+        sa.Column('created_by', postgresql.UUID(as_uuid=True), sa.ForeignKey('users.id', ondelete='SET NULL'), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
+        sa.Column('started_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('finished_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('heartbeat_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
+        sa.CheckConstraint(
+            "status IN ('PENDING', 'RUNNING', 'SUCCEEDED', 'FAILED', 'CANCELLED')",
+            name='ck_background_jobs_status',
+        ),
+    )
+    op.create_index('ix_background_jobs_created_by', 'background_jobs', ['created_by', 'created_at'])
+    op.create_index(
+        'ix_background_jobs_unfinished',
+        'background_jobs',
+        ['heartbeat_at'],
+        postgresql_where=sa.text("status IN ('PENDING', 'RUNNING')"),
+    )
+
+def downgrade():
+    op.drop_index('ix_background_jobs_unfinished', table_name='background_jobs')
+    op.drop_index('ix_background_jobs_created_by', table_name='background_jobs')
+    op.drop_table('background_jobs')
@@ -0,0 +1,38 @@
+"""grade change audit trail
+
+Revision ID: grade_history
+Revises: student_grade_averages
+Create Date: 2026-10-19
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = 'grade_history'
+down_revision = 'student_grade_averages'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    op.create_table(
+        'grade_history',
+        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column('grade_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('grades.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('assignment_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('assignments.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('student_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('students.id'), nullable=False),
+        sa.Column('old_points_earned', sa.Numeric(7, 2), nullable=True),
+        sa.Column('new_points_earned', sa.Numeric(7, 2), nullable=True),
+        sa.Column('old_status', sa.String(20), nullable=True),
+        sa.Column('new_status', sa.String(20), nullable=False),
+        sa.Column('reason', sa.Text(), nullable=True),
+        sa.Column('source', sa.String(20), nullable=False, server_default='TEACHER_UI'),
+        sa.Column('changed_by', postgresql.UUID(as_uuid=True), sa.ForeignKey('users.id'), nullable=True),
+        sa.Column('changed_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
+    )
+    op.create_index('ix_grade_history_assignment_student', 'grade_history', ['assignment_id', 'student_id', 'changed_at'])
+
+def downgrade():
+    op.drop_index('ix_grade_history_assignment_student', table_name='grade_history')
+    op.drop_table('grade_history')
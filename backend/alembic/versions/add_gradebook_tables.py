@@ -0,0 +1,91 @@
+"""gradebook categories, assignments, grades and class policies
+
+Revision ID: gradebook_tables
+Revises: student_attendance_stats
+Create Date: 2026-10-19
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = 'gradebook_tables'
+down_revision = 'student_attendance_stats'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    op.create_table(
+        'assignment_categories',
+        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column('classroom_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('classrooms.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('name', sa.String(100), nullable=False),
+        sa.Column('weight', sa.Numeric(5, 2), nullable=False, server_default='1'),
+        sa.Column('drop_lowest', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('color', sa.String(7), nullable=True),
+        sa.Column('is_active', sa.Boolean(), nullable=False, server_default=sa.text('true')),
+        sa.Column('display_order', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
+    )
+    op.create_index('ix_assignment_categories_classroom', 'assignment_categories', ['classroom_id'])
+
+    op.create_table(
+        'assignments',
+        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column('classroom_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('classrooms.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('category_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('assignment_categories.id'), nullable=True),
+        sa.Column('title', sa.String(200), nullable=False),
+        sa.Column('description', sa.Text(), nullable=True),
+        sa.Column('points_possible', sa.Numeric(7, 2), nullable=False),
+        sa.Column('assigned_date', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('due_date', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('allow_late', sa.Boolean(), nullable=False, server_default=sa.text('true')),
+        sa.Column('late_penalty', sa.Numeric(5, 2), nullable=True),
+        sa.Column('weight_override', sa.Numeric(5, 2), nullable=True),
+        sa.Column('is_extra_credit', sa.Boolean(), nullable=False, server_default=sa.text('false')),
+        sa.Column('is_published', sa.Boolean(), nullable=False, server_default=sa.text('false')),
+        sa.Column('created_by', postgresql.UUID(as_uuid=True), sa.ForeignKey('users.id'), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
+    )
+    op.create_index('ix_assignments_classroom', 'assignments', ['classroom_id'])
+
+    op.create_table(
+        'grades',
+        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column('assignment_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('assignments.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('student_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('students.id'), nullable=False),
+        sa.Column('points_earned', sa.Numeric(7, 2), nullable=True),
+        sa.Column('status', sa.String(20), nullable=False, server_default='GRADED'),
+        sa.Column('comments', sa.Text(), nullable=True),
+        sa.Column('shareable', sa.Boolean(), nullable=False, server_default=sa.text('false')),
+        sa.Column('graded_by', postgresql.UUID(as_uuid=True), sa.ForeignKey('users.id'), nullable=True),
+        sa.Column('graded_date', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
+        sa.UniqueConstraint('assignment_id', 'student_id', name='uq_grades_assignment_student'),
+        sa.CheckConstraint(
+            "status IN ('GRADED', 'MISSING', 'LATE', 'EXCUSED', 'IN_PROGRESS')",
+            name='ck_grades_status',
+        ),
+    )
+    op.create_index('ix_grades_student', 'grades', ['student_id'])
+
+    op.create_table(
+        'class_policies',
+        sa.Column('classroom_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('classrooms.id', ondelete='CASCADE'), primary_key=True),
+        sa.Column('late_policy_type', sa.String(10), nullable=False, server_default='PERCENT'),
+        sa.Column('late_penalty', sa.Numeric(5, 2), nullable=False, server_default='0'),
+        sa.Column('calculate_missing_as_zero', sa.Boolean(), nullable=False, server_default=sa.text('true')),
+        sa.Column('rounding_decimals', sa.Integer(), nullable=False, server_default='2'),
+    )
+
+def downgrade():
+    op.drop_table('class_policies')
+    op.drop_index('ix_grades_student', table_name='grades')
+    op.drop_table('grades')
+    op.drop_index('ix_assignments_classroom', table_name='assignments')
+    op.drop_table('assignments')
+    op.drop_index('ix_assignment_categories_classroom', table_name='assignment_categories')
+    op.drop_table('assignment_categories')
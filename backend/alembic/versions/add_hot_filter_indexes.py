@@ -0,0 +1,44 @@
+"""composite and partial indexes for hot filters
+
+Revision ID: hot_filter_indexes
+Revises: fd07c9b48539
+Create Date: 2026-10-19
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'hot_filter_indexes'
+down_revision = 'fd07c9b48539'
+branch_labels = None
+depends_on = None
+
+# (index name, table, columns, partial predicate)
+INDEXES = [
+    ('ix_enrollments_classroom_active', 'enrollments', ['classroom_id', 'is_active'], None),
+    ('ix_enrollments_student_active', 'enrollments', ['student_id', 'is_active'], None),
+    ('ix_user_roles_user_active', 'user_roles', ['user_id', 'is_active'], None),
+    ('ix_students_school_name', 'students', ['school_id', 'last_name', 'first_name'], None),
+    ('ix_students_school_student_id', 'students', ['school_id', 'student_id'], None),
+    ('ix_academic_years_active_only', 'academic_years', ['is_active'], 'is_active'),
+    ('ix_special_needs_tags_school_active_name', 'special_needs_tag_library', ['school_id', 'is_active', 'tag_name'], None),
+]
+
+def upgrade():
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        for name, table, columns, where in INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                postgresql_concurrently=True,
+                postgresql_where=sa.text(where) if where else None,
+                if_not_exists=True,
+            )
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        for name, table, _, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
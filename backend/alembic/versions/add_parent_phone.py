@@ -0,0 +1,28 @@
+"""parent phone and emergency-contact index
+
+Revision ID: parent_phone
+Revises: background_jobs
+Create Date: 2026-10-19
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'parent_phone'
+down_revision = 'background_jobs'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    op.add_column('parents', sa.Column('phone', sa.String(30), nullable=True))
+    op.create_index(
+        'ix_parent_student_relationships_emergency',
+        'parent_student_relationships',
+        ['student_id', 'emergency_priority'],
+        postgresql_where=sa.text('is_emergency_contact AND is_active'),
+    )
+
+def downgrade():
+    op.drop_index('ix_parent_student_relationships_emergency', table_name='parent_student_relationships')
+    op.drop_column('parents', 'phone')
@@ -0,0 +1,40 @@
+"""special-need review due-queue index and daily review digests
+
+Revision ID: review_due_queue
+Revises: student_flags
+Create Date: 2026-10-19
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = 'review_due_queue'
+down_revision = 'student_flags'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    # Only active assignments with a review date are ever queued, so the index skips the rest
+    op.create_index(
+        'ix_student_special_needs_review_due',
+        'student_special_needs',
+        ['review_date', 'id'],
+        postgresql_where=sa.text('is_active AND review_date IS NOT NULL'),
+    )
+    op.create_table(
+        'special_need_review_digests',
+        sa.Column('school_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('schools.id', ondelete='CASCADE'), primary_key=True),
+        sa.Column('digest_date', sa.Date(), primary_key=True),
+        sa.Column('horizon_days', sa.Integer(), nullable=False),
+        sa.Column('overdue_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('due_7d_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('due_horizon_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('items', postgresql.JSONB(), nullable=False, server_default=sa.text("'[]'::jsonb")),
+        sa.Column('generated_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
+    )
+
+def downgrade():
+    op.drop_table('special_need_review_digests')
+    op.drop_index('ix_student_special_needs_review_due', table_name='student_special_needs')
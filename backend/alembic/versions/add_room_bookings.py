@@ -0,0 +1,58 @@
+"""room bookings as tstzrange with a per-room no-overlap exclusion constraint
+
+Revision ID: room_bookings
+Revises: schedule_tables
+Create Date: 2026-10-19
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = 'room_bookings'
+down_revision = 'schedule_tables'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    # Lets the GiST exclusion constraint combine uuid equality with range overlap
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gist")
+
+    op.create_table(
+        'room_bookings',
+        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column('room_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('rooms.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('school_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('schools.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('during', postgresql.TSTZRANGE(), nullable=False),
+        sa.Column('source', sa.String(10), nullable=False, server_default='EVENT'),
+        sa.Column('occurrence_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('schedule_occurrences.id', ondelete='CASCADE'), nullable=True),
+        sa.Column('title', sa.String(200), nullable=True),
+        sa.Column('booked_by', postgresql.UUID(as_uuid=True), sa.ForeignKey('users.id', ondelete='SET NULL'), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
+        postgresql.ExcludeConstraint(
+            ('room_id', '='),
+            ('during', '&&'),
+            name='ex_room_bookings_no_overlap',
+            using='gist',
+        ),
+        sa.CheckConstraint("source IN ('CLASS', 'EVENT')", name='ck_room_bookings_source'),
+        sa.CheckConstraint('NOT isempty(during)', name='ck_room_bookings_not_empty'),
+    )
+    op.create_index('ix_room_bookings_occurrence', 'room_bookings', ['occurrence_id'])
+    op.create_index('ix_room_bookings_school_during', 'room_bookings', ['school_id', 'during'], postgresql_using='gist')
+
+    # Already-compiled class meetings hold their rooms; the first of any double-booked pair wins
+    op.execute("""
+        INSERT INTO room_bookings (id, room_id, school_id, during, source, occurrence_id, created_at)
+        SELECT gen_random_uuid(), room_id, school_id, tstzrange(starts_at, ends_at, '[)'), 'CLASS', id, now()
+        FROM schedule_occurrences
+        WHERE room_id IS NOT NULL
+        ORDER BY starts_at
+        ON CONFLICT DO NOTHING
+    """)
+
+def downgrade():
+    op.drop_index('ix_room_bookings_school_during', table_name='room_bookings')
+    op.drop_index('ix_room_bookings_occurrence', table_name='room_bookings')
+    op.drop_table('room_bookings')
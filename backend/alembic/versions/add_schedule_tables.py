@@ -0,0 +1,103 @@
+"""bell schedule periods, rotation days, calendar, class blocks and compiled occurrences
+
+Revision ID: schedule_tables
+Revises: grade_history
+Create Date: 2026-10-19
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = 'schedule_tables'
+down_revision = 'grade_history'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    op.create_table(
+        'schedule_periods',
+        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column('school_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('schools.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('academic_year_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('academic_years.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('name', sa.String(50), nullable=False),
+        sa.Column('start_time', sa.Time(), nullable=False),
+        sa.Column('end_time', sa.Time(), nullable=False),
+        sa.Column('display_order', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('is_active', sa.Boolean(), nullable=False, server_default=sa.text('true')),
+        sa.UniqueConstraint('school_id', 'academic_year_id', 'name', name='uq_schedule_periods_school_year_name'),
+        sa.CheckConstraint('end_time > start_time', name='ck_schedule_periods_times'),
+    )
+
+    op.create_table(
+        'rotation_days',
+        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column('school_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('schools.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('academic_year_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('academic_years.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('name', sa.String(20), nullable=False),
+        sa.Column('sequence', sa.Integer(), nullable=False),
+        sa.UniqueConstraint('school_id', 'academic_year_id', 'name', name='uq_rotation_days_school_year_name'),
+    )
+
+    op.create_table(
+        'school_calendar_days',
+        sa.Column('school_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('schools.id', ondelete='CASCADE'), primary_key=True),
+        sa.Column('calendar_date', sa.Date(), primary_key=True),
+        sa.Column('academic_year_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('academic_years.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('is_instructional', sa.Boolean(), nullable=False, server_default=sa.text('true')),
+        sa.Column('rotation_day_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('rotation_days.id', ondelete='SET NULL'), nullable=True),
+        sa.Column('note', sa.String(100), nullable=True),
+    )
+
+    op.create_table(
+        'calendar_blocks',
+        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column('classroom_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('classrooms.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('period_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('schedule_periods.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('rotation_day_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('rotation_days.id', ondelete='CASCADE'), nullable=True),
+        sa.Column('room_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('rooms.id'), nullable=True),
+        sa.Column('effective_from', sa.Date(), nullable=True),
+        sa.Column('effective_to', sa.Date(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
+    )
+    op.create_index('ix_calendar_blocks_classroom', 'calendar_blocks', ['classroom_id'])
+    op.create_index('ix_calendar_blocks_period', 'calendar_blocks', ['period_id'])
+
+    op.create_table(
+        'schedule_occurrences',
+        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column('block_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('calendar_blocks.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('school_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('schools.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('classroom_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('classrooms.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('period_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('schedule_periods.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('room_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('rooms.id'), nullable=True),
+        sa.Column('calendar_date', sa.Date(), nullable=False),
+        sa.Column('starts_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('ends_at', sa.DateTime(timezone=True), nullable=False),
+        sa.UniqueConstraint('block_id', 'calendar_date', name='uq_schedule_occurrences_block_date'),
+    )
+    op.create_index('ix_schedule_occurrences_classroom_date', 'schedule_occurrences', ['classroom_id', 'calendar_date'])
+    op.create_index('ix_schedule_occurrences_room_date', 'schedule_occurrences', ['room_id', 'calendar_date', 'starts_at'])
+    op.create_index('ix_schedule_occurrences_school_date', 'schedule_occurrences', ['school_id', 'calendar_date'])
+
+    # "Today's classes for teacher X" starts from the teacher's assignments
+    op.create_index(
+        'ix_classroom_teacher_assignments_teacher_active',
+        'classroom_teacher_assignments',
+        ['teacher_user_id', 'is_active'],
+        if_not_exists=True,
+    )
+
+def downgrade():
+    op.drop_index('ix_classroom_teacher_assignments_teacher_active', table_name='classroom_teacher_assignments', if_exists=True)
+    op.drop_index('ix_schedule_occurrences_school_date', table_name='schedule_occurrences')
+    op.drop_index('ix_schedule_occurrences_room_date', table_name='schedule_occurrences')
+    op.drop_index('ix_schedule_occurrences_classroom_date', table_name='schedule_occurrences')
+    op.drop_table('schedule_occurrences')
+    op.drop_index('ix_calendar_blocks_period', table_name='calendar_blocks')
+    op.drop_index('ix_calendar_blocks_classroom', table_name='calendar_blocks')
+    op.drop_table('calendar_blocks')
+    op.drop_table('school_calendar_days')
+    op.drop_table('rotation_days')
+    op.drop_table('schedule_periods')
@@ -0,0 +1,64 @@
+"""trigram and full-text search columns for students, users and classrooms
+
+Revision ID: search_columns
+Revises: hot_filter_indexes
+Create Date: 2026-10-19
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = 'search_columns'
+down_revision = 'hot_filter_indexes'
+branch_labels = None
+depends_on = None
+
+# Keep in sync with SEARCH_DOCUMENT in the matching model
+SEARCH_DOCUMENTS = {
+    'students': (
+        "first_name || ' ' || last_name || ' ' || coalesce(student_id, '') || ' ' || "
+        "translate(coalesce(email, ''), '@.', '  ')"
+    ),
+    'users': "first_name || ' ' || last_name || ' ' || translate(email, '@.', '  ')",
+    'classrooms': "name || ' ' || grade_level",
+}
+
+def upgrade():
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    for table, document in SEARCH_DOCUMENTS.items():
+        op.add_column(table, sa.Column('search_text', sa.Text(), sa.Computed(f"lower({document})", persisted=True)))
+        op.add_column(table, sa.Column('search_vector', postgresql.TSVECTOR(), sa.Computed(f"to_tsvector('simple', {document})", persisted=True)))
+
+    # GIN builds on a 100k-row district take a while - don't block writes
+    with op.get_context().autocommit_block():
+        for table in SEARCH_DOCUMENTS:
+            op.create_index(
+                f'ix_{table}_search_text_trgm',
+                table,
+                ['search_text'],
+                postgresql_using='gin',
+                postgresql_ops={'search_text': 'gin_trgm_ops'},
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+            op.create_index(
+                f'ix_{table}_search_vector',
+                table,
+                ['search_vector'],
+                postgresql_using='gin',
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        for table in SEARCH_DOCUMENTS:
+            op.drop_index(f'ix_{table}_search_vector', table_name=table, postgresql_concurrently=True, if_exists=True)
+            op.drop_index(f'ix_{table}_search_text_trgm', table_name=table, postgresql_concurrently=True, if_exists=True)
+
+    for table in SEARCH_DOCUMENTS:
+        op.drop_column(table, 'search_vector')
+        op.drop_column(table, 'search_text')
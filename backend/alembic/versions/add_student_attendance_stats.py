@@ -0,0 +1,47 @@
+"""per-student attendance streaks and rolling absence rates
+
+Revision ID: student_attendance_stats
+Revises: attendance_sync_mutations
+Create Date: 2026-10-19
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = 'student_attendance_stats'
+down_revision = 'attendance_sync_mutations'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    op.create_table(
+        'student_attendance_stats',
+        sa.Column('student_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('students.id', ondelete='CASCADE'), primary_key=True),
+        sa.Column('classroom_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('classrooms.id', ondelete='CASCADE'), primary_key=True),
+        sa.Column('academic_year_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('academic_years.id'), nullable=False),
+        sa.Column('absent_streak', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('tardy_streak', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('prior_absent_streak', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('prior_tardy_streak', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('last_session_date', sa.Date(), nullable=True),
+        sa.Column('last_status', sa.String(20), nullable=True),
+        sa.Column('session_bits', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('absent_bits', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('sessions_30d', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('absences_30d', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('absence_rate_30d', sa.Numeric(5, 4), nullable=False, server_default='0'),
+        sa.Column('has_alert', sa.Boolean(), nullable=False, server_default=sa.text('false')),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
+    )
+    op.create_index(
+        'ix_student_attendance_stats_alerts',
+        'student_attendance_stats',
+        ['classroom_id'],
+        postgresql_where=sa.text('has_alert'),
+    )
+
+def downgrade():
+    op.drop_index('ix_student_attendance_stats_alerts', table_name='student_attendance_stats')
+    op.drop_table('student_attendance_stats')
@@ -0,0 +1,44 @@
+"""maintained per-student special-need and parent counts
+
+Revision ID: student_flags
+Revises: parent_phone
+Create Date: 2026-10-19
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = 'student_flags'
+down_revision = 'parent_phone'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    op.create_table(
+        'student_flags',
+        sa.Column('student_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('students.id', ondelete='CASCADE'), primary_key=True),
+        sa.Column('special_need_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('parent_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
+    )
+    # Per-tag student counts aggregate over active assignments only
+    op.create_index(
+        'ix_student_special_needs_tag_active',
+        'student_special_needs',
+        ['tag_library_id', 'student_id'],
+        postgresql_where=sa.text('is_active'),
+    )
+    op.execute("""
+        INSERT INTO student_flags (student_id, special_need_count, parent_count, updated_at)
+        SELECT s.id,
+               (SELECT count(*) FROM student_special_needs n WHERE n.student_id = s.id AND n.is_active),
+               (SELECT count(*) FROM parent_student_relationships r WHERE r.student_id = s.id AND r.is_active),
+               now()
+        FROM students s
+    """)
+
+def downgrade():
+    op.drop_index('ix_student_special_needs_tag_active', table_name='student_special_needs')
+    op.drop_table('student_flags')
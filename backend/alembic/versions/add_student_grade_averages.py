@@ -0,0 +1,32 @@
+"""cached per-student class averages with incremental state
+
+Revision ID: student_grade_averages
+Revises: gradebook_tables
+Create Date: 2026-10-19
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = 'student_grade_averages'
+down_revision = 'gradebook_tables'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    op.create_table(
+        'student_grade_averages',
+        sa.Column('classroom_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('classrooms.id', ondelete='CASCADE'), primary_key=True),
+        sa.Column('student_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('students.id', ondelete='CASCADE'), primary_key=True),
+        sa.Column('overall_percent', sa.Numeric(6, 2), nullable=True),
+        sa.Column('category_percents', postgresql.JSONB(), nullable=False, server_default=sa.text("'{}'::jsonb")),
+        sa.Column('state', postgresql.JSONB(), nullable=False),
+        sa.Column('computed_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
+    )
+    op.create_index('ix_student_grade_averages_student', 'student_grade_averages', ['student_id'])
+
+def downgrade():
+    op.drop_index('ix_student_grade_averages_student', table_name='student_grade_averages')
+    op.drop_table('student_grade_averages')
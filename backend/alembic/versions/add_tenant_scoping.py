@@ -0,0 +1,59 @@
+"""classrooms.school_id and school row-level security policies
+
+Revision ID: tenant_scoping
+Revises: year_partitions
+Create Date: 2026-10-19
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = 'tenant_scoping'
+down_revision = 'year_partitions'
+branch_labels = None
+depends_on = None
+
+# Tables with a school_id that the tenant policies cover; classrooms without a school stay visible
+POLICIES = {
+    'classrooms': 'school_id IS NULL OR school_id = current_setting(\'app.school_id\')::uuid',
+    'students': 'school_id = current_setting(\'app.school_id\')::uuid',
+    'rooms': 'school_id = current_setting(\'app.school_id\')::uuid',
+}
+
+def upgrade():
+    op.add_column(
+        'classrooms',
+        sa.Column('school_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('schools.id', ondelete='CASCADE'), nullable=True),
+    )
+    # Room's school, else the school most of the class's students attend, else its teachers' school
+    op.execute("""
+        UPDATE classrooms c
+        SET school_id = coalesce(
+            (SELECT r.school_id FROM rooms r WHERE r.id = c.room_id),
+            (SELECT s.school_id FROM enrollments e JOIN students s ON s.id = e.student_id
+             WHERE e.classroom_id = c.id AND e.academic_year_id = c.academic_year_id
+             GROUP BY s.school_id ORDER BY count(*) DESC LIMIT 1),
+            (SELECT ur.school_id FROM classroom_teacher_assignments t JOIN user_roles ur ON ur.user_id = t.teacher_user_id
+             WHERE t.classroom_id = c.id AND ur.is_active
+             GROUP BY ur.school_id ORDER BY count(*) DESC LIMIT 1)
+        )
+    """)
+    op.create_index('ix_classrooms_school_year', 'classrooms', ['school_id', 'academic_year_id'])
+
+    # Policies are inert until scripts/tenant_rls.py enables row-level security on the tables.
+    # No app.school_id (scripts, jobs, unscoped requests) means no restriction.
+    for table, predicate in POLICIES.items():
+        op.execute(f"""
+            CREATE POLICY tenant_school ON {table}
+            USING (coalesce(current_setting('app.school_id', true), '') = '' OR {predicate})
+        """)
+
+def downgrade():
+    for table in POLICIES:
+        op.execute(f'ALTER TABLE {table} NO FORCE ROW LEVEL SECURITY')
+        op.execute(f'ALTER TABLE {table} DISABLE ROW LEVEL SECURITY')
+        op.execute(f'DROP POLICY IF EXISTS tenant_school ON {table}')
+    op.drop_index('ix_classrooms_school_year', table_name='classrooms')
+    op.drop_column('classrooms', 'school_id')
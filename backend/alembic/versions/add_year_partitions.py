@@ -0,0 +1,109 @@
+"""partition enrollments and attendance_marks by academic year
+
+Revision ID: year_partitions
+Revises: year_rollover
+Create Date: 2026-10-19
+
+"""
+import re
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'year_partitions'
+down_revision = 'year_rollover'
+branch_labels = None
+depends_on = None
+
+TABLES = ('enrollments', 'attendance_marks')
+
+_YEAR_NAME = re.compile(r'^(\d{4})-(\d{4})$')
+
+
+def _partition_name(table, year_id, year_name):
+    # Same scheme as services/year_partitions.partition_name
+    match = _YEAR_NAME.match(year_name or '')
+    suffix = f'y{match.group(1)}_{match.group(2)}' if match else f'y{year_id.hex[:12]}'
+    return f'{table}_{suffix}'
+
+
+def _structure(conn, table):
+    """Indexes (name, definition, primary, unique, constraint name, columns) and foreign keys of a table"""
+    indexes = conn.execute(sa.text("""
+        SELECT i.relname, pg_get_indexdef(ix.indexrelid), ix.indisprimary, ix.indisunique, con.conname,
+               ARRAY(
+                   SELECT a.attname
+                   FROM unnest(ix.indkey::int2[]) WITH ORDINALITY AS k(attnum, n)
+                   JOIN pg_attribute a ON a.attrelid = ix.indrelid AND a.attnum = k.attnum
+                   ORDER BY k.n
+               )
+        FROM pg_index ix
+        JOIN pg_class i ON i.oid = ix.indexrelid
+        LEFT JOIN pg_constraint con ON con.conindid = ix.indexrelid AND con.conrelid = ix.indrelid
+        WHERE ix.indrelid = CAST(:table AS regclass)
+    """), {'table': table}).all()
+    foreign_keys = conn.execute(sa.text("""
+        SELECT conname, pg_get_constraintdef(oid)
+        FROM pg_constraint
+        WHERE conrelid = CAST(:table AS regclass) AND contype = 'f'
+    """), {'table': table}).all()
+    return indexes, foreign_keys
+
+
+def _rebuild(table, partitioned):
+    """Recreate ``table`` (partitioned by year or plain), copying columns, indexes, keys and rows"""
+    conn = op.get_bind()
+    old = f'{table}_old'
+    indexes, foreign_keys = _structure(conn, table)
+
+    op.execute(f'ALTER TABLE {table} RENAME TO {old}')
+    for name, *_ in indexes:
+        op.execute(f'ALTER INDEX {name} RENAME TO {name[:59]}_old')
+
+    partition_by = ' PARTITION BY LIST (academic_year_id)' if partitioned else ''
+    op.execute(f'CREATE TABLE {table} (LIKE {old} INCLUDING DEFAULTS INCLUDING CONSTRAINTS INCLUDING COMMENTS){partition_by}')
+    op.execute(f'ALTER TABLE {table} ALTER COLUMN academic_year_id SET NOT NULL')
+
+    for name, definition, primary, unique, constraint, columns in indexes:
+        if primary:
+            key = ['id', 'academic_year_id'] if partitioned else ['id']
+            op.execute(f'ALTER TABLE {table} ADD CONSTRAINT {table}_pkey PRIMARY KEY ({", ".join(key)})')
+        elif unique:
+            # Unique keys on a partitioned table must include the partition key
+            key = list(columns) + (['academic_year_id'] if 'academic_year_id' not in columns else [])
+            if constraint:
+                op.execute(f'ALTER TABLE {table} ADD CONSTRAINT {constraint} UNIQUE ({", ".join(key)})')
+            else:
+                op.execute(f'CREATE UNIQUE INDEX {name} ON {table} ({", ".join(key)})')
+        else:
+            # Captured before the rename, so it already names the new table
+            op.execute(definition)
+    for name, definition in foreign_keys:
+        op.execute(f'ALTER TABLE {table} ADD CONSTRAINT {name} {definition}')
+
+    if partitioned:
+        for year_id, year_name in conn.execute(sa.text('SELECT id, name FROM academic_years')).all():
+            op.execute(
+                f"CREATE TABLE {_partition_name(table, year_id, year_name)} PARTITION OF {table} FOR VALUES IN ('{year_id}')"
+            )
+        op.execute(f'CREATE TABLE {table}_default PARTITION OF {table} DEFAULT')
+
+    op.execute(f'INSERT INTO {table} SELECT * FROM {old}')
+    op.execute(f'DROP TABLE {old}')
+
+
+def upgrade():
+    # The partition key may not be NULL, and an enrollment's year is its classroom's year
+    op.execute("""
+        UPDATE enrollments e
+        SET academic_year_id = c.academic_year_id
+        FROM classrooms c
+        WHERE c.id = e.classroom_id AND e.academic_year_id IS DISTINCT FROM c.academic_year_id
+    """)
+    for table in TABLES:
+        _rebuild(table, partitioned=True)
+
+def downgrade():
+    for table in TABLES:
+        _rebuild(table, partitioned=False)
@@ -0,0 +1,34 @@
+"""classrooms.cloned_from_id for academic-year rollover
+
+Revision ID: year_rollover
+Revises: review_due_queue
+Create Date: 2026-10-19
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = 'year_rollover'
+down_revision = 'review_due_queue'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    op.add_column(
+        'classrooms',
+        sa.Column('cloned_from_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('classrooms.id', ondelete='SET NULL'), nullable=True),
+    )
+    # A class is cloned into a year at most once; rollover re-runs conflict here and skip it
+    op.create_index(
+        'uq_classrooms_year_cloned_from',
+        'classrooms',
+        ['academic_year_id', 'cloned_from_id'],
+        unique=True,
+        postgresql_where=sa.text('cloned_from_id IS NOT NULL'),
+    )
+
+def downgrade():
+    op.drop_index('uq_classrooms_year_cloned_from', table_name='classrooms')
+    op.drop_column('classrooms', 'cloned_from_id')
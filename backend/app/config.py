@@ -15,6 +15,57 @@ class Settings(BaseSettings):
     access_token_expire_minutes: int = 60
     default_timezone: str = "America/Chicago"
 
+    # Tracing: exporter is "none", "console" or "file"; sample rate is 0.0-1.0
+    trace_exporter: str = "none"
+    trace_sample_rate: float = 0.0
+    trace_file_path: str = "traces.jsonl"
+
+    # Slow-query log: statements above the threshold land in an in-memory ring buffer
+    slow_query_threshold_ms: float = 200.0
+    slow_query_buffer_size: int = 200
+    slow_query_explain_sample_rate: float = 0.0
+    slow_query_explain_timeout_ms: int = 5000
+
+    # Search: minimum pg_trgm word similarity for a typo-tolerant match
+    search_similarity_threshold: float = 0.3
+
+    # Roster cache: number of (classroom, active_only) rosters kept in memory, and seconds one is
+    # trusted before a reload (bounds staleness from writes committed by other workers)
+    roster_cache_max_entries: int = 5000
+    roster_cache_max_age_seconds: int = 300
+
+    # Attendance alerts: 30-day absence rate that flags a student on the dashboard
+    attendance_alert_absence_rate: float = 0.2
+
+    # Background jobs: concurrent jobs per process, process-pool size for CPU-bound steps,
+    # progress write interval, heartbeat interval, and silence after which a job counts as dead
+    job_max_concurrency: int = 4
+    job_process_workers: int = 2
+    job_progress_flush_seconds: float = 1.0
+    job_heartbeat_seconds: int = 15
+    job_stale_after_seconds: int = 120
+
+    # Room utilization report: seconds a (school, academic year) report is reused; 0 disables caching
+    room_utilization_cache_seconds: int = 300
+
+    # Parent portal: seconds a parent's summary is reused; 0 disables caching
+    parent_summary_cache_seconds: int = 120
+
+    # Emergency contacts: seconds a school's in-memory directory is trusted before a reload
+    emergency_directory_max_age_seconds: int = 900
+
+    # Special-need reviews: local hour the daily digest is built, days ahead it covers, days of digests kept
+    review_digest_hour: int = 5
+    review_digest_horizon_days: int = 30
+    review_digest_keep_days: int = 30
+
+    # Live events: per-stream queue length before a slow client is told to resync, and SSE keep-alive interval
+    live_events_queue_size: int = 256
+    live_events_keepalive_seconds: int = 15
+
+    # Tenant scoping: also set app.school_id per transaction for the Postgres row-level security policies
+    tenant_rls_enabled: bool = False
+
     @validator('default_timezone')
     def tz_us_only(cls, v):
         if v not in US_TZS:
@@ -1,6 +1,7 @@
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.orm import DeclarativeBase
 from .config import get_settings
+from .services import slow_queries, tracing
 
 class Base(DeclarativeBase):
     pass
@@ -13,6 +14,8 @@ def get_engine():
     if _engine is None:
         settings = get_settings()
         _engine = create_async_engine(settings.database_url, future=True, echo=False)
+        tracing.instrument_engine(_engine)
+        slow_queries.instrument_engine(_engine)
     return _engine
 
 def get_sessionmaker():
@@ -1,14 +1,18 @@
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Query, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
+from typing import Optional
 
 from .db import get_session
 from .security import decode_access_token
 from .models.user import User
 from .models.user_role import UserRole
+from .services.tenant import preferred_school, set_school_scope
+from .services.tracing import start_span
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
+optional_oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login", auto_error=False)
 
 # Provide a single, consistent DB dependency
 async def get_db(session: AsyncSession = Depends(get_session)) -> AsyncSession:
@@ -19,14 +23,36 @@ async def get_current_user(
     token: str = Depends(oauth2_scheme),
     session: AsyncSession = Depends(get_db),
 ) -> User:
-    email = decode_access_token(token)
-    if not email:
-        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
-    result = await session.execute(select(User).where(User.email == email))
-    user = result.scalar_one_or_none()
-    if not user or not user.is_active:
-        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found or inactive")
-    return user
+    with start_span("deps.get_current_user"):
+        email = decode_access_token(token)
+        if not email:
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
+        result = await session.execute(select(User).where(User.email == email))
+        user = result.scalar_one_or_none()
+        if not user or not user.is_active:
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found or inactive")
+        return user
+
+# Resolve the user for an EventSource stream - browsers cannot set headers on
+# EventSource, so the token may come as ?access_token= instead of a Bearer header
+async def get_stream_user(
+    access_token: Optional[str] = Query(None),
+    header_token: Optional[str] = Depends(optional_oauth2_scheme),
+    session: AsyncSession = Depends(get_db),
+) -> User:
+    token = header_token or access_token
+    if not token:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Not authenticated")
+    return await get_current_user(token=token, session=session)
+
+# DB session scoped to the current user's preferred school (see services/tenant.py)
+async def get_scoped_db(
+    user: User = Depends(get_current_user),
+    session: AsyncSession = Depends(get_db),
+) -> AsyncSession:
+    with start_span("deps.get_scoped_db"):
+        await set_school_scope(session, await preferred_school(session, user.id))
+        return session
 
 # “Admin-ish” roles allowed
 ADMIN_ALIASES = {
@@ -43,26 +69,28 @@ async def require_admin(
     user: User = Depends(get_current_user),
     session: AsyncSession = Depends(get_db),
 ) -> User:
-    result = await session.execute(
-        select(UserRole).where(UserRole.user_id == user.id, UserRole.is_active == True)
-    )
-    roles = result.scalars().all()
-    if not roles or not any(_is_adminish(r.role) for r in roles):
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Admin role required")
-    return user
+    with start_span("deps.require_admin"):
+        result = await session.execute(
+            select(UserRole).where(UserRole.user_id == user.id, UserRole.is_active == True)
+        )
+        roles = result.scalars().all()
+        if not roles or not any(_is_adminish(r.role) for r in roles):
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Admin role required")
+        return user
 
 def require_role(*required_roles: str):
     async def _inner(
         user: User = Depends(get_current_user),
         session: AsyncSession = Depends(get_db),
     ) -> User:
-        result = await session.execute(
-            select(UserRole).where(UserRole.user_id == user.id, UserRole.is_active == True)
-        )
-        roles = [r.role.lower() for r in result.scalars().all()]
-        if required_roles and not any(
-            any(req.lower() in role for role in roles) for req in required_roles
-        ):
-            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Required role missing")
-        return user
+        with start_span("deps.require_role", roles=",".join(required_roles)):
+            result = await session.execute(
+                select(UserRole).where(UserRole.user_id == user.id, UserRole.is_active == True)
+            )
+            roles = [r.role.lower() for r in result.scalars().all()]
+            if required_roles and not any(
+                any(req.lower() in role for role in roles) for req in required_roles
+            ):
+                raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Required role missing")
+            return user
     return _inner
@@ -11,6 +11,9 @@ import traceback
 
 from .models import *
 from .db import get_session
+from .services.tracing import get_tracer, bind_request_scope, reset_request_scope
+from .services import jobs as jobs_service
+from .services import review_queue as review_queue_service
 from .routers import auth as auth_router
 from .routers import schools as schools_router
 from .routers import admin as admin_router
@@ -25,6 +28,14 @@ from .routers import parents as parents_router
 from .routers import student_services as student_services_router
 from .routers import enrollments as enrollments_router
 from .routers import users as users_router
+from .routers import diagnostics as diagnostics_router
+from .routers import search as search_router
+from .routers import attendance as attendance_router
+from .routers import gradebook as gradebook_router
+from .routers import schedule as schedule_router
+from .routers import jobs as jobs_router
+from .routers import events as events_router
+from .routers import emergency_contacts as emergency_contacts_router
 
 # Configure logging
 logging.basicConfig(
@@ -47,8 +58,29 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"],
     allow_headers=["*"],
+    expose_headers=["traceresponse"],
 )
 
+# Request tracing - opens the root span every dependency/SQL span nests under
+@app.middleware("http")
+async def trace_requests(request: Request, call_next):
+    scope_token = bind_request_scope(request.scope)
+    try:
+        with get_tracer().span(
+            f"{request.method} {request.url.path}",
+            traceparent=request.headers.get("traceparent"),
+            **{"http.method": request.method, "http.target": request.url.path},
+        ) as span:
+            response = await call_next(request)
+            route = request.scope.get("route")
+            if route is not None and getattr(route, "path", None):
+                span.name = f"{request.method} {route.path}"
+            span.set_attribute("http.status_code", response.status_code)
+            response.headers["traceresponse"] = span.traceparent
+            return response
+    finally:
+        reset_request_scope(scope_token)
+
 # Global exception handler
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
@@ -82,6 +114,14 @@ app.include_router(parents_router.router)
 app.include_router(student_services_router.router)
 app.include_router(enrollments_router.router)
 app.include_router(users_router.router)
+app.include_router(diagnostics_router.router)
+app.include_router(search_router.router)
+app.include_router(attendance_router.router)
+app.include_router(gradebook_router.router)
+app.include_router(schedule_router.router)
+app.include_router(jobs_router.router)
+app.include_router(events_router.router)
+app.include_router(emergency_contacts_router.router)
 
 
 # Startup event
@@ -89,6 +129,18 @@ app.include_router(users_router.router)
 async def startup_event():
     logger.info("SIS API starting up...")
     logger.info("Enrollment endpoints registered at /enrollments")
+    try:
+        interrupted = await jobs_service.recover_interrupted_jobs()
+        if interrupted:
+            logger.warning(f"Marked {interrupted} interrupted background jobs as failed")
+    except Exception as e:
+        logger.error(f"Could not check for interrupted background jobs: {e}")
+    review_queue_service.start_review_digest_scheduler()
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    await review_queue_service.stop_review_digest_scheduler()
+    await jobs_service.shutdown_jobs()
 
 
 for r in app.router.routes:
@@ -18,4 +18,10 @@ from .student_special_need import StudentSpecialNeed
 from .parent import Parent
 from .parent_student_relationship import ParentStudentRelationship
 from .enrollment import Enrollment
-
+from .attendance import AttendanceSession, AttendanceMark, AttendanceSyncMutation, StudentAttendanceStats
+from .gradebook import AssignmentCategory, Assignment, Grade, GradeHistory, ClassPolicy, StudentGradeAverage
+from .schedule import SchedulePeriod, RotationDay, SchoolCalendarDay, CalendarBlock, ScheduleOccurrence
+from .room_booking import RoomBooking
+from .background_job import BackgroundJob
+from .student_flags import StudentFlags
+from .special_need_review_digest import SpecialNeedReviewDigest
@@ -1,7 +1,7 @@
 # backend/app/models/academic_year.py
 
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy import String, Date, Boolean
+from sqlalchemy import String, Date, Boolean, Index, text
 from sqlalchemy.dialects.postgresql import UUID
 from datetime import date
 import uuid
@@ -9,6 +9,9 @@ from .base import Base
 
 class AcademicYear(Base):
     __tablename__ = "academic_years"
+    __table_args__ = (
+        Index("ix_academic_years_active_only", "is_active", postgresql_where=text("is_active")),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     name: Mapped[str] = mapped_column(String(9), nullable=False)  # "2024-2025"
@@ -0,0 +1,141 @@
+# backend/app/models/attendance.py
+
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import String, Text, Date, Boolean, Integer, Numeric, DateTime, ForeignKey, Index, UniqueConstraint, CheckConstraint, text
+from sqlalchemy.dialects.postgresql import UUID
+from datetime import date, datetime, timezone
+from typing import Optional
+import uuid
+from .base import Base
+
+# Canonical attendance states (Phase A attendance spec, BR-4)
+ATTENDANCE_STATUSES = (
+    "PRESENT",
+    "ABSENT_EXCUSED",
+    "ABSENT_UNEXCUSED",
+    "TARDY_EXCUSED",
+    "TARDY_UNEXCUSED",
+)
+
+class AttendanceSession(Base):
+    """One class meeting that attendance is taken for (classroom + date)"""
+    __tablename__ = "attendance_sessions"
+    __table_args__ = (
+        UniqueConstraint("classroom_id", "session_date", name="uq_attendance_sessions_classroom_date"),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    classroom_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("classrooms.id", ondelete="CASCADE"), nullable=False)
+    academic_year_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("academic_years.id"), nullable=False)
+    session_date: Mapped[date] = mapped_column(Date, nullable=False)
+
+    created_by: Mapped[Optional[uuid.UUID]] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=lambda: datetime.now(timezone.utc))
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc))
+
+    # Relationships
+    classroom = relationship("Classroom")
+    marks = relationship("AttendanceMark", back_populates="session", cascade="all, delete-orphan")
+
+    def __repr__(self):
+        return f"<AttendanceSession {self.classroom_id} on {self.session_date}>"
+
+class AttendanceMark(Base):
+    """A student's attendance status for one session"""
+    __tablename__ = "attendance_marks"
+    __table_args__ = (
+        # Unique keys of a partitioned table must include the partition key
+        UniqueConstraint("session_id", "student_id", "academic_year_id", name="uq_attendance_marks_session_student"),
+        Index("ix_attendance_marks_student_recorded", "student_id", "recorded_at"),
+        CheckConstraint(
+            "status IN ('PRESENT', 'ABSENT_EXCUSED', 'ABSENT_UNEXCUSED', 'TARDY_EXCUSED', 'TARDY_UNEXCUSED')",
+            name="ck_attendance_marks_status",
+        ),
+        # One partition per academic year (see services/year_partitions.py)
+        {"postgresql_partition_by": "LIST (academic_year_id)"},
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    session_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("attendance_sessions.id", ondelete="CASCADE"), nullable=False)
+    student_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("students.id"), nullable=False)
+    academic_year_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("academic_years.id"), primary_key=True)
+
+    status: Mapped[str] = mapped_column(String(20), nullable=False, default="PRESENT")
+    minutes_late: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    note_internal: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    note_shareable: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    shared_with_parent: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+
+    # Who/when/why of the latest change
+    recorded_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=lambda: datetime.now(timezone.utc))
+    recorded_by: Mapped[Optional[uuid.UUID]] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=True)
+    edited_reason: Mapped[Optional[str]] = mapped_column(Text, nullable=True)  # Required for admin edits after lock
+    source: Mapped[str] = mapped_column(String(20), nullable=False, default="TEACHER_UI")  # TEACHER_UI, ADMIN_UI, IMPORT, OFFLINE_QUEUE, API
+
+    # Bumped on every real change - lets clients detect they edited a stale mark
+    version: Mapped[int] = mapped_column(Integer, nullable=False, default=1)
+
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=lambda: datetime.now(timezone.utc))
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc))
+
+    # Relationships
+    session = relationship("AttendanceSession", back_populates="marks")
+    student = relationship("Student")
+
+    def __repr__(self):
+        return f"<AttendanceMark {self.student_id} {self.status} (v{self.version})>"
+
+class AttendanceSyncMutation(Base):
+    """Outcome of each offline-queued mutation, keyed by the client's idempotency key"""
+    __tablename__ = "attendance_sync_mutations"
+
+    mutation_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True)
+    user_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
+    session_id: Mapped[Optional[uuid.UUID]] = mapped_column(UUID(as_uuid=True), ForeignKey("attendance_sessions.id", ondelete="CASCADE"), nullable=True)
+    student_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("students.id"), nullable=False)
+
+    outcome: Mapped[str] = mapped_column(String(20), nullable=False)  # APPLIED, CONFLICT, REJECTED
+    code: Mapped[Optional[str]] = mapped_column(String(40), nullable=True)
+    version: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)  # Mark version after this mutation
+
+    client_ts: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=lambda: datetime.now(timezone.utc))
+
+    def __repr__(self):
+        return f"<AttendanceSyncMutation {self.mutation_id} {self.outcome}>"
+
+class StudentAttendanceStats(Base):
+    """
+    Running attendance state per student per classroom, maintained incrementally
+    as marks are written (see services/attendance_stats.py). The 30-day window is
+    kept as two bitmasks - bit 0 is last_session_date, bit n is n days earlier.
+    """
+    __tablename__ = "student_attendance_stats"
+    __table_args__ = (
+        Index("ix_student_attendance_stats_alerts", "classroom_id", postgresql_where=text("has_alert")),
+    )
+
+    student_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("students.id", ondelete="CASCADE"), primary_key=True)
+    classroom_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("classrooms.id", ondelete="CASCADE"), primary_key=True)
+    academic_year_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("academic_years.id"), nullable=False)
+
+    # Consecutive sessions ending at last_session_date, and ending at the session before it
+    absent_streak: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    tardy_streak: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    prior_absent_streak: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    prior_tardy_streak: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    last_session_date: Mapped[Optional[date]] = mapped_column(Date, nullable=True)
+    last_status: Mapped[Optional[str]] = mapped_column(String(20), nullable=True)
+
+    # Rolling 30-day window ending at last_session_date
+    session_bits: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    absent_bits: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    sessions_30d: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    absences_30d: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    absence_rate_30d: Mapped[float] = mapped_column(Numeric(5, 4), nullable=False, default=0)
+
+    has_alert: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc))
+
+    def __repr__(self):
+        return f"<StudentAttendanceStats {self.student_id} absent_streak={self.absent_streak} tardy_streak={self.tardy_streak}>"
@@ -0,0 +1,56 @@
+# backend/app/models/background_job.py
+# Persistent record of long-running admin jobs (see services/jobs.py)
+
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import String, Text, Integer, Boolean, DateTime, ForeignKey, Index, CheckConstraint, text
+from sqlalchemy.dialects.postgresql import UUID, JSONB
+from datetime import datetime, timezone
+from typing import Any, Optional
+import uuid
+from .base import Base
+
+JOB_STATUSES = ("PENDING", "RUNNING", "SUCCEEDED", "FAILED", "CANCELLED")
+FINISHED_JOB_STATUSES = ("SUCCEEDED", "FAILED", "CANCELLED")
+
+class BackgroundJob(Base):
+    """One run of a background job: what it is, how far it got and how it ended"""
+    __tablename__ = "background_jobs"
+    __table_args__ = (
+        CheckConstraint(
+            "status IN ('PENDING', 'RUNNING', 'SUCCEEDED', 'FAILED', 'CANCELLED')",
+            name="ck_background_jobs_status",
+        ),
+        Index("ix_background_jobs_created_by", "created_by", "created_at"),
+        Index(
+            "ix_background_jobs_unfinished",
+            "heartbeat_at",
+            postgresql_where=text("status IN ('PENDING', 'RUNNING')"),
+        ),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    kind: Mapped[str] = mapped_column(String(50), nullable=False)  # "homeroom_sync", "student_promotion", ...
+    status: Mapped[str] = mapped_column(String(10), nullable=False, default="PENDING")
+    params: Mapped[dict] = mapped_column(JSONB, nullable=False, default=dict)
+    done: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    total: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    message: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    result: Mapped[Optional[Any]] = mapped_column(JSONB, nullable=True)
+    error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    cancel_requested: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+    created_by: Mapped[Optional[uuid.UUID]] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=lambda: datetime.now(timezone.utc))
+    started_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    finished_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    heartbeat_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=lambda: datetime.now(timezone.utc))  # Last sign of life from the runner
+
+    @property
+    def progress(self) -> Optional[float]:
+        if self.status == "SUCCEEDED":
+            return 1.0
+        if not self.total:
+            return None
+        return min(self.done / self.total, 1.0)
+
+    def __repr__(self):
+        return f"<BackgroundJob {self.kind} {self.status} {self.done}/{self.total}>"
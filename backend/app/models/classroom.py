@@ -2,14 +2,25 @@
 # UPDATED TO FIX RELATIONSHIP ISSUES
 
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy import String, Integer, ForeignKey
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import String, Text, Integer, ForeignKey, Index, Computed, text
+from sqlalchemy.dialects.postgresql import UUID, TSVECTOR
 import uuid
 from typing import Optional
 from .base import Base
 
+SEARCH_DOCUMENT = "name || ' ' || grade_level"
+
 class Classroom(Base):
     __tablename__ = "classrooms"
+    __table_args__ = (
+        Index("ix_classrooms_search_text_trgm", "search_text", postgresql_using="gin", postgresql_ops={"search_text": "gin_trgm_ops"}),
+        Index("ix_classrooms_search_vector", "search_vector", postgresql_using="gin"),
+        Index("ix_classrooms_school_year", "school_id", "academic_year_id"),
+        Index(
+            "uq_classrooms_year_cloned_from", "academic_year_id", "cloned_from_id",
+            unique=True, postgresql_where=text("cloned_from_id IS NOT NULL"),
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     
@@ -21,6 +32,11 @@ class Classroom(Base):
     grade_level: Mapped[str] = mapped_column(String(10), nullable=False)
     classroom_type: Mapped[str] = mapped_column(String(20), nullable=False, default="CORE")
     
+    # Owning school (tenant scope); None for district-wide classes
+    school_id: Mapped[Optional[uuid.UUID]] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("schools.id", ondelete="CASCADE"), nullable=True
+    )
+
     # Academic Year Association
     academic_year_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("academic_years.id"), nullable=False)
     
@@ -29,6 +45,15 @@ class Classroom(Base):
     
     # Optional Capacity Limit
     max_students: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+
+    # Year rollover: the previous year's class this one was cloned from
+    cloned_from_id: Mapped[Optional[uuid.UUID]] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("classrooms.id", ondelete="SET NULL"), nullable=True
+    )
+
+    # Search columns (generated by Postgres, deferred so normal loads skip them)
+    search_text: Mapped[str] = mapped_column(Text, Computed(f"lower({SEARCH_DOCUMENT})", persisted=True), deferred=True)
+    search_vector = mapped_column(TSVECTOR, Computed(f"to_tsvector('simple', {SEARCH_DOCUMENT})", persisted=True), deferred=True)
     
     # FIXED RELATIONSHIPS - Using back_populates instead of backref
     subject = relationship("Subject", back_populates="classrooms")
@@ -1,7 +1,7 @@
 # backend/app/models/classroom_teacher_assignment.py
 
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy import String, Boolean, Date, ForeignKey
+from sqlalchemy import String, Boolean, Date, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID
 from datetime import date
 import uuid
@@ -9,6 +9,9 @@ from .base import Base
 
 class ClassroomTeacherAssignment(Base):
     __tablename__ = "classroom_teacher_assignments"
+    __table_args__ = (
+        Index("ix_classroom_teacher_assignments_teacher_active", "teacher_user_id", "is_active"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     classroom_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("classrooms.id"), nullable=False)
@@ -3,7 +3,7 @@
 # PATH: backend/app/models/enrollment.py
 
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy import String, Date, Boolean, ForeignKey, Text, Integer, Numeric
+from sqlalchemy import String, Date, Boolean, ForeignKey, Text, Integer, Numeric, Index
 from sqlalchemy.dialects.postgresql import UUID
 from datetime import date
 from typing import Optional
@@ -17,6 +17,12 @@ class Enrollment(Base):
     UPDATED: Added grade_level field for proper grade tracking per enrollment.
     """
     __tablename__ = "enrollments"
+    __table_args__ = (
+        Index("ix_enrollments_classroom_active", "classroom_id", "is_active"),
+        Index("ix_enrollments_student_active", "student_id", "is_active"),
+        # One partition per academic year (see services/year_partitions.py)
+        {"postgresql_partition_by": "LIST (academic_year_id)"},
+    )
 
     # Primary identification
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
@@ -25,11 +31,12 @@ class Enrollment(Base):
     student_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("students.id"), nullable=False)
     classroom_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("classrooms.id"), nullable=False)
     
-    # Academic year context - Essential for SIS
-    academic_year_id: Mapped[Optional[uuid.UUID]] = mapped_column(
+    # Academic year context - Essential for SIS. Always the classroom's year; also the partition key
+    academic_year_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), 
         ForeignKey("academic_years.id"), 
-        nullable=True,
+        primary_key=True,
+        nullable=False,
         comment="Academic year for this enrollment"
     )
     
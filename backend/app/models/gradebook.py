@@ -0,0 +1,158 @@
+# backend/app/models/gradebook.py
+# Gradebook baseline (Phase A gradebook spec, section 5)
+
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import String, Text, Boolean, Integer, Numeric, DateTime, ForeignKey, Index, UniqueConstraint, CheckConstraint
+from sqlalchemy.dialects.postgresql import UUID, JSONB
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import Optional
+import uuid
+from .base import Base
+
+# Grade cell states
+GRADE_STATUSES = ("GRADED", "MISSING", "LATE", "EXCUSED", "IN_PROGRESS")
+
+class AssignmentCategory(Base):
+    """Per-classroom category grouping (Homework, Quizzes, Tests...) with weight and drop-lowest"""
+    __tablename__ = "assignment_categories"
+    __table_args__ = (
+        Index("ix_assignment_categories_classroom", "classroom_id"),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    classroom_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("classrooms.id", ondelete="CASCADE"), nullable=False)
+    name: Mapped[str] = mapped_column(String(100), nullable=False)
+    weight: Mapped[Decimal] = mapped_column(Numeric(5, 2), nullable=False, default=1)
+    drop_lowest: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    color: Mapped[Optional[str]] = mapped_column(String(7), nullable=True)  # "#RRGGBB"
+    is_active: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True)
+    display_order: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=lambda: datetime.now(timezone.utc))
+
+    # Relationships
+    assignments = relationship("Assignment", back_populates="category")
+
+    def __repr__(self):
+        return f"<AssignmentCategory {self.name} w={self.weight} drop={self.drop_lowest}>"
+
+class Assignment(Base):
+    __tablename__ = "assignments"
+    __table_args__ = (
+        Index("ix_assignments_classroom", "classroom_id"),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    classroom_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("classrooms.id", ondelete="CASCADE"), nullable=False)
+    category_id: Mapped[Optional[uuid.UUID]] = mapped_column(UUID(as_uuid=True), ForeignKey("assignment_categories.id"), nullable=True)
+    title: Mapped[str] = mapped_column(String(200), nullable=False)
+    description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    points_possible: Mapped[Decimal] = mapped_column(Numeric(7, 2), nullable=False)
+    assigned_date: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    due_date: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+
+    # Policies
+    allow_late: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True)
+    late_penalty: Mapped[Optional[Decimal]] = mapped_column(Numeric(5, 2), nullable=True)  # Overrides the class policy
+    weight_override: Mapped[Optional[Decimal]] = mapped_column(Numeric(5, 2), nullable=True)  # Replaces points_possible as the in-category weight
+    is_extra_credit: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+    is_published: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+
+    created_by: Mapped[Optional[uuid.UUID]] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=lambda: datetime.now(timezone.utc))
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc))
+
+    # Relationships
+    category = relationship("AssignmentCategory", back_populates="assignments")
+    grades = relationship("Grade", back_populates="assignment", cascade="all, delete-orphan")
+
+    def __repr__(self):
+        return f"<Assignment {self.title} ({self.points_possible} pts)>"
+
+class Grade(Base):
+    __tablename__ = "grades"
+    __table_args__ = (
+        UniqueConstraint("assignment_id", "student_id", name="uq_grades_assignment_student"),
+        Index("ix_grades_student", "student_id"),
+        CheckConstraint(
+            "status IN ('GRADED', 'MISSING', 'LATE', 'EXCUSED', 'IN_PROGRESS')",
+            name="ck_grades_status",
+        ),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    assignment_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("assignments.id", ondelete="CASCADE"), nullable=False)
+    student_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("students.id"), nullable=False)
+    points_earned: Mapped[Optional[Decimal]] = mapped_column(Numeric(7, 2), nullable=True)
+    status: Mapped[str] = mapped_column(String(20), nullable=False, default="GRADED")
+    comments: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    shareable: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+    graded_by: Mapped[Optional[uuid.UUID]] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=True)
+    graded_date: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=lambda: datetime.now(timezone.utc))
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc))
+
+    # Relationships
+    assignment = relationship("Assignment", back_populates="grades")
+    student = relationship("Student")
+
+    def __repr__(self):
+        return f"<Grade {self.student_id} {self.points_earned} {self.status}>"
+
+class GradeHistory(Base):
+    """Audit trail: one row per grade change (old and new values)"""
+    __tablename__ = "grade_history"
+    __table_args__ = (
+        Index("ix_grade_history_assignment_student", "assignment_id", "student_id", "changed_at"),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    grade_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("grades.id", ondelete="CASCADE"), nullable=False)
+    assignment_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("assignments.id", ondelete="CASCADE"), nullable=False)
+    student_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("students.id"), nullable=False)
+    old_points_earned: Mapped[Optional[Decimal]] = mapped_column(Numeric(7, 2), nullable=True)
+    new_points_earned: Mapped[Optional[Decimal]] = mapped_column(Numeric(7, 2), nullable=True)
+    old_status: Mapped[Optional[str]] = mapped_column(String(20), nullable=True)  # None = grade created
+    new_status: Mapped[str] = mapped_column(String(20), nullable=False)
+    reason: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    source: Mapped[str] = mapped_column(String(20), nullable=False, default="TEACHER_UI")  # TEACHER_UI, BULK_ENTRY, ADMIN_UI
+    changed_by: Mapped[Optional[uuid.UUID]] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=True)
+    changed_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=lambda: datetime.now(timezone.utc))
+
+    def __repr__(self):
+        return f"<GradeHistory {self.student_id} {self.old_points_earned}->{self.new_points_earned}>"
+
+class ClassPolicy(Base):
+    """Per-classroom calculation policy"""
+    __tablename__ = "class_policies"
+
+    classroom_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("classrooms.id", ondelete="CASCADE"), primary_key=True)
+    late_policy_type: Mapped[str] = mapped_column(String(10), nullable=False, default="PERCENT")  # PERCENT, POINTS
+    late_penalty: Mapped[Decimal] = mapped_column(Numeric(5, 2), nullable=False, default=0)
+    calculate_missing_as_zero: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True)
+    rounding_decimals: Mapped[int] = mapped_column(Integer, nullable=False, default=2)
+
+    def __repr__(self):
+        return f"<ClassPolicy {self.classroom_id} late={self.late_policy_type}:{self.late_penalty}>"
+
+class StudentGradeAverage(Base):
+    """Cached class averages per student, served to parent/student views as-is.
+
+    ``state`` holds the running category sums used to apply single-score edits
+    incrementally (see services.gradebook_incremental); it is deferred so plain
+    reads never load it.
+    """
+    __tablename__ = "student_grade_averages"
+    __table_args__ = (
+        Index("ix_student_grade_averages_student", "student_id"),
+    )
+
+    classroom_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("classrooms.id", ondelete="CASCADE"), primary_key=True)
+    student_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("students.id", ondelete="CASCADE"), primary_key=True)
+    overall_percent: Mapped[Optional[Decimal]] = mapped_column(Numeric(6, 2), nullable=True)
+    category_percents: Mapped[dict] = mapped_column(JSONB, nullable=False, default=dict)  # {category_id|"uncategorized": percent|null}
+    state: Mapped[dict] = mapped_column(JSONB, nullable=False, deferred=True)
+    computed_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=lambda: datetime.now(timezone.utc))
+
+    def __repr__(self):
+        return f"<StudentGradeAverage {self.student_id} {self.overall_percent}>"
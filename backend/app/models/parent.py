@@ -4,6 +4,7 @@ from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy import String, Boolean, ForeignKey
 from sqlalchemy.dialects.postgresql import UUID
 import uuid
+from typing import Optional
 from .base import Base
 
 class Parent(Base):
@@ -19,6 +20,7 @@ class Parent(Base):
     
     # Contact preferences
     preferred_contact_method: Mapped[str] = mapped_column(String(20), default="EMAIL")  # "EMAIL", "PHONE", "TEXT"
+    phone: Mapped[Optional[str]] = mapped_column(String(30), nullable=True)
     
     # Relationships
     user = relationship("User", back_populates="parent_profile")  # Link to user account
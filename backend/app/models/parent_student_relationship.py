@@ -4,13 +4,19 @@
 # backend/app/models/parent_student_relationship.py
 
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy import String, Boolean, Integer, ForeignKey
+from sqlalchemy import String, Boolean, Integer, ForeignKey, Index, text
 from sqlalchemy.dialects.postgresql import UUID
 import uuid
 from .base import Base
 
 class ParentStudentRelationship(Base):
     __tablename__ = "parent_student_relationships"
+    __table_args__ = (
+        Index(
+            "ix_parent_student_relationships_emergency", "student_id", "emergency_priority",
+            postgresql_where=text("is_emergency_contact AND is_active"),
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     parent_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("parents.id"), nullable=False)
@@ -61,7 +67,7 @@ class ParentStudentRelationship(Base):
     
     @classmethod
     def get_emergency_contacts(cls, session, student_id):
-        """Get emergency contacts for a student, ordered by priority"""
+        """Get emergency contacts for a student, ordered by priority (sync sessions only - the API uses services.emergency_directory)"""
         return session.query(cls).filter(
             cls.student_id == student_id,
             cls.is_emergency_contact == True,
@@ -58,9 +58,11 @@ class Room(Base):
     
     @property
     def is_available(self):
-        """Check if room is currently available for assignment"""
-        # For now, just check if it's active
-        # In the future, this could check scheduling conflicts
+        """Whether the room can be assigned or booked at all.
+
+        Being free at a particular time depends on its bookings - use
+        services.room_booking.is_room_free / free_rooms for that.
+        """
         return self.is_active
     
     @property
@@ -0,0 +1,58 @@
+# backend/app/models/room_booking.py
+# Time-bounded room reservations; Postgres refuses overlapping bookings for the same room
+
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import String, DateTime, ForeignKey, Index, CheckConstraint
+from sqlalchemy.dialects.postgresql import UUID, TSTZRANGE, ExcludeConstraint, Range
+from datetime import datetime, timezone
+from typing import Optional
+import uuid
+from .base import Base
+
+BOOKING_SOURCES = ("CLASS", "EVENT")
+
+class RoomBooking(Base):
+    """A room held for a half-open time range ``[start, end)``.
+
+    CLASS bookings are written by schedule compilation (one per compiled
+    occurrence, removed with it); EVENT bookings are made by staff. The
+    exclusion constraint makes double-booking impossible regardless of source,
+    and its GiST index answers "is this room busy between t1 and t2".
+    """
+    __tablename__ = "room_bookings"
+    __table_args__ = (
+        ExcludeConstraint(
+            ("room_id", "="),
+            ("during", "&&"),
+            name="ex_room_bookings_no_overlap",
+            using="gist",
+        ),
+        CheckConstraint("source IN ('CLASS', 'EVENT')", name="ck_room_bookings_source"),
+        CheckConstraint("NOT isempty(during)", name="ck_room_bookings_not_empty"),
+        Index("ix_room_bookings_occurrence", "occurrence_id"),
+        Index("ix_room_bookings_school_during", "school_id", "during", postgresql_using="gist"),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    room_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("rooms.id", ondelete="CASCADE"), nullable=False)
+    school_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("schools.id", ondelete="CASCADE"), nullable=False)
+    during: Mapped[Range[datetime]] = mapped_column(TSTZRANGE, nullable=False)
+    source: Mapped[str] = mapped_column(String(10), nullable=False, default="EVENT")
+    occurrence_id: Mapped[Optional[uuid.UUID]] = mapped_column(UUID(as_uuid=True), ForeignKey("schedule_occurrences.id", ondelete="CASCADE"), nullable=True)
+    title: Mapped[Optional[str]] = mapped_column(String(200), nullable=True)
+    booked_by: Mapped[Optional[uuid.UUID]] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=lambda: datetime.now(timezone.utc))
+
+    # Relationships
+    room = relationship("Room")
+
+    @property
+    def starts_at(self) -> datetime:
+        return self.during.lower
+
+    @property
+    def ends_at(self) -> datetime:
+        return self.during.upper
+
+    def __repr__(self):
+        return f"<RoomBooking {self.room_id} {self.source} {self.during}>"
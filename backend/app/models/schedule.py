@@ -0,0 +1,110 @@
+# backend/app/models/schedule.py
+# Bell schedule: periods, rotation days, school calendar, class meeting blocks and the compiled daily index
+
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import String, Boolean, Integer, Date, Time, DateTime, ForeignKey, Index, UniqueConstraint, CheckConstraint
+from sqlalchemy.dialects.postgresql import UUID
+from datetime import date, datetime, time, timezone
+from typing import Optional
+import uuid
+from .base import Base
+
+class SchedulePeriod(Base):
+    """A named slot in a school's bell schedule ("Period 1", 08:00-08:50), in school-local time"""
+    __tablename__ = "schedule_periods"
+    __table_args__ = (
+        UniqueConstraint("school_id", "academic_year_id", "name", name="uq_schedule_periods_school_year_name"),
+        CheckConstraint("end_time > start_time", name="ck_schedule_periods_times"),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    school_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("schools.id", ondelete="CASCADE"), nullable=False)
+    academic_year_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("academic_years.id", ondelete="CASCADE"), nullable=False)
+    name: Mapped[str] = mapped_column(String(50), nullable=False)
+    start_time: Mapped[time] = mapped_column(Time, nullable=False)
+    end_time: Mapped[time] = mapped_column(Time, nullable=False)
+    display_order: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    is_active: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True)
+
+    def __repr__(self):
+        return f"<SchedulePeriod {self.name} {self.start_time}-{self.end_time}>"
+
+class RotationDay(Base):
+    """A day type in a rotating schedule ("A"/"B", "Day 1".."Day 6")"""
+    __tablename__ = "rotation_days"
+    __table_args__ = (
+        UniqueConstraint("school_id", "academic_year_id", "name", name="uq_rotation_days_school_year_name"),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    school_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("schools.id", ondelete="CASCADE"), nullable=False)
+    academic_year_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("academic_years.id", ondelete="CASCADE"), nullable=False)
+    name: Mapped[str] = mapped_column(String(20), nullable=False)
+    sequence: Mapped[int] = mapped_column(Integer, nullable=False)  # Position in the cycle, from 1
+
+    def __repr__(self):
+        return f"<RotationDay {self.name} #{self.sequence}>"
+
+class SchoolCalendarDay(Base):
+    """One school-local date: whether classes meet and which rotation day it is"""
+    __tablename__ = "school_calendar_days"
+
+    school_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("schools.id", ondelete="CASCADE"), primary_key=True)
+    calendar_date: Mapped[date] = mapped_column(Date, primary_key=True)
+    academic_year_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("academic_years.id", ondelete="CASCADE"), nullable=False)
+    is_instructional: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True)
+    rotation_day_id: Mapped[Optional[uuid.UUID]] = mapped_column(UUID(as_uuid=True), ForeignKey("rotation_days.id", ondelete="SET NULL"), nullable=True)
+    note: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)  # "Thanksgiving break", "Early release"
+
+    def __repr__(self):
+        return f"<SchoolCalendarDay {self.calendar_date} {'school' if self.is_instructional else 'no school'}>"
+
+class CalendarBlock(Base):
+    """A classroom meeting: this class meets in this period (on this rotation day, or every day)"""
+    __tablename__ = "calendar_blocks"
+    __table_args__ = (
+        Index("ix_calendar_blocks_classroom", "classroom_id"),
+        Index("ix_calendar_blocks_period", "period_id"),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    classroom_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("classrooms.id", ondelete="CASCADE"), nullable=False)
+    period_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("schedule_periods.id", ondelete="CASCADE"), nullable=False)
+    rotation_day_id: Mapped[Optional[uuid.UUID]] = mapped_column(UUID(as_uuid=True), ForeignKey("rotation_days.id", ondelete="CASCADE"), nullable=True)  # None = every instructional day
+    room_id: Mapped[Optional[uuid.UUID]] = mapped_column(UUID(as_uuid=True), ForeignKey("rooms.id"), nullable=True)  # None = the classroom's room
+    effective_from: Mapped[Optional[date]] = mapped_column(Date, nullable=True)
+    effective_to: Mapped[Optional[date]] = mapped_column(Date, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=lambda: datetime.now(timezone.utc))
+
+    # Relationships
+    period = relationship("SchedulePeriod")
+    rotation_day = relationship("RotationDay")
+
+    def __repr__(self):
+        return f"<CalendarBlock {self.classroom_id} period={self.period_id} day={self.rotation_day_id}>"
+
+class ScheduleOccurrence(Base):
+    """Compiled index: one row per block per instructional date, with absolute start/end.
+
+    Generated by services.schedule.compile_schedule - never edited directly.
+    """
+    __tablename__ = "schedule_occurrences"
+    __table_args__ = (
+        UniqueConstraint("block_id", "calendar_date", name="uq_schedule_occurrences_block_date"),
+        Index("ix_schedule_occurrences_classroom_date", "classroom_id", "calendar_date"),
+        Index("ix_schedule_occurrences_room_date", "room_id", "calendar_date", "starts_at"),
+        Index("ix_schedule_occurrences_school_date", "school_id", "calendar_date"),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    block_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("calendar_blocks.id", ondelete="CASCADE"), nullable=False)
+    school_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("schools.id", ondelete="CASCADE"), nullable=False)
+    classroom_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("classrooms.id", ondelete="CASCADE"), nullable=False)
+    period_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("schedule_periods.id", ondelete="CASCADE"), nullable=False)
+    room_id: Mapped[Optional[uuid.UUID]] = mapped_column(UUID(as_uuid=True), ForeignKey("rooms.id"), nullable=True)
+    calendar_date: Mapped[date] = mapped_column(Date, nullable=False)  # School-local date
+    starts_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    ends_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+    def __repr__(self):
+        return f"<ScheduleOccurrence {self.classroom_id} {self.starts_at}-{self.ends_at}>"
@@ -0,0 +1,29 @@
+# backend/app/models/special_need_review_digest.py
+
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import Integer, Date, DateTime, ForeignKey
+from sqlalchemy.dialects.postgresql import UUID, JSONB
+from datetime import date, datetime, timezone
+from typing import Any, List
+import uuid
+from .base import Base
+
+class SpecialNeedReviewDigest(Base):
+    """
+    One school's special-need reviews coming due, as of one school-local day.
+    Built once a day by the review digest job (see services/review_queue.py)
+    so the case manager dashboard reads one row instead of scanning assignments.
+    """
+    __tablename__ = "special_need_review_digests"
+
+    school_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("schools.id", ondelete="CASCADE"), primary_key=True)
+    digest_date: Mapped[date] = mapped_column(Date, primary_key=True)
+    horizon_days: Mapped[int] = mapped_column(Integer, nullable=False)
+    overdue_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)  # review_date before digest_date
+    due_7d_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)  # due within 7 days, overdue excluded
+    due_horizon_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)  # due within horizon_days, overdue excluded
+    items: Mapped[List[Any]] = mapped_column(JSONB, nullable=False, default=list)  # Overdue and upcoming reviews, soonest first
+    generated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=lambda: datetime.now(timezone.utc))
+
+    def __repr__(self):
+        return f"<SpecialNeedReviewDigest {self.school_id} {self.digest_date} overdue={self.overdue_count}>"
@@ -1,7 +1,7 @@
 # backend/app/models/special_needs_tag_library.py
 
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy import String, Boolean, ForeignKey
+from sqlalchemy import String, Boolean, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID
 from typing import Optional
 import uuid
@@ -10,6 +10,9 @@ from .base import Base
 class SpecialNeedsTagLibrary(Base):
     """Admin-configurable library of special needs tags"""
     __tablename__ = "special_needs_tag_library"
+    __table_args__ = (
+        Index("ix_special_needs_tags_school_active_name", "school_id", "is_active", "tag_name"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     tag_name: Mapped[str] = mapped_column(String(50), nullable=False)  # "Speech Therapy", "Reading Support"
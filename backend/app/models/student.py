@@ -2,16 +2,42 @@
 # TYPE: FULL REPLACEMENT
 # PATH: backend/app/models/student.py
 
-from sqlalchemy import Column, String, Date, Boolean, DateTime, ForeignKey, func, select
-from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import Mapped, mapped_column, relationship, column_property
+from sqlalchemy import Column, String, Text, Date, Boolean, DateTime, ForeignKey, Index, Computed, func, select
+from sqlalchemy.dialects.postgresql import UUID, TSVECTOR
+from sqlalchemy.orm import Mapped, mapped_column, relationship, column_property, deferred
 from sqlalchemy.ext.hybrid import hybrid_property
 from datetime import date, datetime, timezone
 import uuid
 from .base import Base
 
+# Search document: name, external ID and email (split on @ and . so each part is a word)
+SEARCH_DOCUMENT = (
+    "first_name || ' ' || last_name || ' ' || coalesce(student_id, '') || ' ' || "
+    "translate(coalesce(email, ''), '@.', '  ')"
+)
+
+# Promotion workflow: each grade's next grade (8th graders graduate)
+GRADE_PROGRESSION = {
+    'PK': 'K',
+    'K': '1',
+    '1': '2',
+    '2': '3',
+    '3': '4',
+    '4': '5',
+    '5': '6',
+    '6': '7',
+    '7': '8',
+    '8': 'GRADUATED',
+}
+
 class Student(Base):
     __tablename__ = "students"
+    __table_args__ = (
+        Index("ix_students_school_name", "school_id", "last_name", "first_name"),
+        Index("ix_students_school_student_id", "school_id", "student_id"),
+        Index("ix_students_search_text_trgm", "search_text", postgresql_using="gin", postgresql_ops={"search_text": "gin_trgm_ops"}),
+        Index("ix_students_search_vector", "search_vector", postgresql_using="gin"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     school_id = Column(UUID(as_uuid=True), ForeignKey('schools.id', ondelete='CASCADE'), nullable=False)
@@ -35,6 +61,10 @@ class Student(Base):
     created_at = Column(DateTime(timezone=True), nullable=False, default=lambda: datetime.now(timezone.utc))
     updated_at = Column(DateTime(timezone=True), nullable=False, default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc))
 
+    # Search columns (generated by Postgres, deferred so normal loads skip them)
+    search_text = deferred(Column(Text, Computed(f"lower({SEARCH_DOCUMENT})", persisted=True)))
+    search_vector = deferred(Column(TSVECTOR, Computed(f"to_tsvector('simple', {SEARCH_DOCUMENT})", persisted=True)))
+
     # Relationships
     school = relationship("School", back_populates="students")
     enrollments = relationship("Enrollment", back_populates="student", cascade="all, delete-orphan")
@@ -78,20 +108,7 @@ class Student(Base):
     
     def promote_to_next_grade(self):
         """Helper method for grade promotion"""
-        grade_progression = {
-            'PK': 'K',
-            'K': '1',
-            '1': '2',
-            '2': '3',
-            '3': '4',
-            '4': '5',
-            '5': '6',
-            '6': '7',
-            '7': '8',
-            '8': 'GRADUATED'
-        }
-        
-        if self.current_grade_level in grade_progression:
-            self.current_grade_level = grade_progression[self.current_grade_level]
+        if self.current_grade_level in GRADE_PROGRESSION:
+            self.current_grade_level = GRADE_PROGRESSION[self.current_grade_level]
             return True
         return False
\ No newline at end of file
@@ -0,0 +1,28 @@
+# backend/app/models/student_flags.py
+
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import Integer, DateTime, ForeignKey
+from sqlalchemy.dialects.postgresql import UUID
+from datetime import datetime, timezone
+import uuid
+from .base import Base
+
+class StudentFlags(Base):
+    """
+    Per-student counts shown on list screens, kept current by the write paths
+    (see services/student_flags.py) so lists join one row instead of aggregating.
+    A student without a row has no special needs and no parents.
+    """
+    __tablename__ = "student_flags"
+
+    student_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("students.id", ondelete="CASCADE"), primary_key=True)
+    special_need_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)  # Active StudentSpecialNeed rows
+    parent_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)  # Active ParentStudentRelationship rows
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=lambda: datetime.now(timezone.utc))
+
+    @property
+    def has_special_needs(self) -> bool:
+        return self.special_need_count > 0
+
+    def __repr__(self):
+        return f"<StudentFlags {self.student_id} needs={self.special_need_count} parents={self.parent_count}>"
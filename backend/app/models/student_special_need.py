@@ -1,7 +1,7 @@
 # backend/app/models/student_special_need.py
 
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy import String, Date, Boolean, ForeignKey
+from sqlalchemy import String, Date, Boolean, ForeignKey, Index, text
 from sqlalchemy.dialects.postgresql import UUID
 from datetime import date
 from typing import Optional
@@ -11,6 +11,15 @@ from .base import Base
 class StudentSpecialNeed(Base):
     """Individual student special needs assignments"""
     __tablename__ = "student_special_needs"
+    __table_args__ = (
+        Index("ix_student_special_needs_tag_active", "tag_library_id", "student_id", postgresql_where=text("is_active")),
+        # Review due-queue: active assignments with a review date, walked in (review_date, id) order
+        Index(
+            "ix_student_special_needs_review_due",
+            "review_date", "id",
+            postgresql_where=text("is_active AND review_date IS NOT NULL"),
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     student_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("students.id"), nullable=False)
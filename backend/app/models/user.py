@@ -1,15 +1,21 @@
 # backend/app/models/user.py - Updated with parent profile relationship
 
-from sqlalchemy import Column, String, Boolean, DateTime
-from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, String, Text, Boolean, DateTime, Index, Computed
+from sqlalchemy.dialects.postgresql import UUID, TSVECTOR
+from sqlalchemy.orm import relationship, deferred
 import uuid
 from datetime import datetime, timezone
 
 from .base import Base
 
+SEARCH_DOCUMENT = "first_name || ' ' || last_name || ' ' || translate(email, '@.', '  ')"
+
 class User(Base):
     __tablename__ = 'users'
+    __table_args__ = (
+        Index('ix_users_search_text_trgm', 'search_text', postgresql_using='gin', postgresql_ops={'search_text': 'gin_trgm_ops'}),
+        Index('ix_users_search_vector', 'search_vector', postgresql_using='gin'),
+    )
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     email = Column(String, unique=True, nullable=False, index=True)
     hashed_password = Column(String, nullable=False)
@@ -20,6 +26,10 @@ class User(Base):
 
     created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), nullable=False)
     updated_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc), nullable=False)
+
+    # Search columns (generated by Postgres, deferred so normal loads skip them)
+    search_text = deferred(Column(Text, Computed(f"lower({SEARCH_DOCUMENT})", persisted=True)))
+    search_vector = deferred(Column(TSVECTOR, Computed(f"to_tsvector('simple', {SEARCH_DOCUMENT})", persisted=True)))
     
     # Relationships
     user_roles = relationship("UserRole", back_populates="user", cascade="all, delete-orphan")
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey
+from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 import uuid
@@ -8,6 +8,9 @@ from .base import Base
 
 class UserRole(Base):
     __tablename__ = 'user_roles'
+    __table_args__ = (
+        Index('ix_user_roles_user_active', 'user_id', 'is_active'),
+    )
     
     user_id = Column(UUID(as_uuid=True), ForeignKey('users.id', ondelete='CASCADE'), primary_key=True)
     role = Column(String, nullable=False, primary_key=True)  # allow multiple roles per user per school
@@ -1,10 +1,16 @@
 from fastapi import APIRouter, Depends, HTTPException, status
+from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, update
 from typing import List
 from ..deps import get_db, require_admin, get_current_user
 from ..models.academic_year import AcademicYear
-from ..schemas.academic_year import AcademicYearCreate, AcademicYearOut, AcademicYearUpdate
+from ..models.user import User
+from ..schemas.academic_year import AcademicYearCreate, AcademicYearOut, AcademicYearUpdate, AcademicYearRolloverRequest
+from ..schemas.job import JobOut
+from ..services import year_partitions
+from ..services.jobs import start_job
+from ..services.year_rollover import rollover_year
 
 router = APIRouter(prefix="/academic-years", tags=["academic-years"])
 
@@ -71,6 +77,8 @@ async def create_academic_year(
     )
     
     session.add(academic_year)
+    await session.flush()
+    await year_partitions.ensure_year_partitions(session, academic_year)
     await session.commit()
     await session.refresh(academic_year)
     return academic_year
@@ -82,8 +90,6 @@ async def activate_academic_year(
     _: any = Depends(require_admin),
 ):
     """Set an academic year as the active one"""
-    from uuid import UUID
-    
     # Deactivate all years
     await session.execute(
         update(AcademicYear).values(is_active=False)
@@ -95,6 +101,90 @@ async def activate_academic_year(
         raise HTTPException(status_code=404, detail="Academic year not found")
     
     academic_year.is_active = True
+    await year_partitions.ensure_year_partitions(session, academic_year)
     await session.commit()
     await session.refresh(academic_year)
-    return academic_year
\ No newline at end of file
+    return academic_year
+
+@router.post("/{year_id}/rollover", response_model=JobOut, status_code=status.HTTP_202_ACCEPTED)
+async def rollover_academic_year(
+    year_id: str,
+    payload: AcademicYearRolloverRequest,
+    session: AsyncSession = Depends(get_db),
+    current_user: User = Depends(require_admin),
+):
+    """Clone classes, teacher and room assignments from a previous year into this one; poll GET /jobs/{id}.
+
+    Safe to re-run: anything already cloned is skipped. Use dry_run to see the counts first.
+    """
+    try:
+        target_id = UUID(year_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid year_id")
+    target = await session.get(AcademicYear, target_id)
+    source = await session.get(AcademicYear, payload.source_academic_year_id)
+    if not target or not source:
+        raise HTTPException(status_code=404, detail="Academic year not found")
+    if source.id == target.id:
+        raise HTTPException(status_code=400, detail="Source and target academic years must differ")
+    if source.start_date >= target.start_date:
+        raise HTTPException(status_code=400, detail="Source academic year must start before the target year")
+
+    job = await start_job(
+        "year_rollover", rollover_year, source.id, target.id,
+        include_rooms=payload.include_rooms,
+        include_teachers=payload.include_teachers,
+        pre_enroll_homerooms=payload.pre_enroll_homerooms,
+        dry_run=payload.dry_run,
+        created_by=current_user.id,
+        params={"source_academic_year_id": source.id, "target_academic_year_id": target.id, **payload.dict(exclude={"source_academic_year_id"})},
+    )
+    return job.to_dict()
+
+# Year partitions of enrollments and attendance marks
+@router.get("/partitions")
+async def list_year_partitions(
+    session: AsyncSession = Depends(get_db),
+    _: User = Depends(require_admin),
+):
+    """Each year's enrollment and attendance partitions, attached or archived, with estimated rows"""
+    return await year_partitions.list_partitions(session)
+
+@router.post("/{year_id}/archive")
+async def archive_academic_year(
+    year_id: str,
+    session: AsyncSession = Depends(get_db),
+    _: User = Depends(require_admin),
+):
+    """Detach a closed year's enrollment and attendance partitions into the archive schema"""
+    year = await _get_year(session, year_id)
+    try:
+        archived = await year_partitions.archive_year(session, year)
+    except year_partitions.PartitionError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    await session.commit()
+    return {"academic_year_id": year.id, "archived": archived}
+
+@router.post("/{year_id}/restore")
+async def restore_academic_year(
+    year_id: str,
+    session: AsyncSession = Depends(get_db),
+    _: User = Depends(require_admin),
+):
+    """Attach an archived year's partitions back so its enrollments and attendance are live again"""
+    year = await _get_year(session, year_id)
+    try:
+        restored = await year_partitions.restore_year(session, year)
+    except year_partitions.PartitionError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    await session.commit()
+    return {"academic_year_id": year.id, "restored": restored}
+
+async def _get_year(session: AsyncSession, year_id: str) -> AcademicYear:
+    try:
+        year = await session.get(AcademicYear, UUID(year_id))
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid year_id")
+    if not year:
+        raise HTTPException(status_code=404, detail="Academic year not found")
+    return year
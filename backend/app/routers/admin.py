@@ -2,12 +2,14 @@ from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from typing import List
-from ..deps import get_db, require_admin, get_current_user
+from ..deps import get_db, get_scoped_db, require_admin, get_current_user
 from ..models.user import User
 from ..models.user_role import UserRole
 from ..models.school import School
 from ..schemas.user import UserCreate, UserOut
 from ..security import get_password_hash
+from ..services import live_events
+from ..services.tenant import school_scope
 
 
 router = APIRouter(prefix="/admin", tags=["admin"])
@@ -71,10 +73,11 @@ async def list_users(session: AsyncSession = Depends(get_db), _: any = Depends(r
 @router.get("/teachers")
 async def list_teachers(
     school_id: str | None = None,
-    session: AsyncSession = Depends(get_db),
+    session: AsyncSession = Depends(get_scoped_db),
     _: any = Depends(require_admin),
 ):
-    # users having a teacher role at a given school (or any school if not provided)
+    # users having a teacher role at a given school (default: the admin's current school, else any)
+    school_id = school_id or school_scope(session)
     stmt = (
         select(User)
         .join(UserRole, UserRole.user_id == User.id)
@@ -89,6 +92,15 @@ async def list_teachers(
         for u in users
     ]
 
+def _notify_roles_changed(session: AsyncSession, user_id, school_id) -> None:
+    live_events.notify(
+        session,
+        [live_events.user_topic(user_id), live_events.school_topic(school_id)],
+        live_events.ROLES_CHANGED,
+        user_id=user_id,
+        school_id=school_id,
+    )
+
 @router.post("/users", response_model=UserOut)
 async def create_user(
     user_data: UserCreate, 
@@ -146,6 +158,7 @@ async def create_user(
 
         # Create new role assignment
         session.add(UserRole(user_id=user.id, role=user_data.role, school_id=user_data.school_id, is_active=True))
+        _notify_roles_changed(session, user.id, user_data.school_id)
         await session.commit()
         return await _serialize_user(user)
 
@@ -167,6 +180,7 @@ async def create_user(
         if not school:
             raise HTTPException(status_code=400, detail="School not found")
         session.add(UserRole(user_id=user.id, role=user_data.role, school_id=user_data.school_id, is_active=True))
+        _notify_roles_changed(session, user.id, user_data.school_id)
         await session.commit()
 
     return await _serialize_user(user)
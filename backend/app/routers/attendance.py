@@ -0,0 +1,161 @@
+# backend/app/routers/attendance.py
+# Class session attendance sheet (Phase A attendance spec)
+
+from collections import Counter
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import date
+from typing import Optional
+from uuid import UUID
+
+from ..deps import get_db, get_current_user
+from ..models.user import User
+from ..schemas.attendance import (
+    AttendanceSheetOut,
+    AttendanceSaveRequest,
+    AttendanceSaveResponse,
+    AttendanceSyncRequest,
+    AttendanceSyncResponse,
+)
+from ..services import attendance as attendance_service
+from ..services import attendance_stats
+from ..services import live_events
+from ..services.attendance_sync import apply_sync_batch, APPLIED, CONFLICT, REJECTED
+from ..services.roster_cache import get_roster
+from ..services.timezone import school_today
+
+router = APIRouter(prefix="/attendance", tags=["attendance"])
+
+def _parse_classroom_id(classroom_id: str) -> UUID:
+    try:
+        return UUID(classroom_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid classroom_id")
+
+@router.get("/classrooms/{classroom_id}/sheet", response_model=AttendanceSheetOut)
+async def get_attendance_sheet(
+    classroom_id: str,
+    session_date: Optional[date] = Query(None, description="Defaults to today (school time zone)"),
+    session: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Active roster with saved marks; unmarked students default to Present"""
+    classroom_uuid = _parse_classroom_id(classroom_id)
+    tz = await attendance_service.classroom_tz(session, classroom_uuid)
+    session_date = session_date or school_today(tz)
+
+    access = await attendance_service.get_access(session, current_user.id, classroom_uuid)
+    if not access.can_view:
+        raise HTTPException(status_code=403, detail="PERMISSION_DENIED")
+
+    sheet = await attendance_service.load_sheet(session, classroom_uuid, session_date, tz)
+    if sheet is None:
+        raise HTTPException(status_code=404, detail="Classroom not found")
+    return sheet
+
+@router.put("/classrooms/{classroom_id}/sheet", response_model=AttendanceSaveResponse)
+async def save_attendance_sheet(
+    classroom_id: str,
+    payload: AttendanceSaveRequest,
+    session_date: Optional[date] = Query(None, description="Defaults to today (school time zone)"),
+    session: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Save all marks for the session in one upsert"""
+    classroom_uuid = _parse_classroom_id(classroom_id)
+    tz = await attendance_service.classroom_tz(session, classroom_uuid)
+    session_date = session_date or school_today(tz)
+
+    access = await attendance_service.get_access(session, current_user.id, classroom_uuid)
+    if not access.can_edit:
+        raise HTTPException(status_code=403, detail="PERMISSION_DENIED")
+
+    if attendance_service.is_locked(session_date, tz):
+        if not access.is_admin:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="ATTENDANCE_LOCKED: Attendance is locked for this class. Request an admin override to make changes.",
+            )
+        if not (payload.edited_reason or "").strip():
+            raise HTTPException(status_code=400, detail="edited_reason is required to edit a locked sheet")
+
+    try:
+        roster = await get_roster(session, classroom_uuid, active_only=True)
+        if roster is None:
+            raise HTTPException(status_code=404, detail="Classroom not found")
+        rostered = {row.id for row in roster}
+
+        # Last entry wins if the client sent a student twice
+        marks = {}
+        errors = []
+        for mark in payload.marks:
+            if mark.student_id in rostered:
+                marks[mark.student_id] = mark.dict()
+            else:
+                errors.append({
+                    "student_id": mark.student_id,
+                    "code": "NOT_ENROLLED",
+                    "message": "Student is not on this class's active roster",
+                })
+
+        session_id, academic_year_id = await attendance_service.ensure_session(
+            session, classroom_uuid, session_date, current_user.id
+        )
+        saved = await attendance_service.upsert_marks(
+            session,
+            session_id,
+            academic_year_id,
+            list(marks.values()),
+            recorded_by=current_user.id,
+            source="ADMIN_UI" if access.is_admin else "TEACHER_UI",
+            edited_reason=payload.edited_reason,
+        )
+        await attendance_stats.apply_marks(
+            session,
+            [(r.student_id, classroom_uuid, academic_year_id, session_date, r.status) for r in saved],
+        )
+        if saved:
+            await live_events.notify_attendance_submitted(session, classroom_uuid, session_date, len(saved))
+        await session.commit()
+
+        saved_ids = {row.student_id for row in saved}
+        return {
+            "session_id": session_id,
+            "saved": [{"student_id": r.student_id, "status": r.status, "version": r.version} for r in saved],
+            "unchanged": [student_id for student_id in marks if student_id not in saved_ids],
+            "errors": errors,
+        }
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        await session.rollback()
+        raise HTTPException(status_code=500, detail=f"Failed to save attendance: {str(e)}")
+
+@router.post("/sync", response_model=AttendanceSyncResponse)
+async def sync_offline_marks(
+    payload: AttendanceSyncRequest,
+    session: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Apply an offline queue of mark changes (any sessions) in one transaction"""
+    try:
+        results = await apply_sync_batch(session, current_user.id, payload.mutations)
+        applied = Counter(
+            (m.classroom_id, m.session_date)
+            for m, r in zip(payload.mutations, results)
+            if r["outcome"] == APPLIED and not r.get("replayed")
+        )
+        for (classroom_id, session_date), marks in applied.items():
+            await live_events.notify_attendance_submitted(session, classroom_id, session_date, marks)
+        await session.commit()
+    except Exception as e:
+        await session.rollback()
+        raise HTTPException(status_code=500, detail=f"Failed to sync attendance: {str(e)}")
+
+    return {
+        "applied": sum(1 for r in results if r["outcome"] == APPLIED),
+        "conflicts": sum(1 for r in results if r["outcome"] == CONFLICT),
+        "rejected": sum(1 for r in results if r["outcome"] == REJECTED),
+        "results": results,
+    }
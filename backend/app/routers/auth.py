@@ -11,6 +11,7 @@ from ..models.school import School
 from ..security import verify_password, create_access_token
 from ..schemas.auth import Token
 from ..schemas.user import UserOut
+from ..services import live_events
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
@@ -123,6 +124,9 @@ async def set_preference(
     else:
         pref.role = role
         pref.school_id = school_id
+    # Other tabs of this user reload their auth context
+    live_events.notify(session, [live_events.user_topic(user.id)], live_events.ROLES_CHANGED,
+                       user_id=user.id, school_id=school_id)
     await session.commit()
     await session.refresh(pref)
     return {"status": "ok", "active_role": pref.role, "active_school": str(pref.school_id)}
@@ -9,7 +9,7 @@ from typing import List, Optional
 import uuid
 from uuid import UUID
 
-from ..deps import get_db, require_admin, get_current_user
+from ..deps import get_db, get_scoped_db, require_admin, get_current_user
 from ..models.classroom import Classroom
 from ..models.subject import Subject
 from ..models.academic_year import AcademicYear
@@ -17,6 +17,9 @@ from ..models.room import Room
 from ..models.user import User
 from ..models.classroom_teacher_assignment import ClassroomTeacherAssignment
 from ..schemas.classroom import ClassroomCreate, ClassroomOut, ClassroomWithDetails, ClassroomUpdate
+from ..services import live_events
+from ..services.schedule import recompile_classrooms
+from ..services.tenant import school_scope
 
 router = APIRouter(prefix="/classrooms", tags=["classrooms"])
 
@@ -25,7 +28,7 @@ async def list_classrooms(
     academic_year_id: Optional[str] = None,
     subject_id: Optional[str] = None,
     teacher_user_id: Optional[str] = None,
-    session: AsyncSession = Depends(get_db),
+    session: AsyncSession = Depends(get_scoped_db),
     _: any = Depends(get_current_user),
 ):
     """List classrooms with optional filtering - FIXED to load all relationships"""
@@ -66,7 +69,7 @@ async def list_classrooms(
     academic_year_id: Optional[str] = None,
     subject_id: Optional[str] = None,
     teacher_user_id: Optional[str] = None,
-    session: AsyncSession = Depends(get_db),
+    session: AsyncSession = Depends(get_scoped_db),
     _: any = Depends(get_current_user),
 ):
     """List classrooms with optional filtering - DEBUG VERSION"""
@@ -118,7 +121,7 @@ async def list_classrooms(
 @router.post("", response_model=ClassroomOut, status_code=status.HTTP_201_CREATED)
 async def create_classroom(
     payload: ClassroomCreate,
-    session: AsyncSession = Depends(get_db),
+    session: AsyncSession = Depends(get_scoped_db),
     _: any = Depends(require_admin),
 ):
     """Create a new classroom with enhanced validation and room assignment"""
@@ -148,7 +151,9 @@ async def create_classroom(
         "academic_year_id": UUID(payload.academic_year_id),
         "grade_level": payload.grade_level,
         "classroom_type": payload.classroom_type,
-        "max_students": payload.max_students
+        "max_students": payload.max_students,
+        # The room's school, else the school the admin is working in
+        "school_id": room.school_id if room else school_scope(session),
     }
     
     # Add room assignment if provided
@@ -168,7 +173,7 @@ async def create_classroom(
 @router.post("/homeroom", response_model=ClassroomOut, status_code=status.HTTP_201_CREATED)
 async def create_homeroom_classroom(
     payload: dict,
-    session: AsyncSession = Depends(get_db),
+    session: AsyncSession = Depends(get_scoped_db),
     _: any = Depends(require_admin),
 ):
     """
@@ -239,7 +244,8 @@ async def create_homeroom_classroom(
             "academic_year_id": UUID(academic_year_id),
             "grade_level": grade_level,
             "classroom_type": "HOMEROOM",
-            "max_students": max_students
+            "max_students": max_students,
+            "school_id": room.school_id if room else school_scope(session),
         }
         
         # Add room assignment if provided
@@ -265,6 +271,8 @@ async def create_homeroom_classroom(
             is_active=True
         )
         session.add(teacher_assignment)
+        live_events.notify(session, [live_events.user_topic(teacher.id)], live_events.ASSIGNMENTS_CHANGED,
+                           classroom_id=classroom.id)
         
         await session.commit()
         await session.refresh(classroom)
@@ -297,6 +305,8 @@ async def update_classroom(
     if not classroom:
         raise HTTPException(status_code=404, detail="Classroom not found")
     
+    previous_room_id = classroom.room_id
+
     # Validate room if being updated
     if payload.room_id is not None:
         if payload.room_id == "":
@@ -317,6 +327,11 @@ async def update_classroom(
         classroom.classroom_type = payload.classroom_type
     if payload.max_students is not None:
         classroom.max_students = payload.max_students
+
+    # Upcoming meetings that use the classroom's room move with it
+    if classroom.room_id != previous_room_id:
+        await session.flush()
+        await recompile_classrooms(session, [classroom.id])
     
     await session.commit()
     await session.refresh(classroom, ["subject", "academic_year", "room"])
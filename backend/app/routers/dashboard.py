@@ -1,9 +1,11 @@
 from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import exists, select, func
 import sqlalchemy as sa
+from datetime import timedelta
+from uuid import UUID
 
-from ..deps import get_db, require_admin, require_role, get_current_user
+from ..deps import _is_adminish, get_db, require_admin, require_role, get_current_user
 from ..models.user import User
 from ..models.user_role import UserRole
 from ..models.school import School
@@ -11,6 +13,10 @@ from ..models.school_year import SchoolYear
 from ..models.enrollment import Enrollment
 from ..models.classroom import Classroom
 from ..models.student import Student
+from ..models.classroom_teacher_assignment import ClassroomTeacherAssignment
+from ..models.attendance import StudentAttendanceStats
+from ..services.attendance_stats import ALERT_STREAK, WINDOW_DAYS
+from ..services.timezone import school_today
 
 router = APIRouter(prefix="/dashboard", tags=["dashboard"])
 
@@ -160,6 +166,81 @@ async def teacher_overview(
     }
 
 
+@router.get("/attendance_alerts")
+async def attendance_alerts(
+    classroom_id: str | None = None,
+    user: User = Depends(get_current_user),
+    session: AsyncSession = Depends(get_db),
+    _: User = Depends(require_role("teacher", "admin")),
+):
+    """Absent/tardy streaks and high 30-day absence rates, read from precomputed stats.
+
+    ``has_alert`` only changes when a new mark arrives, so alerts for students
+    no longer enrolled in the class, or for classes with no session in the
+    window, are left out here rather than shown forever.
+    """
+    window_start = school_today(None) - timedelta(days=WINDOW_DAYS)
+    query = (
+        select(StudentAttendanceStats, Student.first_name, Student.last_name, Classroom.name)
+        .join(Student, Student.id == StudentAttendanceStats.student_id)
+        .join(Classroom, Classroom.id == StudentAttendanceStats.classroom_id)
+        .where(
+            StudentAttendanceStats.has_alert == True,
+            StudentAttendanceStats.last_session_date >= window_start,
+            exists().where(
+                # Matching the stats row's year keeps the probe to that year's enrollments partition
+                Enrollment.academic_year_id == StudentAttendanceStats.academic_year_id,
+                Enrollment.student_id == StudentAttendanceStats.student_id,
+                Enrollment.classroom_id == StudentAttendanceStats.classroom_id,
+                Enrollment.is_active == True,
+            ),
+        )
+    )
+    if classroom_id:
+        query = query.where(StudentAttendanceStats.classroom_id == UUID(classroom_id))
+
+    # Teachers only see alerts for classrooms they are assigned to
+    roles = (await session.execute(
+        select(UserRole.role).where(UserRole.user_id == user.id, UserRole.is_active == True)
+    )).scalars().all()
+    if not any(_is_adminish(r) for r in roles):
+        query = query.where(StudentAttendanceStats.classroom_id.in_(
+            select(ClassroomTeacherAssignment.classroom_id).where(
+                ClassroomTeacherAssignment.teacher_user_id == user.id,
+                ClassroomTeacherAssignment.is_active == True,
+            )
+        ))
+
+    rows = (await session.execute(
+        query.order_by(StudentAttendanceStats.absent_streak.desc(), Student.last_name, Student.first_name)
+    )).all()
+
+    alerts = []
+    for stats, first_name, last_name, classroom_name in rows:
+        reasons = []
+        if stats.absent_streak >= ALERT_STREAK:
+            reasons.append(f"Absent {stats.absent_streak} sessions in a row")
+        if stats.tardy_streak >= ALERT_STREAK:
+            reasons.append(f"Tardy {stats.tardy_streak} sessions in a row")
+        if not reasons:
+            reasons.append(f"Absent {stats.absences_30d} of last {stats.sessions_30d} sessions")
+        alerts.append({
+            "student_id": str(stats.student_id),
+            "student_name": f"{first_name} {last_name}",
+            "classroom_id": str(stats.classroom_id),
+            "classroom_name": classroom_name,
+            "absent_streak": stats.absent_streak,
+            "tardy_streak": stats.tardy_streak,
+            "absences_30d": stats.absences_30d,
+            "sessions_30d": stats.sessions_30d,
+            "absence_rate_30d": float(stats.absence_rate_30d),
+            "last_session_date": stats.last_session_date.isoformat() if stats.last_session_date else None,
+            "reasons": reasons,
+        })
+
+    return {"count": len(alerts), "alerts": alerts}
+
+
 @router.get("/parent_overview")
 async def parent_overview(
     user: User = Depends(get_current_user),
@@ -0,0 +1,61 @@
+# backend/app/routers/diagnostics.py
+# Admin-only runtime diagnostics (slow-query log, in-process caches)
+
+from fastapi import APIRouter, Depends, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
+
+from ..config import get_settings
+from ..deps import get_db, require_admin
+from ..services.slow_queries import get_slow_query_log
+from ..services.roster_cache import get_roster_cache
+from ..services.student_flags import refresh_flags
+
+router = APIRouter(prefix="/diagnostics", tags=["diagnostics"])
+
+@router.get("/slow-queries")
+async def list_slow_queries(
+    route: Optional[str] = Query(None, description="Only entries issued by this route"),
+    limit: int = Query(50, ge=1, le=1000),
+    _: any = Depends(require_admin),
+):
+    """Most recent slow statements, newest first"""
+    settings = get_settings()
+    entries = get_slow_query_log().entries(route=route, limit=limit)
+    return {
+        "threshold_ms": settings.slow_query_threshold_ms,
+        "explain_sample_rate": settings.slow_query_explain_sample_rate,
+        "count": len(entries),
+        "entries": entries,
+    }
+
+@router.delete("/slow-queries", status_code=status.HTTP_204_NO_CONTENT)
+async def clear_slow_queries(
+    _: any = Depends(require_admin),
+):
+    """Empty the slow-query ring buffer"""
+    get_slow_query_log().clear()
+
+@router.get("/roster-cache")
+async def roster_cache_stats(
+    _: any = Depends(require_admin),
+):
+    """Size and hit/miss counters of this process's roster cache"""
+    return get_roster_cache().stats()
+
+@router.delete("/roster-cache", status_code=status.HTTP_204_NO_CONTENT)
+async def clear_roster_cache(
+    _: any = Depends(require_admin),
+):
+    """Drop every cached roster in this process"""
+    get_roster_cache().clear()
+
+@router.post("/student-flags/rebuild")
+async def rebuild_student_flags(
+    session: AsyncSession = Depends(get_db),
+    _: any = Depends(require_admin),
+):
+    """Recount special-need and parent flags for every student (after bulk imports or direct SQL edits)"""
+    rows = await refresh_flags(session)
+    await session.commit()
+    return {"students": rows}
@@ -0,0 +1,118 @@
+# backend/app/routers/emergency_contacts.py
+# Front-office emergency-contact lookups served from the in-memory directory
+
+import csv
+import io
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
+from uuid import UUID
+
+from ..deps import get_db, require_admin
+from ..models.user import User
+from ..schemas.emergency_contact import EmergencyDirectoryOut, EmergencyLookupRequest, StudentEmergencyContactsOut
+from ..services import emergency_directory
+from ..services.roster_cache import get_roster
+
+router = APIRouter(prefix="/emergency-contacts", tags=["emergency-contacts"])
+
+def _parse_uuid(value: str, name: str) -> UUID:
+    try:
+        return UUID(value)
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"Invalid {name}")
+
+def _entry_dict(entry: emergency_directory.DirectoryEntry) -> dict:
+    return {**entry._asdict(), "contacts": [c._asdict() for c in entry.contacts]}
+
+def _csv(entries) -> str:
+    out = io.StringIO()
+    writer = csv.writer(out)
+    writer.writerow([
+        "Last name", "First name", "Student ID", "Grade", "Priority", "Contact", "Relationship",
+        "Phone", "Email", "Pickup", "Medical", "Custody",
+    ])
+    for e in entries:
+        student = [e.last_name, e.first_name, e.external_id or "", e.grade_level]
+        if not e.contacts:
+            writer.writerow(student + ["", "NO EMERGENCY CONTACT"] + [""] * 6)
+        for c in e.contacts:
+            writer.writerow(student + [
+                c.priority, c.name, c.relationship_type, c.phone or "", c.email or "",
+                "Y" if c.can_pickup else "N", "Y" if c.can_authorize_medical else "N", c.custody_status or "",
+            ])
+    return out.getvalue()
+
+@router.get("/schools/{school_id}/students/{student_id}", response_model=StudentEmergencyContactsOut)
+async def get_student_contacts(
+    school_id: str,
+    student_id: str,
+    session: AsyncSession = Depends(get_db),
+    _: User = Depends(require_admin),
+):
+    """One student's emergency contacts in call order"""
+    directory = await emergency_directory.get_directory(session, _parse_uuid(school_id, "school_id"))
+    entry = directory.get(_parse_uuid(student_id, "student_id"))
+    if entry is None:
+        raise HTTPException(status_code=404, detail="Student not found at this school")
+    return _entry_dict(entry)
+
+@router.post("/schools/{school_id}/lookup", response_model=EmergencyDirectoryOut)
+async def lookup_contacts(
+    school_id: str,
+    payload: EmergencyLookupRequest,
+    session: AsyncSession = Depends(get_db),
+    _: User = Depends(require_admin),
+):
+    """Contacts for a batch of students (e.g. everyone unaccounted for in a drill), in request order"""
+    school_uuid = _parse_uuid(school_id, "school_id")
+    directory = await emergency_directory.get_directory(session, school_uuid)
+    students, not_found = [], []
+    for student_id in payload.student_ids:
+        entry = directory.get(student_id)
+        if entry is None:
+            not_found.append(student_id)
+        else:
+            students.append(_entry_dict(entry))
+    return {"school_id": school_uuid, "count": len(students), "students": students, "not_found": not_found}
+
+@router.get("/schools/{school_id}", response_model=EmergencyDirectoryOut)
+async def print_directory(
+    school_id: str,
+    grade_level: Optional[str] = Query(None),
+    classroom_id: Optional[str] = Query(None, description="Only students on this class's active roster"),
+    missing_only: bool = Query(False, description="Only students with no emergency contact"),
+    format: str = Query("json", regex="^(json|csv)$"),
+    session: AsyncSession = Depends(get_db),
+    _: User = Depends(require_admin),
+):
+    """The whole directory (or a grade / class) in name order, as JSON or a printable CSV"""
+    school_uuid = _parse_uuid(school_id, "school_id")
+    directory = await emergency_directory.get_directory(session, school_uuid)
+
+    entries = directory.entries.values()
+    if classroom_id:
+        roster = await get_roster(session, _parse_uuid(classroom_id, "classroom_id"), active_only=True)
+        if roster is None:
+            raise HTTPException(status_code=404, detail="Classroom not found")
+        rostered = {row.id for row in roster}
+        entries = [e for e in entries if e.student_id in rostered]
+    if grade_level:
+        entries = [e for e in entries if e.grade_level == grade_level]
+    if missing_only:
+        entries = [e for e in entries if not e.contacts]
+
+    if format == "csv":
+        return Response(
+            _csv(entries),
+            media_type="text/csv",
+            headers={"Content-Disposition": f'attachment; filename="emergency-contacts-{school_uuid}.csv"'},
+        )
+    students = [_entry_dict(e) for e in entries]
+    return {"school_id": school_uuid, "count": len(students), "students": students}
+
+@router.get("/stats")
+async def directory_stats(_: User = Depends(require_admin)):
+    """Directories loaded in this process"""
+    return emergency_directory.stats()
@@ -1,6 +1,8 @@
 # backend/app/routers/enrollments.py
 # CLEAN ROUTER - Fixed syntax errors
 
+import logging
+
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, and_, func
@@ -9,10 +11,15 @@ from typing import List, Optional
 from uuid import UUID
 from datetime import date
 
-from ..deps import get_db, get_current_user, require_admin
+from ..deps import get_db, get_scoped_db, get_current_user, require_admin
 from ..models.enrollment import Enrollment
 from ..models.student import Student
 from ..models.classroom import Classroom
+from ..services import gradebook as gradebook_service
+from ..services import live_events
+from ..services.jobs import start_job
+from ..services.roster_cache import get_roster
+from ..services.tenant import school_scope
 from ..schemas.enrollment import (
     EnrollmentCreate, 
     EnrollmentOut, 
@@ -32,8 +39,9 @@ async def test_enrollment():
 async def list_enrollments(
     student_id: Optional[str] = Query(None, description="Filter by student ID"),
     classroom_id: Optional[str] = Query(None, description="Filter by classroom ID"),
+    academic_year_id: Optional[str] = Query(None, description="Filter by academic year (defaults to the classroom's year)"),
     is_active: Optional[bool] = Query(True, description="Filter by active status"),
-    session: AsyncSession = Depends(get_db),
+    session: AsyncSession = Depends(get_scoped_db),
     _: any = Depends(get_current_user),
 ):
     """List enrollments with filtering"""
@@ -43,6 +51,9 @@ async def list_enrollments(
     try:
         print("🔍 Building query...")
         query = select(Enrollment)
+        if school_scope(session) is not None:
+            # Enrollments carry no school; the session's scope applies to the joined student
+            query = query.join(Student, Student.id == Enrollment.student_id)
         
         if student_id:
             print(f"🔍 Adding student_id filter")
@@ -51,6 +62,18 @@ async def list_enrollments(
         if classroom_id:
             print(f"🔍 Adding classroom_id filter")
             query = query.where(Enrollment.classroom_id == UUID(classroom_id))
+            if not academic_year_id:
+                # A class's enrollments all live in its year's partition
+                year_result = await session.execute(
+                    select(Classroom.academic_year_id).where(Classroom.id == UUID(classroom_id))
+                )
+                classroom_year_id = year_result.scalar_one_or_none()
+                if classroom_year_id is None:
+                    return []
+                query = query.where(Enrollment.academic_year_id == classroom_year_id)
+
+        if academic_year_id:
+            query = query.where(Enrollment.academic_year_id == UUID(academic_year_id))
         
         if is_active is not None:
             print(f"🔍 Adding is_active filter")
@@ -108,6 +131,20 @@ async def get_enrollment(
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get enrollment: {str(e)}")
 
+async def _start_average_backfill(enrollment: Enrollment, user_id: UUID) -> None:
+    """Queue the student's stored averages; the enrollment is already saved, so failures are only logged"""
+    try:
+        await start_job(
+            "gradebook_backfill", gradebook_service.backfill_averages,
+            enrollment.classroom_id, [enrollment.student_id],
+            created_by=user_id,
+            params={"classroom_id": enrollment.classroom_id, "student_id": enrollment.student_id},
+        )
+    except Exception:
+        logging.getLogger("uvicorn.error").exception(
+            "Failed to queue average backfill for enrollment %s", enrollment.id
+        )
+
 @router.post("", response_model=EnrollmentOut, status_code=status.HTTP_201_CREATED)
 async def create_enrollment(
     payload: EnrollmentCreate,
@@ -136,6 +173,7 @@ async def create_enrollment(
         existing_result = await session.execute(
             select(Enrollment).where(
                 and_(
+                    Enrollment.academic_year_id == classroom.academic_year_id,
                     Enrollment.student_id == UUID(payload.student_id),
                     Enrollment.classroom_id == UUID(payload.classroom_id),
                     Enrollment.is_active == True
@@ -150,6 +188,7 @@ async def create_enrollment(
             current_enrollment_result = await session.execute(
                 select(func.count(Enrollment.id)).where(
                     and_(
+                        Enrollment.academic_year_id == classroom.academic_year_id,
                         Enrollment.classroom_id == UUID(payload.classroom_id),
                         Enrollment.is_active == True
                     )
@@ -178,23 +217,26 @@ async def create_enrollment(
         )
         
         session.add(enrollment)
+        await live_events.notify_enrollment_changed(session, enrollment, "created")
         await session.commit()
         await session.refresh(enrollment)
         
-        return enrollment
-        
     except HTTPException:
         raise
     except Exception as e:
         await session.rollback()
         raise HTTPException(status_code=500, detail=f"Failed to create enrollment: {str(e)}")
 
+    # Families read stored averages only, so give the new student theirs
+    await _start_average_backfill(enrollment, current_user.id)
+    return enrollment
+
 @router.patch("/{enrollment_id}", response_model=EnrollmentOut)
 async def update_enrollment(
     enrollment_id: str,
     payload: EnrollmentUpdate,
     session: AsyncSession = Depends(get_db),
-    _: any = Depends(require_admin),
+    current_user: any = Depends(require_admin),
 ):
     """Update an enrollment"""
     try:
@@ -217,17 +259,20 @@ async def update_enrollment(
             if not enrollment.withdrawal_date:
                 enrollment.withdrawal_date = date.today()
         
+        await live_events.notify_enrollment_changed(session, enrollment, "updated")
         await session.commit()
         await session.refresh(enrollment)
         
-        return enrollment
-        
     except HTTPException:
         raise
     except Exception as e:
         await session.rollback()
         raise HTTPException(status_code=500, detail=f"Failed to update enrollment: {str(e)}")
 
+    if enrollment.is_active:
+        await _start_average_backfill(enrollment, current_user.id)
+    return enrollment
+
 @router.delete("/{enrollment_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_enrollment(
     enrollment_id: str,
@@ -249,6 +294,7 @@ async def delete_enrollment(
         enrollment.enrollment_status = "WITHDRAWN"
         enrollment.withdrawal_date = date.today()
         
+        await live_events.notify_enrollment_changed(session, enrollment, "withdrawn")
         await session.commit()
         
     except Exception as e:
@@ -296,49 +342,15 @@ async def get_classroom_roster(
     session: AsyncSession = Depends(get_db),
     _: any = Depends(get_current_user),
 ):
-    """Get all students enrolled in a specific classroom"""
+    """Get all students enrolled in a specific classroom (served from the roster cache)"""
     try:
-        # Verify classroom exists
-        classroom_result = await session.execute(
-            select(Classroom).where(Classroom.id == UUID(classroom_id))
-        )
-        classroom = classroom_result.scalar_one_or_none()
-        if not classroom:
+        roster = await get_roster(session, UUID(classroom_id), active_only)
+        if roster is None:
             raise HTTPException(status_code=404, detail="Classroom not found")
-        
-        # Build query
-        query = select(Enrollment).options(
-            selectinload(Enrollment.student)
-        ).where(Enrollment.classroom_id == UUID(classroom_id))
-        
-        if active_only:
-            query = query.where(Enrollment.is_active == True)
-        
-        query = query.order_by(Enrollment.id.desc())
-        
-        result = await session.execute(query)
-        enrollments = result.scalars().all()
-        
-        # Convert to roster format
-        roster = []
-        for enrollment in enrollments:
-            if enrollment.student:
-                student_data = ClassroomRosterStudent(
-                    id=enrollment.student.id,
-                    student_id=enrollment.student.student_id,
-                    first_name=enrollment.student.first_name,
-                    last_name=enrollment.student.last_name,
-                    enrollment_id=enrollment.id,
-                    enrollment_date=enrollment.enrollment_date,
-                    enrollment_status=enrollment.enrollment_status,
-                    is_active=enrollment.is_active,
-                    requires_accommodation=enrollment.requires_accommodation
-                )
-                roster.append(student_data)
-        
-        return roster
+
+        return [ClassroomRosterStudent(**row._asdict()) for row in roster]
         
     except HTTPException:
         raise
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to get classroom roster: {str(e)}")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=f"Failed to get classroom roster: {str(e)}")
@@ -0,0 +1,76 @@
+# backend/app/routers/events.py
+# Per-user server-sent events stream of change notifications
+
+import asyncio
+import json
+from fastapi import APIRouter, Depends, Request
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..config import get_settings
+from ..db import get_sessionmaker
+from ..deps import get_db, get_stream_user, require_admin
+from ..models.user import User
+from ..services import live_events
+
+router = APIRouter(prefix="/events", tags=["events"])
+
+def _format(name: str, data: dict, event_id=None) -> str:
+    lines = [f"id: {event_id}"] if event_id is not None else []
+    lines += [f"event: {name}", f"data: {json.dumps(data)}"]
+    return "\n".join(lines) + "\n\n"
+
+@router.get("/stream")
+async def stream_events(
+    request: Request,
+    session: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_stream_user),
+):
+    """Server-sent events: change notifications for the current user's classes, schools and account.
+
+    Opens with a ``ready`` event. Every later event names what changed (ids only);
+    refetch through the regular endpoints. ``resync`` means events were dropped and
+    everything should be refetched. Authenticate with ``?access_token=`` from EventSource.
+    """
+    user_id = current_user.id
+    own_topic = live_events.user_topic(user_id)
+    topics = await live_events.topics_for_user(session, user_id)
+    keepalive = get_settings().live_events_keepalive_seconds
+
+    async def events():
+        bus = live_events.get_event_bus()
+        subscription = bus.subscribe(topics)
+        try:
+            # Reconnecting clients wait 5s; the ready event tells them to refetch what they missed
+            yield "retry: 5000\n" + _format("ready", {"topics": len(subscription.topics)})
+            while True:
+                try:
+                    live_event = await asyncio.wait_for(subscription.queue.get(), timeout=keepalive)
+                except asyncio.TimeoutError:
+                    if await request.is_disconnected():
+                        return
+                    yield ": keep-alive\n\n"
+                    continue
+
+                if live_event["topic"] == own_topic and live_event["type"] in live_events.ACCESS_EVENTS:
+                    async with get_sessionmaker()() as lookup:
+                        bus.update(subscription, await live_events.topics_for_user(lookup, user_id))
+
+                yield _format(
+                    live_event["type"],
+                    {"topic": live_event["topic"], "at": live_event["at"], **live_event["data"]},
+                    live_event["id"],
+                )
+        finally:
+            bus.unsubscribe(subscription)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+@router.get("/stats")
+async def event_bus_stats(_: User = Depends(require_admin)):
+    """Connected streams, topics and events published/dropped in this process"""
+    return live_events.get_event_bus().stats()
@@ -0,0 +1,307 @@
+# backend/app/routers/gradebook.py
+# Gradebook categories, assignments and class averages (Phase A gradebook spec)
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List
+from uuid import UUID
+
+from ..deps import get_db, get_current_user, require_admin
+from ..models.academic_year import AcademicYear
+from ..models.classroom import Classroom
+from ..models.gradebook import Assignment, AssignmentCategory, Grade, StudentGradeAverage
+from ..models.user import User
+from ..schemas.gradebook import (
+    AssignmentCategoryCreate,
+    AssignmentCategoryOut,
+    AssignmentCreate,
+    AssignmentOut,
+    BulkGradeRequest,
+    BulkGradeResponse,
+    CachedAverageOut,
+    ClassAveragesOut,
+    GradeIn,
+    GradeSaveResponse,
+)
+from ..schemas.job import JobOut
+from ..services import gradebook as gradebook_service
+from ..services.jobs import start_job
+from ..services.gradebook_engine import compute
+from ..services.roster_cache import get_roster
+
+router = APIRouter(prefix="/gradebook", tags=["gradebook"])
+
+def _parse_uuid(value: str, name: str) -> UUID:
+    try:
+        return UUID(value)
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"Invalid {name}")
+
+def _parse_classroom_id(classroom_id: str) -> UUID:
+    return _parse_uuid(classroom_id, "classroom_id")
+
+def _average_out(row: StudentGradeAverage, classroom_name: str = None) -> dict:
+    return {
+        "classroom_id": row.classroom_id,
+        "classroom_name": classroom_name,
+        "overall_percent": row.overall_percent,
+        "category_percents": row.category_percents,
+        "computed_at": row.computed_at,
+    }
+
+async def _require_access(session: AsyncSession, user: User, classroom_id: UUID, edit: bool = False):
+    access = await gradebook_service.get_access(session, user.id, classroom_id)
+    if not (access.can_edit if edit else access.can_view):
+        raise HTTPException(status_code=403, detail="PERMISSION_DENIED")
+    return access
+
+@router.get("/classrooms/{classroom_id}/categories", response_model=List[AssignmentCategoryOut])
+async def list_categories(
+    classroom_id: str,
+    session: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    classroom_uuid = _parse_classroom_id(classroom_id)
+    await _require_access(session, current_user, classroom_uuid)
+    result = await session.execute(
+        select(AssignmentCategory)
+        .where(AssignmentCategory.classroom_id == classroom_uuid)
+        .order_by(AssignmentCategory.display_order, AssignmentCategory.name)
+    )
+    return result.scalars().all()
+
+@router.post("/classrooms/{classroom_id}/categories", response_model=AssignmentCategoryOut)
+async def create_category(
+    classroom_id: str,
+    payload: AssignmentCategoryCreate,
+    session: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    classroom_uuid = _parse_classroom_id(classroom_id)
+    await _require_access(session, current_user, classroom_uuid, edit=True)
+    try:
+        category = AssignmentCategory(classroom_id=classroom_uuid, **payload.dict())
+        session.add(category)
+        await session.flush()
+        await gradebook_service.rebuild_averages(session, classroom_uuid)
+        await session.commit()
+        await session.refresh(category)
+        return category
+    except Exception as e:
+        await session.rollback()
+        raise HTTPException(status_code=500, detail=f"Failed to create category: {str(e)}")
+
+@router.get("/classrooms/{classroom_id}/assignments", response_model=List[AssignmentOut])
+async def list_assignments(
+    classroom_id: str,
+    session: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    classroom_uuid = _parse_classroom_id(classroom_id)
+    await _require_access(session, current_user, classroom_uuid)
+    result = await session.execute(
+        select(Assignment)
+        .where(Assignment.classroom_id == classroom_uuid)
+        .order_by(Assignment.due_date.nulls_last(), Assignment.created_at)
+    )
+    return result.scalars().all()
+
+@router.post("/classrooms/{classroom_id}/assignments", response_model=AssignmentOut)
+async def create_assignment(
+    classroom_id: str,
+    payload: AssignmentCreate,
+    session: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    classroom_uuid = _parse_classroom_id(classroom_id)
+    await _require_access(session, current_user, classroom_uuid, edit=True)
+    try:
+        if payload.category_id is not None:
+            category = await session.get(AssignmentCategory, payload.category_id)
+            if category is None or category.classroom_id != classroom_uuid:
+                raise HTTPException(status_code=400, detail="Category does not belong to this classroom")
+
+        assignment = Assignment(classroom_id=classroom_uuid, created_by=current_user.id, **payload.dict())
+        session.add(assignment)
+        await session.flush()
+        if assignment.is_published:
+            await gradebook_service.rebuild_averages(session, classroom_uuid)
+        await session.commit()
+        await session.refresh(assignment)
+        return assignment
+    except HTTPException:
+        raise
+    except Exception as e:
+        await session.rollback()
+        raise HTTPException(status_code=500, detail=f"Failed to create assignment: {str(e)}")
+
+@router.get("/classrooms/{classroom_id}/averages", response_model=ClassAveragesOut)
+async def get_class_averages(
+    classroom_id: str,
+    include_unpublished: bool = Query(False, description="Count assignments not yet published to families"),
+    session: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Category and overall averages for every student on the active roster"""
+    classroom_uuid = _parse_classroom_id(classroom_id)
+    await _require_access(session, current_user, classroom_uuid)
+
+    matrix = await gradebook_service.load_matrix(session, classroom_uuid, include_unpublished)
+    if matrix is None:
+        raise HTTPException(status_code=404, detail="Classroom not found")
+    return {"classroom_id": classroom_uuid, **gradebook_service.result_rows(compute(matrix))}
+
+@router.put("/assignments/{assignment_id}/grades/{student_id}", response_model=GradeSaveResponse)
+async def save_grade(
+    assignment_id: str,
+    student_id: str,
+    payload: GradeIn,
+    session: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Save one cell; only this student's cached average is recomputed"""
+    assignment_uuid = _parse_uuid(assignment_id, "assignment_id")
+    student_uuid = _parse_uuid(student_id, "student_id")
+
+    assignment = await session.get(Assignment, assignment_uuid)
+    if assignment is None:
+        raise HTTPException(status_code=404, detail="Assignment not found")
+    classroom_uuid = assignment.classroom_id
+    access = await _require_access(session, current_user, classroom_uuid, edit=True)
+
+    roster = await get_roster(session, classroom_uuid, active_only=True)
+    if roster is None or student_uuid not in {row.id for row in roster}:
+        raise HTTPException(status_code=400, detail="NOT_ENROLLED: Student is not on this class's active roster")
+
+    try:
+        values = payload.dict()
+        await gradebook_service.save_grades(
+            session,
+            classroom_uuid,
+            assignment_uuid,
+            [{"student_id": student_uuid, **values}],
+            fields=list(values),
+            graded_by=current_user.id,
+            source="ADMIN_UI" if access.is_admin else "TEACHER_UI",
+        )
+        await session.commit()
+
+        grade = (await session.execute(
+            select(Grade).where(Grade.assignment_id == assignment_uuid, Grade.student_id == student_uuid)
+        )).scalar_one()
+        average = await session.get(StudentGradeAverage, (classroom_uuid, student_uuid))
+        return {"grade": grade, "average": _average_out(average) if average else None}
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        await session.rollback()
+        raise HTTPException(status_code=500, detail=f"Failed to save grade: {str(e)}")
+
+@router.post("/grades/bulk", response_model=BulkGradeResponse)
+async def save_grades_bulk(
+    payload: BulkGradeRequest,
+    session: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Enter one assignment's grades for many students: one permission check, one upsert,
+    one audit insert and one incremental recompute"""
+    assignment = await session.get(Assignment, payload.assignment_id)
+    if assignment is None:
+        raise HTTPException(status_code=404, detail="Assignment not found")
+    classroom_uuid = assignment.classroom_id
+    access = await _require_access(session, current_user, classroom_uuid, edit=True)
+
+    try:
+        roster = await get_roster(session, classroom_uuid, active_only=True)
+        rostered = {row.id for row in roster or ()}
+
+        fields = ["points_earned"] + [
+            field for field, column in (("status", payload.statuses), ("comments", payload.comments), ("shareable", payload.shareable))
+            if column is not None
+        ]
+        columns = {
+            "points_earned": payload.points_earned,
+            "status": payload.statuses,
+            "comments": payload.comments,
+            "shareable": payload.shareable,
+        }
+
+        # Last entry wins if a student appears twice
+        grades = {}
+        errors = []
+        for i, student_id in enumerate(payload.student_ids):
+            if student_id not in rostered:
+                errors.append({
+                    "student_id": student_id,
+                    "code": "NOT_ENROLLED",
+                    "message": "Student is not on this class's active roster",
+                })
+                continue
+            grades[student_id] = {"student_id": student_id, **{field: columns[field][i] for field in fields}}
+
+        saved = await gradebook_service.save_grades(
+            session,
+            classroom_uuid,
+            assignment.id,
+            list(grades.values()),
+            fields=fields,
+            graded_by=current_user.id,
+            source="ADMIN_UI" if access.is_admin else "BULK_ENTRY",
+            reason=payload.reason,
+        )
+        await session.commit()
+
+        saved_ids = {row.student_id for row in saved}
+        return {
+            "assignment_id": assignment.id,
+            "saved": [{"student_id": r.student_id, "points_earned": r.points_earned, "status": r.status} for r in saved],
+            "unchanged": [student_id for student_id in grades if student_id not in saved_ids],
+            "errors": errors,
+        }
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        await session.rollback()
+        raise HTTPException(status_code=500, detail=f"Failed to save grades: {str(e)}")
+
+@router.get("/students/{student_id}/averages", response_model=List[CachedAverageOut])
+async def get_student_averages(
+    student_id: str,
+    session: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Stored published averages for parent/student views - read as-is, never recalculated"""
+    student_uuid = _parse_uuid(student_id, "student_id")
+    scope = await gradebook_service.student_view_scope(session, current_user.id, student_uuid)
+    if scope is not None and not scope:
+        raise HTTPException(status_code=403, detail="PERMISSION_DENIED")
+
+    rows = await gradebook_service.get_cached_averages(session, student_uuid)
+    if scope is not None:
+        rows = [row for row in rows if row.classroom_id in scope]
+    names = dict((await session.execute(
+        select(Classroom.id, Classroom.name).where(Classroom.id.in_({row.classroom_id for row in rows}))
+    )).all()) if rows else {}
+    return sorted(
+        (_average_out(row, names.get(row.classroom_id)) for row in rows),
+        key=lambda r: (r["classroom_name"] or ""),
+    )
+
+@router.post("/academic-years/{academic_year_id}/rebuild", response_model=JobOut, status_code=status.HTTP_202_ACCEPTED)
+async def rebuild_year_averages(
+    academic_year_id: str,
+    session: AsyncSession = Depends(get_db),
+    current_user: User = Depends(require_admin),
+):
+    """Recompute every class's cached averages in the background (e.g. after a policy change); poll GET /jobs/{id}"""
+    year = await session.get(AcademicYear, _parse_uuid(academic_year_id, "academic_year_id"))
+    if year is None:
+        raise HTTPException(status_code=404, detail="Academic year not found")
+    job = await start_job(
+        "gradebook_rebuild", gradebook_service.rebuild_year_averages, year.id,
+        created_by=current_user.id, params={"academic_year_id": year.id},
+    )
+    return job.to_dict()
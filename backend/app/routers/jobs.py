@@ -0,0 +1,95 @@
+# backend/app/routers/jobs.py
+# Status, progress stream and cancellation for background jobs
+
+import json
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List
+from uuid import UUID
+
+from ..deps import _is_adminish, get_db, get_current_user, get_stream_user
+from ..models.background_job import FINISHED_JOB_STATUSES, BackgroundJob
+from ..models.user import User
+from ..models.user_role import UserRole
+from ..schemas.job import JobOut
+from ..services import jobs as job_service
+
+router = APIRouter(prefix="/jobs", tags=["jobs"])
+
+async def _get_own_job(session: AsyncSession, job_id: str, user: User) -> dict:
+    try:
+        job_uuid = UUID(job_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid job_id")
+
+    job = await job_service.get_job(session, job_uuid)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    # Jobs are visible to whoever started them; system jobs (no owner) only to admins
+    if job["created_by"] is None:
+        roles = (await session.execute(
+            select(UserRole.role).where(UserRole.user_id == user.id, UserRole.is_active == True)
+        )).scalars().all()
+        if not any(_is_adminish(role) for role in roles):
+            raise HTTPException(status_code=404, detail="Job not found")
+    elif job["created_by"] != user.id:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+@router.get("", response_model=List[JobOut])
+async def list_my_jobs(
+    limit: int = Query(20, ge=1, le=100),
+    session: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """The current user's most recent jobs"""
+    result = await session.execute(
+        select(BackgroundJob.id)
+        .where(BackgroundJob.created_by == current_user.id)
+        .order_by(BackgroundJob.created_at.desc())
+        .limit(limit)
+    )
+    jobs = [await job_service.get_job(session, job_id) for job_id in result.scalars().all()]
+    return [job for job in jobs if job is not None]
+
+@router.get("/{job_id}", response_model=JobOut)
+async def get_job_status(
+    job_id: str,
+    session: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    return await _get_own_job(session, job_id, current_user)
+
+@router.post("/{job_id}/cancel", response_model=JobOut)
+async def cancel_job(
+    job_id: str,
+    session: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Ask a pending or running job to stop; finished jobs are returned unchanged"""
+    job = await _get_own_job(session, job_id, current_user)
+    return await job_service.cancel_job(session, job["id"])
+
+@router.get("/{job_id}/events")
+async def stream_job_events(
+    job_id: str,
+    session: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_stream_user),
+):
+    """Server-sent events: one ``progress`` event per change, then ``done`` when the job finishes"""
+    job = await _get_own_job(session, job_id, current_user)
+
+    async def events():
+        async for state in job_service.job_events(job["id"]):
+            name = "done" if state["status"] in FINISHED_JOB_STATUSES else "progress"
+            payload = json.dumps(jsonable_encoder(JobOut(**state)))
+            yield f"event: {name}\ndata: {payload}\n\n"
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -3,20 +3,26 @@
 
 # backend/app/routers/parents.py
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
+from sqlalchemy.orm import selectinload
 from typing import List
-from ..deps import get_db, require_admin, get_current_user
+from uuid import UUID
+from ..deps import get_db, require_admin, get_current_user, _is_adminish
 from ..models.parent import Parent
 from ..models.parent_student_relationship import ParentStudentRelationship
 from ..models.user import User
+from ..models.user_role import UserRole
 from ..models.student import Student
 from ..schemas.parent import (
     ParentCreate, ParentOut, ParentUpdate,
-    ParentStudentRelationshipCreate, ParentStudentRelationshipOut, ParentStudentRelationshipUpdate
+    ParentStudentRelationshipCreate, ParentStudentRelationshipOut, ParentStudentRelationshipUpdate,
+    ParentSummaryOut,
 )
 from ..security import get_password_hash
+from ..services.parent_summary import get_parent_summary
+from ..services.student_flags import refresh_flags
 
 router = APIRouter(prefix="/parents", tags=["parents"])
 
@@ -66,6 +72,7 @@ async def create_parent(
         emergency_contact=payload.emergency_contact,
         pickup_authorized=payload.pickup_authorized,
         preferred_contact_method=payload.preferred_contact_method.upper(),
+        phone=payload.phone,
     )
     
     session.add(parent)
@@ -73,17 +80,64 @@ async def create_parent(
     await session.refresh(parent)
     return parent
 
+async def _viewable_parent_id(session: AsyncSession, parent_id: str, user: User) -> UUID:
+    """Parents may see their own records; admins may see anyone's"""
+    try:
+        parent_uuid = UUID(parent_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid parent_id")
+
+    parent = await session.get(Parent, parent_uuid)
+    if not parent:
+        raise HTTPException(status_code=404, detail="Parent not found")
+    if parent.user_id != user.id:
+        roles = await session.execute(
+            select(UserRole.role).where(UserRole.user_id == user.id, UserRole.is_active == True)
+        )
+        if not any(_is_adminish(role) for role in roles.scalars().all()):
+            raise HTTPException(status_code=403, detail="PERMISSION_DENIED")
+    return parent_uuid
+
+@router.get("/me/summary", response_model=ParentSummaryOut)
+async def get_my_summary(
+    refresh: bool = Query(False, description="Bypass the cached summary"),
+    session: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Parent home page: every child's classes, teachers, grades and attendance in one call"""
+    parent = (await session.execute(
+        select(Parent).where(Parent.user_id == current_user.id)
+    )).scalar_one_or_none()
+    if not parent:
+        raise HTTPException(status_code=404, detail="No parent profile for this user")
+    return await get_parent_summary(session, parent.id, refresh=refresh)
+
+@router.get("/{parent_id}/summary", response_model=ParentSummaryOut)
+async def get_summary(
+    parent_id: str,
+    refresh: bool = Query(False, description="Bypass the cached summary"),
+    session: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """A parent's home page summary, as that parent would see it"""
+    parent_uuid = await _viewable_parent_id(session, parent_id, current_user)
+    return await get_parent_summary(session, parent_uuid, refresh=refresh)
+
 @router.get("/{parent_id}/students", response_model=List[ParentStudentRelationshipOut])
 async def get_parent_students(
     parent_id: str,
     session: AsyncSession = Depends(get_db),
-    _: any = Depends(get_current_user),
+    current_user: User = Depends(get_current_user),
 ):
     """Get all students for a parent"""
-    from uuid import UUID
-    
-    relationships = ParentStudentRelationship.get_parent_students(session, UUID(parent_id))
-    return relationships
+    parent_uuid = await _viewable_parent_id(session, parent_id, current_user)
+    result = await session.execute(
+        select(ParentStudentRelationship).where(
+            ParentStudentRelationship.parent_id == parent_uuid,
+            ParentStudentRelationship.is_active == True,
+        )
+    )
+    return result.scalars().all()
 
 @router.post("/relationships", response_model=ParentStudentRelationshipOut, status_code=status.HTTP_201_CREATED)
 async def create_parent_student_relationship(
@@ -92,8 +146,6 @@ async def create_parent_student_relationship(
     _: any = Depends(require_admin),
 ):
     """Create a parent-student relationship"""
-    from uuid import UUID
-    
     # Validate parent and student exist
     parent = await session.get(Parent, UUID(payload.parent_id))
     if not parent:
@@ -129,6 +181,63 @@ async def create_parent_student_relationship(
     )
     
     session.add(relationship)
+    await session.flush()
+    await refresh_flags(session, [relationship.student_id])
     await session.commit()
     await session.refresh(relationship)
-    return relationship
\ No newline at end of file
+    return relationship
+
+@router.patch("/relationships/{relationship_id}", response_model=ParentStudentRelationshipOut)
+async def update_parent_student_relationship(
+    relationship_id: str,
+    payload: ParentStudentRelationshipUpdate,
+    session: AsyncSession = Depends(get_db),
+    _: any = Depends(require_admin),
+):
+    """Update permissions, emergency priority or status of a parent-student relationship"""
+    try:
+        relationship = await session.get(ParentStudentRelationship, UUID(relationship_id))
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid relationship_id")
+    if not relationship:
+        raise HTTPException(status_code=404, detail="Relationship not found")
+
+    update_data = payload.dict(exclude_unset=True)
+    for field in ("relationship_type", "custody_status"):
+        if update_data.get(field):
+            update_data[field] = update_data[field].upper()
+    for field, value in update_data.items():
+        setattr(relationship, field, value)
+
+    if "is_active" in update_data:
+        await session.flush()
+        await refresh_flags(session, [relationship.student_id])
+    await session.commit()
+    await session.refresh(relationship)
+    return relationship
+
+@router.patch("/{parent_id}", response_model=ParentOut)
+async def update_parent(
+    parent_id: str,
+    payload: ParentUpdate,
+    session: AsyncSession = Depends(get_db),
+    _: any = Depends(require_admin),
+):
+    """Update a parent's profile (contact preferences, phone)"""
+    try:
+        parent = await session.get(Parent, UUID(parent_id), options=[selectinload(Parent.user)])
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid parent_id")
+    if not parent:
+        raise HTTPException(status_code=404, detail="Parent not found")
+
+    update_data = payload.dict(exclude_unset=True)
+    for field in ("relationship_type", "preferred_contact_method"):
+        if update_data.get(field):
+            update_data[field] = update_data[field].upper()
+    for field, value in update_data.items():
+        setattr(parent, field, value)
+
+    await session.commit()
+    await session.refresh(parent, ["user"])
+    return parent
@@ -5,10 +5,15 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, and_, or_
 from sqlalchemy.orm import selectinload, joinedload  # ADDED: Missing import
 from typing import List, Optional
+from datetime import datetime, timedelta, timezone
 from ..deps import get_db, require_admin, get_current_user
 from ..models.room import Room
+from ..models.room_booking import RoomBooking
 from ..models.classroom import Classroom
-from ..schemas.room import RoomCreate, RoomOut, RoomUpdate
+from ..models.user import User
+from ..schemas.room import RoomCreate, RoomOut, RoomUpdate, RoomBookingCreate, RoomBookingOut, RoomUtilizationReport
+from ..services import room_booking as booking_service
+from ..services.room_utilization import get_utilization
 from uuid import UUID
 
 router = APIRouter(prefix="/rooms", tags=["rooms"])
@@ -24,10 +29,17 @@ async def list_rooms(
     has_computers: Optional[bool] = None,
     has_smartboard: Optional[bool] = None,
     has_sink: Optional[bool] = None,
+    available_from: Optional[datetime] = None,
+    available_to: Optional[datetime] = None,
     session: AsyncSession = Depends(get_db),
     _: any = Depends(get_current_user),
 ):
-    """Get rooms with comprehensive filtering options"""
+    """Get rooms with comprehensive filtering options.
+
+    ``available_only`` keeps rooms with no booking (class meeting or event)
+    overlapping ``[available_from, available_to)``; the window defaults to
+    right now.
+    """
     # FIXED: Add joinedload for school relationship
     query = select(Room).options(
         joinedload(Room.school)
@@ -58,17 +70,135 @@ async def list_rooms(
     if has_sink is not None:
         query = query.where(Room.has_sink == has_sink)
     
-    # Filter out rooms that are currently assigned to classrooms
+    # Filter out rooms booked during the window - a classroom's room is only taken while it meets
     if available_only:
-        # Subquery to get rooms that are in use
-        used_rooms_subquery = select(Classroom.room_id).where(
-            Classroom.room_id.isnot(None)
-        )
-        query = query.where(Room.id.notin_(used_rooms_subquery))
+        start = available_from or datetime.now(timezone.utc)
+        end = available_to or start + timedelta(minutes=1)
+        if end <= start:
+            raise HTTPException(status_code=400, detail="available_to must be after available_from")
+        query = query.where(booking_service.room_is_free(start, end))
     
     result = await session.execute(query)
     return result.scalars().unique().all()  # FIXED: Added unique() to handle joined data
 
+@router.get("/free", response_model=List[RoomOut])
+async def list_free_rooms(
+    school_id: str,
+    starts_at: datetime,
+    ends_at: datetime,
+    min_capacity: Optional[int] = None,
+    room_type: Optional[str] = None,
+    has_projector: Optional[bool] = None,
+    has_computers: Optional[bool] = None,
+    has_smartboard: Optional[bool] = None,
+    has_sink: Optional[bool] = None,
+    bookable_only: bool = True,
+    session: AsyncSession = Depends(get_db),
+    _: any = Depends(get_current_user),
+):
+    """Rooms free for the whole window that match the capacity/equipment filters, smallest first"""
+    if starts_at.tzinfo is None or ends_at.tzinfo is None:
+        raise HTTPException(status_code=400, detail="Times must include a UTC offset")
+    if ends_at <= starts_at:
+        raise HTTPException(status_code=400, detail="ends_at must be after starts_at")
+    try:
+        school_uuid = UUID(school_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid school_id")
+
+    return await booking_service.free_rooms(
+        session,
+        school_uuid,
+        starts_at,
+        ends_at,
+        min_capacity=min_capacity,
+        room_type=room_type,
+        has_projector=has_projector,
+        has_computers=has_computers,
+        has_smartboard=has_smartboard,
+        has_sink=has_sink,
+        bookable_only=bookable_only,
+    )
+
+@router.get("/utilization", response_model=RoomUtilizationReport)
+async def get_school_room_utilization(
+    school_id: str,
+    academic_year_id: Optional[str] = None,
+    refresh: bool = Query(False, description="Bypass the cached report"),
+    session: AsyncSession = Depends(get_db),
+    _: any = Depends(get_current_user),
+):
+    """Assigned classrooms, seat utilization and over-capacity warnings for every room at a school"""
+    try:
+        school_uuid = UUID(school_id)
+        year_uuid = UUID(academic_year_id) if academic_year_id else None
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid school_id or academic_year_id")
+    return await get_utilization(session, school_uuid, year_uuid, refresh=refresh)
+
+@router.get("/{room_id}/bookings", response_model=List[RoomBookingOut])
+async def list_room_bookings(
+    room_id: str,
+    starts_at: datetime,
+    ends_at: datetime,
+    session: AsyncSession = Depends(get_db),
+    _: any = Depends(get_current_user),
+):
+    """Class meetings and events holding the room during a window"""
+    if ends_at <= starts_at:
+        raise HTTPException(status_code=400, detail="ends_at must be after starts_at")
+    return await booking_service.find_conflicts(session, UUID(room_id), starts_at, ends_at)
+
+@router.post("/{room_id}/bookings", response_model=RoomBookingOut, status_code=status.HTTP_201_CREATED)
+async def create_room_booking(
+    room_id: str,
+    payload: RoomBookingCreate,
+    session: AsyncSession = Depends(get_db),
+    current_user: User = Depends(require_admin),
+):
+    """Reserve a room for an event; 409 lists the bookings in the way"""
+    room = await session.get(Room, UUID(room_id))
+    if not room or not room.is_active:
+        raise HTTPException(status_code=404, detail="Room not found")
+    if not room.is_bookable:
+        raise HTTPException(status_code=400, detail="Room is not bookable")
+
+    try:
+        booking, conflicts = await booking_service.create_booking(
+            session, room, payload.starts_at, payload.ends_at, payload.title, current_user.id
+        )
+        if booking is None:
+            raise HTTPException(
+                status_code=409,
+                detail={
+                    "code": "ROOM_CONFLICT",
+                    "conflicts": [RoomBookingOut.from_orm(c).dict() for c in conflicts],
+                },
+            )
+        await session.commit()
+        await session.refresh(booking)
+        return booking
+    except HTTPException:
+        raise
+    except Exception as e:
+        await session.rollback()
+        raise HTTPException(status_code=500, detail=f"Failed to book room: {str(e)}")
+
+@router.delete("/bookings/{booking_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_room_booking(
+    booking_id: str,
+    session: AsyncSession = Depends(get_db),
+    _: any = Depends(require_admin),
+):
+    """Cancel an event booking; class bookings follow the schedule and are not edited here"""
+    booking = await session.get(RoomBooking, UUID(booking_id))
+    if not booking:
+        raise HTTPException(status_code=404, detail="Booking not found")
+    if booking.source != "EVENT":
+        raise HTTPException(status_code=400, detail="Class bookings are managed through the schedule")
+    await session.delete(booking)
+    await session.commit()
+
 @router.get("/{room_id}/usage", response_model=dict)
 async def get_room_usage(
     room_id: str,
@@ -97,6 +227,7 @@ async def get_room_usage(
     )
     
     assigned_classrooms = classroom_result.scalars().unique().all()
+    now = datetime.now(timezone.utc)
     
     usage_info = {
         "room": {
@@ -107,6 +238,7 @@ async def get_room_usage(
             "capacity": room.capacity
         },
         "is_available": len(assigned_classrooms) == 0,
+        "is_free_now": await booking_service.is_room_free(session, room.id, now, now + timedelta(minutes=1)),
         "assigned_classrooms": [
             {
                 "id": str(classroom.id),
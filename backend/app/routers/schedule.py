@@ -0,0 +1,262 @@
+# backend/app/routers/schedule.py
+# Bell schedule setup and the compiled "who is where" lookups
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import date, datetime
+from typing import List, Optional
+from uuid import UUID
+
+from ..deps import get_db, get_current_user, require_admin
+from ..models.classroom import Classroom
+from ..models.room import Room
+from ..models.schedule import CalendarBlock, RotationDay, SchedulePeriod
+from ..models.school import School
+from ..models.user import User
+from ..schemas.schedule import (
+    CalendarBlockCreate,
+    CalendarBlockOut,
+    CalendarGenerateRequest,
+    CalendarGenerateResponse,
+    CompileResponse,
+    RoomConflictOut,
+    RoomNowOut,
+    RotationDayCreate,
+    RotationDayOut,
+    ScheduleOccurrenceOut,
+    SchedulePeriodCreate,
+    SchedulePeriodOut,
+)
+from ..services import schedule as schedule_service
+from ..services.room_booking import unbooked_occurrences
+from ..services.timezone import school_today
+
+router = APIRouter(prefix="/schedule", tags=["schedule"])
+
+def _parse_uuid(value: str, name: str) -> UUID:
+    try:
+        return UUID(value)
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"Invalid {name}")
+
+async def _get_school(session: AsyncSession, school_id: str) -> School:
+    school = await session.get(School, _parse_uuid(school_id, "school_id"))
+    if not school:
+        raise HTTPException(status_code=404, detail="School not found")
+    return school
+
+@router.get("/schools/{school_id}/periods", response_model=List[SchedulePeriodOut])
+async def list_periods(
+    school_id: str,
+    academic_year_id: Optional[str] = None,
+    session: AsyncSession = Depends(get_db),
+    _: User = Depends(get_current_user),
+):
+    school = await _get_school(session, school_id)
+    query = select(SchedulePeriod).where(SchedulePeriod.school_id == school.id)
+    if academic_year_id:
+        query = query.where(SchedulePeriod.academic_year_id == _parse_uuid(academic_year_id, "academic_year_id"))
+    result = await session.execute(query.order_by(SchedulePeriod.display_order, SchedulePeriod.start_time))
+    return result.scalars().all()
+
+@router.post("/schools/{school_id}/periods", response_model=SchedulePeriodOut)
+async def create_period(
+    school_id: str,
+    payload: SchedulePeriodCreate,
+    session: AsyncSession = Depends(get_db),
+    _: User = Depends(require_admin),
+):
+    school = await _get_school(session, school_id)
+    try:
+        period = SchedulePeriod(school_id=school.id, **payload.dict())
+        session.add(period)
+        await session.commit()
+        await session.refresh(period)
+        return period
+    except Exception as e:
+        await session.rollback()
+        raise HTTPException(status_code=500, detail=f"Failed to create period: {str(e)}")
+
+@router.get("/schools/{school_id}/rotation-days", response_model=List[RotationDayOut])
+async def list_rotation_days(
+    school_id: str,
+    academic_year_id: Optional[str] = None,
+    session: AsyncSession = Depends(get_db),
+    _: User = Depends(get_current_user),
+):
+    school = await _get_school(session, school_id)
+    query = select(RotationDay).where(RotationDay.school_id == school.id)
+    if academic_year_id:
+        query = query.where(RotationDay.academic_year_id == _parse_uuid(academic_year_id, "academic_year_id"))
+    result = await session.execute(query.order_by(RotationDay.sequence))
+    return result.scalars().all()
+
+@router.post("/schools/{school_id}/rotation-days", response_model=RotationDayOut)
+async def create_rotation_day(
+    school_id: str,
+    payload: RotationDayCreate,
+    session: AsyncSession = Depends(get_db),
+    _: User = Depends(require_admin),
+):
+    school = await _get_school(session, school_id)
+    try:
+        rotation_day = RotationDay(school_id=school.id, **payload.dict())
+        session.add(rotation_day)
+        await session.commit()
+        await session.refresh(rotation_day)
+        return rotation_day
+    except Exception as e:
+        await session.rollback()
+        raise HTTPException(status_code=500, detail=f"Failed to create rotation day: {str(e)}")
+
+@router.post("/schools/{school_id}/calendar", response_model=CalendarGenerateResponse)
+async def generate_calendar(
+    school_id: str,
+    payload: CalendarGenerateRequest,
+    session: AsyncSession = Depends(get_db),
+    _: User = Depends(require_admin),
+):
+    """Lay out school days and rotation days for a range, then recompile the schedule over it"""
+    school = await _get_school(session, school_id)
+    try:
+        days = await schedule_service.generate_calendar(
+            session,
+            school.id,
+            payload.academic_year_id,
+            payload.start_date,
+            payload.end_date,
+            set(payload.closed_dates),
+            payload.weekdays,
+        )
+        # Past days stay as they were compiled
+        start = max(payload.start_date, school_today(school.tz))
+        occurrences = 0
+        if start <= payload.end_date:
+            occurrences = await schedule_service.compile_schedule(session, school.id, start, payload.end_date)
+        await session.commit()
+        return {"days_written": days, "occurrences_written": occurrences}
+    except Exception as e:
+        await session.rollback()
+        raise HTTPException(status_code=500, detail=f"Failed to generate calendar: {str(e)}")
+
+@router.post("/schools/{school_id}/compile", response_model=CompileResponse)
+async def compile_schedule(
+    school_id: str,
+    session: AsyncSession = Depends(get_db),
+    _: User = Depends(require_admin),
+):
+    """Rebuild the school's compiled schedule from today onward"""
+    school = await _get_school(session, school_id)
+    try:
+        written = await schedule_service.compile_schedule(session, school.id)
+        await session.commit()
+        return {"school_id": school.id, "occurrences_written": written}
+    except Exception as e:
+        await session.rollback()
+        raise HTTPException(status_code=500, detail=f"Failed to compile schedule: {str(e)}")
+
+@router.get("/schools/{school_id}/room-conflicts", response_model=List[RoomConflictOut])
+async def list_room_conflicts(
+    school_id: str,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    session: AsyncSession = Depends(get_db),
+    _: User = Depends(require_admin),
+):
+    """Upcoming class meetings that could not get their room because something else holds it"""
+    school = await _get_school(session, school_id)
+    start = start_date or school_today(school.tz)
+    return await unbooked_occurrences(session, school.id, start, end_date)
+
+@router.get("/classrooms/{classroom_id}/blocks", response_model=List[CalendarBlockOut])
+async def list_blocks(
+    classroom_id: str,
+    session: AsyncSession = Depends(get_db),
+    _: User = Depends(get_current_user),
+):
+    classroom_uuid = _parse_uuid(classroom_id, "classroom_id")
+    result = await session.execute(
+        select(CalendarBlock).where(CalendarBlock.classroom_id == classroom_uuid).order_by(CalendarBlock.created_at)
+    )
+    return result.scalars().all()
+
+@router.post("/classrooms/{classroom_id}/blocks", response_model=CalendarBlockOut)
+async def create_block(
+    classroom_id: str,
+    payload: CalendarBlockCreate,
+    session: AsyncSession = Depends(get_db),
+    _: User = Depends(require_admin),
+):
+    classroom = await session.get(Classroom, _parse_uuid(classroom_id, "classroom_id"))
+    if not classroom:
+        raise HTTPException(status_code=404, detail="Classroom not found")
+    period = await session.get(SchedulePeriod, payload.period_id)
+    if not period:
+        raise HTTPException(status_code=400, detail="Period not found")
+    if period.academic_year_id != classroom.academic_year_id:
+        raise HTTPException(status_code=400, detail="Period belongs to a different academic year")
+    if payload.rotation_day_id is not None:
+        rotation_day = await session.get(RotationDay, payload.rotation_day_id)
+        if not rotation_day or rotation_day.school_id != period.school_id:
+            raise HTTPException(status_code=400, detail="Rotation day not found for this school")
+    if payload.room_id is not None:
+        room = await session.get(Room, payload.room_id)
+        if not room or room.school_id != period.school_id:
+            raise HTTPException(status_code=400, detail="Room not found for this school")
+
+    try:
+        block = CalendarBlock(classroom_id=classroom.id, **payload.dict())
+        session.add(block)
+        await session.flush()
+        await schedule_service.recompile_classrooms(session, [classroom.id])
+        await session.commit()
+        await session.refresh(block)
+        return block
+    except Exception as e:
+        await session.rollback()
+        raise HTTPException(status_code=500, detail=f"Failed to create block: {str(e)}")
+
+@router.delete("/blocks/{block_id}", status_code=204)
+async def delete_block(
+    block_id: str,
+    session: AsyncSession = Depends(get_db),
+    _: User = Depends(require_admin),
+):
+    block = await session.get(CalendarBlock, _parse_uuid(block_id, "block_id"))
+    if not block:
+        raise HTTPException(status_code=404, detail="Block not found")
+    try:
+        classroom_id = block.classroom_id
+        # Its occurrences cascade with it; recompiling lets a remaining block take over the slot
+        await session.delete(block)
+        await session.flush()
+        await schedule_service.recompile_classrooms(session, [classroom_id])
+        await session.commit()
+    except Exception as e:
+        await session.rollback()
+        raise HTTPException(status_code=500, detail=f"Failed to delete block: {str(e)}")
+
+@router.get("/teachers/me/day", response_model=List[ScheduleOccurrenceOut])
+async def my_day(
+    on_date: Optional[date] = Query(None, alias="date", description="School-local date; defaults to each school's today"),
+    session: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """The current teacher's classes for the day, with room and roster size"""
+    return await schedule_service.teacher_day(session, current_user.id, on_date)
+
+@router.get("/rooms/{room_id}/now", response_model=RoomNowOut)
+async def room_now(
+    room_id: str,
+    at: Optional[datetime] = Query(None, description="Defaults to now"),
+    session: AsyncSession = Depends(get_db),
+    _: User = Depends(get_current_user),
+):
+    """What meets in a room right now, and what is next"""
+    room = await session.get(Room, _parse_uuid(room_id, "room_id"))
+    if not room:
+        raise HTTPException(status_code=404, detail="Room not found")
+    if at is not None and at.tzinfo is None:
+        raise HTTPException(status_code=400, detail="at must include a UTC offset")
+    return await schedule_service.room_now(session, room.id, at)
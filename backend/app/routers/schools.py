@@ -2,8 +2,10 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from typing import List
-from ..deps import get_db, require_admin, get_current_user
+from ..deps import _is_adminish, get_db, require_admin, get_current_user
 from ..models.school import School
+from ..models.user import User
+from ..models.user_role import UserRole
 from ..schemas.school import SchoolCreate, SchoolOut, SchoolUpdate
 
 router = APIRouter(prefix="/schools", tags=["schools"])
@@ -11,9 +13,18 @@ router = APIRouter(prefix="/schools", tags=["schools"])
 @router.get("", response_model=List[SchoolOut])
 async def list_schools(
     session: AsyncSession = Depends(get_db),
-    _: any = Depends(get_current_user),
+    user: User = Depends(get_current_user),
 ):
-    res = await session.execute(select(School).order_by(School.name))
+    # Only the schools the caller holds an active role at. Admins (who can create
+    # schools they hold no role at) and users with no roles yet (first-run setup)
+    # still see every school
+    roles = (await session.execute(
+        select(UserRole.role, UserRole.school_id).where(UserRole.user_id == user.id, UserRole.is_active == True)
+    )).all()
+    query = select(School).order_by(School.name)
+    if roles and not any(_is_adminish(role) for role, _ in roles):
+        query = query.where(School.id.in_({school_id for _, school_id in roles}))
+    res = await session.execute(query)
     return res.scalars().all()
 
 @router.post("", response_model=SchoolOut, status_code=status.HTTP_201_CREATED)
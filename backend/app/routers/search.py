@@ -0,0 +1,40 @@
+# backend/app/routers/search.py
+# Server-side search so the frontend no longer downloads full lists to filter them
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
+from uuid import UUID
+
+from ..deps import get_db, require_role
+from ..schemas.search import SearchResponse
+from ..services.search import SEARCH_MODES, SEARCH_TYPES, search
+
+router = APIRouter(prefix="/search", tags=["search"])
+
+@router.get("", response_model=SearchResponse)
+async def search_directory(
+    q: str = Query(..., min_length=1, max_length=100),
+    types: Optional[str] = Query(None, description="Comma-separated: students,staff,classrooms"),
+    mode: str = Query("search", description="search (ranked, typo-tolerant) or prefix (autocomplete)"),
+    school_id: Optional[str] = None,
+    limit: int = Query(10, ge=1, le=50),
+    session: AsyncSession = Depends(get_db),
+    _: any = Depends(require_role("admin", "teacher")),
+):
+    """Ranked search across students, staff and classrooms"""
+    if mode not in SEARCH_MODES:
+        raise HTTPException(status_code=400, detail=f"mode must be one of {', '.join(SEARCH_MODES)}")
+
+    requested = [t.strip() for t in types.split(",") if t.strip()] if types else list(SEARCH_TYPES)
+    unknown = [t for t in requested if t not in SEARCH_TYPES]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown search type(s): {', '.join(unknown)}")
+
+    try:
+        school_uuid = UUID(school_id) if school_id else None
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid school_id")
+
+    results = await search(session, q, requested, mode=mode, limit=limit, school_id=school_uuid)
+    return {"query": q, "mode": mode, "results": results}
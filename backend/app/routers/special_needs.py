@@ -3,7 +3,7 @@
 
 # backend/app/routers/special_needs.py
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from typing import List, Optional
@@ -12,8 +12,14 @@ from ..models.special_needs_tag_library import SpecialNeedsTagLibrary
 from ..models.student_special_need import StudentSpecialNeed
 from ..schemas.special_needs import (
     SpecialNeedsTagCreate, SpecialNeedsTagOut, SpecialNeedsTagUpdate,
-    StudentSpecialNeedCreate, StudentSpecialNeedOut, StudentSpecialNeedUpdate
+    StudentSpecialNeedCreate, StudentSpecialNeedOut, StudentSpecialNeedUpdate,
+    StudentSpecialNeedReview, SpecialNeedAssignmentOut, ReviewDuePage, ReviewDigestOut,
 )
+from ..schemas.job import JobOut
+from ..services import review_queue
+from ..services.jobs import start_job
+from ..services.student_flags import refresh_flags
+from ..services.timezone import school_today
 
 router = APIRouter(prefix="/special-needs", tags=["special-needs"])
 
@@ -134,6 +140,118 @@ async def assign_special_need_to_student(
     )
     
     session.add(assignment)
+    await session.flush()
+    await refresh_flags(session, [assignment.student_id])
     await session.commit()
     await session.refresh(assignment)
-    return assignment
\ No newline at end of file
+    return assignment
+
+def _parse_uuid(value: str, name: str):
+    from uuid import UUID
+    try:
+        return UUID(value)
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"Invalid {name}")
+
+@router.patch("/assignments/{assignment_id}", response_model=SpecialNeedAssignmentOut)
+async def update_special_need_assignment(
+    assignment_id: str,
+    payload: StudentSpecialNeedUpdate,
+    session: AsyncSession = Depends(get_db),
+    _: any = Depends(require_admin),
+):
+    """Change severity, notes, end/review dates or deactivate an assignment"""
+    assignment = await session.get(StudentSpecialNeed, _parse_uuid(assignment_id, "assignment_id"))
+    if not assignment:
+        raise HTTPException(status_code=404, detail="Assignment not found")
+
+    changes = payload.dict(exclude_unset=True)
+    for field, value in changes.items():
+        setattr(assignment, field, value)
+    await session.flush()
+    if "is_active" in changes:
+        await refresh_flags(session, [assignment.student_id])
+    await session.commit()
+    await session.refresh(assignment)
+    return assignment
+
+@router.post("/assignments/{assignment_id}/review", response_model=SpecialNeedAssignmentOut)
+async def record_special_need_review(
+    assignment_id: str,
+    payload: StudentSpecialNeedReview,
+    session: AsyncSession = Depends(get_db),
+    current_user: any = Depends(require_admin),
+):
+    """Mark an assignment reviewed today; it leaves the due-queue until next_review_date"""
+    from ..models.student import Student
+    from ..models.school import School
+
+    assignment = await session.get(StudentSpecialNeed, _parse_uuid(assignment_id, "assignment_id"))
+    if not assignment or not assignment.is_active:
+        raise HTTPException(status_code=404, detail="Active assignment not found")
+
+    tz = (await session.execute(
+        select(School.tz).join(Student, Student.school_id == School.id).where(Student.id == assignment.student_id)
+    )).scalar_one_or_none()
+    today = school_today(tz)
+    if payload.next_review_date is not None and payload.next_review_date <= today:
+        raise HTTPException(status_code=400, detail="next_review_date must be after today")
+
+    assignment.last_reviewed_by = current_user.id
+    assignment.last_reviewed_date = today
+    assignment.review_date = payload.next_review_date
+    if payload.notes is not None:
+        assignment.notes = payload.notes
+    await session.commit()
+    await session.refresh(assignment)
+    return assignment
+
+# Review due-queue
+@router.get("/reviews/due", response_model=ReviewDuePage)
+async def list_due_reviews(
+    days: int = Query(30, ge=0, le=366, description="Include reviews due within this many days"),
+    school_id: Optional[str] = None,
+    tag_library_id: Optional[str] = None,
+    include_overdue: bool = True,
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    limit: int = Query(50, ge=1, le=200),
+    session: AsyncSession = Depends(get_db),
+    _: any = Depends(require_admin),
+):
+    """Active assignments due for review, overdue first then soonest; page with next_cursor"""
+    after = None
+    if cursor:
+        try:
+            after = review_queue.decode_cursor(cursor)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+    return await review_queue.due_reviews(
+        session,
+        days,
+        school_id=_parse_uuid(school_id, "school_id") if school_id else None,
+        tag_library_id=_parse_uuid(tag_library_id, "tag_library_id") if tag_library_id else None,
+        include_overdue=include_overdue,
+        cursor=after,
+        limit=limit,
+    )
+
+@router.get("/reviews/digest", response_model=ReviewDigestOut)
+async def get_review_digest(
+    school_id: str,
+    session: AsyncSession = Depends(get_db),
+    _: any = Depends(require_admin),
+):
+    """The school's latest precomputed review digest (built daily)"""
+    digest = await review_queue.get_digest(session, _parse_uuid(school_id, "school_id"))
+    if digest is None:
+        raise HTTPException(status_code=404, detail="No review digest has been built for this school yet")
+    return digest
+
+@router.post("/reviews/digest/rebuild", response_model=JobOut, status_code=status.HTTP_202_ACCEPTED)
+async def rebuild_review_digests(current_user: any = Depends(require_admin)):
+    """Rebuild today's review digests for every school in the background; poll GET /jobs/{id}"""
+    job = await start_job(
+        "review_digest", review_queue.build_review_digests, force=True,
+        created_by=current_user.id, params={"force": True},
+    )
+    return job.to_dict()
@@ -10,6 +10,7 @@ from uuid import UUID
 
 from ..deps import get_db, require_admin, get_current_user
 from ..models.special_needs_tag_library import SpecialNeedsTagLibrary
+from ..services.student_flags import tag_student_counts
 
 # Simple schemas that match your actual model
 from pydantic import BaseModel
@@ -63,6 +64,7 @@ async def get_student_service_tags(
         
         result = await session.execute(query)
         tags = result.scalars().all()
+        student_counts = await tag_student_counts(session, [tag.id for tag in tags])
         
         # Convert to output format with frontend compatibility
         output_tags = []
@@ -78,7 +80,7 @@ async def get_student_service_tags(
                 display_color="#e53e3e",  # Default for frontend compatibility
                 requires_documentation=True,
                 is_confidential=False,
-                student_count=0
+                student_count=student_counts.get(tag.id, 0)
             ))
         
         return output_tags
@@ -190,6 +192,7 @@ async def update_student_service_tag(
         
         await session.commit()
         await session.refresh(tag)
+        student_counts = await tag_student_counts(session, [tag.id])
         
         return StudentServiceTagOut(
             id=tag.id,
@@ -202,7 +205,7 @@ async def update_student_service_tag(
             display_color="#e53e3e",
             requires_documentation=True,
             is_confidential=False,
-            student_count=0
+            student_count=student_counts.get(tag.id, 0)
         )
         
     except HTTPException:
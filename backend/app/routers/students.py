@@ -22,6 +22,11 @@ from ..models.classroom import Classroom
 from ..models.classroom_teacher_assignment import ClassroomTeacherAssignment
 from ..schemas.enrollment import EnrollmentOut
 from ..models.school import School
+from ..models.student_flags import StudentFlags
+from ..schemas.job import JobOut
+from ..services import promotion as promotion_service
+from ..services.student_flags import flag_columns
+from ..services.jobs import start_job
 
 router = APIRouter(prefix="/students", tags=["students"])
 
@@ -158,10 +163,12 @@ async def get_students(
                 Student,
                 func.coalesce(
                     func.count(case((Enrollment.is_active == True, 1))), 0
-                ).label("enrollment_count")
+                ).label("enrollment_count"),
+                *flag_columns(),
             )
             .outerjoin(Enrollment, Student.id == Enrollment.student_id)
-            .group_by(Student.id)
+            .outerjoin(StudentFlags, StudentFlags.student_id == Student.id)
+            .group_by(Student.id, StudentFlags.student_id)
             .order_by(Student.last_name, Student.first_name)
         )
         
@@ -181,7 +188,7 @@ async def get_students(
         
         # Transform to StudentWithDetails format
         students_with_details = []
-        for student_obj, enrollment_count in student_enrollment_data:
+        for student_obj, enrollment_count, has_special_needs, parent_count in student_enrollment_data:
             student_dict = {
                 # Basic student fields
                 "id": student_obj.id,
@@ -197,8 +204,8 @@ async def get_students(
                 "is_active": student_obj.is_active,
                 # Enhanced fields
                 "enrollment_count": enrollment_count,
-                "has_special_needs": False,  # TODO: Add special needs count if needed
-                "parent_count": 0,  # TODO: Add parent count if needed
+                "has_special_needs": has_special_needs,
+                "parent_count": parent_count,
             }
             students_with_details.append(StudentWithDetails(**student_dict))
         
@@ -287,65 +294,33 @@ async def create_student(
         raise HTTPException(status_code=500, detail="Failed to create student")
 
 
-@router.post("/promote", response_model=dict)
+@router.post("/promote", response_model=JobOut, status_code=status.HTTP_202_ACCEPTED)
 async def promote_students(
     academic_year_id: str = Query(..., description="Target academic year"),
     grade_level: Optional[str] = Query(None, description="Specific grade to promote"),
     session: AsyncSession = Depends(get_db),
-    _: any = Depends(require_admin),
+    current_user = Depends(require_admin),
 ):
-    """Bulk promote students to next grade level"""
+    """Bulk promote students to next grade level as a background job; poll GET /jobs/{id} for the result"""
     try:
-        from ..models.academic_year import AcademicYear
-        
         # Verify academic year exists
-        target_year = await session.get(AcademicYear, UUID(academic_year_id))
+        try:
+            target_year = await session.get(AcademicYear, UUID(academic_year_id))
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid academic_year_id")
         if not target_year:
             raise HTTPException(status_code=404, detail="Academic year not found")
-        
-        # Build query for students to promote
-        query = select(Student).where(Student.is_active == True)
-        
-        if grade_level:
-            # Promote only specific grade
-            query = query.where(Student.current_grade_level == grade_level)
-        else:
-            # Promote all except graduated
-            query = query.where(Student.current_grade_level != 'GRADUATED')
-        
-        result = await session.execute(query)
-        students = result.scalars().all()
-        
-        promoted_count = 0
-        held_back = []
-        graduated = []
-        
-        for student in students:
-            # Check if student can be promoted (could add logic here for grades, attendance, etc.)
-            old_grade = student.current_grade_level
-            
-            if student.promote_to_next_grade():
-                promoted_count += 1
-                
-                if student.current_grade_level == 'GRADUATED':
-                    graduated.append(f"{student.full_name}")
-                    student.is_active = False  # Mark graduated students as inactive
-            else:
-                held_back.append(f"{student.full_name} (Grade {old_grade})")
-        
-        await session.commit()
-        
-        return {
-            "promoted": promoted_count,
-            "graduated": graduated,
-            "held_back": held_back,
-            "message": f"Successfully promoted {promoted_count} students"
-        }
-        
+
+        job = await start_job(
+            "student_promotion", promotion_service.promote_students, grade_level,
+            created_by=current_user.id,
+            params={"academic_year_id": target_year.id, "grade_level": grade_level},
+        )
+        return job.to_dict()
+
     except HTTPException:
         raise
     except Exception as e:
-        await session.rollback()
         logging.error(f"Failed to promote students: {str(e)}")
         raise HTTPException(status_code=500, detail="Failed to promote students")
 
@@ -1,13 +1,16 @@
 # backend/app/routers/subjects.py
 # Fixed with missing PUT endpoint and homeroom sync logic
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, func
+from sqlalchemy import select, func
 from typing import List, Optional
 from ..deps import get_db, require_admin, get_current_user
 from ..models.subject import Subject
+from ..schemas.job import JobOut
 from ..schemas.subject import SubjectCreate, SubjectOut, SubjectUpdate
+from ..services.homeroom_sync import sync_homeroom_subject
+from ..services.jobs import Job, start_job
 
 router = APIRouter(prefix="/subjects", tags=["subjects"])
 
@@ -46,8 +49,9 @@ async def get_core_subjects(
 @router.post("", response_model=SubjectOut, status_code=status.HTTP_201_CREATED)
 async def create_subject(
     payload: SubjectCreate,
+    response: Response,
     session: AsyncSession = Depends(get_db),
-    _: any = Depends(require_admin),
+    current_user: any = Depends(require_admin),
 ):
     """Create a new subject"""
     # Check for duplicate code
@@ -72,9 +76,9 @@ async def create_subject(
     await session.commit()
     await session.refresh(subject)
     
-    # If this subject was marked as homeroom default, sync with existing homerooms
+    # If this subject was marked as homeroom default, sync with existing homerooms (progress: X-Job-Id)
     if payload.is_homeroom_default:
-        await _sync_homeroom_assignments(session, subject, added=True)
+        await _start_homeroom_sync(subject, response, current_user)
     
     return subject
 
@@ -83,18 +87,20 @@ async def create_subject(
 async def update_subject_put(
     subject_id: str,
     payload: SubjectUpdate,
+    response: Response,
     session: AsyncSession = Depends(get_db),
-    _: any = Depends(require_admin),
+    current_user: any = Depends(require_admin),
 ):
     """Update a subject using PUT method - calls the same logic as PATCH"""
-    return await update_subject_patch(subject_id, payload, session, _)
+    return await update_subject_patch(subject_id, payload, response, session, current_user)
 
 @router.patch("/{subject_id}", response_model=SubjectOut)
 async def update_subject_patch(
     subject_id: str,
     payload: SubjectUpdate,
+    response: Response,
     session: AsyncSession = Depends(get_db),
-    _: any = Depends(require_admin),
+    current_user: any = Depends(require_admin),
 ):
     """Update a subject (cannot modify system core subjects significantly)"""
     from uuid import UUID
@@ -135,16 +141,29 @@ async def update_subject_patch(
     if not subject.is_system_core and payload.is_homeroom_default is not None:
         new_homeroom_status = subject.is_homeroom_default
         
-        if old_homeroom_status != new_homeroom_status:
-            if new_homeroom_status:
-                # Subject was added to homeroom auto-assignment
-                await _sync_homeroom_assignments(session, subject, added=True)
-            else:
-                # Subject was removed from homeroom auto-assignment
-                await _sync_homeroom_assignments(session, subject, added=False)
+        # Subject was added to homeroom auto-assignment (progress: X-Job-Id)
+        if new_homeroom_status and not old_homeroom_status:
+            await _start_homeroom_sync(subject, response, current_user)
     
     return subject
 
+@router.post("/{subject_id}/sync-homerooms", response_model=JobOut, status_code=status.HTTP_202_ACCEPTED)
+async def sync_homerooms(
+    subject_id: str,
+    response: Response,
+    session: AsyncSession = Depends(get_db),
+    current_user: any = Depends(require_admin),
+):
+    """Re-run the homeroom classroom sync for a homeroom-default subject; poll GET /jobs/{id}"""
+    from uuid import UUID
+
+    subject = await session.get(Subject, UUID(subject_id))
+    if not subject:
+        raise HTTPException(status_code=404, detail="Subject not found")
+    if not subject.is_homeroom_default:
+        raise HTTPException(status_code=400, detail="Subject is not a homeroom default")
+    return (await _start_homeroom_sync(subject, response, current_user)).to_dict()
+
 @router.delete("/{subject_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_subject(
     subject_id: str,
@@ -173,150 +192,16 @@ async def delete_subject(
     await session.commit()
 
 # Helper function for homeroom sync logic
-async def _sync_homeroom_assignments(session: AsyncSession, subject: Subject, added: bool):
+async def _start_homeroom_sync(subject: Subject, response: Response, user) -> Job:
     """
-    Sync homeroom assignments when a subject's homeroom status changes
-    
-    Args:
-        subject: The subject that changed
-        added: True if added to homeroom, False if removed
+    Create missing homeroom classrooms for a subject in the background.
+
+    Removing a subject from homeroom auto-assignment needs no sync: existing
+    classrooms (and any grades in them) are preserved.
     """
-    from ..models.classroom import Classroom
-    from ..models.classroom_teacher_assignment import ClassroomTeacherAssignment
-    from ..models.user import User
-    from ..models.academic_year import AcademicYear
-    import uuid
-    
-    try:
-        if added:
-            # Subject was added to homeroom auto-assignment
-            # Find all elementary homeroom teachers and create classrooms for this subject
-            
-            # Get active academic year
-            active_year_result = await session.execute(
-                select(AcademicYear).where(AcademicYear.is_active == True)
-            )
-            active_year = active_year_result.scalar_one_or_none()
-            
-            if not active_year:
-                print(f"⚠️  No active academic year found - skipping homeroom sync for {subject.name}")
-                return
-            
-            # Find elementary homeroom teachers (those with existing Grade K-5 classrooms)
-            homeroom_teachers_result = await session.execute(
-                select(ClassroomTeacherAssignment.teacher_user_id)
-                .join(Classroom)
-                .where(
-                    and_(
-                        Classroom.grade_level.in_(['K', '1', '2', '3', '4', '5']),
-                        Classroom.academic_year_id == active_year.id,
-                        ClassroomTeacherAssignment.is_active == True
-                    )
-                )
-                .distinct()
-            )
-            teacher_ids = [row[0] for row in homeroom_teachers_result.fetchall()]
-            
-            if not teacher_ids:
-                print(f"⚠️  No elementary homeroom teachers found - skipping homeroom sync for {subject.name}")
-                return
-            
-            # For each homeroom teacher, check if they already have a classroom for this subject
-            for teacher_id in teacher_ids:
-                # Check if teacher already has this subject
-                existing_classroom = await session.execute(
-                    select(Classroom)
-                    .join(ClassroomTeacherAssignment)
-                    .where(
-                        and_(
-                            Classroom.subject_id == subject.id,
-                            ClassroomTeacherAssignment.teacher_user_id == teacher_id,
-                            Classroom.academic_year_id == active_year.id,
-                            ClassroomTeacherAssignment.is_active == True
-                        )
-                    )
-                )
-                
-                if existing_classroom.scalar_one_or_none():
-                    continue  # Teacher already has this subject
-                
-                # Get teacher info for classroom name
-                teacher = await session.get(User, teacher_id)
-                if not teacher:
-                    continue
-                
-                # Get teacher's grade level from existing classrooms
-                teacher_grade_result = await session.execute(
-                    select(Classroom.grade_level)
-                    .join(ClassroomTeacherAssignment)
-                    .where(
-                        and_(
-                            ClassroomTeacherAssignment.teacher_user_id == teacher_id,
-                            Classroom.academic_year_id == active_year.id,
-                            ClassroomTeacherAssignment.is_active == True
-                        )
-                    )
-                    .limit(1)
-                )
-                grade_level = teacher_grade_result.scalar_one_or_none()
-                
-                if not grade_level:
-                    continue
-                
-                # Create new classroom for this subject
-                new_classroom = Classroom(
-                    id=uuid.uuid4(),
-                    name=f"{teacher.first_name} {teacher.last_name}'s Grade {grade_level} - {subject.name}",
-                    subject_id=subject.id,
-                    academic_year_id=active_year.id,
-                    grade_level=grade_level,
-                    classroom_type="CORE",
-                    max_students=25
-                )
-                session.add(new_classroom)
-                await session.flush()  # Get classroom ID
-                
-                # Create teacher assignment
-                teacher_assignment = ClassroomTeacherAssignment(
-                    id=uuid.uuid4(),
-                    classroom_id=new_classroom.id,
-                    teacher_user_id=teacher_id,
-                    role_name="Primary Teacher",
-                    can_view_grades=True,
-                    can_modify_grades=True,
-                    can_take_attendance=True,
-                    can_view_parent_contact=True,
-                    can_create_assignments=True,
-                    start_date=active_year.start_date,
-                    is_active=True
-                )
-                session.add(teacher_assignment)
-                
-                print(f"✅ Created {subject.name} classroom for {teacher.first_name} {teacher.last_name} (Grade {grade_level})")
-        
-        else:
-            # Subject was removed from homeroom auto-assignment
-            # Handle removal based on whether classrooms have grades/students
-            
-            # Find all classrooms for this subject
-            classrooms_result = await session.execute(
-                select(Classroom).where(Classroom.subject_id == subject.id)
-            )
-            classrooms = classrooms_result.scalars().all()
-            
-            for classroom in classrooms:
-                # TODO: Check if classroom has grades/assignments
-                # For now, we'll leave the classrooms but could add logic to:
-                # 1. Check for existing grades/assignments
-                # 2. If none exist, remove the classroom
-                # 3. If grades exist, just remove the auto-assignment flag
-                
-                print(f"ℹ️  {subject.name} removed from auto-assignment - classroom '{classroom.name}' preserved")
-        
-        await session.commit()
-        
-    except Exception as e:
-        await session.rollback()
-        print(f"❌ Error syncing homeroom assignments for {subject.name}: {str(e)}")
-        # Don't raise the error - homeroom sync is non-critical
-        pass
\ No newline at end of file
+    job = await start_job(
+        "homeroom_sync", sync_homeroom_subject, subject.id,
+        created_by=user.id, params={"subject_id": subject.id},
+    )
+    response.headers["X-Job-Id"] = str(job.id)
+    return job
@@ -54,4 +54,12 @@ class AcademicYearOut(AcademicYearBase):
     short_name: str
 
     class Config:
-        orm_mode = True
\ No newline at end of file
+        orm_mode = True
+
+class AcademicYearRolloverRequest(BaseModel):
+    """Clone a previous year's classes into this one (see services/year_rollover.py)"""
+    source_academic_year_id: UUID
+    include_rooms: bool = True
+    include_teachers: bool = True
+    pre_enroll_homerooms: bool = False  # Move homeroom students up a grade into this year's homerooms
+    dry_run: bool = False  # Report what would be created, then roll back
@@ -0,0 +1,123 @@
+# backend/app/schemas/attendance.py
+
+from pydantic import BaseModel, validator
+from datetime import date, datetime
+from typing import Optional, List
+from uuid import UUID
+
+from ..models.attendance import ATTENDANCE_STATUSES
+
+class AttendanceSheetRow(BaseModel):
+    """One roster row on the class session sheet"""
+    student_id: UUID
+    student_number: Optional[str]
+    first_name: str
+    last_name: str
+    status: Optional[str]  # None for unmarked students once the sheet has locked
+    is_default: bool  # True when no mark is saved yet
+    minutes_late: Optional[int] = None
+    note_internal: Optional[str] = None
+    note_shareable: Optional[str] = None
+    shared_with_parent: bool = False
+    recorded_at: Optional[datetime] = None
+    recorded_by: Optional[UUID] = None
+    version: int = 0  # 0 = never saved
+
+class AttendanceSheetOut(BaseModel):
+    classroom_id: UUID
+    session_id: Optional[UUID]
+    session_date: date
+    locked: bool
+    counts: dict
+    roster: List[AttendanceSheetRow]
+
+class AttendanceMarkIn(BaseModel):
+    student_id: UUID
+    status: str = "PRESENT"
+    minutes_late: Optional[int] = None
+    note_internal: Optional[str] = None
+    note_shareable: Optional[str] = None
+    shared_with_parent: bool = False
+
+    @validator('status')
+    def validate_status(cls, v):
+        v = v.upper()
+        if v not in ATTENDANCE_STATUSES:
+            raise ValueError(f'Invalid status. Must be one of: {", ".join(ATTENDANCE_STATUSES)}')
+        return v
+
+    @validator('minutes_late')
+    def validate_minutes_late(cls, v):
+        if v is not None and v < 0:
+            raise ValueError('minutes_late cannot be negative')
+        return v
+
+    @validator('note_internal', 'note_shareable')
+    def validate_note_length(cls, v):
+        if v is not None and len(v) > 280:
+            raise ValueError('Notes are limited to 280 characters')
+        return v
+
+class AttendanceSaveRequest(BaseModel):
+    marks: List[AttendanceMarkIn]
+    edited_reason: Optional[str] = None  # Required for admin edits after the sheet locks
+
+class AttendanceSaveError(BaseModel):
+    student_id: UUID
+    code: str
+    message: str
+
+class AttendanceSavedMark(BaseModel):
+    student_id: UUID
+    status: str
+    version: int
+
+class AttendanceSaveResponse(BaseModel):
+    session_id: UUID
+    saved: List[AttendanceSavedMark]
+    unchanged: List[UUID]  # Already saved with identical values - version not bumped
+    errors: List[AttendanceSaveError]
+
+# Offline queue sync
+
+# Keeps the single mark upsert under asyncpg's 32767 bind-parameter limit
+MAX_SYNC_MUTATIONS = 1000
+
+class AttendanceMutationIn(AttendanceMarkIn):
+    """One queued mark change from an offline client"""
+    mutation_id: UUID  # Client idempotency key - replaying it returns the original result
+    classroom_id: UUID
+    session_date: date
+    base_version: int = 0  # Mark version the client last saw (0 = no saved mark)
+    client_ts: datetime  # When the teacher made the change on the device
+    edited_reason: Optional[str] = None
+
+class AttendanceSyncRequest(BaseModel):
+    mutations: List[AttendanceMutationIn]
+
+    @validator('mutations')
+    def validate_batch_size(cls, v):
+        if len(v) > MAX_SYNC_MUTATIONS:
+            raise ValueError(f'At most {MAX_SYNC_MUTATIONS} mutations per sync')
+        return v
+
+class AttendanceServerMark(BaseModel):
+    status: str
+    version: int
+    recorded_at: datetime
+    recorded_by: Optional[UUID]
+
+class AttendanceMutationResult(BaseModel):
+    mutation_id: UUID
+    outcome: str  # APPLIED, CONFLICT, REJECTED
+    code: Optional[str] = None
+    message: Optional[str] = None
+    version: Optional[int] = None
+    replayed: bool = False
+    server_mark: Optional[AttendanceServerMark] = None  # Current server state on CONFLICT
+
+class AttendanceSyncResponse(BaseModel):
+    applied: int
+    conflicts: int
+    rejected: int
+    results: List[AttendanceMutationResult]
@@ -60,6 +60,7 @@ class ClassroomOut(ClassroomBase):
     subject_id: UUID
     academic_year_id: UUID
     room_id: Optional[UUID] = None  # ADDED: Room ID
+    school_id: Optional[UUID] = None
     subject: Optional[SubjectOut] = None
     academic_year: Optional[AcademicYearOut] = None
     room: Optional[RoomOut] = None  # ADDED: Room details
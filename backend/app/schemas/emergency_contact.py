@@ -0,0 +1,40 @@
+# backend/app/schemas/emergency_contact.py
+
+from pydantic import BaseModel, validator
+from typing import List, Optional
+from uuid import UUID
+
+class EmergencyContactOut(BaseModel):
+    parent_id: UUID
+    name: str
+    relationship_type: str
+    priority: int
+    phone: Optional[str]
+    email: Optional[str]
+    preferred_contact_method: Optional[str]
+    can_pickup: bool
+    can_authorize_medical: bool
+    custody_status: Optional[str]
+
+class StudentEmergencyContactsOut(BaseModel):
+    student_id: UUID
+    external_id: Optional[str]
+    first_name: str
+    last_name: str
+    grade_level: str
+    contacts: List[EmergencyContactOut]  # Priority order; first is called first
+
+class EmergencyLookupRequest(BaseModel):
+    student_ids: List[UUID]
+
+    @validator('student_ids')
+    def validate_size(cls, v):
+        if len(v) > 5000:
+            raise ValueError('At most 5000 students per lookup')
+        return v
+
+class EmergencyDirectoryOut(BaseModel):
+    school_id: UUID
+    count: int
+    students: List[StudentEmergencyContactsOut]
+    not_found: List[UUID] = []  # Lookup ids that are not active students at the school
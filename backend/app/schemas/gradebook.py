@@ -0,0 +1,194 @@
+# backend/app/schemas/gradebook.py
+
+from pydantic import BaseModel, validator
+from datetime import datetime
+from decimal import Decimal
+from typing import Dict, List, Optional
+from uuid import UUID
+
+from ..models.gradebook import GRADE_STATUSES
+
+# Keeps the single grade upsert under asyncpg's 32767 bind-parameter limit
+MAX_BULK_GRADES = 2000
+
+class AssignmentCategoryCreate(BaseModel):
+    name: str
+    weight: Decimal = Decimal("1")
+    drop_lowest: int = 0
+    color: Optional[str] = None
+    display_order: int = 0
+
+    @validator('weight')
+    def validate_weight(cls, v):
+        if v < 0:
+            raise ValueError('weight cannot be negative')
+        return v
+
+    @validator('drop_lowest')
+    def validate_drop_lowest(cls, v):
+        if v < 0:
+            raise ValueError('drop_lowest cannot be negative')
+        return v
+
+class AssignmentCategoryOut(BaseModel):
+    id: UUID
+    classroom_id: UUID
+    name: str
+    weight: Decimal
+    drop_lowest: int
+    color: Optional[str]
+    is_active: bool
+    display_order: int
+
+    class Config:
+        orm_mode = True
+
+class AssignmentCreate(BaseModel):
+    title: str
+    category_id: Optional[UUID] = None
+    description: Optional[str] = None
+    points_possible: Decimal
+    assigned_date: Optional[datetime] = None
+    due_date: Optional[datetime] = None
+    allow_late: bool = True
+    late_penalty: Optional[Decimal] = None
+    weight_override: Optional[Decimal] = None
+    is_extra_credit: bool = False
+    is_published: bool = False
+
+    @validator('points_possible')
+    def validate_points_possible(cls, v):
+        if v <= 0:
+            raise ValueError('points_possible must be greater than zero')
+        return v
+
+class AssignmentOut(BaseModel):
+    id: UUID
+    classroom_id: UUID
+    category_id: Optional[UUID]
+    title: str
+    description: Optional[str]
+    points_possible: Decimal
+    assigned_date: Optional[datetime]
+    due_date: Optional[datetime]
+    allow_late: bool
+    late_penalty: Optional[Decimal]
+    weight_override: Optional[Decimal]
+    is_extra_credit: bool
+    is_published: bool
+
+    class Config:
+        orm_mode = True
+
+class StudentAverage(BaseModel):
+    student_id: UUID
+    overall: Optional[float]  # Percent; None until something counts
+    categories: Dict[str, Optional[float]]  # category_id (or "uncategorized") -> percent
+    dropped_count: int
+
+class ClassAveragesOut(BaseModel):
+    classroom_id: UUID
+    category_ids: List[Optional[UUID]]
+    students: List[StudentAverage]
+
+class GradeIn(BaseModel):
+    points_earned: Optional[Decimal] = None
+    status: str = "GRADED"
+    comments: Optional[str] = None
+    shareable: bool = False
+
+    @validator('status')
+    def validate_status(cls, v):
+        v = v.upper()
+        if v not in GRADE_STATUSES:
+            raise ValueError(f'Invalid status. Must be one of: {", ".join(GRADE_STATUSES)}')
+        return v
+
+    @validator('points_earned')
+    def validate_points_earned(cls, v):
+        if v is not None and v < 0:
+            raise ValueError('points_earned cannot be negative')
+        return v
+
+class GradeOut(BaseModel):
+    id: UUID
+    assignment_id: UUID
+    student_id: UUID
+    points_earned: Optional[Decimal]
+    status: str
+    comments: Optional[str]
+    shareable: bool
+    graded_by: Optional[UUID]
+    graded_date: Optional[datetime]
+
+    class Config:
+        orm_mode = True
+
+class CachedAverageOut(BaseModel):
+    classroom_id: UUID
+    classroom_name: Optional[str] = None
+    overall_percent: Optional[Decimal]
+    category_percents: Dict[str, Optional[float]]
+    computed_at: datetime
+
+class GradeSaveResponse(BaseModel):
+    grade: GradeOut
+    average: Optional[CachedAverageOut]  # None for unpublished assignments or withdrawn students
+
+class BulkGradeRequest(BaseModel):
+    """One assignment's grades as parallel columns; index i of every column is student_ids[i].
+
+    Only ``student_ids`` and ``points_earned`` are required. Omitted columns leave
+    stored values untouched (new grades get defaults: GRADED, no comment, not shared).
+    """
+    assignment_id: UUID
+    student_ids: List[UUID]
+    points_earned: List[Optional[Decimal]]
+    statuses: Optional[List[str]] = None
+    comments: Optional[List[Optional[str]]] = None
+    shareable: Optional[List[bool]] = None
+    reason: Optional[str] = None  # Recorded on every audit row
+
+    @validator('student_ids')
+    def validate_batch_size(cls, v):
+        if len(v) > MAX_BULK_GRADES:
+            raise ValueError(f'At most {MAX_BULK_GRADES} grades per request')
+        return v
+
+    @validator('points_earned', 'statuses', 'comments', 'shareable')
+    def validate_column_length(cls, v, values):
+        if v is not None and 'student_ids' in values and len(v) != len(values['student_ids']):
+            raise ValueError('Every column must have one entry per student_id')
+        return v
+
+    @validator('points_earned')
+    def validate_points_earned(cls, v):
+        if any(p is not None and p < 0 for p in v):
+            raise ValueError('points_earned cannot be negative')
+        return v
+
+    @validator('statuses')
+    def validate_statuses(cls, v):
+        if v is None:
+            return v
+        v = [status.upper() for status in v]
+        invalid = sorted(set(v) - set(GRADE_STATUSES))
+        if invalid:
+            raise ValueError(f'Invalid status {", ".join(invalid)}. Must be one of: {", ".join(GRADE_STATUSES)}')
+        return v
+
+class BulkGradeError(BaseModel):
+    student_id: UUID
+    code: str
+    message: str
+
+class BulkGradeSaved(BaseModel):
+    student_id: UUID
+    points_earned: Optional[Decimal]
+    status: str
+
+class BulkGradeResponse(BaseModel):
+    assignment_id: UUID
+    saved: List[BulkGradeSaved]
+    unchanged: List[UUID]  # Already stored with identical values - not rewritten or audited
+    errors: List[BulkGradeError]
@@ -0,0 +1,22 @@
+# backend/app/schemas/job.py
+
+from pydantic import BaseModel
+from datetime import datetime
+from typing import Any, Optional
+from uuid import UUID
+
+class JobOut(BaseModel):
+    id: UUID
+    kind: str
+    status: str  # PENDING, RUNNING, SUCCEEDED, FAILED, CANCELLED
+    done: int
+    total: Optional[int]
+    progress: Optional[float]  # 0..1; None while the total is unknown
+    message: Optional[str]
+    result: Any
+    error: Optional[str]
+    cancel_requested: bool = False
+    created_by: Optional[UUID]
+    created_at: datetime
+    started_at: Optional[datetime]
+    finished_at: Optional[datetime]
@@ -1,6 +1,7 @@
 # backend/app/schemas/parent.py
 
 from pydantic import BaseModel, EmailStr
+from datetime import datetime
 from typing import Optional, List
 from uuid import UUID
 
@@ -9,6 +10,7 @@ class ParentBase(BaseModel):
     emergency_contact: bool = True
     pickup_authorized: bool = True
     preferred_contact_method: str = "EMAIL"  # EMAIL, PHONE, TEXT
+    phone: Optional[str] = None
 
 class ParentCreate(BaseModel):
     # User info for account creation
@@ -21,12 +23,14 @@ class ParentCreate(BaseModel):
     emergency_contact: bool = True
     pickup_authorized: bool = True
     preferred_contact_method: str = "EMAIL"
+    phone: Optional[str] = None
 
 class ParentUpdate(BaseModel):
     relationship_type: Optional[str] = None
     emergency_contact: Optional[bool] = None
     pickup_authorized: Optional[bool] = None
     preferred_contact_method: Optional[str] = None
+    phone: Optional[str] = None
 
 class ParentOut(ParentBase):
     id: UUID
@@ -73,3 +77,42 @@ class ParentStudentRelationshipOut(ParentStudentRelationshipBase):
 
     class Config:
         orm_mode = True
+
+class ParentTeacherOut(BaseModel):
+    id: UUID
+    name: str
+    email: str
+    role_name: str
+
+class ParentChildClassOut(BaseModel):
+    classroom_id: UUID
+    classroom_name: str
+    subject_name: str
+    grade_level: str
+    classroom_type: Optional[str]
+    teachers: List[ParentTeacherOut]
+    overall_percent: Optional[float]  # None when grades are withheld or not yet averaged
+    absence_rate_30d: Optional[float]  # None when attendance is withheld or not yet taken
+
+class ParentChildAttendanceOut(BaseModel):
+    sessions_30d: int
+    absences_30d: int
+    absent_streak: int
+    attendance_rate_30d: Optional[float]
+
+class ParentChildSummaryOut(BaseModel):
+    student_id: UUID
+    first_name: str
+    last_name: str
+    current_grade_level: str
+    school_id: UUID
+    relationship_type: str
+    can_view_grades: bool
+    can_view_attendance: bool
+    classes: List[ParentChildClassOut]
+    attendance: Optional[ParentChildAttendanceOut]  # Across all classes, last 30 days
+
+class ParentSummaryOut(BaseModel):
+    parent_id: UUID
+    generated_at: datetime
+    students: List[ParentChildSummaryOut]
@@ -1,7 +1,8 @@
 # backend/app/schemas/room.py
 
-from pydantic import BaseModel
-from typing import Optional
+from pydantic import BaseModel, validator
+from datetime import datetime
+from typing import List, Optional
 from uuid import UUID
 
 class RoomBase(BaseModel):
@@ -36,4 +37,62 @@ class RoomOut(RoomBase):
     is_active: bool
 
     class Config:
-        orm_mode = True
\ No newline at end of file
+        orm_mode = True
+class RoomBookingCreate(BaseModel):
+    starts_at: datetime
+    ends_at: datetime
+    title: Optional[str] = None
+
+    @validator('ends_at')
+    def validate_window(cls, v, values):
+        starts_at = values.get('starts_at')
+        if v.tzinfo is None or (starts_at is not None and starts_at.tzinfo is None):
+            raise ValueError('Times must include a UTC offset')
+        if starts_at is not None and v <= starts_at:
+            raise ValueError('ends_at must be after starts_at')
+        return v
+
+class RoomBookingOut(BaseModel):
+    id: UUID
+    room_id: UUID
+    source: str  # CLASS (compiled schedule) or EVENT
+    starts_at: datetime
+    ends_at: datetime
+    title: Optional[str]
+    occurrence_id: Optional[UUID]
+    booked_by: Optional[UUID]
+
+    class Config:
+        orm_mode = True
+
+class RoomUtilizationClassroom(BaseModel):
+    id: UUID
+    name: str
+    grade_level: Optional[str]
+    subject: Optional[str]
+    enrolled: int
+    max_students: Optional[int]
+
+class RoomUtilization(BaseModel):
+    room_id: UUID
+    name: str
+    code: str
+    type: str
+    capacity: Optional[int]
+    assigned_classrooms: List[RoomUtilizationClassroom]
+    peak_enrollment: int  # Largest active enrollment among assigned classrooms
+    utilization: float  # peak_enrollment / capacity
+    over_capacity: bool
+    warnings: List[str]
+
+class RoomUtilizationSummary(BaseModel):
+    rooms: int
+    rooms_in_use: int
+    rooms_over_capacity: int
+    average_utilization: float  # Over rooms in use
+
+class RoomUtilizationReport(BaseModel):
+    school_id: UUID
+    academic_year_id: Optional[UUID]
+    summary: RoomUtilizationSummary
+    rooms: List[RoomUtilization]
@@ -0,0 +1,139 @@
+# backend/app/schemas/schedule.py
+
+from pydantic import BaseModel, validator
+from datetime import date, datetime, time
+from typing import List, Optional
+from uuid import UUID
+
+class SchedulePeriodCreate(BaseModel):
+    academic_year_id: UUID
+    name: str
+    start_time: time
+    end_time: time
+    display_order: int = 0
+
+    @validator('end_time')
+    def validate_times(cls, v, values):
+        if 'start_time' in values and v <= values['start_time']:
+            raise ValueError('end_time must be after start_time')
+        return v
+
+class SchedulePeriodOut(BaseModel):
+    id: UUID
+    school_id: UUID
+    academic_year_id: UUID
+    name: str
+    start_time: time
+    end_time: time
+    display_order: int
+    is_active: bool
+
+    class Config:
+        orm_mode = True
+
+class RotationDayCreate(BaseModel):
+    academic_year_id: UUID
+    name: str
+    sequence: int
+
+    @validator('sequence')
+    def validate_sequence(cls, v):
+        if v < 1:
+            raise ValueError('sequence starts at 1')
+        return v
+
+class RotationDayOut(BaseModel):
+    id: UUID
+    school_id: UUID
+    academic_year_id: UUID
+    name: str
+    sequence: int
+
+    class Config:
+        orm_mode = True
+
+class CalendarGenerateRequest(BaseModel):
+    """Lay out school days for a range; weekdays are Python weekday numbers (Monday = 0)"""
+    academic_year_id: UUID
+    start_date: date
+    end_date: date
+    closed_dates: List[date] = []
+    weekdays: List[int] = [0, 1, 2, 3, 4]
+
+    @validator('end_date')
+    def validate_range(cls, v, values):
+        if 'start_date' in values and v < values['start_date']:
+            raise ValueError('end_date must not be before start_date')
+        if 'start_date' in values and (v - values['start_date']).days > 400:
+            raise ValueError('Range cannot exceed 400 days')
+        return v
+
+    @validator('weekdays')
+    def validate_weekdays(cls, v):
+        if any(day < 0 or day > 6 for day in v):
+            raise ValueError('weekdays must be between 0 (Monday) and 6 (Sunday)')
+        return v
+
+class CalendarGenerateResponse(BaseModel):
+    days_written: int
+    occurrences_written: int
+
+class CalendarBlockCreate(BaseModel):
+    period_id: UUID
+    rotation_day_id: Optional[UUID] = None  # None = every instructional day
+    room_id: Optional[UUID] = None  # None = the classroom's room
+    effective_from: Optional[date] = None
+    effective_to: Optional[date] = None
+
+    @validator('effective_to')
+    def validate_effective_range(cls, v, values):
+        if v is not None and values.get('effective_from') is not None and v < values['effective_from']:
+            raise ValueError('effective_to must not be before effective_from')
+        return v
+
+class CalendarBlockOut(BaseModel):
+    id: UUID
+    classroom_id: UUID
+    period_id: UUID
+    rotation_day_id: Optional[UUID]
+    room_id: Optional[UUID]
+    effective_from: Optional[date]
+    effective_to: Optional[date]
+
+    class Config:
+        orm_mode = True
+
+class CompileResponse(BaseModel):
+    school_id: UUID
+    occurrences_written: int
+
+class ScheduleOccurrenceOut(BaseModel):
+    id: UUID
+    block_id: UUID
+    calendar_date: date
+    starts_at: datetime
+    ends_at: datetime
+    classroom_id: UUID
+    classroom_name: str
+    period_name: str
+    room_id: Optional[UUID]
+    room_name: Optional[str]
+    roster_count: int
+
+class RoomNowOut(BaseModel):
+    room_id: UUID
+    at: datetime
+    current: Optional[ScheduleOccurrenceOut]
+    next: Optional[ScheduleOccurrenceOut]
+
+class RoomConflictOut(BaseModel):
+    occurrence_id: UUID
+    classroom_id: UUID
+    room_id: UUID
+    calendar_date: date
+    starts_at: datetime
+    ends_at: datetime
+    conflicting_booking_id: UUID
+    conflicting_source: str
+    conflicting_title: Optional[str]
+    conflicting_occurrence_id: Optional[UUID]  # Set when another class meeting holds the room
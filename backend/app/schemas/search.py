@@ -0,0 +1,17 @@
+# backend/app/schemas/search.py
+
+from pydantic import BaseModel
+from typing import List, Optional
+from uuid import UUID
+
+class SearchResult(BaseModel):
+    type: str  # student, staff, classroom
+    id: UUID
+    label: str
+    sublabel: Optional[str] = None
+    score: float
+
+class SearchResponse(BaseModel):
+    query: str
+    mode: str  # search, prefix
+    results: List[SearchResult]
@@ -1,7 +1,7 @@
 # backend/app/schemas/special_needs.py
 
 from pydantic import BaseModel
-from datetime import date
+from datetime import date, datetime
 from typing import Optional, List
 from uuid import UUID
 
@@ -58,3 +58,55 @@ class StudentSpecialNeedOut(StudentSpecialNeedBase):
     class Config:
         orm_mode = True
    
+
+class StudentSpecialNeedReview(BaseModel):
+    """Record a completed review; next_review_date schedules the following one"""
+    next_review_date: Optional[date] = None
+    notes: Optional[str] = None
+
+class SpecialNeedAssignmentOut(BaseModel):
+    id: UUID
+    student_id: UUID
+    tag_library_id: UUID
+    severity_level: Optional[str] = None
+    notes: Optional[str] = None
+    start_date: date
+    end_date: Optional[date] = None
+    review_date: Optional[date] = None
+    is_active: bool
+    last_reviewed_by: Optional[UUID] = None
+    last_reviewed_date: Optional[date] = None
+
+    class Config:
+        orm_mode = True
+
+class ReviewDueItem(BaseModel):
+    assignment_id: UUID
+    student_id: UUID
+    student_name: str
+    grade_level: str
+    school_id: UUID
+    tag_library_id: UUID
+    tag_name: str
+    severity_level: Optional[str] = None
+    review_date: date
+    last_reviewed_date: Optional[date] = None
+    days_until_due: int  # Negative when overdue
+
+class ReviewDuePage(BaseModel):
+    as_of: date
+    items: List[ReviewDueItem]
+    next_cursor: Optional[str] = None
+
+class ReviewDigestOut(BaseModel):
+    school_id: UUID
+    digest_date: date
+    horizon_days: int
+    overdue_count: int
+    due_7d_count: int
+    due_horizon_count: int
+    items: List[ReviewDueItem]
+    generated_at: datetime
+
+    class Config:
+        orm_mode = True
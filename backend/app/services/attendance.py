@@ -0,0 +1,286 @@
+# backend/app/services/attendance.py
+# Class-session attendance: sheet assembly, access checks and bulk mark upserts
+
+"""
+The sheet is the cached active roster (see ``roster_cache``) overlaid with the
+marks saved for that classroom/date, fetched in a single query. Students with
+no saved mark default to PRESENT while the sheet is open (spec BR-1).
+
+Saving writes every mark with one ``INSERT ... ON CONFLICT DO UPDATE``. The
+update only fires when a value actually changed, so re-saving an unchanged
+sheet (autosave) neither bumps ``version`` nor rewrites rows.
+"""
+
+import uuid
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from sqlalchemy import and_, func, select, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..deps import _is_adminish
+from ..models.attendance import AttendanceMark, AttendanceSession
+from ..models.classroom import Classroom
+from ..models.classroom_teacher_assignment import ClassroomTeacherAssignment
+from ..models.room import Room
+from ..models.school import School
+from ..models.user_role import UserRole
+from .roster_cache import get_roster
+from .timezone import school_today
+
+DEFAULT_STATUS = "PRESENT"
+MARK_FIELDS = ("status", "minutes_late", "note_internal", "note_shareable", "shared_with_parent")
+
+
+@dataclass
+class AttendanceAccess:
+    is_admin: bool
+    can_view: bool
+    can_edit: bool
+
+
+async def classroom_timezones(session: AsyncSession, classroom_ids: Iterable[UUID]) -> Dict[UUID, Optional[str]]:
+    """School ``tz`` per classroom (the classroom's school, else its room's); None falls back to the default zone"""
+    classroom_ids = set(classroom_ids)
+    if not classroom_ids:
+        return {}
+    result = await session.execute(
+        select(Classroom.id, School.tz)
+        .outerjoin(Room, Room.id == Classroom.room_id)
+        .outerjoin(School, School.id == func.coalesce(Classroom.school_id, Room.school_id))
+        .where(Classroom.id.in_(classroom_ids))
+    )
+    timezones = dict.fromkeys(classroom_ids)
+    timezones.update(result.all())
+    return timezones
+
+
+async def classroom_tz(session: AsyncSession, classroom_id: UUID) -> Optional[str]:
+    return (await classroom_timezones(session, [classroom_id]))[classroom_id]
+
+
+def is_locked(session_date: date, tz: Optional[str]) -> bool:
+    """Teacher edits close at the end of the session day at the school (spec FR-7)"""
+    return session_date < school_today(tz)
+
+
+async def get_access_many(
+    session: AsyncSession, user_id: UUID, classroom_ids: Iterable[UUID]
+) -> Dict[UUID, AttendanceAccess]:
+    """Access for several classrooms with two queries (roles + assignments)"""
+    classroom_ids = set(classroom_ids)
+    roles = (await session.execute(
+        select(UserRole.role).where(UserRole.user_id == user_id, UserRole.is_active == True)
+    )).scalars().all()
+    if any(_is_adminish(role) for role in roles):
+        return {cid: AttendanceAccess(is_admin=True, can_view=True, can_edit=True) for cid in classroom_ids}
+
+    assignments = (await session.execute(
+        select(ClassroomTeacherAssignment.classroom_id, ClassroomTeacherAssignment.can_take_attendance).where(
+            ClassroomTeacherAssignment.classroom_id.in_(classroom_ids),
+            ClassroomTeacherAssignment.teacher_user_id == user_id,
+            ClassroomTeacherAssignment.is_active == True,
+        )
+    )).all()
+    access = {cid: AttendanceAccess(is_admin=False, can_view=False, can_edit=False) for cid in classroom_ids}
+    for classroom_id, can_take_attendance in assignments:
+        access[classroom_id].can_view = True
+        access[classroom_id].can_edit = access[classroom_id].can_edit or bool(can_take_attendance)
+    return access
+
+
+async def get_access(session: AsyncSession, user_id: UUID, classroom_id: UUID) -> AttendanceAccess:
+    """Admins see and edit everything; teachers need an active assignment to the class"""
+    return (await get_access_many(session, user_id, [classroom_id]))[classroom_id]
+
+
+async def load_sheet(
+    session: AsyncSession, classroom_id: UUID, session_date: date, tz: Optional[str] = None
+) -> Optional[Dict[str, Any]]:
+    """Roster with saved marks overlaid, or None if the classroom does not exist"""
+    roster = await get_roster(session, classroom_id, active_only=True)
+    if roster is None:
+        return None
+
+    result = await session.execute(
+        select(
+            AttendanceSession.id,
+            AttendanceMark.student_id,
+            AttendanceMark.status,
+            AttendanceMark.minutes_late,
+            AttendanceMark.note_internal,
+            AttendanceMark.note_shareable,
+            AttendanceMark.shared_with_parent,
+            AttendanceMark.recorded_at,
+            AttendanceMark.recorded_by,
+            AttendanceMark.version,
+        )
+        .select_from(AttendanceSession)
+        # Matching on the year lets Postgres skip the other years' marks partitions at run time
+        .outerjoin(AttendanceMark, and_(
+            AttendanceMark.session_id == AttendanceSession.id,
+            AttendanceMark.academic_year_id == AttendanceSession.academic_year_id,
+        ))
+        .where(
+            AttendanceSession.classroom_id == classroom_id,
+            AttendanceSession.session_date == session_date,
+        )
+    )
+    session_id = None
+    marks: Dict[UUID, Any] = {}
+    for row in result.all():
+        session_id = row.id
+        if row.student_id is not None:
+            marks[row.student_id] = row
+
+    locked = is_locked(session_date, tz)
+    default_status = None if locked else DEFAULT_STATUS
+    rows = []
+    counts = {"present": 0, "absent": 0, "tardy": 0, "unmarked": 0}
+    for student in sorted(roster, key=lambda r: (r.last_name.lower(), r.first_name.lower())):
+        mark = marks.get(student.id)
+        status = mark.status if mark else default_status
+        rows.append({
+            "student_id": student.id,
+            "student_number": student.student_id,
+            "first_name": student.first_name,
+            "last_name": student.last_name,
+            "status": status,
+            "is_default": mark is None,
+            "minutes_late": mark.minutes_late if mark else None,
+            "note_internal": mark.note_internal if mark else None,
+            "note_shareable": mark.note_shareable if mark else None,
+            "shared_with_parent": mark.shared_with_parent if mark else False,
+            "recorded_at": mark.recorded_at if mark else None,
+            "recorded_by": mark.recorded_by if mark else None,
+            "version": mark.version if mark else 0,
+        })
+        if status is None:
+            counts["unmarked"] += 1
+        else:
+            counts[status.split("_", 1)[0].lower()] += 1
+
+    return {
+        "classroom_id": classroom_id,
+        "session_id": session_id,
+        "session_date": session_date,
+        "locked": locked,
+        "counts": counts,
+        "roster": rows,
+    }
+
+
+async def ensure_sessions(
+    session: AsyncSession, keys: Iterable[Tuple[UUID, date]], created_by: Optional[UUID]
+) -> Dict[Tuple[UUID, date], Tuple[UUID, UUID]]:
+    """Get-or-create session rows for (classroom_id, date) keys in one upsert.
+
+    Returns {key: (session_id, academic_year_id)}; keys whose classroom does not
+    exist are left out.
+    """
+    keys = set(keys)
+    if not keys:
+        return {}
+    years = dict((await session.execute(
+        select(Classroom.id, Classroom.academic_year_id).where(Classroom.id.in_({cid for cid, _ in keys}))
+    )).all())
+    values = [
+        {
+            "id": uuid.uuid4(),
+            "classroom_id": classroom_id,
+            "academic_year_id": years[classroom_id],
+            "session_date": session_date,
+            "created_by": created_by,
+        }
+        for classroom_id, session_date in keys
+        if classroom_id in years
+    ]
+    if not values:
+        return {}
+
+    stmt = pg_insert(AttendanceSession).values(values)
+    # The no-op update makes RETURNING yield the existing row on conflict
+    stmt = stmt.on_conflict_do_update(
+        constraint="uq_attendance_sessions_classroom_date",
+        set_={"updated_at": func.now()},
+    ).returning(
+        AttendanceSession.id,
+        AttendanceSession.classroom_id,
+        AttendanceSession.session_date,
+        AttendanceSession.academic_year_id,
+    )
+    result = await session.execute(stmt)
+    return {
+        (row.classroom_id, row.session_date): (row.id, row.academic_year_id)
+        for row in result.all()
+    }
+
+
+async def ensure_session(
+    session: AsyncSession, classroom_id: UUID, session_date: date, created_by: Optional[UUID]
+) -> Optional[Tuple[UUID, UUID]]:
+    """Get-or-create one session row; returns (session_id, academic_year_id)"""
+    sessions = await ensure_sessions(session, [(classroom_id, session_date)], created_by)
+    return sessions.get((classroom_id, session_date))
+
+
+async def upsert_marks(
+    session: AsyncSession,
+    session_id: UUID,
+    academic_year_id: UUID,
+    marks: Sequence[Dict[str, Any]],
+    recorded_by: Optional[UUID],
+    source: str,
+    edited_reason: Optional[str] = None,
+) -> List[Any]:
+    """Write all marks with a single INSERT ... ON CONFLICT; returns rows that changed"""
+    if not marks:
+        return []
+
+    now = datetime.now(timezone.utc)
+    values = [
+        {
+            "id": uuid.uuid4(),
+            "session_id": session_id,
+            "student_id": mark["student_id"],
+            "academic_year_id": academic_year_id,
+            "status": mark.get("status") or DEFAULT_STATUS,
+            "minutes_late": mark.get("minutes_late"),
+            "note_internal": mark.get("note_internal"),
+            "note_shareable": mark.get("note_shareable"),
+            "shared_with_parent": bool(mark.get("shared_with_parent")),
+            "recorded_at": now,
+            "recorded_by": recorded_by,
+            "edited_reason": edited_reason,
+            "source": source,
+            "version": 1,
+            "created_at": now,
+            "updated_at": now,
+        }
+        for mark in marks
+    ]
+
+    stmt = pg_insert(AttendanceMark).values(values)
+    excluded = stmt.excluded
+    # attendance_marks is partitioned by year, so the conflict target includes it
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["session_id", "student_id", "academic_year_id"],
+        set_={
+            **{field: excluded[field] for field in MARK_FIELDS},
+            "recorded_at": excluded.recorded_at,
+            "recorded_by": excluded.recorded_by,
+            "edited_reason": excluded.edited_reason,
+            "source": excluded.source,
+            "version": AttendanceMark.version + 1,
+            "updated_at": excluded.updated_at,
+        },
+        where=tuple_(*(getattr(AttendanceMark, f) for f in MARK_FIELDS)).is_distinct_from(
+            tuple_(*(excluded[f] for f in MARK_FIELDS))
+        ),
+    ).returning(AttendanceMark.student_id, AttendanceMark.status, AttendanceMark.version)
+
+    result = await session.execute(stmt)
+    return result.all()
@@ -0,0 +1,240 @@
+# backend/app/services/attendance_stats.py
+# Incrementally maintained attendance streaks and rolling 30-day absence rates
+
+"""
+Each (student, classroom) row in ``student_attendance_stats`` is a small state
+machine advanced by every mark write:
+
+* Streaks count consecutive *sessions* absent / tardy. The streak as of the
+  previous session is kept too, so re-marking the latest session (the usual
+  correction) is O(1).
+* The 30-day window is two bitmasks shifted by the number of days between
+  sessions; rates are popcounts. No history scan is needed.
+
+A mark for a date older than the latest session cannot be folded in
+incrementally; those keys are recomputed from their history in one query.
+``rebuild`` does the same for whole classrooms (backfills, threshold changes).
+
+``has_alert`` is stored so dashboard alerts are a partial-index lookup.
+"""
+
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
+from typing import Any, Dict, Iterable, Optional, Sequence, Set, Tuple
+from uuid import UUID
+
+from sqlalchemy import select, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..config import get_settings
+from ..models.attendance import AttendanceMark, AttendanceSession, StudentAttendanceStats
+from . import parent_summary
+
+WINDOW_DAYS = 30
+WINDOW_MASK = (1 << WINDOW_DAYS) - 1
+ALERT_STREAK = 3  # Teacher dashboard spec: absence streaks of 3+ days
+MIN_SESSIONS_FOR_RATE = 5  # Don't alert on a rate computed from a handful of sessions
+
+StatsKey = Tuple[UUID, UUID]  # (student_id, classroom_id)
+
+STATE_FIELDS = (
+    "absent_streak", "tardy_streak", "prior_absent_streak", "prior_tardy_streak",
+    "last_session_date", "last_status", "session_bits", "absent_bits",
+)
+
+
+@dataclass
+class StreakState:
+    academic_year_id: UUID
+    absent_streak: int = 0
+    tardy_streak: int = 0
+    prior_absent_streak: int = 0
+    prior_tardy_streak: int = 0
+    last_session_date: Optional[date] = None
+    last_status: Optional[str] = None
+    session_bits: int = 0
+    absent_bits: int = 0
+
+    def apply(self, session_date: date, status: str) -> bool:
+        """Fold in one mark; False if it predates the latest session (needs a recompute)"""
+        if self.last_session_date is not None and session_date < self.last_session_date:
+            return False
+
+        if self.last_session_date is None or session_date > self.last_session_date:
+            # Moving to a new session: today's "prior" is yesterday's current
+            self.prior_absent_streak = self.absent_streak
+            self.prior_tardy_streak = self.tardy_streak
+            shift = (session_date - self.last_session_date).days if self.last_session_date else WINDOW_DAYS
+            if shift >= WINDOW_DAYS:
+                self.session_bits = self.absent_bits = 0
+            else:
+                self.session_bits = (self.session_bits << shift) & WINDOW_MASK
+                self.absent_bits = (self.absent_bits << shift) & WINDOW_MASK
+            self.last_session_date = session_date
+
+        absent = status.startswith("ABSENT")
+        tardy = status.startswith("TARDY")
+        self.absent_streak = self.prior_absent_streak + 1 if absent else 0
+        self.tardy_streak = self.prior_tardy_streak + 1 if tardy else 0
+        self.last_status = status
+        self.session_bits |= 1
+        self.absent_bits = (self.absent_bits | 1) if absent else (self.absent_bits & ~1)
+        return True
+
+    @property
+    def sessions_30d(self) -> int:
+        return bin(self.session_bits).count("1")
+
+    @property
+    def absences_30d(self) -> int:
+        return bin(self.absent_bits).count("1")
+
+    @property
+    def absence_rate_30d(self) -> float:
+        sessions = self.sessions_30d
+        return round(self.absences_30d / sessions, 4) if sessions else 0.0
+
+    @property
+    def has_alert(self) -> bool:
+        if self.absent_streak >= ALERT_STREAK or self.tardy_streak >= ALERT_STREAK:
+            return True
+        return (
+            self.sessions_30d >= MIN_SESSIONS_FOR_RATE
+            and self.absence_rate_30d >= get_settings().attendance_alert_absence_rate
+        )
+
+    def to_row(self, student_id: UUID, classroom_id: UUID, now: datetime) -> Dict[str, Any]:
+        return {
+            "student_id": student_id,
+            "classroom_id": classroom_id,
+            "academic_year_id": self.academic_year_id,
+            **{name: getattr(self, name) for name in STATE_FIELDS},
+            "sessions_30d": self.sessions_30d,
+            "absences_30d": self.absences_30d,
+            "absence_rate_30d": self.absence_rate_30d,
+            "has_alert": self.has_alert,
+            "updated_at": now,
+        }
+
+
+async def _history(session: AsyncSession, keys: Set[StatsKey]) -> Dict[StatsKey, StreakState]:
+    """Recompute state for the given keys from their full mark history (one query)"""
+    states: Dict[StatsKey, StreakState] = {}
+    if not keys:
+        return states
+    result = await session.execute(
+        select(
+            AttendanceMark.student_id,
+            AttendanceSession.classroom_id,
+            AttendanceSession.academic_year_id,
+            AttendanceSession.session_date,
+            AttendanceMark.status,
+        )
+        .join(AttendanceSession, AttendanceSession.id == AttendanceMark.session_id)
+        .where(tuple_(AttendanceMark.student_id, AttendanceSession.classroom_id).in_(keys))
+        .order_by(AttendanceSession.session_date)
+    )
+    for student_id, classroom_id, academic_year_id, session_date, status in result.all():
+        state = states.setdefault((student_id, classroom_id), StreakState(academic_year_id))
+        state.apply(session_date, status)
+    return states
+
+
+async def _write(session: AsyncSession, states: Dict[StatsKey, StreakState]) -> None:
+    if not states:
+        return
+    now = datetime.now(timezone.utc)
+    values = [state.to_row(student_id, classroom_id, now) for (student_id, classroom_id), state in states.items()]
+    stmt = pg_insert(StudentAttendanceStats).values(values)
+    excluded = stmt.excluded
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["student_id", "classroom_id"],
+        set_={
+            name: excluded[name]
+            for name in values[0]
+            if name not in ("student_id", "classroom_id")
+        },
+    )
+    await session.execute(stmt)
+    parent_summary.mark_students_changed(session, (student_id for student_id, _ in states))
+
+
+async def apply_marks(
+    session: AsyncSession,
+    marks: Iterable[Tuple[UUID, UUID, UUID, date, str]],
+) -> None:
+    """Advance stats for written marks: (student_id, classroom_id, academic_year_id, session_date, status).
+
+    Call after the marks themselves are written, in the same transaction.
+    """
+    marks = sorted(marks, key=lambda m: m[3])
+    if not marks:
+        return
+    keys = {(m[0], m[1]) for m in marks}
+
+    current = await session.execute(
+        select(StudentAttendanceStats)
+        .where(tuple_(StudentAttendanceStats.student_id, StudentAttendanceStats.classroom_id).in_(keys))
+        .with_for_update()
+    )
+    states: Dict[StatsKey, StreakState] = {}
+    for row in current.scalars():
+        states[(row.student_id, row.classroom_id)] = StreakState(
+            row.academic_year_id, **{name: getattr(row, name) for name in STATE_FIELDS}
+        )
+
+    stale: Set[StatsKey] = set()
+    for student_id, classroom_id, academic_year_id, session_date, status in marks:
+        key = (student_id, classroom_id)
+        if key in stale:
+            continue
+        state = states.setdefault(key, StreakState(academic_year_id))
+        if not state.apply(session_date, status):
+            stale.add(key)
+
+    # Back-dated edits: replay those students' history, which already includes this write
+    states.update(await _history(session, stale))
+    await _write(session, states)
+
+
+async def rebuild(session: AsyncSession, classroom_ids: Optional[Sequence[UUID]] = None, batch_size: int = 500) -> int:
+    """Recompute stats from attendance history; returns the number of rows written.
+
+    Keys with no remaining marks are removed. The caller commits.
+    """
+    query = (
+        select(
+            AttendanceMark.student_id,
+            AttendanceSession.classroom_id,
+            AttendanceSession.academic_year_id,
+            AttendanceSession.session_date,
+            AttendanceMark.status,
+        )
+        .join(AttendanceSession, AttendanceSession.id == AttendanceMark.session_id)
+        .order_by(AttendanceMark.student_id, AttendanceSession.classroom_id, AttendanceSession.session_date)
+    )
+    delete_scope = StudentAttendanceStats.__table__.delete()
+    if classroom_ids:
+        query = query.where(AttendanceSession.classroom_id.in_(classroom_ids))
+        delete_scope = delete_scope.where(StudentAttendanceStats.classroom_id.in_(classroom_ids))
+    await session.execute(delete_scope)
+
+    written = 0
+    batch: Dict[StatsKey, StreakState] = {}
+    current_key: Optional[StatsKey] = None
+    result = await session.stream(query.execution_options(yield_per=2000))
+    async for student_id, classroom_id, academic_year_id, session_date, status in result:
+        key = (student_id, classroom_id)
+        if key != current_key:
+            # Rows are grouped by key, so a completed key never reappears
+            if len(batch) >= batch_size:
+                await _write(session, batch)
+                written += len(batch)
+                batch = {}
+            current_key = key
+            batch[key] = StreakState(academic_year_id)
+        batch[key].apply(session_date, status)
+
+    await _write(session, batch)
+    return written + len(batch)
@@ -0,0 +1,263 @@
+# backend/app/services/attendance_sync.py
+# Batched, idempotent application of offline-queued attendance mutations
+
+"""
+A reconnecting tablet posts its whole queue at once. The batch is applied in
+one transaction with a fixed number of statements regardless of its size:
+mutation-log lookup, access check, session upsert, locked read of the affected
+marks, one mark upsert, the streak/absence-rate update and one log insert.
+
+Conflict rules, per (session, student), in client timestamp order:
+
+* No saved mark, or ``base_version`` equals the server version: applied.
+* Server version is newer than the client's ``base_version``: the later edit
+  wins - applied if the client's change was made after the server's last
+  change (``LAST_WRITER_WINS``), otherwise reported as a ``CONFLICT`` with the
+  server's current mark so the client can surface it.
+
+Every outcome is recorded under the client's ``mutation_id``; replaying a
+mutation returns the stored outcome instead of applying it again.
+"""
+
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from sqlalchemy import select, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models.attendance import AttendanceMark, AttendanceSyncMutation
+from . import attendance_stats
+from .attendance import MARK_FIELDS, classroom_timezones, ensure_sessions, get_access_many, is_locked
+from .roster_cache import get_roster
+from .timezone import school_zone
+
+APPLIED = "APPLIED"
+CONFLICT = "CONFLICT"
+REJECTED = "REJECTED"
+
+SOURCE = "OFFLINE_QUEUE"
+
+_MESSAGES = {
+    "PERMISSION_DENIED": "You cannot take attendance for this class",
+    "CLASSROOM_NOT_FOUND": "Classroom not found",
+    "NOT_ENROLLED": "Student is not on this class's active roster",
+    "ATTENDANCE_LOCKED": "Attendance is locked for this class. Request an admin override to make changes.",
+    "REASON_REQUIRED": "edited_reason is required to edit a locked sheet",
+    "SERVER_NEWER": "The mark was changed on the server after this edit",
+    "MUTATION_ID_IN_USE": "This mutation_id was already used by another user",
+}
+
+
+def _utc(ts: datetime, now: datetime) -> datetime:
+    """Normalize a device timestamp; a clock running ahead cannot claim the future"""
+    if ts.tzinfo is None:
+        ts = ts.replace(tzinfo=timezone.utc)
+    return min(ts, now)
+
+
+def _result(mutation_id: UUID, outcome: str, code: Optional[str] = None, **extra) -> Dict[str, Any]:
+    return {
+        "mutation_id": mutation_id,
+        "outcome": outcome,
+        "code": code,
+        "message": _MESSAGES.get(code) if code else None,
+        "version": extra.get("version"),
+        "replayed": extra.get("replayed", False),
+        "server_mark": extra.get("server_mark"),
+    }
+
+
+async def apply_sync_batch(session: AsyncSession, user_id: UUID, mutations: Sequence[Any]) -> List[Dict[str, Any]]:
+    """Apply queued mutations; returns one result per mutation, in request order.
+
+    The caller commits.
+    """
+    now = datetime.now(timezone.utc)
+    results: Dict[UUID, Dict[str, Any]] = {}
+
+    # Replays: anything this user already synced keeps its original outcome. The
+    # log is keyed on mutation_id alone, so an id another user already logged is
+    # refused - applying it could never be recorded, and retries would re-apply it
+    mutation_ids = {m.mutation_id for m in mutations}
+    logged = await session.execute(
+        select(AttendanceSyncMutation).where(AttendanceSyncMutation.mutation_id.in_(mutation_ids))
+    )
+    for entry in logged.scalars():
+        if entry.user_id != user_id:
+            results[entry.mutation_id] = _result(entry.mutation_id, REJECTED, "MUTATION_ID_IN_USE")
+            continue
+        results[entry.mutation_id] = _result(
+            entry.mutation_id, entry.outcome, entry.code, version=entry.version, replayed=True
+        )
+
+    pending = []
+    seen = set(results)
+    for m in mutations:
+        if m.mutation_id not in seen:
+            seen.add(m.mutation_id)
+            pending.append(m)
+    if not pending:
+        return [results[m.mutation_id] for m in mutations]
+
+    # Permission, lock and roster checks
+    access = await get_access_many(session, user_id, {m.classroom_id for m in pending})
+    timezones = await classroom_timezones(session, {m.classroom_id for m in pending})
+    rosters: Dict[UUID, Optional[set]] = {}
+    accepted = []
+    for m in pending:
+        classroom_access = access[m.classroom_id]
+        if not classroom_access.can_edit:
+            results[m.mutation_id] = _result(m.mutation_id, REJECTED, "PERMISSION_DENIED")
+            continue
+
+        client_ts = _utc(m.client_ts, now)
+        # Marks taken on the day but queued offline are still on time
+        tz = timezones[m.classroom_id]
+        if is_locked(m.session_date, tz) and client_ts.astimezone(school_zone(tz)).date() > m.session_date:
+            if not classroom_access.is_admin:
+                results[m.mutation_id] = _result(m.mutation_id, REJECTED, "ATTENDANCE_LOCKED")
+                continue
+            if not (m.edited_reason or "").strip():
+                results[m.mutation_id] = _result(m.mutation_id, REJECTED, "REASON_REQUIRED")
+                continue
+
+        if m.classroom_id not in rosters:
+            roster = await get_roster(session, m.classroom_id, active_only=True)
+            rosters[m.classroom_id] = {row.id for row in roster} if roster is not None else None
+        if rosters[m.classroom_id] is None:
+            results[m.mutation_id] = _result(m.mutation_id, REJECTED, "CLASSROOM_NOT_FOUND")
+            continue
+        if m.student_id not in rosters[m.classroom_id]:
+            results[m.mutation_id] = _result(m.mutation_id, REJECTED, "NOT_ENROLLED")
+            continue
+
+        accepted.append((client_ts, m))
+
+    sessions = await ensure_sessions(session, {(m.classroom_id, m.session_date) for _, m in accepted}, user_id)
+
+    # Current marks, row-locked so concurrent syncs for the same marks serialize
+    keys = {(sessions[(m.classroom_id, m.session_date)][0], m.student_id) for _, m in accepted}
+    state: Dict[Tuple[UUID, UUID], Dict[str, Any]] = {}
+    if keys:
+        current = await session.execute(
+            select(AttendanceMark)
+            .where(
+                AttendanceMark.academic_year_id.in_({year_id for _, year_id in sessions.values()}),
+                tuple_(AttendanceMark.session_id, AttendanceMark.student_id).in_(keys),
+            )
+            .with_for_update()
+        )
+        for mark in current.scalars():
+            state[(mark.session_id, mark.student_id)] = {
+                **{field: getattr(mark, field) for field in MARK_FIELDS},
+                "version": mark.version,
+                "recorded_at": mark.recorded_at,
+                "recorded_by": mark.recorded_by,
+                "edited_reason": mark.edited_reason,
+                "source": mark.source,
+            }
+
+    # Resolve in the order the changes were made on the devices
+    dirty: Dict[Tuple[UUID, UUID], UUID] = {}  # key -> academic_year_id
+    log_keys: Dict[UUID, Tuple[UUID, UUID, datetime]] = {}
+    for client_ts, m in sorted(accepted, key=lambda item: item[0]):
+        session_id, academic_year_id = sessions[(m.classroom_id, m.session_date)]
+        key = (session_id, m.student_id)
+        log_keys[m.mutation_id] = (session_id, m.student_id, client_ts)
+        current = state.get(key)
+
+        code = None
+        if current is not None and current["version"] != m.base_version:
+            if client_ts <= current["recorded_at"]:
+                results[m.mutation_id] = _result(
+                    m.mutation_id, CONFLICT, "SERVER_NEWER",
+                    version=current["version"],
+                    server_mark={
+                        "status": current["status"],
+                        "version": current["version"],
+                        "recorded_at": current["recorded_at"],
+                        "recorded_by": current["recorded_by"],
+                    },
+                )
+                continue
+            code = "LAST_WRITER_WINS"
+
+        values = {field: getattr(m, field) for field in MARK_FIELDS}
+        if current is not None and all(current[f] == values[f] for f in MARK_FIELDS):
+            # Already in this state - nothing to write
+            results[m.mutation_id] = _result(m.mutation_id, APPLIED, code, version=current["version"])
+            continue
+
+        state[key] = {
+            **values,
+            "version": (current["version"] if current else 0) + 1,
+            "recorded_at": client_ts,
+            "recorded_by": user_id,
+            "edited_reason": m.edited_reason,
+            "source": SOURCE,
+        }
+        dirty[key] = academic_year_id
+        results[m.mutation_id] = _result(m.mutation_id, APPLIED, code, version=state[key]["version"])
+
+    if dirty:
+        values = [
+            {
+                "id": uuid.uuid4(),
+                "session_id": session_id,
+                "student_id": student_id,
+                "academic_year_id": academic_year_id,
+                **state[(session_id, student_id)],
+                "created_at": now,
+                "updated_at": now,
+            }
+            for (session_id, student_id), academic_year_id in dirty.items()
+        ]
+        stmt = pg_insert(AttendanceMark).values(values)
+        excluded = stmt.excluded
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["session_id", "student_id", "academic_year_id"],
+            set_={
+                **{field: excluded[field] for field in MARK_FIELDS},
+                "version": excluded.version,
+                "recorded_at": excluded.recorded_at,
+                "recorded_by": excluded.recorded_by,
+                "edited_reason": excluded.edited_reason,
+                "source": excluded.source,
+                "updated_at": excluded.updated_at,
+            },
+            # Never move a mark backwards if a row appeared after our locked read
+            where=AttendanceMark.version < excluded.version,
+        )
+        await session.execute(stmt)
+
+        session_keys = {session_id: key for key, (session_id, _) in sessions.items()}
+        await attendance_stats.apply_marks(session, [
+            (student_id, session_keys[session_id][0], academic_year_id, session_keys[session_id][1],
+             state[(session_id, student_id)]["status"])
+            for (session_id, student_id), academic_year_id in dirty.items()
+        ])
+
+    # Record every new outcome under its idempotency key
+    log_rows = []
+    for m in pending:
+        result = results[m.mutation_id]
+        session_id, student_id, client_ts = log_keys.get(m.mutation_id, (None, m.student_id, _utc(m.client_ts, now)))
+        log_rows.append({
+            "mutation_id": m.mutation_id,
+            "user_id": user_id,
+            "session_id": session_id,
+            "student_id": student_id,
+            "outcome": result["outcome"],
+            "code": result["code"],
+            "version": result["version"],
+            "client_ts": client_ts,
+            "created_at": now,
+        })
+    await session.execute(
+        pg_insert(AttendanceSyncMutation).values(log_rows).on_conflict_do_nothing(index_elements=["mutation_id"])
+    )
+
+    return [results[m.mutation_id] for m in mutations]
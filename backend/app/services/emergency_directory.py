@@ -0,0 +1,201 @@
+# backend/app/services/emergency_directory.py
+# In-memory emergency-contact directory per school for front-office lookups
+
+"""
+During a drill the front office may look up hundreds of students in a few
+minutes, and every lookup has to be instant. Each school's directory is loaded
+with one query: active students left-joined to their active emergency-contact
+relationships, the parents and the parents' user accounts, in priority order.
+It is kept as tuples keyed by student id, so a lookup is a dict access and
+never waits on the database.
+
+A directory is dropped when a committed ORM write touches something it shows:
+a relationship, parent or parent user account of a listed contact, or a
+student at the school. The next lookup reloads it (one query, one loader per
+school at a time). ``emergency_directory_max_age_seconds`` bounds staleness
+from Core writes that bypass ORM events and do not call
+``mark_students_changed``.
+"""
+
+import asyncio
+import time
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+from uuid import UUID
+
+from sqlalchemy import and_, event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from ..config import get_settings
+from ..models.parent import Parent
+from ..models.parent_student_relationship import ParentStudentRelationship
+from ..models.student import Student
+from ..models.user import User
+
+_PENDING_KEY = "emergency_directory_pending"
+
+
+class EmergencyContact(NamedTuple):
+    parent_id: UUID
+    name: str
+    relationship_type: str
+    priority: int
+    phone: Optional[str]
+    email: Optional[str]
+    preferred_contact_method: Optional[str]
+    can_pickup: bool
+    can_authorize_medical: bool
+    custody_status: Optional[str]
+
+
+class DirectoryEntry(NamedTuple):
+    student_id: UUID
+    external_id: Optional[str]  # students.student_id
+    first_name: str
+    last_name: str
+    grade_level: str
+    contacts: Tuple[EmergencyContact, ...]
+
+
+class SchoolDirectory:
+    """One school's students in name order, with reverse indexes used for invalidation"""
+
+    def __init__(self, school_id: UUID, entries: Dict[UUID, DirectoryEntry], user_ids: Set[UUID]):
+        self.school_id = school_id
+        self.entries = entries
+        self.parent_ids = {c.parent_id for e in entries.values() for c in e.contacts}
+        self.user_ids = user_ids
+        self.loaded_at = time.monotonic()
+
+    def get(self, student_id: UUID) -> Optional[DirectoryEntry]:
+        return self.entries.get(student_id)
+
+
+_directories: Dict[UUID, SchoolDirectory] = {}
+_load_locks: Dict[UUID, asyncio.Lock] = {}
+
+
+async def get_directory(session: AsyncSession, school_id: UUID) -> SchoolDirectory:
+    directory = _directories.get(school_id)
+    max_age = get_settings().emergency_directory_max_age_seconds
+    if directory is not None and time.monotonic() - directory.loaded_at < max_age:
+        return directory
+
+    lock = _load_locks.setdefault(school_id, asyncio.Lock())
+    async with lock:
+        # Another request may have loaded it while this one waited
+        directory = _directories.get(school_id)
+        if directory is not None and time.monotonic() - directory.loaded_at < max_age:
+            return directory
+        directory = await _load(session, school_id)
+        _directories[school_id] = directory
+        return directory
+
+
+async def _load(session: AsyncSession, school_id: UUID) -> SchoolDirectory:
+    result = await session.execute(
+        select(
+            Student.id, Student.student_id, Student.first_name, Student.last_name, Student.current_grade_level,
+            Parent.id, User.id, User.first_name, User.last_name, User.email, Parent.phone,
+            Parent.preferred_contact_method, ParentStudentRelationship.relationship_type,
+            ParentStudentRelationship.emergency_priority, ParentStudentRelationship.can_pickup_student,
+            ParentStudentRelationship.can_authorize_medical, ParentStudentRelationship.custody_status,
+        )
+        .outerjoin(ParentStudentRelationship, and_(
+            ParentStudentRelationship.student_id == Student.id,
+            ParentStudentRelationship.is_emergency_contact == True,
+            ParentStudentRelationship.is_active == True,
+        ))
+        .outerjoin(Parent, Parent.id == ParentStudentRelationship.parent_id)
+        .outerjoin(User, User.id == Parent.user_id)
+        .where(Student.school_id == school_id, Student.is_active == True)
+        .order_by(Student.last_name, Student.first_name, Student.id, ParentStudentRelationship.emergency_priority)
+    )
+
+    students: Dict[UUID, Tuple[tuple, List[EmergencyContact]]] = {}
+    user_ids: Set[UUID] = set()
+    for row in result.all():
+        (student_id, external_id, first_name, last_name, grade_level, parent_id, user_id, parent_first,
+         parent_last, email, phone, preferred, relationship_type, priority, can_pickup, can_medical, custody) = row
+        student = students.setdefault(student_id, ((student_id, external_id, first_name, last_name, grade_level), []))
+        if parent_id is None:
+            continue
+        user_ids.add(user_id)
+        student[1].append(EmergencyContact(
+            parent_id, f"{parent_first} {parent_last}", relationship_type, priority or 1, phone, email,
+            preferred, bool(can_pickup), bool(can_medical), custody,
+        ))
+
+    entries = {
+        student_id: DirectoryEntry(*fields, tuple(contacts))
+        for student_id, (fields, contacts) in students.items()
+    }
+    return SchoolDirectory(school_id, entries, user_ids)
+
+
+def invalidate_schools(school_ids: Iterable[UUID]) -> None:
+    for school_id in set(school_ids):
+        _directories.pop(school_id, None)
+
+
+def invalidate(student_ids: Set[UUID], parent_ids: Set[UUID], user_ids: Set[UUID]) -> None:
+    """Drop every directory showing any of these students, parents or parent accounts"""
+    stale = [
+        school_id for school_id, directory in _directories.items()
+        if student_ids & directory.entries.keys()
+        or parent_ids & directory.parent_ids
+        or user_ids & directory.user_ids
+    ]
+    invalidate_schools(stale)
+
+
+def mark_students_changed(session: AsyncSession, student_ids: Iterable[UUID]) -> None:
+    """For Core writes: drop directories listing these students once the session commits"""
+    _pending(session.sync_session)[1].update(student_ids)
+
+
+def stats() -> dict:
+    return {
+        "schools": len(_directories),
+        "students": sum(len(d.entries) for d in _directories.values()),
+        "contacts": sum(len(e.contacts) for d in _directories.values() for e in d.entries.values()),
+    }
+
+
+# ---------------------------------------------------------------------------
+# Session events - collect what a flush touched, drop directories on commit
+# ---------------------------------------------------------------------------
+
+def _pending(session: Session) -> Tuple[Set[UUID], Set[UUID], Set[UUID], Set[UUID]]:
+    return session.info.setdefault(_PENDING_KEY, (set(), set(), set(), set()))
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_directory_changes(session: Session, flush_context) -> None:
+    school_ids, student_ids, parent_ids, user_ids = _pending(session)
+    for obj in list(session.new) + list(session.dirty) + list(session.deleted):
+        if isinstance(obj, ParentStudentRelationship):
+            student_ids.add(obj.student_id)
+        elif isinstance(obj, Student):
+            # New students and school moves change which directory lists them
+            student_ids.add(obj.id)
+            school_ids.add(obj.school_id)
+        elif isinstance(obj, Parent):
+            parent_ids.add(obj.id)
+        elif isinstance(obj, User):
+            user_ids.add(obj.id)
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_directory_invalidation(session: Session) -> None:
+    pending = session.info.pop(_PENDING_KEY, None)
+    if pending is None:
+        return
+    school_ids, student_ids, parent_ids, user_ids = pending
+    invalidate_schools(school_ids)
+    invalidate(student_ids, parent_ids, user_ids)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_directory_changes(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
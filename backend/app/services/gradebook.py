@@ -0,0 +1,502 @@
+# backend/app/services/gradebook.py
+# Gradebook access checks and class-average loading
+
+"""
+Loading a class's averages is four queries - the cached roster aside - no
+matter how many grades it has: policy, categories, assignments and one grade
+query over the whole class. The rows are packed into a ``GradebookMatrix`` and
+handed to ``gradebook_engine.compute``.
+
+Published averages are also persisted per student (``student_grade_averages``)
+for parent and student views, which read them without recalculating:
+
+* ``rebuild_averages`` recomputes a whole class with the engine - after
+  assignment/category/policy changes, and (through the ``gradebook_backfill``
+  job) when an enrollment adds a student who has no row yet. Core bulk enrollments
+  (rollover, imports) are covered by the ``gradebook_rebuild`` job.
+* ``apply_grade_changes`` folds saved grades into the stored per-student
+  state (``gradebook_incremental``), touching only the edited students' rows.
+
+``save_grades`` is the single write path for grade entry: one upsert for any
+number of students, one bulk ``grade_history`` insert for the rows that
+actually changed, then one incremental recompute.
+"""
+
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+from uuid import UUID
+
+from sqlalchemy import delete, select, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import undefer
+
+from ..deps import _is_adminish
+from ..models.classroom import Classroom
+from ..models.classroom_teacher_assignment import ClassroomTeacherAssignment
+from ..models.enrollment import Enrollment
+from ..models.parent import Parent
+from ..models.parent_student_relationship import ParentStudentRelationship
+from ..models.gradebook import Assignment, AssignmentCategory, ClassPolicy, Grade, GradeHistory, StudentGradeAverage
+from ..models.user_role import UserRole
+from . import gradebook_engine as engine
+from .gradebook_incremental import StudentGradeState, category_key, states_from_result
+from . import parent_summary
+from .jobs import Job, run_cpu
+from .roster_cache import get_roster
+
+
+@dataclass
+class GradebookAccess:
+    is_admin: bool
+    can_view: bool
+    can_edit: bool
+
+
+async def get_access_many(
+    session: AsyncSession, user_id: UUID, classroom_ids: Iterable[UUID]
+) -> Dict[UUID, GradebookAccess]:
+    """Admins see and edit everything; teachers need an active assignment with grade permissions"""
+    classroom_ids = set(classroom_ids)
+    roles = (await session.execute(
+        select(UserRole.role).where(UserRole.user_id == user_id, UserRole.is_active == True)
+    )).scalars().all()
+    if any(_is_adminish(role) for role in roles):
+        return {cid: GradebookAccess(is_admin=True, can_view=True, can_edit=True) for cid in classroom_ids}
+
+    assignments = (await session.execute(
+        select(
+            ClassroomTeacherAssignment.classroom_id,
+            ClassroomTeacherAssignment.can_view_grades,
+            ClassroomTeacherAssignment.can_modify_grades,
+        ).where(
+            ClassroomTeacherAssignment.classroom_id.in_(classroom_ids),
+            ClassroomTeacherAssignment.teacher_user_id == user_id,
+            ClassroomTeacherAssignment.is_active == True,
+        )
+    )).all()
+    access = {cid: GradebookAccess(is_admin=False, can_view=False, can_edit=False) for cid in classroom_ids}
+    for classroom_id, can_view_grades, can_modify_grades in assignments:
+        access[classroom_id].can_edit = access[classroom_id].can_edit or bool(can_modify_grades)
+        access[classroom_id].can_view = access[classroom_id].can_view or bool(can_view_grades) or access[classroom_id].can_edit
+    return access
+
+
+async def get_access(session: AsyncSession, user_id: UUID, classroom_id: UUID) -> GradebookAccess:
+    return (await get_access_many(session, user_id, [classroom_id]))[classroom_id]
+
+
+async def student_view_scope(session: AsyncSession, user_id: UUID, student_id: UUID) -> Optional[Set[UUID]]:
+    """Classrooms whose grades the user may see for one student; None = all of them.
+
+    Admins and parents with ``can_view_grades`` see everything; teachers see the
+    classes they hold grade permissions for (possibly none).
+    """
+    roles = (await session.execute(
+        select(UserRole.role).where(UserRole.user_id == user_id, UserRole.is_active == True)
+    )).scalars().all()
+    if any(_is_adminish(role) for role in roles):
+        return None
+
+    is_guardian = (await session.execute(
+        select(ParentStudentRelationship.id)
+        .join(Parent, Parent.id == ParentStudentRelationship.parent_id)
+        .where(
+            Parent.user_id == user_id,
+            ParentStudentRelationship.student_id == student_id,
+            ParentStudentRelationship.is_active == True,
+            ParentStudentRelationship.can_view_grades == True,
+        )
+        .limit(1)
+    )).first()
+    if is_guardian:
+        return None
+
+    return set((await session.execute(
+        select(ClassroomTeacherAssignment.classroom_id).where(
+            ClassroomTeacherAssignment.teacher_user_id == user_id,
+            ClassroomTeacherAssignment.is_active == True,
+            (ClassroomTeacherAssignment.can_view_grades == True) | (ClassroomTeacherAssignment.can_modify_grades == True),
+        )
+    )).scalars().all())
+
+
+async def load_matrix(
+    session: AsyncSession, classroom_id: UUID, include_unpublished: bool = False
+) -> Optional[engine.GradebookMatrix]:
+    """Score matrix for the active roster, or None if the classroom does not exist"""
+    roster = await get_roster(session, classroom_id, active_only=True)
+    if roster is None:
+        return None
+    student_ids = [row.id for row in sorted(roster, key=lambda r: (r.last_name.lower(), r.first_name.lower()))]
+
+    policy = await session.get(ClassPolicy, classroom_id)
+
+    categories = (await session.execute(
+        select(AssignmentCategory.id, AssignmentCategory.weight, AssignmentCategory.drop_lowest)
+        .where(AssignmentCategory.classroom_id == classroom_id, AssignmentCategory.is_active == True)
+        .order_by(AssignmentCategory.display_order, AssignmentCategory.name)
+    )).mappings().all()
+
+    # Assignments in deactivated categories drop out of the calculation entirely
+    assignment_query = (
+        select(
+            Assignment.id,
+            Assignment.category_id,
+            Assignment.points_possible,
+            Assignment.weight_override,
+            Assignment.is_extra_credit,
+            Assignment.allow_late,
+            Assignment.late_penalty,
+        )
+        .outerjoin(AssignmentCategory, AssignmentCategory.id == Assignment.category_id)
+        .where(
+            Assignment.classroom_id == classroom_id,
+            (Assignment.category_id.is_(None)) | (AssignmentCategory.is_active == True),
+        )
+        .order_by(Assignment.due_date.nulls_last(), Assignment.created_at)
+    )
+    if not include_unpublished:
+        assignment_query = assignment_query.where(Assignment.is_published == True)
+    assignments = (await session.execute(assignment_query)).mappings().all()
+
+    grades = []
+    if assignments and student_ids:
+        grades = (await session.execute(
+            select(Grade.student_id, Grade.assignment_id, Grade.points_earned, Grade.status)
+            .join(Assignment, Assignment.id == Grade.assignment_id)
+            .where(Assignment.classroom_id == classroom_id)
+        )).all()
+
+    return engine.build_matrix(
+        student_ids,
+        assignments,
+        categories,
+        grades,
+        late_policy_type=policy.late_policy_type if policy else engine.LATE_PERCENT,
+        late_penalty=policy.late_penalty if policy else 0,
+        missing_as_zero=policy.calculate_missing_as_zero if policy else True,
+        decimals=policy.rounding_decimals if policy else 2,
+    )
+
+
+def _number(value: float) -> Optional[float]:
+    return None if value != value else float(value)  # nan -> None
+
+
+def result_rows(result: engine.GradebookResult) -> Dict[str, Any]:
+    """JSON-ready averages: one row per student with per-category percentages"""
+    return {
+        "category_ids": result.category_ids,
+        "students": [
+            {
+                "student_id": student_id,
+                "overall": _number(result.overall[i]),
+                "categories": {
+                    category_key(category_id): _number(value)
+                    for category_id, value in zip(result.category_ids, result.category_averages[i])
+                },
+                "dropped_count": int(result.dropped[i].sum()),
+            }
+            for i, student_id in enumerate(result.student_ids)
+        ],
+    }
+
+
+# Cached averages
+
+# Rows per upsert; keeps each statement well under asyncpg's bind-parameter limit
+AVERAGES_BATCH = 1000
+
+# (student_id, assignment_id, points_earned, status) - status None = grade deleted
+GradeChange = Tuple[UUID, UUID, Optional[Any], Optional[str]]
+
+
+async def _write_averages(session: AsyncSession, classroom_id: UUID, states: Dict[UUID, StudentGradeState]) -> None:
+    now = datetime.now(timezone.utc)
+    values = []
+    for student_id, state in states.items():
+        summary = state.summary()
+        values.append({
+            "classroom_id": classroom_id,
+            "student_id": student_id,
+            "overall_percent": summary["overall"],
+            "category_percents": summary["categories"],
+            "state": state.to_json(),
+            "computed_at": now,
+        })
+    for start in range(0, len(values), AVERAGES_BATCH):
+        stmt = pg_insert(StudentGradeAverage).values(values[start:start + AVERAGES_BATCH])
+        excluded = stmt.excluded
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["classroom_id", "student_id"],
+            set_={
+                "overall_percent": excluded.overall_percent,
+                "category_percents": excluded.category_percents,
+                "state": excluded.state,
+                "computed_at": excluded.computed_at,
+            },
+        )
+        await session.execute(stmt)
+    parent_summary.mark_students_changed(session, states)
+
+
+async def rebuild_averages(session: AsyncSession, classroom_id: UUID, use_process_pool: bool = False) -> int:
+    """Recompute and persist published averages for the class; returns rows written.
+
+    Rows for students no longer on the active roster are removed. Background
+    jobs pass ``use_process_pool`` so the matrix math runs off the event loop.
+    The caller commits.
+    """
+    matrix = await load_matrix(session, classroom_id, include_unpublished=False)
+    await session.execute(delete(StudentGradeAverage).where(StudentGradeAverage.classroom_id == classroom_id))
+    if matrix is None or not matrix.student_ids:
+        return 0
+    result = await run_cpu(engine.compute, matrix) if use_process_pool else engine.compute(matrix)
+    states = states_from_result(matrix, result)
+    await _write_averages(session, classroom_id, dict(zip(matrix.student_ids, states)))
+    return len(states)
+
+
+async def rebuild_year_averages(job: Job, session: AsyncSession, academic_year_id: UUID) -> Dict[str, Any]:
+    """Job body: rebuild cached averages for every class in an academic year.
+
+    Each class commits on its own, so a cancelled run keeps the classes it finished.
+    """
+    classroom_ids = (await session.execute(
+        select(Classroom.id).where(Classroom.academic_year_id == academic_year_id).order_by(Classroom.id)
+    )).scalars().all()
+    job.report(0, len(classroom_ids), f"Rebuilding averages for {len(classroom_ids)} classes")
+
+    rows = 0
+    for done, classroom_id in enumerate(classroom_ids, 1):
+        rows += await rebuild_averages(session, classroom_id, use_process_pool=True)
+        await session.commit()
+        job.report(done)
+    return {"classrooms": len(classroom_ids), "rows_written": rows}
+
+
+async def apply_grade_changes(session: AsyncSession, classroom_id: UUID, changes: Sequence[GradeChange]) -> int:
+    """Fold saved grades into the cached averages of the students they belong to.
+
+    Call after the grades are written, in the same transaction. Falls back to a
+    class rebuild when a student has no cached state yet. Returns rows written.
+    """
+    assignment_ids = {assignment_id for _, assignment_id, _, _ in changes}
+    if not assignment_ids:
+        return 0
+    assignments = {
+        row.id: row
+        for row in (await session.execute(
+            select(
+                Assignment.id,
+                Assignment.category_id,
+                Assignment.points_possible,
+                Assignment.weight_override,
+                Assignment.is_extra_credit,
+                Assignment.allow_late,
+                Assignment.late_penalty,
+            ).where(
+                Assignment.id.in_(assignment_ids),
+                Assignment.classroom_id == classroom_id,
+                Assignment.is_published == True,
+            )
+        )).all()
+    }
+    # Unpublished work is not part of the cached (family-facing) averages
+    changes = [change for change in changes if change[1] in assignments]
+    if not changes:
+        return 0
+
+    roster = await get_roster(session, classroom_id, active_only=True)
+    rostered = {row.id for row in roster or ()}
+    # Withdrawn students keep their grades but have no cached average
+    changes = [change for change in changes if change[0] in rostered]
+    student_ids = {student_id for student_id, _, _, _ in changes}
+    if not student_ids:
+        return 0
+    rows = (await session.execute(
+        select(StudentGradeAverage)
+        .options(undefer(StudentGradeAverage.state))
+        .where(
+            StudentGradeAverage.classroom_id == classroom_id,
+            StudentGradeAverage.student_id.in_(student_ids),
+        )
+        .with_for_update()
+    )).scalars().all()
+    states = {row.student_id: StudentGradeState.from_json(row.state) for row in rows}
+    if len(states) < len(student_ids):
+        return await rebuild_averages(session, classroom_id)
+
+    policy = await session.get(ClassPolicy, classroom_id)
+    late_policy_type = policy.late_policy_type if policy else engine.LATE_PERCENT
+    class_penalty = float(policy.late_penalty) if policy else 0.0
+    missing_as_zero = policy.calculate_missing_as_zero if policy else True
+
+    for student_id, assignment_id, points_earned, status in changes:
+        assignment = assignments[assignment_id]
+        state = states[student_id]
+        key = category_key(assignment.category_id)
+        if key not in state.categories:
+            # Category set changed since the state was built
+            return await rebuild_averages(session, classroom_id)
+        fraction = None
+        if status is not None:
+            fraction = engine.cell_fraction(
+                points_earned,
+                status,
+                float(assignment.points_possible),
+                assignment.allow_late,
+                float(assignment.late_penalty) if assignment.late_penalty is not None else class_penalty,
+                late_policy_type,
+                missing_as_zero,
+            )
+        weight = float(assignment.weight_override if assignment.weight_override is not None else assignment.points_possible)
+        state.set_score(key, str(assignment_id), fraction, weight, assignment.is_extra_credit)
+
+    await _write_averages(session, classroom_id, states)
+    return len(states)
+
+
+async def ensure_averages(session: AsyncSession, classroom_id: UUID, student_ids: Iterable[UUID]) -> int:
+    """Rebuild the class's averages if any of these rostered students has no stored row; returns rows written.
+
+    Call after the enrollment is committed, so the roster includes the student. The caller commits.
+    """
+    student_ids = set(student_ids)
+    stored = set((await session.execute(
+        select(StudentGradeAverage.student_id).where(
+            StudentGradeAverage.classroom_id == classroom_id,
+            StudentGradeAverage.student_id.in_(student_ids),
+        )
+    )).scalars().all())
+    if not student_ids - stored:
+        return 0
+    return await rebuild_averages(session, classroom_id)
+
+
+async def backfill_averages(job: Job, session: AsyncSession, classroom_id: UUID, student_ids: List[UUID]) -> Dict[str, Any]:
+    """Job body: ``ensure_averages`` off the request, for single enrollments"""
+    rows = await ensure_averages(session, classroom_id, student_ids)
+    await session.commit()
+    return {"classroom_id": classroom_id, "rows_written": rows}
+
+
+async def get_cached_averages(session: AsyncSession, student_id: UUID) -> List[StudentGradeAverage]:
+    """Stored averages for each of the student's active classes, read as-is.
+
+    No grade math on the read path: a class without a stored row yet is simply absent.
+    """
+    classroom_ids = set((await session.execute(
+        select(Enrollment.classroom_id).where(Enrollment.student_id == student_id, Enrollment.is_active == True)
+    )).scalars().all())
+    if not classroom_ids:
+        return []
+
+    rows = (await session.execute(
+        select(StudentGradeAverage).where(
+            StudentGradeAverage.student_id == student_id,
+            StudentGradeAverage.classroom_id.in_(classroom_ids),
+        )
+    )).scalars().all()
+    return list(rows)
+
+
+# Grade entry
+
+GRADE_FIELDS = ("points_earned", "status", "comments", "shareable")
+
+
+async def save_grades(
+    session: AsyncSession,
+    classroom_id: UUID,
+    assignment_id: UUID,
+    grades: Sequence[Dict[str, Any]],
+    fields: Sequence[str],
+    graded_by: Optional[UUID],
+    source: str,
+    reason: Optional[str] = None,
+) -> List[Any]:
+    """Upsert one assignment's grades in a single statement; returns the rows that changed.
+
+    ``grades`` are dicts with ``student_id`` plus the ``fields`` being written;
+    fields not listed keep their stored values (new rows get column defaults).
+    Unchanged rows are not rewritten and get no history row. The caller commits.
+    """
+    if not grades:
+        return []
+    fields = [field for field in GRADE_FIELDS if field in fields]
+    now = datetime.now(timezone.utc)
+    student_ids = [grade["student_id"] for grade in grades]
+
+    # Old values for the audit trail, locked so concurrent saves serialize
+    previous = {
+        row.student_id: row
+        for row in (await session.execute(
+            select(Grade.student_id, Grade.points_earned, Grade.status)
+            .where(Grade.assignment_id == assignment_id, Grade.student_id.in_(student_ids))
+            .with_for_update()
+        )).all()
+    }
+
+    values = [
+        {
+            "id": uuid.uuid4(),
+            "assignment_id": assignment_id,
+            "student_id": grade["student_id"],
+            "points_earned": None,
+            "status": "GRADED",
+            "comments": None,
+            "shareable": False,
+            **{field: grade[field] for field in fields},
+            "graded_by": graded_by,
+            "graded_date": now,
+            "created_at": now,
+            "updated_at": now,
+        }
+        for grade in grades
+    ]
+    stmt = pg_insert(Grade).values(values)
+    excluded = stmt.excluded
+    stmt = stmt.on_conflict_do_update(
+        constraint="uq_grades_assignment_student",
+        set_={
+            **{field: excluded[field] for field in fields},
+            "graded_by": excluded.graded_by,
+            "graded_date": excluded.graded_date,
+            "updated_at": excluded.updated_at,
+        },
+        where=tuple_(*(getattr(Grade, f) for f in fields)).is_distinct_from(
+            tuple_(*(excluded[f] for f in fields))
+        ),
+    ).returning(Grade.id, Grade.student_id, Grade.points_earned, Grade.status)
+    changed = (await session.execute(stmt)).all()
+    if not changed:
+        return []
+
+    await session.execute(
+        pg_insert(GradeHistory).values([
+            {
+                "id": uuid.uuid4(),
+                "grade_id": row.id,
+                "assignment_id": assignment_id,
+                "student_id": row.student_id,
+                "old_points_earned": previous[row.student_id].points_earned if row.student_id in previous else None,
+                "new_points_earned": row.points_earned,
+                "old_status": previous[row.student_id].status if row.student_id in previous else None,
+                "new_status": row.status,
+                "reason": reason,
+                "source": source,
+                "changed_by": graded_by,
+                "changed_at": now,
+            }
+            for row in changed
+        ])
+    )
+
+    await apply_grade_changes(
+        session, classroom_id, [(row.student_id, assignment_id, row.points_earned, row.status) for row in changed]
+    )
+    return changed
@@ -0,0 +1,274 @@
+# backend/app/services/gradebook_engine.py
+# Vectorized category-weighted grade calculation (Phase A gradebook spec, section 6)
+
+"""
+A classroom's scores are held as a students x assignments matrix and every
+student's category and overall averages are computed in one pass of array
+operations; nothing here loops over students or grades.
+
+Rules, in order:
+
+* Status masks: GRADED and LATE scores count; MISSING counts as zero when the
+  class policy says so and is otherwise left out, like EXCUSED, IN_PROGRESS and
+  cells with no grade at all.
+* Late penalty: LATE scores lose a percentage of the score or a number of
+  points (class policy, overridable per assignment), floored at zero. A LATE
+  score on an assignment that does not allow late work counts as zero.
+* Drop-lowest: each category drops a student's N lowest counted percentages,
+  always keeping at least one; among equal percentages the more heavily
+  weighted score is dropped first. Extra credit is never dropped.
+* Category average: weighted mean of the counted percentages, weight being
+  ``weight_override`` or else ``points_possible`` (plain points-based when no
+  overrides are set). Extra credit adds to the numerator only.
+* Overall: category averages weighted by category weight, normalized over the
+  categories in which the student has counted work.
+* Rounding: half-up to the policy's number of decimals.
+
+This module only needs NumPy; loading the matrix from the database lives in
+``services.gradebook``.
+"""
+
+from dataclasses import dataclass
+from typing import List, Optional, Sequence
+from uuid import UUID
+
+import numpy as np
+
+# Status codes used in GradebookMatrix.status
+GRADED, MISSING, LATE, EXCUSED, IN_PROGRESS, UNGRADED = range(6)
+STATUS_CODES = {
+    "GRADED": GRADED,
+    "MISSING": MISSING,
+    "LATE": LATE,
+    "EXCUSED": EXCUSED,
+    "IN_PROGRESS": IN_PROGRESS,
+}
+
+LATE_PERCENT = "PERCENT"
+LATE_POINTS = "POINTS"
+
+
+@dataclass
+class GradebookMatrix:
+    """Score matrix for one classroom; S students, A assignments, C categories"""
+    student_ids: List[UUID]
+    assignment_ids: List[UUID]
+    category_ids: List[Optional[UUID]]  # None = uncategorized bucket
+    earned: np.ndarray  # (S, A) float64 points earned, nan = no score entered
+    status: np.ndarray  # (S, A) int8 status codes
+    points_possible: np.ndarray  # (A,) float64
+    weight_override: np.ndarray  # (A,) float64, nan = weight by points_possible
+    extra_credit: np.ndarray  # (A,) bool
+    allow_late: np.ndarray  # (A,) bool
+    late_penalty: np.ndarray  # (A,) float64, already resolved against the class policy
+    category_index: np.ndarray  # (A,) int index into category_ids
+    category_weights: np.ndarray  # (C,) float64
+    drop_lowest: np.ndarray  # (C,) int
+    late_policy_type: str = LATE_PERCENT
+    missing_as_zero: bool = True
+    decimals: int = 2
+
+
+@dataclass
+class GradebookResult:
+    student_ids: List[UUID]
+    category_ids: List[Optional[UUID]]
+    percent: np.ndarray  # (S, A) fraction of points possible after penalties, nan = not counted (before drops)
+    category_averages: np.ndarray  # (S, C) percent, nan = nothing counted
+    overall: np.ndarray  # (S,) percent, nan = nothing counted
+    counted: np.ndarray  # (S, A) bool, after drops
+    dropped: np.ndarray  # (S, A) bool
+
+
+def round_half_up(values: np.ndarray, decimals: int) -> np.ndarray:
+    """Half-up rounding (np.round is half-to-even); nan passes through"""
+    scale = 10.0 ** decimals
+    # Trim binary noise first so 89.995 (stored as 89.99499...) rounds up
+    return np.floor(np.round(values * scale, 6) + 0.5) / scale
+
+
+def assignment_weights(m: GradebookMatrix) -> np.ndarray:
+    """(A,) in-category weight: weight_override, else points_possible"""
+    return np.where(np.isnan(m.weight_override), m.points_possible, m.weight_override)
+
+
+def cell_fraction(
+    points_earned: Optional[float],
+    status: str,
+    points_possible: float,
+    allow_late: bool,
+    late_penalty: float,
+    late_policy_type: str = LATE_PERCENT,
+    missing_as_zero: bool = True,
+) -> Optional[float]:
+    """Scalar form of the per-cell rules for single-score edits; None = not counted"""
+    code = STATUS_CODES[status]
+    if points_possible <= 0:
+        return None
+    if code == MISSING:
+        return 0.0 if missing_as_zero else None
+    if code not in (GRADED, LATE) or points_earned is None:
+        return None
+    earned = float(points_earned)
+    if code == LATE:
+        if not allow_late:
+            earned = 0.0
+        elif late_policy_type == LATE_POINTS:
+            earned = max(earned - late_penalty, 0.0)
+        else:
+            earned = max(earned * (1.0 - late_penalty / 100.0), 0.0)
+    return earned / points_possible
+
+
+def _percentages(m: GradebookMatrix) -> np.ndarray:
+    """Per-cell fraction of points possible after late penalties; nan where not counted"""
+    earned = m.earned
+    late = m.status == LATE
+    scored = ((m.status == GRADED) | late) & ~np.isnan(earned)
+    if late.any():
+        if m.late_policy_type == LATE_POINTS:
+            penalized = earned - m.late_penalty
+        else:
+            penalized = earned * (1.0 - m.late_penalty / 100.0)
+        penalized = np.where(m.allow_late, np.maximum(penalized, 0.0), 0.0)
+        earned = np.where(late, penalized, earned)
+
+    if m.missing_as_zero:
+        earned = np.where(m.status == MISSING, 0.0, earned)
+        scored |= m.status == MISSING
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        pct = earned / m.points_possible
+    return np.where(scored & (m.points_possible > 0), pct, np.nan)
+
+
+def _drop_mask(m: GradebookMatrix, pct: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    """(S, A) mask of scores removed by each category's drop-lowest rule"""
+    dropped = np.zeros(pct.shape, dtype=bool)
+    droppable = ~np.isnan(pct) & ~m.extra_credit
+    for c in np.flatnonzero(m.drop_lowest > 0):
+        cols = np.flatnonzero(m.category_index == c)
+        if cols.size < 2:
+            continue
+        candidates = droppable[:, cols]
+        # Non-droppable cells sort last; on equal percentages the heavier score goes
+        # first. Ranks are computed for all students at once.
+        keys = np.where(candidates, pct[:, cols], np.inf)
+        heavier_first = np.broadcast_to(-weights[cols], keys.shape)
+        order = np.lexsort((heavier_first, keys), axis=1)
+        ranks = np.empty_like(order)
+        np.put_along_axis(ranks, order, np.arange(cols.size)[None, :], axis=1)
+        # Drop at most N, and never a student's last counted score
+        limit = np.minimum(m.drop_lowest[c], np.maximum(candidates.sum(axis=1) - 1, 0))
+        dropped[:, cols] = candidates & (ranks < limit[:, None])
+    return dropped
+
+
+def compute(m: GradebookMatrix) -> GradebookResult:
+    """All category and overall averages for the class in one vectorized pass"""
+    pct = _percentages(m)
+    weights = assignment_weights(m)
+    dropped = _drop_mask(m, pct, weights) if (m.drop_lowest > 0).any() else np.zeros(pct.shape, dtype=bool)
+    counted = ~np.isnan(pct) & ~dropped
+
+    weighted = np.where(counted, pct * weights, 0.0)
+    denominators = np.where(counted & ~m.extra_credit, weights, 0.0)
+
+    # (A, C) one-hot category membership turns per-category sums into matmuls
+    membership = np.zeros((m.category_index.size, len(m.category_ids)))
+    membership[np.arange(m.category_index.size), m.category_index] = 1.0
+    numerator = weighted @ membership
+    denominator = denominators @ membership
+
+    has_work = denominator > 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        category_avg = np.where(has_work, numerator / denominator, np.nan)
+        active_weights = np.where(has_work, m.category_weights, 0.0)
+        weight_total = active_weights.sum(axis=1)
+        overall = np.where(
+            weight_total > 0,
+            np.nansum(category_avg * active_weights, axis=1) / weight_total,
+            np.nan,
+        )
+
+    return GradebookResult(
+        student_ids=m.student_ids,
+        category_ids=m.category_ids,
+        percent=pct,
+        category_averages=round_half_up(category_avg * 100.0, m.decimals),
+        overall=round_half_up(overall * 100.0, m.decimals),
+        counted=counted,
+        dropped=dropped,
+    )
+
+
+def build_matrix(
+    student_ids: Sequence[UUID],
+    assignments: Sequence[dict],
+    categories: Sequence[dict],
+    grades: Sequence[tuple],
+    late_policy_type: str = LATE_PERCENT,
+    late_penalty: float = 0.0,
+    missing_as_zero: bool = True,
+    decimals: int = 2,
+) -> GradebookMatrix:
+    """Assemble a matrix from plain rows.
+
+    ``assignments``: dicts with id, category_id, points_possible, weight_override,
+    is_extra_credit, allow_late, late_penalty. ``categories``: dicts with id,
+    weight, drop_lowest. ``grades``: (student_id, assignment_id, points_earned, status).
+    Assignments whose category is not listed fall into an uncategorized bucket,
+    which only carries weight when the class has no weighted categories.
+    """
+    student_ids = list(student_ids)
+    category_ids: List[Optional[UUID]] = [c["id"] for c in categories]
+    category_weights = [float(c["weight"] or 0) for c in categories]
+    drop_lowest = [int(c["drop_lowest"] or 0) for c in categories]
+    category_pos = {cid: i for i, cid in enumerate(category_ids)}
+
+    if any(a["category_id"] not in category_pos for a in assignments):
+        category_pos[None] = len(category_ids)
+        category_ids.append(None)
+        category_weights.append(0.0 if any(w > 0 for w in category_weights) else 1.0)
+        drop_lowest.append(0)
+
+    def column(key, default=np.nan):
+        return np.array([default if a[key] is None else float(a[key]) for a in assignments], dtype=np.float64)
+
+    class_penalty = float(late_penalty or 0)
+    a_count = len(assignments)
+    earned = np.full((len(student_ids), a_count), np.nan)
+    status = np.full((len(student_ids), a_count), UNGRADED, dtype=np.int8)
+
+    student_pos = {sid: i for i, sid in enumerate(student_ids)}
+    assignment_pos = {a["id"]: j for j, a in enumerate(assignments)}
+    cells = [
+        (student_pos[sid], assignment_pos[aid], np.nan if points is None else float(points), STATUS_CODES[st])
+        for sid, aid, points, st in grades
+        if sid in student_pos and aid in assignment_pos
+    ]
+    if cells:
+        rows, cols, points, codes = (np.array(values) for values in zip(*cells))
+        earned[rows, cols] = points
+        status[rows, cols] = codes
+
+    return GradebookMatrix(
+        student_ids=student_ids,
+        assignment_ids=[a["id"] for a in assignments],
+        category_ids=category_ids,
+        earned=earned,
+        status=status,
+        points_possible=column("points_possible", 0.0),
+        weight_override=column("weight_override"),
+        extra_credit=np.array([bool(a["is_extra_credit"]) for a in assignments], dtype=bool),
+        allow_late=np.array([bool(a["allow_late"]) for a in assignments], dtype=bool),
+        late_penalty=column("late_penalty", class_penalty),
+        category_index=np.array(
+            [category_pos.get(a["category_id"], category_pos.get(None, 0)) for a in assignments], dtype=np.intp
+        ),
+        category_weights=np.array(category_weights, dtype=np.float64),
+        drop_lowest=np.array(drop_lowest, dtype=np.intp),
+        late_policy_type=late_policy_type,
+        missing_as_zero=missing_as_zero,
+        decimals=decimals,
+    )
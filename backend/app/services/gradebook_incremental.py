@@ -0,0 +1,226 @@
+# backend/app/services/gradebook_incremental.py
+# Per-student running category sums for O(log n) single-score recomputation
+
+"""
+A full class recompute (``gradebook_engine.compute``) is cheap, but a grade
+entry grid saves one cell at a time and only that student's average moves.
+``StudentGradeState`` keeps, per category, the running numerator/denominator
+of the student's kept scores plus two heaps:
+
+* ``kept`` - min-heap of kept regular scores (the next candidate to drop)
+* ``dropped`` - max-heap of the scores removed by drop-lowest
+
+Changing one score updates the sums and moves at most a couple of entries
+between the heaps, so an edit is O(log n) in the category's assignment count.
+Heaps use lazy deletion: an entry is live only while ``scores`` still points at
+it (matching sequence number and side). They are compacted - and the sums
+recomputed exactly, shedding float drift - once stale entries dominate.
+
+The state serializes to plain JSON and is stored next to the cached averages
+(``StudentGradeAverage.state``). It holds already-penalized fractions, so it is
+only valid for the assignment/category configuration it was built from;
+configuration changes rebuild it from the vectorized engine.
+"""
+
+import heapq
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from .gradebook_engine import GradebookMatrix, GradebookResult, assignment_weights, round_half_up
+
+UNCATEGORIZED = "uncategorized"
+
+# scores entries: [fraction, weight, is_extra_credit, is_dropped, seq]
+_PCT, _WEIGHT, _EC, _DROPPED, _SEQ = range(5)
+
+
+def category_key(category_id) -> str:
+    return str(category_id) if category_id is not None else UNCATEGORIZED
+
+
+@dataclass
+class CategoryState:
+    weight: float  # Category weight in the overall average
+    drop_lowest: int = 0
+    numerator: float = 0.0  # sum(fraction * weight) over kept scores, extra credit included
+    denominator: float = 0.0  # sum(weight) over kept regular scores
+    regular: int = 0  # Live non-extra-credit scores
+    n_dropped: int = 0
+    seq: int = 0
+    scores: Dict[str, list] = field(default_factory=dict)
+    kept: List[list] = field(default_factory=list)  # [fraction, -weight, seq, assignment_id]
+    dropped: List[list] = field(default_factory=list)  # [-fraction, weight, -seq, assignment_id]
+
+    @property
+    def average(self) -> Optional[float]:
+        # Counts, not the running float sum, decide emptiness (the sum may drift to ~1e-16)
+        if self.regular - self.n_dropped <= 0 or self.denominator <= 1e-9:
+            return None
+        return self.numerator / self.denominator
+
+    def set(self, assignment_id: str, fraction: Optional[float], weight: float, extra_credit: bool) -> None:
+        """Replace one assignment's score; fraction None removes it (excused, ungraded...)"""
+        self._remove(assignment_id)
+        if fraction is not None:
+            self.seq += 1
+            self.scores[assignment_id] = [fraction, weight, extra_credit, False, self.seq]
+            self.numerator += fraction * weight
+            if not extra_credit:
+                self.denominator += weight
+                self.regular += 1
+                heapq.heappush(self.kept, [fraction, -weight, self.seq, assignment_id])
+        self._rebalance()
+        if len(self.kept) + len(self.dropped) > 2 * len(self.scores) + 16:
+            self._compact()
+
+    def _remove(self, assignment_id: str) -> None:
+        entry = self.scores.pop(assignment_id, None)
+        if entry is None:
+            return
+        if entry[_DROPPED]:
+            self.n_dropped -= 1
+        else:
+            self.numerator -= entry[_PCT] * entry[_WEIGHT]
+            if not entry[_EC]:
+                self.denominator -= entry[_WEIGHT]
+        if not entry[_EC]:
+            self.regular -= 1
+
+    def _live(self, heap: List[list], dropped: bool) -> Optional[list]:
+        """Top live heap entry, discarding stale ones on the way"""
+        while heap:
+            assignment_id = heap[0][3]
+            entry = self.scores.get(assignment_id)
+            seq = -heap[0][2] if dropped else heap[0][2]
+            if entry is not None and entry[_SEQ] == seq and entry[_DROPPED] == dropped:
+                return entry
+            heapq.heappop(heap)
+        return None
+
+    def _drop_one(self) -> bool:
+        entry = self._live(self.kept, dropped=False)
+        if entry is None:
+            return False
+        _, _, seq, assignment_id = heapq.heappop(self.kept)
+        entry[_DROPPED] = True
+        self.n_dropped += 1
+        self.numerator -= entry[_PCT] * entry[_WEIGHT]
+        self.denominator -= entry[_WEIGHT]
+        heapq.heappush(self.dropped, [-entry[_PCT], entry[_WEIGHT], -seq, assignment_id])
+        return True
+
+    def _restore_one(self) -> bool:
+        entry = self._live(self.dropped, dropped=True)
+        if entry is None:
+            return False
+        _, _, neg_seq, assignment_id = heapq.heappop(self.dropped)
+        entry[_DROPPED] = False
+        self.n_dropped -= 1
+        self.numerator += entry[_PCT] * entry[_WEIGHT]
+        self.denominator += entry[_WEIGHT]
+        heapq.heappush(self.kept, [entry[_PCT], -entry[_WEIGHT], -neg_seq, assignment_id])
+        return True
+
+    def _rebalance(self) -> None:
+        # Same rule as the engine: drop up to N, never a student's last regular score
+        limit = min(self.drop_lowest, max(self.regular - 1, 0))
+        while self.n_dropped > limit and self._restore_one():
+            pass
+        while self.n_dropped < limit and self._drop_one():
+            pass
+        # A kept score fell below a dropped one (or a dropped one rose): swap them.
+        # Ordering matches the engine - lower percentage first, then heavier weight.
+        while True:
+            top_dropped = self._live(self.dropped, dropped=True)
+            top_kept = self._live(self.kept, dropped=False)
+            if top_dropped is None or top_kept is None:
+                break
+            if (top_dropped[_PCT], -top_dropped[_WEIGHT]) <= (top_kept[_PCT], -top_kept[_WEIGHT]):
+                break
+            self._restore_one()
+            self._drop_one()
+
+    def _compact(self) -> None:
+        self.kept, self.dropped = [], []
+        self.numerator = self.denominator = 0.0
+        for assignment_id, entry in self.scores.items():
+            if entry[_DROPPED]:
+                self.dropped.append([-entry[_PCT], entry[_WEIGHT], -entry[_SEQ], assignment_id])
+                continue
+            self.numerator += entry[_PCT] * entry[_WEIGHT]
+            if not entry[_EC]:
+                self.denominator += entry[_WEIGHT]
+                self.kept.append([entry[_PCT], -entry[_WEIGHT], entry[_SEQ], assignment_id])
+        heapq.heapify(self.kept)
+        heapq.heapify(self.dropped)
+
+    def to_json(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in self.__dataclass_fields__}
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> "CategoryState":
+        return cls(**data)
+
+
+@dataclass
+class StudentGradeState:
+    """All of one student's category states for one classroom"""
+    decimals: int
+    categories: Dict[str, CategoryState]
+
+    def set_score(self, category: str, assignment_id: str, fraction: Optional[float], weight: float, extra_credit: bool) -> None:
+        self.categories[category].set(assignment_id, fraction, weight, extra_credit)
+
+    def summary(self) -> Dict[str, Any]:
+        """Rounded percentages: {"overall": float|None, "categories": {key: float|None}}"""
+        averages = {key: state.average for key, state in self.categories.items()}
+        weighted = [(averages[key], state.weight) for key, state in self.categories.items() if averages[key] is not None]
+        weight_total = sum(weight for _, weight in weighted)
+        overall = sum(avg * weight for avg, weight in weighted) / weight_total if weight_total > 0 else None
+        return {
+            "overall": self._percent(overall),
+            "categories": {key: self._percent(avg) for key, avg in averages.items()},
+        }
+
+    def _percent(self, fraction: Optional[float]) -> Optional[float]:
+        if fraction is None:
+            return None
+        return float(round_half_up(np.float64(fraction * 100.0), self.decimals))
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "decimals": self.decimals,
+            "categories": {key: state.to_json() for key, state in self.categories.items()},
+        }
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> "StudentGradeState":
+        return cls(
+            decimals=data["decimals"],
+            categories={key: CategoryState.from_json(value) for key, value in data["categories"].items()},
+        )
+
+
+def states_from_result(m: GradebookMatrix, result: GradebookResult) -> List[StudentGradeState]:
+    """Seed per-student states from a full vectorized compute (one per matrix row)"""
+    weights = assignment_weights(m)
+    keys = [category_key(cid) for cid in m.category_ids]
+    assignment_keys = [str(aid) for aid in m.assignment_ids]
+    states = []
+    for i in range(len(m.student_ids)):
+        state = StudentGradeState(
+            decimals=m.decimals,
+            categories={
+                key: CategoryState(weight=float(m.category_weights[c]), drop_lowest=int(m.drop_lowest[c]))
+                for c, key in enumerate(keys)
+            },
+        )
+        for j in np.flatnonzero(~np.isnan(result.percent[i])):
+            state.set_score(
+                keys[m.category_index[j]], assignment_keys[j], float(result.percent[i, j]),
+                float(weights[j]), bool(m.extra_credit[j]),
+            )
+        states.append(state)
+    return states
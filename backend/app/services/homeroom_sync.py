@@ -0,0 +1,141 @@
+# backend/app/services/homeroom_sync.py
+# Set-based creation of homeroom-default subject classrooms
+
+"""
+When a subject becomes a homeroom default, every elementary homeroom teacher
+in the active academic year should get a classroom for it. The old per-teacher
+loop issued four queries and a flush per teacher; this finds every teacher
+still missing the subject in one query, then bulk-inserts their classrooms
+and primary-teacher assignments in batches.
+
+A teacher's grade is the grade most of their active elementary classrooms are
+in (``mode() WITHIN GROUP``), so a teacher who covers one extra grade keeps
+their homeroom grade. The new classroom takes the school most of those
+classrooms belong to, so it stays scoped to that school (``services.tenant``).
+
+Runs as a tracked job (``services.jobs``); progress is rows inserted out of
+teachers found. The subject row is locked for the whole run so two toggles of
+the same subject cannot create duplicate classrooms.
+"""
+
+import uuid
+from typing import Any, Dict, List
+from uuid import UUID
+
+from sqlalchemy import exists, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models.academic_year import AcademicYear
+from ..models.classroom import Classroom
+from ..models.classroom_teacher_assignment import ClassroomTeacherAssignment
+from ..models.subject import Subject
+from ..models.user import User
+from . import live_events
+from .jobs import Job
+
+ELEMENTARY_GRADES = ("K", "1", "2", "3", "4", "5")
+
+# Classrooms/assignments per INSERT; 11 parameters per assignment row stays far below asyncpg's 32767 limit
+BATCH_SIZE = 1000
+
+
+async def missing_homeroom_classrooms(session: AsyncSession, subject_id: UUID, academic_year_id: UUID) -> List[Any]:
+    """(teacher_id, grade_level, school_id, first_name, last_name) for homeroom teachers without a classroom for the subject"""
+    teacher_grades = (
+        select(
+            ClassroomTeacherAssignment.teacher_user_id.label("teacher_id"),
+            func.mode().within_group(Classroom.grade_level).label("grade_level"),
+            func.mode().within_group(Classroom.school_id).label("school_id"),
+        )
+        .join(Classroom, Classroom.id == ClassroomTeacherAssignment.classroom_id)
+        .where(
+            Classroom.grade_level.in_(ELEMENTARY_GRADES),
+            Classroom.academic_year_id == academic_year_id,
+            ClassroomTeacherAssignment.is_active == True,
+        )
+        .group_by(ClassroomTeacherAssignment.teacher_user_id)
+        .subquery()
+    )
+
+    has_subject = (
+        exists()
+        .select_from(ClassroomTeacherAssignment)
+        .join(Classroom, Classroom.id == ClassroomTeacherAssignment.classroom_id)
+        .where(
+            ClassroomTeacherAssignment.teacher_user_id == teacher_grades.c.teacher_id,
+            ClassroomTeacherAssignment.is_active == True,
+            Classroom.subject_id == subject_id,
+            Classroom.academic_year_id == academic_year_id,
+        )
+    )
+
+    result = await session.execute(
+        select(
+            teacher_grades.c.teacher_id, teacher_grades.c.grade_level, teacher_grades.c.school_id,
+            User.first_name, User.last_name,
+        )
+        .join(User, User.id == teacher_grades.c.teacher_id)
+        .where(~has_subject)
+        .order_by(User.last_name, User.first_name)
+    )
+    return result.all()
+
+
+async def sync_homeroom_subject(job: Job, session: AsyncSession, subject_id: UUID) -> Dict[str, Any]:
+    """Job body: give every elementary homeroom teacher a classroom for a homeroom-default subject"""
+    subject = (await session.execute(
+        select(Subject).where(Subject.id == subject_id).with_for_update()
+    )).scalar_one_or_none()
+    if subject is None or not subject.is_homeroom_default:
+        job.report(0, 0, "Subject is no longer a homeroom default - nothing to do")
+        return {"classrooms_created": 0}
+
+    active_year = (await session.execute(
+        select(AcademicYear).where(AcademicYear.is_active == True).limit(1)
+    )).scalar_one_or_none()
+    if active_year is None:
+        job.report(0, 0, "No active academic year")
+        return {"classrooms_created": 0}
+
+    missing = await missing_homeroom_classrooms(session, subject.id, active_year.id)
+    job.report(0, len(missing), f"{len(missing)} homeroom teachers need a {subject.name} classroom")
+
+    for offset in range(0, len(missing), BATCH_SIZE):
+        batch = missing[offset:offset + BATCH_SIZE]
+        classrooms = []
+        assignments = []
+        for teacher_id, grade_level, school_id, first_name, last_name in batch:
+            classroom_id = uuid.uuid4()
+            classrooms.append({
+                "id": classroom_id,
+                "name": f"{first_name} {last_name}'s Grade {grade_level} - {subject.name}"[:100],
+                "subject_id": subject.id,
+                "academic_year_id": active_year.id,
+                "grade_level": grade_level,
+                "school_id": school_id,
+                "classroom_type": "CORE",
+                "max_students": 25,
+            })
+            assignments.append({
+                "id": uuid.uuid4(),
+                "classroom_id": classroom_id,
+                "teacher_user_id": teacher_id,
+                "role_name": "Primary Teacher",
+                "can_view_grades": True,
+                "can_modify_grades": True,
+                "can_take_attendance": True,
+                "can_view_parent_contact": True,
+                "can_create_assignments": True,
+                "start_date": active_year.start_date,
+                "is_active": True,
+            })
+        await session.execute(insert(Classroom.__table__).values(classrooms))
+        await session.execute(insert(ClassroomTeacherAssignment.__table__).values(assignments))
+        job.report(offset + len(batch))
+
+    for teacher_id, *_ in missing:
+        live_events.notify(session, [live_events.user_topic(teacher_id)], live_events.ASSIGNMENTS_CHANGED,
+                           subject_id=subject.id)
+    await session.commit()
+    job.report(len(missing), len(missing), f"Created {len(missing)} {subject.name} classrooms")
+    return {"classrooms_created": len(missing), "academic_year_id": str(active_year.id)}
@@ -0,0 +1,371 @@
+# backend/app/services/jobs.py
+# Persistent background jobs: bounded concurrency, progress, cancellation, process pool
+
+"""
+Long-running admin operations (bulk syncs, promotions, rebuilds) should not
+hold an HTTP request open. ``start_job`` records a ``background_jobs`` row and
+runs an async function on the API process's event loop with its own database
+session; the caller returns the job id straight away.
+
+* Concurrency is bounded by ``job_max_concurrency`` per process; extra jobs
+  wait as PENDING.
+* A job function receives the live ``Job`` and an ``AsyncSession`` and calls
+  ``job.report(done, total, message)`` as it goes. It commits its own work;
+  an exception rolls the session back and marks the job FAILED.
+* Progress is kept in memory and written to the row at most every
+  ``job_progress_flush_seconds``, together with a heartbeat. Polling
+  (``GET /jobs/{id}``) and the SSE stream read the live job when it runs in
+  this process and the row otherwise, so any worker can answer.
+* ``cancel_job`` sets ``cancel_requested``. A job running here is cancelled
+  immediately (``asyncio.CancelledError`` at its next await); one running in
+  another worker sees the flag on its next flush. Jobs that must not stop
+  half-way should do their writes in one transaction - cancellation rolls it
+  back.
+* CPU-bound steps go through ``run_cpu`` to a process pool so they do not
+  stall the event loop. Pool workers are spawned fresh and import the app
+  package once.
+* On startup, jobs whose heartbeat stopped (the process died) are marked FAILED.
+
+No broker is involved: jobs run in the worker that accepted the request and
+do not survive a restart.
+"""
+
+import asyncio
+import json
+import logging
+import multiprocessing
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Optional
+
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..config import get_settings
+from ..db import get_sessionmaker
+from ..models.background_job import FINISHED_JOB_STATUSES, BackgroundJob
+
+logger = logging.getLogger("app.jobs")
+
+JobFunction = Callable[..., Awaitable[Any]]
+
+UNFINISHED_JOB_STATUSES = ("PENDING", "RUNNING")
+
+
+@dataclass
+class Job:
+    """Live state of a job running in this process"""
+    kind: str
+    created_by: Optional[uuid.UUID] = None
+    params: Dict[str, Any] = field(default_factory=dict)
+    id: uuid.UUID = field(default_factory=uuid.uuid4)
+    status: str = "PENDING"
+    done: int = 0
+    total: Optional[int] = None
+    message: Optional[str] = None
+    result: Any = None
+    error: Optional[str] = None
+    cancel_requested: bool = False
+    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    _dirty: bool = field(default=False, repr=False)
+    _changed: asyncio.Event = field(default_factory=asyncio.Event, repr=False)
+
+    def report(self, done: int, total: Optional[int] = None, message: Optional[str] = None) -> None:
+        self.done = done
+        if total is not None:
+            self.total = total
+        if message is not None:
+            self.message = message
+        self._touch()
+
+    def _touch(self) -> None:
+        self._dirty = True
+        self._changed.set()
+
+    @property
+    def progress(self) -> Optional[float]:
+        if self.status == "SUCCEEDED":
+            return 1.0
+        if not self.total:
+            return None
+        return min(self.done / self.total, 1.0)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "kind": self.kind,
+            "status": self.status,
+            "done": self.done,
+            "total": self.total,
+            "progress": self.progress,
+            "message": self.message,
+            "result": self.result,
+            "error": self.error,
+            "cancel_requested": self.cancel_requested,
+            "created_by": self.created_by,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+        }
+
+
+_live: Dict[uuid.UUID, Job] = {}
+_tasks: Dict[uuid.UUID, asyncio.Task] = {}
+_semaphore: Optional[asyncio.Semaphore] = None
+_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _get_semaphore() -> asyncio.Semaphore:
+    global _semaphore
+    if _semaphore is None:
+        _semaphore = asyncio.Semaphore(get_settings().job_max_concurrency)
+    return _semaphore
+
+
+def _row_dict(row: BackgroundJob) -> Dict[str, Any]:
+    return {
+        "id": row.id,
+        "kind": row.kind,
+        "status": row.status,
+        "done": row.done,
+        "total": row.total,
+        "progress": row.progress,
+        "message": row.message,
+        "result": row.result,
+        "error": row.error,
+        "cancel_requested": row.cancel_requested,
+        "created_by": row.created_by,
+        "created_at": row.created_at,
+        "started_at": row.started_at,
+        "finished_at": row.finished_at,
+    }
+
+
+def _json_safe(value: Any) -> Any:
+    """Results land in a JSONB column; UUIDs, dates and Decimals become strings"""
+    return json.loads(json.dumps(value, default=str))
+
+
+async def _write(job: Job, **extra) -> bool:
+    """Persist the job's current state; returns whether cancellation was requested"""
+    values = {
+        "status": job.status,
+        "done": job.done,
+        "total": job.total,
+        "message": job.message,
+        "error": job.error,
+        "started_at": job.started_at,
+        "finished_at": job.finished_at,
+        "heartbeat_at": datetime.now(timezone.utc),
+        **extra,
+    }
+    job._dirty = False
+    async with get_sessionmaker()() as session:
+        result = await session.execute(
+            update(BackgroundJob)
+            .where(BackgroundJob.id == job.id)
+            .values(**values)
+            .returning(BackgroundJob.cancel_requested)
+        )
+        cancel_requested = bool(result.scalar_one_or_none())
+        await session.commit()
+    return cancel_requested
+
+
+async def _monitor(job: Job, task: asyncio.Task) -> None:
+    """Flush progress, keep the heartbeat fresh and pick up cancellation from other workers"""
+    settings = get_settings()
+    last_write = time.monotonic()
+    while True:
+        await asyncio.sleep(settings.job_progress_flush_seconds)
+        if not job._dirty and time.monotonic() - last_write < settings.job_heartbeat_seconds:
+            continue
+        try:
+            if await _write(job) and not job.cancel_requested:
+                job.cancel_requested = True
+                task.cancel()
+        except Exception:
+            logger.exception("Could not record progress for job %s", job.id)
+        last_write = time.monotonic()
+
+
+async def _run(job: Job, func: JobFunction, args: tuple, kwargs: dict) -> None:
+    task = asyncio.current_task()
+    monitor = None
+    try:
+        async with _get_semaphore():
+            job.status = "RUNNING"
+            job.started_at = datetime.now(timezone.utc)
+            job._touch()
+            if await _write(job):
+                job.cancel_requested = True
+            if job.cancel_requested:
+                raise asyncio.CancelledError()
+
+            monitor = asyncio.create_task(_monitor(job, task))
+            async with get_sessionmaker()() as session:
+                try:
+                    job.result = _json_safe(await func(job, session, *args, **kwargs))
+                except BaseException:
+                    await session.rollback()
+                    raise
+            job.status = "SUCCEEDED"
+    except asyncio.CancelledError:
+        job.status = "CANCELLED"
+        job.message = "Cancelled" if job.cancel_requested else "Stopped by server shutdown"
+    except Exception as e:
+        logger.exception("Job %s (%s) failed", job.id, job.kind)
+        job.status = "FAILED"
+        job.error = str(e)
+    finally:
+        if monitor is not None:
+            monitor.cancel()
+        job.finished_at = datetime.now(timezone.utc)
+        job._touch()
+        try:
+            await _write(job, result=job.result)
+        except Exception:
+            logger.exception("Could not record final state for job %s", job.id)
+        _tasks.pop(job.id, None)
+        _live.pop(job.id, None)
+
+
+async def start_job(
+    kind: str,
+    func: JobFunction,
+    *args,
+    created_by: Optional[uuid.UUID] = None,
+    params: Optional[Dict[str, Any]] = None,
+    **kwargs,
+) -> Job:
+    """Record a job and schedule ``func(job, session, *args, **kwargs)`` on the running loop.
+
+    The row is committed on its own session before the job starts, so the id
+    can be polled from any worker as soon as this returns.
+    """
+    job = Job(kind=kind, created_by=created_by, params=_json_safe(params or {}))
+    async with get_sessionmaker()() as session:
+        session.add(BackgroundJob(
+            id=job.id,
+            kind=kind,
+            status=job.status,
+            params=job.params,
+            created_by=created_by,
+            created_at=job.created_at,
+            heartbeat_at=job.created_at,
+        ))
+        await session.commit()
+
+    _live[job.id] = job
+    # Keep a reference so the task is not garbage-collected mid-run
+    _tasks[job.id] = asyncio.get_running_loop().create_task(_run(job, func, args, kwargs))
+    return job
+
+
+async def get_job(session: AsyncSession, job_id: uuid.UUID) -> Optional[Dict[str, Any]]:
+    """Current state of a job - live if it runs in this process, else from its row"""
+    job = _live.get(job_id)
+    if job is not None:
+        return job.to_dict()
+    row = await session.get(BackgroundJob, job_id, populate_existing=True)
+    return _row_dict(row) if row is not None else None
+
+
+async def cancel_job(session: AsyncSession, job_id: uuid.UUID) -> Optional[Dict[str, Any]]:
+    """Request cancellation; returns the job's state, or None if it does not exist"""
+    await session.execute(
+        update(BackgroundJob)
+        .where(BackgroundJob.id == job_id, BackgroundJob.status.in_(UNFINISHED_JOB_STATUSES))
+        .values(cancel_requested=True)
+    )
+    await session.commit()
+
+    job = _live.get(job_id)
+    task = _tasks.get(job_id)
+    if job is not None and task is not None and not job.cancel_requested:
+        job.cancel_requested = True
+        task.cancel()
+    return await get_job(session, job_id)
+
+
+async def job_events(job_id: uuid.UUID, poll_seconds: float = 1.0) -> AsyncIterator[Dict[str, Any]]:
+    """Yield the job's state each time it changes, ending after it finishes"""
+    last = None
+    while True:
+        job = _live.get(job_id)
+        if job is not None:
+            job._changed.clear()
+            state = job.to_dict()
+        else:
+            async with get_sessionmaker()() as session:
+                state = await get_job(session, job_id)
+            if state is None:
+                return
+
+        snapshot = (state["status"], state["done"], state["total"], state["message"])
+        if snapshot != last:
+            last = snapshot
+            yield state
+        if state["status"] in FINISHED_JOB_STATUSES:
+            return
+
+        if job is not None:
+            try:
+                await asyncio.wait_for(job._changed.wait(), timeout=poll_seconds * 15)
+            except asyncio.TimeoutError:
+                pass
+        else:
+            await asyncio.sleep(poll_seconds)
+
+
+def get_process_pool() -> ProcessPoolExecutor:
+    global _pool
+    if _pool is None:
+        _pool = ProcessPoolExecutor(
+            max_workers=get_settings().job_process_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _pool
+
+
+async def run_cpu(func: Callable[..., Any], *args) -> Any:
+    """Run a CPU-bound, picklable top-level function in the process pool"""
+    return await asyncio.get_running_loop().run_in_executor(get_process_pool(), func, *args)
+
+
+async def recover_interrupted_jobs() -> int:
+    """Mark jobs whose runner stopped heartbeating as FAILED; returns how many"""
+    cutoff = datetime.now(timezone.utc) - timedelta(seconds=get_settings().job_stale_after_seconds)
+    async with get_sessionmaker()() as session:
+        result = await session.execute(
+            update(BackgroundJob)
+            .where(
+                BackgroundJob.status.in_(UNFINISHED_JOB_STATUSES),
+                BackgroundJob.heartbeat_at < cutoff,
+            )
+            .values(
+                status="FAILED",
+                error="Interrupted: the server stopped while the job was running",
+                finished_at=datetime.now(timezone.utc),
+            )
+        )
+        await session.commit()
+    return result.rowcount
+
+
+async def shutdown_jobs() -> None:
+    """Cancel running jobs (recorded as CANCELLED) and stop the process pool"""
+    global _pool
+    tasks = list(_tasks.values())
+    for task in tasks:
+        task.cancel()
+    if tasks:
+        await asyncio.gather(*tasks, return_exceptions=True)
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
@@ -0,0 +1,251 @@
+# backend/app/services/live_events.py
+# In-process pub/sub bus behind the per-user server-sent events stream
+
+"""
+Write endpoints announce what changed; connected browsers hear about it over
+``GET /events/stream`` and invalidate just the affected queries instead of
+re-polling dashboards and rosters.
+
+Events are published to topics:
+
+* ``user:{id}`` - things about one user (their roles or class assignments changed)
+* ``classroom:{id}`` - roster and attendance changes for a class
+* ``school:{id}`` - school-wide changes, for that school's admins
+
+A stream subscribes to its own user topic, the classrooms the user actively
+teaches and the schools where they hold an admin-ish role. When an
+``ACCESS_EVENTS`` event arrives on the user's own topic the subscription is
+re-resolved, so a new class assignment starts streaming without a reconnect.
+
+Endpoints call ``notify(session, topics, event_type, **data)`` before they
+commit. Like the roster cache, delivery is tied to session events: queued
+events go out after the transaction commits and are dropped on rollback, so
+a client never refetches data that was not saved.
+
+Events carry ids only, never record contents - clients refetch through the
+normal, permission-checked endpoints. Each stream has a bounded queue; a
+client too slow to keep up gets a single ``resync`` event telling it to
+refetch everything.
+
+The bus lives in the API process. With several workers a client only hears
+about writes committed by the worker its stream is connected to, so run the
+stream behind sticky routing or a single worker until the bus is moved onto
+Postgres ``LISTEN/NOTIFY``.
+"""
+
+import asyncio
+import itertools
+from datetime import date, datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Set
+from uuid import UUID
+
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from ..config import get_settings
+from ..deps import _is_adminish
+from ..models.classroom import Classroom
+from ..models.classroom_teacher_assignment import ClassroomTeacherAssignment
+from ..models.enrollment import Enrollment
+from ..models.student import Student
+from ..models.user_role import UserRole
+
+# Event types, so the frontend's invalidation map has one place to match against
+ENROLLMENT_CHANGED = "enrollment.changed"
+ATTENDANCE_SUBMITTED = "attendance.submitted"
+ROLES_CHANGED = "roles.changed"
+ASSIGNMENTS_CHANGED = "assignments.changed"
+RESYNC = "resync"
+
+# Events on a user's own topic that change which topics they may hear
+ACCESS_EVENTS = (ROLES_CHANGED, ASSIGNMENTS_CHANGED)
+
+_PENDING_KEY = "live_events_pending"
+
+
+def user_topic(user_id: UUID) -> str:
+    return f"user:{user_id}"
+
+
+def classroom_topic(classroom_id: UUID) -> str:
+    return f"classroom:{classroom_id}"
+
+
+def school_topic(school_id: UUID) -> str:
+    return f"school:{school_id}"
+
+
+class Subscription:
+    """One stream's queue of events and the topics it listens on"""
+
+    def __init__(self, topics: Set[str], max_queue: int):
+        self.topics = topics
+        self.queue: "asyncio.Queue[Dict[str, Any]]" = asyncio.Queue(maxsize=max_queue)
+        self.dropped = 0
+
+    def deliver(self, live_event: Dict[str, Any]) -> None:
+        try:
+            self.queue.put_nowait(live_event)
+        except asyncio.QueueFull:
+            # The client cannot keep up; replace the backlog with one "refetch everything"
+            while not self.queue.empty():
+                self.queue.get_nowait()
+                self.dropped += 1
+            self.queue.put_nowait({"id": live_event["id"], "type": RESYNC, "topic": None, "data": {}, "at": live_event["at"]})
+
+
+class EventBus:
+    """Topic -> subscriptions fan-out; publishing never blocks"""
+
+    def __init__(self, max_queue: int):
+        self.max_queue = max_queue
+        self._subscribers: Dict[str, Set[Subscription]] = {}
+        self._ids = itertools.count(1)
+        self.published = 0
+
+    def subscribe(self, topics: Iterable[str]) -> Subscription:
+        subscription = Subscription(set(), self.max_queue)
+        self.update(subscription, topics)
+        return subscription
+
+    def update(self, subscription: Subscription, topics: Iterable[str]) -> None:
+        topics = set(topics)
+        for topic in subscription.topics - topics:
+            self._remove(topic, subscription)
+        for topic in topics - subscription.topics:
+            self._subscribers.setdefault(topic, set()).add(subscription)
+        subscription.topics = topics
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        for topic in subscription.topics:
+            self._remove(topic, subscription)
+        subscription.topics = set()
+
+    def _remove(self, topic: str, subscription: Subscription) -> None:
+        subscribers = self._subscribers.get(topic)
+        if subscribers is not None:
+            subscribers.discard(subscription)
+            if not subscribers:
+                del self._subscribers[topic]
+
+    def publish(self, topics: Iterable[str], event_type: str, data: Dict[str, Any]) -> int:
+        """Deliver one event to every subscription on any of the topics; returns how many received it"""
+        live_event = {
+            "id": next(self._ids),
+            "type": event_type,
+            "data": data,
+            "at": datetime.now(timezone.utc).isoformat(),
+        }
+        # A stream on two of the topics still gets the event once
+        receivers: Dict[Subscription, str] = {}
+        for topic in topics:
+            for subscription in self._subscribers.get(topic, ()):
+                receivers.setdefault(subscription, topic)
+        for subscription, topic in receivers.items():
+            subscription.deliver({**live_event, "topic": topic})
+        self.published += 1
+        return len(receivers)
+
+    def stats(self) -> dict:
+        streams = {s for subscribers in self._subscribers.values() for s in subscribers}
+        return {
+            "streams": len(streams),
+            "topics": len(self._subscribers),
+            "published": self.published,
+            "dropped": sum(s.dropped for s in streams),
+        }
+
+
+_bus: Optional[EventBus] = None
+
+
+def get_event_bus() -> EventBus:
+    global _bus
+    if _bus is None:
+        _bus = EventBus(get_settings().live_events_queue_size)
+    return _bus
+
+
+def notify(session: AsyncSession, topics: Iterable[str], event_type: str, **data: Any) -> None:
+    """Queue an event to publish once the session's transaction commits.
+
+    ``data`` should hold ids and small scalars only; UUIDs and dates are sent as strings.
+    """
+    payload = {key: str(value) if isinstance(value, (UUID, date)) else value for key, value in data.items()}
+    session.info.setdefault(_PENDING_KEY, []).append((tuple(topics), event_type, payload))
+
+
+async def topics_for_user(session: AsyncSession, user_id: UUID) -> Set[str]:
+    """Topics a user's stream may listen on: their own, classes they teach, schools they administer"""
+    topics = {user_topic(user_id)}
+
+    roles = await session.execute(
+        select(UserRole.role, UserRole.school_id).where(UserRole.user_id == user_id, UserRole.is_active == True)
+    )
+    topics.update(school_topic(school_id) for role, school_id in roles.all() if _is_adminish(role))
+
+    classroom_ids = await session.execute(
+        select(ClassroomTeacherAssignment.classroom_id).where(
+            ClassroomTeacherAssignment.teacher_user_id == user_id,
+            ClassroomTeacherAssignment.is_active == True,
+        )
+    )
+    topics.update(classroom_topic(classroom_id) for classroom_id in classroom_ids.scalars().all())
+    return topics
+
+
+async def classroom_school_ids(session: AsyncSession, classroom_id: UUID) -> List[UUID]:
+    """The class's school; for a district-wide class (no school_id), the schools of its enrolled students"""
+    school_id = (await session.execute(
+        select(Classroom.school_id).where(Classroom.id == classroom_id)
+    )).scalar_one_or_none()
+    if school_id is not None:
+        return [school_id]
+    result = await session.execute(
+        select(Student.school_id)
+        .join(Enrollment, Enrollment.student_id == Student.id)
+        .where(Enrollment.classroom_id == classroom_id)
+        .distinct()
+    )
+    return result.scalars().all()
+
+
+async def notify_enrollment_changed(session: AsyncSession, enrollment: Enrollment, action: str) -> None:
+    """Announce an enrollment write to its class and its student's school"""
+    school_id = (await session.execute(
+        select(Student.school_id).where(Student.id == enrollment.student_id)
+    )).scalar_one_or_none()
+    topics = [classroom_topic(enrollment.classroom_id)]
+    if school_id is not None:
+        topics.append(school_topic(school_id))
+    notify(
+        session, topics, ENROLLMENT_CHANGED,
+        action=action, classroom_id=enrollment.classroom_id, student_id=enrollment.student_id,
+    )
+
+
+async def notify_attendance_submitted(session: AsyncSession, classroom_id: UUID, session_date: date, marks: int) -> None:
+    """Announce saved attendance marks to the class and the schools of its students"""
+    topics = [classroom_topic(classroom_id)]
+    topics += [school_topic(school_id) for school_id in await classroom_school_ids(session, classroom_id)]
+    notify(session, topics, ATTENDANCE_SUBMITTED, classroom_id=classroom_id, session_date=session_date, marks=marks)
+
+
+# ---------------------------------------------------------------------------
+# Session events - publish what a transaction announced once it commits
+# ---------------------------------------------------------------------------
+
+@event.listens_for(Session, "after_commit")
+def _publish_pending(session: Session) -> None:
+    pending = session.info.pop(_PENDING_KEY, None)
+    if not pending:
+        return
+    bus = get_event_bus()
+    for topics, event_type, data in pending:
+        bus.publish(topics, event_type, data)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
@@ -0,0 +1,256 @@
+# backend/app/services/parent_summary.py
+# Parent portal home page: every child's classes, teachers, grades and attendance
+
+"""
+A parent home page used to need several calls per child (enrollments, then
+teachers and averages per class). ``get_parent_summary`` builds the whole
+page from at most five queries however many children and classes there are:
+
+1. the parent's active relationships joined to their students
+2. those students' active enrollments with classroom and subject names
+3. active teacher assignments for all of those classrooms
+4. cached class averages (``student_grade_averages``) for children whose
+   relationship has ``can_view_grades``
+5. attendance stats (``student_attendance_stats``) for children whose
+   relationship has ``can_view_attendance``
+
+Queries 4 and 5 never touch students the parent may not see, so a withheld
+grade or attendance rate is absent rather than filtered out afterwards.
+Averages are read as stored; a class not yet averaged shows ``None`` instead of
+being rebuilt on this path.
+
+Summaries are cached per parent for ``parent_summary_cache_seconds``. A
+committed ORM change to a relationship, enrollment, teacher assignment or
+student drops the summaries of the parents involved. Grade averages and
+attendance stats are written with Core upserts, so their writers call
+``mark_students_changed`` to do the same at commit.
+"""
+
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, Optional, Set, Tuple
+from uuid import UUID
+
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from ..config import get_settings
+from ..models.attendance import StudentAttendanceStats
+from ..models.classroom import Classroom
+from ..models.classroom_teacher_assignment import ClassroomTeacherAssignment
+from ..models.enrollment import Enrollment
+from ..models.gradebook import StudentGradeAverage
+from ..models.parent_student_relationship import ParentStudentRelationship
+from ..models.student import Student
+from ..models.subject import Subject
+from ..models.user import User
+
+_PENDING_KEY = "parent_summary_pending"
+
+# parent_id -> (stored at, children's student ids, summary)
+_cache: Dict[UUID, Tuple[float, Set[UUID], Dict[str, Any]]] = {}
+
+
+def invalidate_parents(parent_ids: Iterable[UUID]) -> None:
+    for parent_id in set(parent_ids):
+        _cache.pop(parent_id, None)
+
+
+def invalidate_students(student_ids: Iterable[UUID]) -> None:
+    student_ids = set(student_ids)
+    if not student_ids:
+        return
+    stale = [parent_id for parent_id, (_, children, _) in _cache.items() if children & student_ids]
+    invalidate_parents(stale)
+
+
+def invalidate_classrooms(classroom_ids: Iterable[UUID]) -> None:
+    classroom_ids = set(classroom_ids)
+    stale = [
+        parent_id for parent_id, (_, _, summary) in _cache.items()
+        if any(c["classroom_id"] in classroom_ids for child in summary["students"] for c in child["classes"])
+    ]
+    invalidate_parents(stale)
+
+
+def mark_students_changed(session: AsyncSession, student_ids: Iterable[UUID]) -> None:
+    """For Core writes: drop summaries showing these students once the session commits"""
+    _pending(session.info)[1].update(student_ids)
+
+
+async def get_parent_summary(session: AsyncSession, parent_id: UUID, refresh: bool = False) -> Dict[str, Any]:
+    ttl = get_settings().parent_summary_cache_seconds
+    cached = _cache.get(parent_id)
+    if cached is not None and not refresh and time.monotonic() - cached[0] < ttl:
+        return cached[2]
+
+    summary = await _build_summary(session, parent_id)
+    if ttl > 0:
+        children = {child["student_id"] for child in summary["students"]}
+        _cache[parent_id] = (time.monotonic(), children, summary)
+    return summary
+
+
+def _rate(value) -> Optional[float]:
+    return float(value) if value is not None else None
+
+
+async def _build_summary(session: AsyncSession, parent_id: UUID) -> Dict[str, Any]:
+    children: Dict[UUID, Dict[str, Any]] = {}
+    relationships = await session.execute(
+        select(ParentStudentRelationship, Student)
+        .join(Student, Student.id == ParentStudentRelationship.student_id)
+        .where(
+            ParentStudentRelationship.parent_id == parent_id,
+            ParentStudentRelationship.is_active == True,
+            Student.is_active == True,
+        )
+        .order_by(Student.last_name, Student.first_name)
+    )
+    for rel, student in relationships.all():
+        children[student.id] = {
+            "student_id": student.id,
+            "first_name": student.first_name,
+            "last_name": student.last_name,
+            "current_grade_level": student.current_grade_level,
+            "school_id": student.school_id,
+            "relationship_type": rel.relationship_type,
+            "can_view_grades": bool(rel.can_view_grades),
+            "can_view_attendance": bool(rel.can_view_attendance),
+            "classes": [],
+            "attendance": None,
+        }
+    summary = {
+        "parent_id": parent_id,
+        "generated_at": datetime.now(timezone.utc),
+        "students": list(children.values()),
+    }
+    if not children:
+        return summary
+
+    classes: Dict[Tuple[UUID, UUID], Dict[str, Any]] = {}
+    enrollments = await session.execute(
+        select(
+            Enrollment.student_id, Classroom.id, Classroom.name, Classroom.grade_level,
+            Classroom.classroom_type, Subject.name,
+        )
+        .join(Classroom, Classroom.id == Enrollment.classroom_id)
+        .join(Subject, Subject.id == Classroom.subject_id)
+        .where(Enrollment.student_id.in_(children), Enrollment.is_active == True)
+        .order_by(Subject.name, Classroom.name)
+    )
+    for student_id, classroom_id, name, grade_level, classroom_type, subject_name in enrollments.all():
+        entry = {
+            "classroom_id": classroom_id,
+            "classroom_name": name,
+            "subject_name": subject_name,
+            "grade_level": grade_level,
+            "classroom_type": classroom_type,
+            "teachers": [],
+            "overall_percent": None,
+            "absence_rate_30d": None,
+        }
+        classes[(student_id, classroom_id)] = entry
+        children[student_id]["classes"].append(entry)
+    if not classes:
+        return summary
+
+    classroom_ids = {classroom_id for _, classroom_id in classes}
+    teachers: Dict[UUID, list] = {}
+    assignments = await session.execute(
+        select(ClassroomTeacherAssignment.classroom_id, ClassroomTeacherAssignment.role_name, User.id,
+               User.first_name, User.last_name, User.email)
+        .join(User, User.id == ClassroomTeacherAssignment.teacher_user_id)
+        .where(ClassroomTeacherAssignment.classroom_id.in_(classroom_ids), ClassroomTeacherAssignment.is_active == True)
+        .order_by(User.last_name, User.first_name)
+    )
+    for classroom_id, role_name, user_id, first_name, last_name, email in assignments.all():
+        teachers.setdefault(classroom_id, []).append({
+            "id": user_id, "name": f"{first_name} {last_name}", "email": email, "role_name": role_name,
+        })
+    for (_, classroom_id), entry in classes.items():
+        entry["teachers"] = teachers.get(classroom_id, [])
+
+    grade_students = [sid for sid, child in children.items() if child["can_view_grades"]]
+    if grade_students:
+        averages = await session.execute(
+            select(StudentGradeAverage.student_id, StudentGradeAverage.classroom_id, StudentGradeAverage.overall_percent)
+            .where(
+                StudentGradeAverage.student_id.in_(grade_students),
+                StudentGradeAverage.classroom_id.in_(classroom_ids),
+            )
+        )
+        for student_id, classroom_id, overall in averages.all():
+            entry = classes.get((student_id, classroom_id))
+            if entry is not None:
+                entry["overall_percent"] = _rate(overall)
+
+    attendance_students = [sid for sid, child in children.items() if child["can_view_attendance"]]
+    if attendance_students:
+        stats = await session.execute(
+            select(
+                StudentAttendanceStats.student_id, StudentAttendanceStats.classroom_id,
+                StudentAttendanceStats.sessions_30d, StudentAttendanceStats.absences_30d,
+                StudentAttendanceStats.absence_rate_30d, StudentAttendanceStats.absent_streak,
+            )
+            .where(
+                StudentAttendanceStats.student_id.in_(attendance_students),
+                StudentAttendanceStats.classroom_id.in_(classroom_ids),
+            )
+        )
+        totals: Dict[UUID, Dict[str, int]] = {}
+        for student_id, classroom_id, sessions, absences, rate, streak in stats.all():
+            entry = classes.get((student_id, classroom_id))
+            if entry is None:
+                continue
+            entry["absence_rate_30d"] = _rate(rate)
+            total = totals.setdefault(student_id, {"sessions_30d": 0, "absences_30d": 0, "absent_streak": 0})
+            total["sessions_30d"] += sessions
+            total["absences_30d"] += absences
+            total["absent_streak"] = max(total["absent_streak"], streak)
+        for student_id, total in totals.items():
+            sessions = total["sessions_30d"]
+            children[student_id]["attendance"] = {
+                **total,
+                "attendance_rate_30d": round(1 - total["absences_30d"] / sessions, 4) if sessions else None,
+            }
+
+    return summary
+
+
+# ---------------------------------------------------------------------------
+# Session events - collect the parents/students a flush touched, invalidate on commit
+# ---------------------------------------------------------------------------
+
+def _pending(info: dict) -> Tuple[Set[UUID], Set[UUID], Set[UUID]]:
+    return info.setdefault(_PENDING_KEY, (set(), set(), set()))
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_summary_changes(session: Session, flush_context) -> None:
+    parent_ids, student_ids, classroom_ids = _pending(session.info)
+    for obj in list(session.new) + list(session.dirty) + list(session.deleted):
+        if isinstance(obj, ParentStudentRelationship):
+            parent_ids.add(obj.parent_id)
+        elif isinstance(obj, (Enrollment, Student)):
+            student_ids.add(obj.student_id if isinstance(obj, Enrollment) else obj.id)
+        elif isinstance(obj, ClassroomTeacherAssignment):
+            classroom_ids.add(obj.classroom_id)
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_summary_invalidation(session: Session) -> None:
+    pending = session.info.pop(_PENDING_KEY, None)
+    if pending is None:
+        return
+    parent_ids, student_ids, classroom_ids = pending
+    invalidate_parents(parent_ids)
+    invalidate_students(student_ids)
+    if classroom_ids:
+        invalidate_classrooms(classroom_ids)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_summary_changes(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
@@ -0,0 +1,68 @@
+# backend/app/services/promotion.py
+# Set-based end-of-year grade promotion
+
+"""
+Promotion used to load every active student and call
+``Student.promote_to_next_grade`` one row at a time. It is now one ``UPDATE``
+with a ``CASE`` over ``GRADE_PROGRESSION``; ``RETURNING`` gives back the rows
+that changed so the result still names the graduates. Students whose grade has
+no successor (ungraded, unknown codes) are left alone and reported as held back.
+
+Runs as a tracked job (``services.jobs``). The whole promotion is one
+transaction, so a cancelled or failed run changes nothing. Being a Core
+``UPDATE`` it bypasses the ORM flush hooks, so the promoted students are
+handed to the roster, emergency-directory and parent-summary caches, which
+drop them when the transaction commits.
+"""
+
+from typing import Any, Dict, Optional
+
+from sqlalchemy import case, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models.student import GRADE_PROGRESSION, Student
+from . import emergency_directory, parent_summary, roster_cache
+from .jobs import Job
+
+
+async def promote_students(job: Job, session: AsyncSession, grade_level: Optional[str] = None) -> Dict[str, Any]:
+    """Job body: move active students up one grade; 8th graders graduate and become inactive"""
+    scope = [Student.is_active == True]
+    if grade_level:
+        scope.append(Student.current_grade_level == grade_level)
+    else:
+        scope.append(Student.current_grade_level != "GRADUATED")
+
+    held_back = (await session.execute(
+        select(Student.first_name, Student.last_name, Student.current_grade_level)
+        .where(*scope, Student.current_grade_level.notin_(GRADE_PROGRESSION))
+        .order_by(Student.last_name, Student.first_name)
+    )).all()
+    job.report(0, None, "Promoting students")
+
+    next_grade = case(GRADE_PROGRESSION, value=Student.current_grade_level)
+    result = await session.execute(
+        update(Student)
+        .where(*scope, Student.current_grade_level.in_(GRADE_PROGRESSION))
+        .values(
+            current_grade_level=next_grade,
+            is_active=case((Student.current_grade_level == "8", False), else_=Student.is_active),
+        )
+        .returning(Student.id, Student.first_name, Student.last_name, Student.current_grade_level)
+        .execution_options(synchronize_session=False)
+    )
+    promoted = result.all()
+    student_ids = [row.id for row in promoted]
+    roster_cache.mark_students_changed(session, student_ids)
+    emergency_directory.mark_students_changed(session, student_ids)
+    parent_summary.mark_students_changed(session, student_ids)
+    await session.commit()
+
+    graduated = [f"{first} {last}" for _, first, last, grade in promoted if grade == "GRADUATED"]
+    job.report(len(promoted), len(promoted), f"Successfully promoted {len(promoted)} students")
+    return {
+        "promoted": len(promoted),
+        "graduated": graduated,
+        "held_back": [f"{first} {last} (Grade {grade})" for first, last, grade in held_back],
+        "message": f"Successfully promoted {len(promoted)} students",
+    }
@@ -0,0 +1,280 @@
+# backend/app/services/review_queue.py
+# Special-need review due-queue and the daily precomputed review digest
+
+"""
+Every active special-need assignment with a ``review_date`` has to be reviewed
+by then. Case managers work two views of that:
+
+* ``due_reviews`` - the live queue. Active assignments due on or before
+  today + ``days`` (overdue first), paged with a keyset cursor on
+  ``(review_date, id)``. The partial index ``ix_student_special_needs_review_due``
+  holds exactly the queued rows in that order, so a page is an index range
+  scan however many inactive or undated assignments exist, and a deep page
+  costs the same as the first.
+* ``special_need_review_digests`` - one row per school per school-local day
+  with overdue / due-in-7-days / due-in-horizon counts and the items behind
+  them. ``build_review_digests`` writes every school's row in one pass (one
+  queue scan, one upsert) and runs as a background job, so the dashboard
+  reads a single row.
+
+The digest job is started by ``run_review_digest_scheduler`` once a day at
+``review_digest_hour`` (district default timezone) and on startup when today's
+digest is missing. Every API worker runs the scheduler; the job takes a
+transaction-level advisory lock and skips schools already built for their
+day, so concurrent runs do the work once. ``POST
+/special-needs/reviews/digest/rebuild`` forces a rebuild.
+"""
+
+import asyncio
+import logging
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import delete, func, select, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..config import get_settings
+from ..db import get_sessionmaker
+from ..models.school import School
+from ..models.special_need_review_digest import SpecialNeedReviewDigest
+from ..models.special_needs_tag_library import SpecialNeedsTagLibrary
+from ..models.student import Student
+from ..models.student_special_need import StudentSpecialNeed
+from .jobs import Job, start_job
+from .timezone import school_now, school_today
+
+logger = logging.getLogger("app.review_queue")
+
+# pg_try_advisory_xact_lock key held while digests are written
+_DIGEST_LOCK_KEY = 4_604_601
+
+_scheduler_task: Optional[asyncio.Task] = None
+
+
+def encode_cursor(review_date: date, assignment_id: UUID) -> str:
+    return f"{review_date.isoformat()}_{assignment_id}"
+
+
+def decode_cursor(cursor: str) -> Tuple[date, UUID]:
+    """Raises ValueError on a malformed cursor"""
+    review_date, _, assignment_id = cursor.partition("_")
+    return date.fromisoformat(review_date), UUID(assignment_id)
+
+
+def _queue_query(through: date):
+    """Active assignments due on or before ``through``, with student and tag, in queue order"""
+    return (
+        select(
+            StudentSpecialNeed.id, StudentSpecialNeed.review_date, StudentSpecialNeed.severity_level,
+            StudentSpecialNeed.last_reviewed_date, StudentSpecialNeed.tag_library_id,
+            SpecialNeedsTagLibrary.tag_name, Student.id, Student.first_name, Student.last_name,
+            Student.current_grade_level, Student.school_id,
+        )
+        .join(Student, Student.id == StudentSpecialNeed.student_id)
+        .join(SpecialNeedsTagLibrary, SpecialNeedsTagLibrary.id == StudentSpecialNeed.tag_library_id)
+        # Both predicates match the partial index so the planner can use it
+        .where(
+            StudentSpecialNeed.is_active == True,
+            StudentSpecialNeed.review_date.isnot(None),
+            StudentSpecialNeed.review_date <= through,
+            Student.is_active == True,
+        )
+        .order_by(StudentSpecialNeed.review_date, StudentSpecialNeed.id)
+    )
+
+
+def _item(row, today: date) -> Dict[str, Any]:
+    (assignment_id, review_date, severity, last_reviewed, tag_id, tag_name,
+     student_id, first_name, last_name, grade_level, school_id) = row
+    return {
+        "assignment_id": assignment_id,
+        "student_id": student_id,
+        "student_name": f"{first_name} {last_name}",
+        "grade_level": grade_level,
+        "school_id": school_id,
+        "tag_library_id": tag_id,
+        "tag_name": tag_name,
+        "severity_level": severity,
+        "review_date": review_date,
+        "last_reviewed_date": last_reviewed,
+        "days_until_due": (review_date - today).days,
+    }
+
+
+async def due_reviews(
+    session: AsyncSession,
+    days: int,
+    school_id: Optional[UUID] = None,
+    tag_library_id: Optional[UUID] = None,
+    include_overdue: bool = True,
+    cursor: Optional[Tuple[date, UUID]] = None,
+    limit: int = 50,
+) -> Dict[str, Any]:
+    """One page of the review queue: reviews due within ``days`` of today, soonest first"""
+    tz = None
+    if school_id is not None:
+        tz = (await session.execute(select(School.tz).where(School.id == school_id))).scalar_one_or_none()
+    today = school_today(tz)
+
+    stmt = _queue_query(today + timedelta(days=days))
+    if not include_overdue:
+        stmt = stmt.where(StudentSpecialNeed.review_date >= today)
+    if school_id is not None:
+        stmt = stmt.where(Student.school_id == school_id)
+    if tag_library_id is not None:
+        stmt = stmt.where(StudentSpecialNeed.tag_library_id == tag_library_id)
+    if cursor is not None:
+        stmt = stmt.where(tuple_(StudentSpecialNeed.review_date, StudentSpecialNeed.id) > tuple_(*cursor))
+
+    # One extra row says whether there is a next page without a count query
+    rows = (await session.execute(stmt.limit(limit + 1))).all()
+    page = rows[:limit]
+    next_cursor = encode_cursor(page[-1][1], page[-1][0]) if len(rows) > limit else None
+    return {"as_of": today, "items": [_item(row, today) for row in page], "next_cursor": next_cursor}
+
+
+async def get_digest(session: AsyncSession, school_id: UUID) -> Optional[SpecialNeedReviewDigest]:
+    """The school's most recent digest"""
+    result = await session.execute(
+        select(SpecialNeedReviewDigest)
+        .where(SpecialNeedReviewDigest.school_id == school_id)
+        .order_by(SpecialNeedReviewDigest.digest_date.desc())
+        .limit(1)
+    )
+    return result.scalar_one_or_none()
+
+
+def _json_item(item: Dict[str, Any]) -> Dict[str, Any]:
+    return {key: str(value) if isinstance(value, (UUID, date)) else value for key, value in item.items()}
+
+
+async def build_review_digests(job: Job, session: AsyncSession, force: bool = False) -> Dict[str, Any]:
+    """Job body: write today's review digest for every school.
+
+    Without ``force``, schools that already have a digest for their local day
+    are skipped. Runs in one transaction under an advisory lock; a second run
+    that cannot take the lock returns straight away.
+    """
+    locked = (await session.execute(select(func.pg_try_advisory_xact_lock(_DIGEST_LOCK_KEY)))).scalar()
+    if not locked:
+        job.report(0, 0, "Another worker is building the digests")
+        return {"skipped": "locked"}
+
+    settings = get_settings()
+    horizon = settings.review_digest_horizon_days
+    schools = {
+        school_id: school_today(tz)
+        for school_id, tz in (await session.execute(select(School.id, School.tz))).all()
+    }
+    if not force and schools:
+        built = set((await session.execute(
+            select(SpecialNeedReviewDigest.school_id, SpecialNeedReviewDigest.digest_date)
+            .where(SpecialNeedReviewDigest.digest_date >= min(schools.values()))
+        )).all())
+        schools = {sid: today for sid, today in schools.items() if (sid, today) not in built}
+    if not schools:
+        job.report(0, 0, "Digests are up to date")
+        return {"schools": 0}
+    job.report(0, len(schools), f"Building review digests for {len(schools)} schools")
+
+    # One scan of the queue covers every school; each school's "today" may differ by a day
+    through = max(schools.values()) + timedelta(days=horizon)
+    rows = (await session.execute(
+        _queue_query(through).where(Student.school_id.in_(schools))
+    )).all()
+
+    digests: Dict[UUID, Dict[str, Any]] = {
+        school_id: {
+            "school_id": school_id,
+            "digest_date": today,
+            "horizon_days": horizon,
+            "overdue_count": 0,
+            "due_7d_count": 0,
+            "due_horizon_count": 0,
+            "items": [],
+            "generated_at": datetime.now(timezone.utc),
+        }
+        for school_id, today in schools.items()
+    }
+    for row in rows:
+        digest = digests[row[-1]]
+        item = _item(row, digest["digest_date"])
+        days_until = item["days_until_due"]
+        if days_until > horizon:
+            continue
+        if days_until < 0:
+            digest["overdue_count"] += 1
+        else:
+            digest["due_horizon_count"] += 1
+            if days_until <= 7:
+                digest["due_7d_count"] += 1
+        digest["items"].append(_json_item(item))
+
+    stmt = pg_insert(SpecialNeedReviewDigest).values(list(digests.values()))
+    await session.execute(stmt.on_conflict_do_update(
+        index_elements=["school_id", "digest_date"],
+        set_={
+            column: stmt.excluded[column]
+            for column in ("horizon_days", "overdue_count", "due_7d_count", "due_horizon_count", "items", "generated_at")
+        },
+    ))
+    keep_after = min(schools.values()) - timedelta(days=settings.review_digest_keep_days)
+    await session.execute(delete(SpecialNeedReviewDigest).where(SpecialNeedReviewDigest.digest_date < keep_after))
+    await session.commit()
+
+    job.report(len(digests), len(digests), "Review digests built")
+    return {
+        "schools": len(digests),
+        "overdue": sum(d["overdue_count"] for d in digests.values()),
+        "due_horizon": sum(d["due_horizon_count"] for d in digests.values()),
+    }
+
+
+# ---------------------------------------------------------------------------
+# Daily scheduler - one loop per API process
+# ---------------------------------------------------------------------------
+
+def _seconds_until_next_run() -> float:
+    hour = get_settings().review_digest_hour
+    now = school_now(None)
+    next_run = now.replace(hour=hour, minute=0, second=0, microsecond=0)
+    if next_run <= now:
+        next_run += timedelta(days=1)
+    return (next_run - now).total_seconds()
+
+
+async def _digest_missing() -> bool:
+    async with get_sessionmaker()() as session:
+        latest = (await session.execute(select(func.max(SpecialNeedReviewDigest.digest_date)))).scalar()
+    return latest is None or latest < school_today(None)
+
+
+async def run_review_digest_scheduler() -> None:
+    """Build missing digests now, then once a day at ``review_digest_hour``"""
+    first = True
+    while True:
+        try:
+            if not first or await _digest_missing():
+                await start_job("review_digest", build_review_digests, params={"scheduled": True})
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("Could not start the review digest job")
+        first = False
+        await asyncio.sleep(_seconds_until_next_run())
+
+
+def start_review_digest_scheduler() -> None:
+    global _scheduler_task
+    if _scheduler_task is None:
+        _scheduler_task = asyncio.get_running_loop().create_task(run_review_digest_scheduler())
+
+
+async def stop_review_digest_scheduler() -> None:
+    global _scheduler_task
+    task, _scheduler_task = _scheduler_task, None
+    if task is not None:
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
@@ -0,0 +1,227 @@
+# backend/app/services/room_booking.py
+# Room availability and booking conflicts over tstzrange
+
+"""
+A room is busy exactly when some ``room_bookings`` row for it overlaps the
+requested window. Class meetings hold their rooms through CLASS bookings
+written alongside compiled schedule occurrences; staff reservations are EVENT
+bookings. Both share one table so the ``ex_room_bookings_no_overlap``
+exclusion constraint rules out double-booking whatever the source.
+
+Windows are half-open (``[start, end)``): a class ending at 09:00 does not
+conflict with one starting at 09:00.
+
+"Free rooms with capacity >= N and a projector between t1 and t2" is a filter
+on ``rooms`` plus ``NOT EXISTS`` against bookings, which the exclusion
+constraint's GiST index on ``(room_id, during)`` answers per room without
+looking at classrooms at all.
+"""
+
+from datetime import date, datetime
+from typing import Iterable, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import and_, exists, func, literal, select
+from sqlalchemy.dialects.postgresql import Range, insert as pg_insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models.room import Room
+from ..models.room_booking import RoomBooking
+from ..models.schedule import ScheduleOccurrence
+
+
+def booking_range(start: datetime, end: datetime):
+    """SQL ``tstzrange(start, end, '[)')``"""
+    return func.tstzrange(start, end, literal("[)"))
+
+
+def room_is_free(start: datetime, end: datetime):
+    """Clause true for ``Room`` rows with no booking overlapping ``[start, end)``"""
+    return ~exists().where(
+        RoomBooking.room_id == Room.id,
+        RoomBooking.during.overlaps(booking_range(start, end)),
+    )
+
+
+async def free_rooms(
+    session: AsyncSession,
+    school_id: UUID,
+    start: datetime,
+    end: datetime,
+    min_capacity: Optional[int] = None,
+    room_type: Optional[str] = None,
+    has_projector: Optional[bool] = None,
+    has_computers: Optional[bool] = None,
+    has_smartboard: Optional[bool] = None,
+    has_sink: Optional[bool] = None,
+    bookable_only: bool = True,
+) -> List[Room]:
+    """Active rooms at a school that are free for the whole window and match the filters"""
+    query = select(Room).where(
+        Room.school_id == school_id,
+        Room.is_active == True,
+        room_is_free(start, end),
+    )
+    if bookable_only:
+        query = query.where(Room.is_bookable == True)
+    if min_capacity:
+        query = query.where(Room.capacity >= min_capacity)
+    if room_type:
+        query = query.where(Room.room_type == room_type.upper())
+    for column, wanted in (
+        (Room.has_projector, has_projector),
+        (Room.has_computers, has_computers),
+        (Room.has_smartboard, has_smartboard),
+        (Room.has_sink, has_sink),
+    ):
+        if wanted is not None:
+            query = query.where(column == wanted)
+
+    result = await session.execute(query.order_by(Room.capacity, Room.name))
+    return result.scalars().all()
+
+
+async def is_room_free(session: AsyncSession, room_id: UUID, start: datetime, end: datetime) -> bool:
+    """Whether one room has no booking overlapping ``[start, end)``"""
+    busy = await session.execute(
+        select(
+            exists().where(
+                RoomBooking.room_id == room_id,
+                RoomBooking.during.overlaps(booking_range(start, end)),
+            )
+        )
+    )
+    return not busy.scalar()
+
+
+async def find_conflicts(
+    session: AsyncSession,
+    room_id: UUID,
+    start: datetime,
+    end: datetime,
+) -> List[RoomBooking]:
+    """Bookings for a room that overlap ``[start, end)``, earliest first"""
+    result = await session.execute(
+        select(RoomBooking)
+        .where(
+            RoomBooking.room_id == room_id,
+            RoomBooking.during.overlaps(booking_range(start, end)),
+        )
+        .order_by(func.lower(RoomBooking.during))
+    )
+    return result.scalars().all()
+
+
+async def create_booking(
+    session: AsyncSession,
+    room: Room,
+    start: datetime,
+    end: datetime,
+    title: Optional[str],
+    booked_by: Optional[UUID],
+) -> Tuple[Optional[RoomBooking], List[RoomBooking]]:
+    """Book a room for an event.
+
+    Returns ``(booking, [])`` on success or ``(None, conflicts)`` when the
+    window overlaps existing bookings. A booking that slips in between the
+    check and the insert is caught by the exclusion constraint and reported
+    the same way. The caller commits.
+    """
+    conflicts = await find_conflicts(session, room.id, start, end)
+    if conflicts:
+        return None, conflicts
+
+    booking = RoomBooking(
+        room_id=room.id,
+        school_id=room.school_id,
+        during=Range(start, end, bounds="[)"),
+        source="EVENT",
+        title=title,
+        booked_by=booked_by,
+    )
+    try:
+        async with session.begin_nested():
+            session.add(booking)
+            await session.flush()
+    except IntegrityError:
+        return None, await find_conflicts(session, room.id, start, end)
+    return booking, []
+
+
+async def book_class_occurrences(
+    session: AsyncSession,
+    school_id: UUID,
+    start: date,
+    end: Optional[date] = None,
+    classroom_ids: Optional[Iterable[UUID]] = None,
+) -> int:
+    """Give compiled class meetings in a date range their CLASS room bookings.
+
+    Meetings that would overlap an existing booking are skipped rather than
+    failing the compile; ``unbooked_occurrences`` lists them. Returns bookings made.
+    """
+    source = (
+        select(
+            func.gen_random_uuid(),
+            ScheduleOccurrence.room_id,
+            ScheduleOccurrence.school_id,
+            booking_range(ScheduleOccurrence.starts_at, ScheduleOccurrence.ends_at),
+            literal("CLASS"),
+            ScheduleOccurrence.id,
+            func.now(),
+        )
+        .where(
+            ScheduleOccurrence.school_id == school_id,
+            ScheduleOccurrence.calendar_date >= start,
+            ScheduleOccurrence.room_id.isnot(None),
+            ~exists().where(RoomBooking.occurrence_id == ScheduleOccurrence.id),
+        )
+        # Deterministic winner when two meetings claim one room: the earlier-starting one
+        .order_by(ScheduleOccurrence.starts_at, ScheduleOccurrence.id)
+    )
+    if end is not None:
+        source = source.where(ScheduleOccurrence.calendar_date <= end)
+    if classroom_ids is not None:
+        source = source.where(ScheduleOccurrence.classroom_id.in_(set(classroom_ids)))
+
+    result = await session.execute(
+        pg_insert(RoomBooking)
+        .from_select(["id", "room_id", "school_id", "during", "source", "occurrence_id", "created_at"], source)
+        .on_conflict_do_nothing()
+    )
+    return result.rowcount
+
+
+async def unbooked_occurrences(session: AsyncSession, school_id: UUID, start: date, end: Optional[date] = None):
+    """Class meetings that have a room but lost it to an overlapping booking, with the booking that holds it"""
+    holder = RoomBooking.__table__.alias("holder")
+    query = (
+        select(
+            ScheduleOccurrence.id.label("occurrence_id"),
+            ScheduleOccurrence.classroom_id,
+            ScheduleOccurrence.room_id,
+            ScheduleOccurrence.calendar_date,
+            ScheduleOccurrence.starts_at,
+            ScheduleOccurrence.ends_at,
+            holder.c.id.label("conflicting_booking_id"),
+            holder.c.source.label("conflicting_source"),
+            holder.c.title.label("conflicting_title"),
+            holder.c.occurrence_id.label("conflicting_occurrence_id"),
+        )
+        .join(holder, and_(
+            holder.c.room_id == ScheduleOccurrence.room_id,
+            holder.c.during.op("&&")(booking_range(ScheduleOccurrence.starts_at, ScheduleOccurrence.ends_at)),
+        ))
+        .where(
+            ScheduleOccurrence.school_id == school_id,
+            ScheduleOccurrence.calendar_date >= start,
+            ScheduleOccurrence.room_id.isnot(None),
+            ~exists().where(RoomBooking.occurrence_id == ScheduleOccurrence.id),
+        )
+        .order_by(ScheduleOccurrence.starts_at)
+    )
+    if end is not None:
+        query = query.where(ScheduleOccurrence.calendar_date <= end)
+    result = await session.execute(query)
+    return [dict(row) for row in result.mappings()]
@@ -0,0 +1,173 @@
+# backend/app/services/room_utilization.py
+# School-wide room utilization report, cached per (school, academic year)
+
+"""
+The facilities page needs, for every room at a school, which classrooms are
+assigned to it and how full they are. Asking ``/rooms/{id}/usage`` once per
+room costs two queries per row; this builds the whole report from one query:
+rooms left-joined to their classrooms for the year, left-joined to active
+enrollment counts grouped per classroom.
+
+Seat utilization is per classroom (classrooms sharing a room meet at
+different times), so a room's utilization is its fullest classroom's
+enrollment over the room's capacity.
+
+Reports are cached in-process for ``room_utilization_cache_seconds``. Any
+committed ORM change to a Room, Classroom or Enrollment clears the cache;
+Core bulk writes are covered by the expiry.
+"""
+
+import time
+from typing import Any, Dict, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import and_, event, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from ..config import get_settings
+from ..models.academic_year import AcademicYear
+from ..models.classroom import Classroom
+from ..models.enrollment import Enrollment
+from ..models.room import Room
+from ..models.subject import Subject
+
+_PENDING_KEY = "room_utilization_dirty"
+
+_cache: Dict[Tuple[UUID, Optional[UUID]], Tuple[float, Dict[str, Any]]] = {}
+
+
+def invalidate() -> None:
+    _cache.clear()
+
+
+async def _active_year_id(session: AsyncSession) -> Optional[UUID]:
+    result = await session.execute(select(AcademicYear.id).where(AcademicYear.is_active == True).limit(1))
+    return result.scalar_one_or_none()
+
+
+async def get_utilization(
+    session: AsyncSession,
+    school_id: UUID,
+    academic_year_id: Optional[UUID] = None,
+    refresh: bool = False,
+) -> Dict[str, Any]:
+    """Utilization for every active room at a school; defaults to the active academic year"""
+    academic_year_id = academic_year_id or await _active_year_id(session)
+    key = (school_id, academic_year_id)
+    ttl = get_settings().room_utilization_cache_seconds
+    cached = _cache.get(key)
+    if cached is not None and not refresh and time.monotonic() - cached[0] < ttl:
+        return cached[1]
+
+    report = await _build_report(session, school_id, academic_year_id)
+    if ttl > 0:
+        _cache[key] = (time.monotonic(), report)
+    return report
+
+
+async def _build_report(session: AsyncSession, school_id: UUID, academic_year_id: Optional[UUID]) -> Dict[str, Any]:
+    classroom_filter = Classroom.room_id == Room.id
+    if academic_year_id is not None:
+        classroom_filter = and_(classroom_filter, Classroom.academic_year_id == academic_year_id)
+
+    enrolled = (
+        select(Enrollment.classroom_id, func.count().label("enrolled"))
+        .join(Classroom, Classroom.id == Enrollment.classroom_id)
+        .join(Room, classroom_filter)
+        .where(Room.school_id == school_id, Enrollment.is_active == True)
+        .group_by(Enrollment.classroom_id)
+    )
+    if academic_year_id is not None:
+        enrolled = enrolled.where(Enrollment.academic_year_id == academic_year_id)
+    enrolled = enrolled.subquery()
+
+    result = await session.execute(
+        select(
+            Room.id, Room.name, Room.room_code, Room.room_type, Room.capacity,
+            Classroom.id, Classroom.name, Classroom.grade_level, Classroom.max_students,
+            Subject.name, func.coalesce(enrolled.c.enrolled, 0),
+        )
+        .outerjoin(Classroom, classroom_filter)
+        .outerjoin(Subject, Subject.id == Classroom.subject_id)
+        .outerjoin(enrolled, enrolled.c.classroom_id == Classroom.id)
+        .where(Room.school_id == school_id, Room.is_active == True)
+        .order_by(Room.name, Classroom.name)
+    )
+
+    rooms: Dict[UUID, Dict[str, Any]] = {}
+    for (room_id, room_name, room_code, room_type, capacity,
+         classroom_id, classroom_name, grade_level, max_students, subject_name, enrolled_count) in result.all():
+        room = rooms.get(room_id)
+        if room is None:
+            room = rooms[room_id] = {
+                "room_id": room_id,
+                "name": room_name,
+                "code": room_code,
+                "type": room_type,
+                "capacity": capacity,
+                "assigned_classrooms": [],
+                "peak_enrollment": 0,
+                "utilization": 0.0,
+                "over_capacity": False,
+                "warnings": [],
+            }
+        if classroom_id is None:
+            continue
+
+        room["assigned_classrooms"].append({
+            "id": classroom_id,
+            "name": classroom_name,
+            "grade_level": grade_level,
+            "subject": subject_name,
+            "enrolled": enrolled_count,
+            "max_students": max_students,
+        })
+        room["peak_enrollment"] = max(room["peak_enrollment"], enrolled_count)
+        if capacity and enrolled_count > capacity:
+            room["warnings"].append(f"{classroom_name}: {enrolled_count} enrolled for {capacity} seats")
+        elif capacity and max_students and max_students > capacity:
+            room["warnings"].append(f"{classroom_name}: class size limit {max_students} exceeds {capacity} seats")
+
+    for room in rooms.values():
+        capacity = room["capacity"]
+        room["utilization"] = round(room["peak_enrollment"] / capacity, 3) if capacity else 0.0
+        room["over_capacity"] = bool(capacity) and room["peak_enrollment"] > capacity
+
+    in_use = [room for room in rooms.values() if room["assigned_classrooms"]]
+    return {
+        "school_id": school_id,
+        "academic_year_id": academic_year_id,
+        "summary": {
+            "rooms": len(rooms),
+            "rooms_in_use": len(in_use),
+            "rooms_over_capacity": sum(1 for room in rooms.values() if room["over_capacity"]),
+            "average_utilization": round(sum(room["utilization"] for room in in_use) / len(in_use), 3) if in_use else 0.0,
+        },
+        "rooms": list(rooms.values()),
+    }
+
+
+# ---------------------------------------------------------------------------
+# Session events - drop cached reports once a relevant write commits
+# ---------------------------------------------------------------------------
+
+@event.listens_for(Session, "after_flush")
+def _collect_utilization_changes(session: Session, flush_context) -> None:
+    if session.info.get(_PENDING_KEY):
+        return
+    for obj in list(session.new) + list(session.dirty) + list(session.deleted):
+        if isinstance(obj, (Room, Classroom, Enrollment)):
+            session.info[_PENDING_KEY] = True
+            return
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_utilization_invalidation(session: Session) -> None:
+    if session.info.pop(_PENDING_KEY, False):
+        invalidate()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_utilization_changes(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
@@ -0,0 +1,261 @@
+# backend/app/services/roster_cache.py
+# In-process classroom roster cache with write-through invalidation
+
+"""
+Rosters are read far more often than they change, so each (classroom,
+active_only) roster is cached as a tuple of plain ``RosterRow`` tuples.
+
+Invalidation is driven by ORM session events rather than by individual
+endpoints: any committed insert/update/delete of an Enrollment drops the
+rosters of the classroom(s) it touched, and a committed edit to a roster field
+of a Student drops every cached roster that student appears in. Code that
+writes with Core statements (bulk inserts, ``UPDATE ... FROM``) must call
+``invalidate_classrooms`` / ``invalidate_students`` itself.
+
+The cache lives in the API process; with several workers each keeps its own
+copy, and each is invalidated by the writes that worker commits. Writes
+committed by another worker are not seen until the roster ages out, so an
+entry is only trusted for ``roster_cache_max_age_seconds``.
+
+A load that was running when any invalidation happened does not store its
+result: the cache keeps one generation counter, bumped by every
+invalidation, and ``put`` drops a roster loaded under an older generation.
+"""
+
+import time
+from collections import OrderedDict
+from datetime import date
+from typing import Dict, Iterable, NamedTuple, Optional, Set, Tuple
+from uuid import UUID
+
+from sqlalchemy import event, inspect, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from ..config import get_settings
+from ..models.classroom import Classroom
+from ..models.enrollment import Enrollment
+from ..models.student import Student
+
+
+class RosterRow(NamedTuple):
+    id: UUID  # students.id
+    student_id: Optional[str]
+    first_name: str
+    last_name: str
+    current_grade_level: str
+    enrollment_id: UUID
+    enrollment_date: Optional[date]
+    enrollment_status: str
+    is_active: bool
+    requires_accommodation: bool
+
+
+Roster = Tuple[RosterRow, ...]
+RosterKey = Tuple[UUID, bool]
+
+# Student attributes that appear in a roster row - edits to anything else are ignored
+STUDENT_ROSTER_FIELDS = ("student_id", "first_name", "last_name", "current_grade_level")
+
+_PENDING_KEY = "roster_cache_pending"
+
+
+class RosterCache:
+    """LRU of rosters plus a student -> classrooms index for targeted invalidation"""
+
+    def __init__(self, max_entries: int, max_age: float):
+        self.max_entries = max_entries
+        self.max_age = max_age
+        self._rosters: "OrderedDict[RosterKey, Tuple[float, Roster]]" = OrderedDict()
+        self._student_classrooms: Dict[UUID, Set[UUID]] = {}
+        # Bumped on every invalidation; a load that started under an older
+        # generation must not store its (possibly stale) result. One counter
+        # for the whole cache: a student edit can touch a classroom whose
+        # roster is still loading and so is not in the index yet
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+
+    def generation(self) -> int:
+        return self._generation
+
+    def get(self, classroom_id: UUID, active_only: bool) -> Optional[Roster]:
+        key = (classroom_id, active_only)
+        entry = self._rosters.get(key)
+        if entry is not None and time.monotonic() - entry[0] >= self.max_age:
+            self._drop(key)
+            self.expired += 1
+            entry = None
+        if entry is None:
+            self.misses += 1
+            return None
+        self._rosters.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def put(self, classroom_id: UUID, active_only: bool, roster: Roster, generation: int) -> None:
+        if self._generation != generation:
+            return
+        key = (classroom_id, active_only)
+        self._drop(key)
+        self._rosters[key] = (time.monotonic(), roster)
+        for row in roster:
+            self._student_classrooms.setdefault(row.id, set()).add(classroom_id)
+        while len(self._rosters) > self.max_entries:
+            self._drop(next(iter(self._rosters)))
+
+    def _drop(self, key: RosterKey) -> None:
+        """Remove one roster and unindex students no other cached roster of the classroom holds"""
+        entry = self._rosters.pop(key, None)
+        if entry is None:
+            return
+        classroom_id, active_only = key
+        other = self._rosters.get((classroom_id, not active_only))
+        still_cached = {row.id for row in other[1]} if other is not None else set()
+        for row in entry[1]:
+            if row.id in still_cached:
+                continue
+            classrooms = self._student_classrooms.get(row.id)
+            if classrooms is not None:
+                classrooms.discard(classroom_id)
+                if not classrooms:
+                    del self._student_classrooms[row.id]
+
+    def invalidate_classrooms(self, classroom_ids: Iterable[UUID]) -> None:
+        self._generation += 1
+        for classroom_id in set(classroom_ids):
+            for active_only in (True, False):
+                self._drop((classroom_id, active_only))
+
+    def invalidate_students(self, student_ids: Iterable[UUID]) -> None:
+        classroom_ids: Set[UUID] = set()
+        for student_id in set(student_ids):
+            classroom_ids |= self._student_classrooms.get(student_id, set())
+        self.invalidate_classrooms(classroom_ids)
+
+    def clear(self) -> None:
+        self._generation += 1
+        self._rosters.clear()
+        self._student_classrooms.clear()
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self._rosters),
+            "max_entries": self.max_entries,
+            "max_age_seconds": self.max_age,
+            "indexed_students": len(self._student_classrooms),
+            "hits": self.hits,
+            "misses": self.misses,
+            "expired": self.expired,
+        }
+
+
+_cache: Optional[RosterCache] = None
+
+
+def get_roster_cache() -> RosterCache:
+    global _cache
+    if _cache is None:
+        settings = get_settings()
+        _cache = RosterCache(settings.roster_cache_max_entries, settings.roster_cache_max_age_seconds)
+    return _cache
+
+
+def invalidate_classrooms(classroom_ids: Iterable[UUID]) -> None:
+    get_roster_cache().invalidate_classrooms(classroom_ids)
+
+
+def invalidate_students(student_ids: Iterable[UUID]) -> None:
+    get_roster_cache().invalidate_students(student_ids)
+
+
+def mark_classrooms_changed(session: AsyncSession, classroom_ids: Iterable[UUID]) -> None:
+    """For Core writes: drop these classrooms' rosters once the session commits"""
+    _pending(session.sync_session)[0].update(classroom_ids)
+
+
+def mark_students_changed(session: AsyncSession, student_ids: Iterable[UUID]) -> None:
+    """For Core writes: drop rosters showing these students once the session commits"""
+    _pending(session.sync_session)[1].update(student_ids)
+
+
+async def get_roster(session: AsyncSession, classroom_id: UUID, active_only: bool = True) -> Optional[Roster]:
+    """Cached roster for a classroom, or None if the classroom does not exist"""
+    cache = get_roster_cache()
+    roster = cache.get(classroom_id, active_only)
+    if roster is not None:
+        return roster
+
+    generation = cache.generation()
+    academic_year_id = (await session.execute(
+        select(Classroom.academic_year_id).where(Classroom.id == classroom_id)
+    )).scalar_one_or_none()
+    if academic_year_id is None:
+        return None
+
+    query = (
+        select(
+            Student.id, Student.student_id, Student.first_name, Student.last_name,
+            Student.current_grade_level, Enrollment.id, Enrollment.enrollment_date,
+            Enrollment.enrollment_status, Enrollment.is_active, Enrollment.requires_accommodation,
+        )
+        .join(Student, Student.id == Enrollment.student_id)
+        # The year constant prunes the scan to that year's enrollments partition
+        .where(Enrollment.academic_year_id == academic_year_id, Enrollment.classroom_id == classroom_id)
+        .order_by(Enrollment.id.desc())
+    )
+    if active_only:
+        query = query.where(Enrollment.is_active == True)
+
+    result = await session.execute(query)
+    roster = tuple(
+        RosterRow(
+            row[0], row[1], row[2], row[3], row[4], row[5], row[6],
+            row[7] or "ACTIVE", bool(row[8]), bool(row[9]),
+        )
+        for row in result.all()
+    )
+    cache.put(classroom_id, active_only, roster, generation)
+    return roster
+
+
+# ---------------------------------------------------------------------------
+# Session events - collect what a flush touched, invalidate once it commits
+# ---------------------------------------------------------------------------
+
+def _pending(session: Session) -> Tuple[Set[UUID], Set[UUID]]:
+    return session.info.setdefault(_PENDING_KEY, (set(), set()))
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_roster_changes(session: Session, flush_context) -> None:
+    classroom_ids, student_ids = _pending(session)
+
+    for obj in list(session.new) + list(session.dirty) + list(session.deleted):
+        if isinstance(obj, Enrollment):
+            history = inspect(obj).attrs.classroom_id.history
+            classroom_ids.update(cid for cid in (*history.added, *history.unchanged, *history.deleted) if cid)
+        elif isinstance(obj, Student):
+            if obj in session.deleted:
+                student_ids.add(obj.id)
+                continue
+            state = inspect(obj)
+            if any(state.attrs[field].history.has_changes() for field in STUDENT_ROSTER_FIELDS):
+                student_ids.add(obj.id)
+        elif isinstance(obj, Classroom) and obj in session.deleted:
+            classroom_ids.add(obj.id)
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_roster_invalidation(session: Session) -> None:
+    classroom_ids, student_ids = session.info.pop(_PENDING_KEY, (set(), set()))
+    if classroom_ids:
+        invalidate_classrooms(classroom_ids)
+    if student_ids:
+        invalidate_students(student_ids)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_roster_changes(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
@@ -0,0 +1,288 @@
+# backend/app/services/schedule.py
+# Schedule compilation and "what meets when" lookups
+
+"""
+Periods, rotation days, the school calendar and class blocks are the editable
+source of truth. Answering "what meets today" from them directly means joining
+four tables and resolving rotation days and time zones on every request, so
+they are compiled into ``schedule_occurrences``: one row per block per
+instructional date with absolute ``starts_at``/``ends_at``.
+
+Compilation is a single ``INSERT ... SELECT`` per school, followed by the
+CLASS room bookings for the new rows (see ``services.room_booking``).
+School-local period times become timestamps with
+``timezone(School.tz, date + time)``, so daylight saving changes are handled
+by Postgres. Past dates are left alone; edits recompile from the school's
+today onward.
+
+With the index in place:
+
+* a teacher's day is one query - their active assignments (indexed by
+  teacher) joined to occurrences on ``(classroom_id, calendar_date)``;
+* a room's current class is one range scan on ``(room_id, calendar_date, starts_at)``.
+"""
+
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set
+from uuid import UUID
+
+from sqlalchemy import and_, delete, func, or_, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models.classroom import Classroom
+from ..models.classroom_teacher_assignment import ClassroomTeacherAssignment
+from ..models.enrollment import Enrollment
+from ..models.room import Room
+from ..models.schedule import CalendarBlock, RotationDay, ScheduleOccurrence, SchedulePeriod, SchoolCalendarDay
+from ..models.school import School
+from ..models.user_role import UserRole
+from .room_booking import book_class_occurrences
+from .timezone import school_today
+
+WEEKDAYS = (0, 1, 2, 3, 4)  # Monday-Friday
+
+
+async def compile_schedule(
+    session: AsyncSession,
+    school_id: UUID,
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+    classroom_ids: Optional[Iterable[UUID]] = None,
+) -> int:
+    """Rebuild occurrences for a school from ``start`` (default: the school's today) onward.
+
+    ``classroom_ids`` limits the rebuild to those classes. Returns rows written;
+    the caller commits.
+    """
+    school = await session.get(School, school_id)
+    if school is None:
+        return 0
+    start = start or school_today(school.tz)
+    classroom_ids = set(classroom_ids) if classroom_ids is not None else None
+
+    stale = delete(ScheduleOccurrence).where(
+        ScheduleOccurrence.school_id == school_id,
+        ScheduleOccurrence.calendar_date >= start,
+    )
+    if end is not None:
+        stale = stale.where(ScheduleOccurrence.calendar_date <= end)
+    if classroom_ids is not None:
+        stale = stale.where(ScheduleOccurrence.classroom_id.in_(classroom_ids))
+    await session.execute(stale)
+
+    day = SchoolCalendarDay
+    source = (
+        select(
+            func.gen_random_uuid(),
+            CalendarBlock.id,
+            SchedulePeriod.school_id,
+            CalendarBlock.classroom_id,
+            SchedulePeriod.id,
+            func.coalesce(CalendarBlock.room_id, Classroom.room_id),
+            day.calendar_date,
+            func.timezone(School.tz, day.calendar_date + SchedulePeriod.start_time),
+            func.timezone(School.tz, day.calendar_date + SchedulePeriod.end_time),
+        )
+        .select_from(CalendarBlock)
+        .join(SchedulePeriod, and_(SchedulePeriod.id == CalendarBlock.period_id, SchedulePeriod.is_active == True))
+        .join(School, School.id == SchedulePeriod.school_id)
+        .join(Classroom, Classroom.id == CalendarBlock.classroom_id)
+        .join(day, and_(
+            day.school_id == SchedulePeriod.school_id,
+            day.academic_year_id == SchedulePeriod.academic_year_id,
+            day.is_instructional == True,
+            or_(CalendarBlock.rotation_day_id.is_(None), CalendarBlock.rotation_day_id == day.rotation_day_id),
+        ))
+        .where(
+            SchedulePeriod.school_id == school_id,
+            day.calendar_date >= start,
+            or_(CalendarBlock.effective_from.is_(None), day.calendar_date >= CalendarBlock.effective_from),
+            or_(CalendarBlock.effective_to.is_(None), day.calendar_date <= CalendarBlock.effective_to),
+        )
+    )
+    if end is not None:
+        source = source.where(day.calendar_date <= end)
+    if classroom_ids is not None:
+        source = source.where(CalendarBlock.classroom_id.in_(classroom_ids))
+
+    written = await session.execute(
+        pg_insert(ScheduleOccurrence).from_select(
+            [
+                "id", "block_id", "school_id", "classroom_id", "period_id",
+                "room_id", "calendar_date", "starts_at", "ends_at",
+            ],
+            source,
+        )
+    )
+    # Across the whole school: meetings that lost a room to one just removed can claim it now
+    await book_class_occurrences(session, school_id, start, end)
+    return written.rowcount
+
+
+async def recompile_classrooms(session: AsyncSession, classroom_ids: Iterable[UUID]) -> int:
+    """Recompile upcoming occurrences for classes whose blocks or room changed"""
+    classroom_ids = set(classroom_ids)
+    if not classroom_ids:
+        return 0
+    school_ids = set((await session.execute(
+        select(SchedulePeriod.school_id)
+        .join(CalendarBlock, CalendarBlock.period_id == SchedulePeriod.id)
+        .where(CalendarBlock.classroom_id.in_(classroom_ids))
+        .distinct()
+    )).scalars().all())
+    # Include schools that still hold occurrences (e.g. the class's last block was deleted)
+    school_ids |= set((await session.execute(
+        select(ScheduleOccurrence.school_id)
+        .where(ScheduleOccurrence.classroom_id.in_(classroom_ids))
+        .distinct()
+    )).scalars().all())
+
+    written = 0
+    for school_id in school_ids:
+        written += await compile_schedule(session, school_id, classroom_ids=classroom_ids)
+    return written
+
+
+async def generate_calendar(
+    session: AsyncSession,
+    school_id: UUID,
+    academic_year_id: UUID,
+    start: date,
+    end: date,
+    closed_dates: Set[date],
+    weekdays: Sequence[int] = WEEKDAYS,
+) -> int:
+    """Fill the school calendar for a date range, cycling rotation days over instructional days.
+
+    Closed dates are stored as non-instructional and do not advance the
+    rotation. Existing days in the range are overwritten. Returns days written.
+    """
+    rotation = (await session.execute(
+        select(RotationDay.id)
+        .where(RotationDay.school_id == school_id, RotationDay.academic_year_id == academic_year_id)
+        .order_by(RotationDay.sequence)
+    )).scalars().all()
+
+    values = []
+    position = 0
+    current = start
+    while current <= end:
+        if current.weekday() in weekdays:
+            instructional = current not in closed_dates
+            values.append({
+                "school_id": school_id,
+                "calendar_date": current,
+                "academic_year_id": academic_year_id,
+                "is_instructional": instructional,
+                "rotation_day_id": rotation[position % len(rotation)] if (rotation and instructional) else None,
+                "note": None if instructional else "Closed",
+            })
+            if instructional:
+                position += 1
+        current += timedelta(days=1)
+
+    # Weekends inside the range are removed rather than stored as closed days
+    await session.execute(delete(SchoolCalendarDay).where(
+        SchoolCalendarDay.school_id == school_id,
+        SchoolCalendarDay.calendar_date.between(start, end),
+    ))
+    # 6 parameters per day; a school year is ~260 weekdays
+    for offset in range(0, len(values), 2000):
+        await session.execute(pg_insert(SchoolCalendarDay).values(values[offset:offset + 2000]))
+    return len(values)
+
+
+def _roster_count():
+    return (
+        select(func.count())
+        .select_from(Enrollment)
+        .where(Enrollment.classroom_id == ScheduleOccurrence.classroom_id, Enrollment.is_active == True)
+        .correlate(ScheduleOccurrence)
+        .scalar_subquery()
+    )
+
+
+def _occurrence_columns():
+    return (
+        ScheduleOccurrence.id,
+        ScheduleOccurrence.block_id,
+        ScheduleOccurrence.calendar_date,
+        ScheduleOccurrence.starts_at,
+        ScheduleOccurrence.ends_at,
+        ScheduleOccurrence.classroom_id,
+        Classroom.name.label("classroom_name"),
+        SchedulePeriod.name.label("period_name"),
+        ScheduleOccurrence.room_id,
+        Room.name.label("room_name"),
+        _roster_count().label("roster_count"),
+    )
+
+
+async def teacher_day(session: AsyncSession, teacher_user_id: UUID, on_date: Optional[date] = None) -> List[Dict[str, Any]]:
+    """A teacher's classes for a day, in start order.
+
+    Without ``on_date`` each school's own "today" is used, so a teacher working
+    in schools in different time zones still sees the right day for each.
+    """
+    if on_date is not None:
+        day_filter = ScheduleOccurrence.calendar_date == on_date
+    else:
+        zones = (await session.execute(
+            select(School.id, School.tz)
+            .join(UserRole, UserRole.school_id == School.id)
+            .where(UserRole.user_id == teacher_user_id, UserRole.is_active == True)
+            .distinct()
+        )).all()
+        if not zones:
+            return []
+        day_filter = or_(*(
+            and_(ScheduleOccurrence.school_id == school_id, ScheduleOccurrence.calendar_date == school_today(tz))
+            for school_id, tz in zones
+        ))
+
+    result = await session.execute(
+        select(*_occurrence_columns())
+        .join(ClassroomTeacherAssignment, and_(
+            ClassroomTeacherAssignment.classroom_id == ScheduleOccurrence.classroom_id,
+            ClassroomTeacherAssignment.teacher_user_id == teacher_user_id,
+            ClassroomTeacherAssignment.is_active == True,
+        ))
+        .join(Classroom, Classroom.id == ScheduleOccurrence.classroom_id)
+        .join(SchedulePeriod, SchedulePeriod.id == ScheduleOccurrence.period_id)
+        .outerjoin(Room, Room.id == ScheduleOccurrence.room_id)
+        .where(day_filter)
+        .order_by(ScheduleOccurrence.starts_at)
+    )
+    # A co-teacher can hold two assignments to one class; list each meeting once
+    seen = set()
+    rows = []
+    for row in result.mappings():
+        if row["id"] not in seen:
+            seen.add(row["id"])
+            rows.append(dict(row))
+    return rows
+
+
+async def room_now(session: AsyncSession, room_id: UUID, at: Optional[datetime] = None) -> Dict[str, Any]:
+    """The class in a room at ``at`` (default now) and the next one after it"""
+    at = at or datetime.now(timezone.utc)
+    # Local dates are within a day of the UTC date, which keeps this an index range scan
+    utc_day = at.astimezone(timezone.utc).date()
+    result = await session.execute(
+        select(*_occurrence_columns())
+        .join(Classroom, Classroom.id == ScheduleOccurrence.classroom_id)
+        .join(SchedulePeriod, SchedulePeriod.id == ScheduleOccurrence.period_id)
+        .outerjoin(Room, Room.id == ScheduleOccurrence.room_id)
+        .where(
+            ScheduleOccurrence.room_id == room_id,
+            ScheduleOccurrence.calendar_date.between(utc_day - timedelta(days=1), utc_day + timedelta(days=1)),
+            ScheduleOccurrence.ends_at > at,
+        )
+        .order_by(ScheduleOccurrence.starts_at)
+        .limit(2)
+    )
+    rows = [dict(row) for row in result.mappings()]
+    current = rows[0] if rows and rows[0]["starts_at"] <= at else None
+    upcoming = [row for row in rows if row is not current]
+    return {"room_id": room_id, "at": at, "current": current, "next": upcoming[0] if upcoming else None}
@@ -0,0 +1,167 @@
+# backend/app/services/search.py
+# Ranked student / staff / classroom search over the generated search columns
+
+"""
+Two modes share the same indexes:
+
+* ``search`` - full query. Matches the ``tsvector`` column (``websearch`` syntax)
+  or, for typos, the trigram index via ``word_similarity``. Ranked by the
+  better of the two scores.
+* ``prefix`` - autocomplete. Every typed word becomes a ``word:*`` prefix term
+  against the ``tsvector`` column, so "jo sm" finds "John Smith".
+"""
+
+import re
+from typing import Dict, List, Optional, Sequence
+from uuid import UUID
+
+from sqlalchemy import and_, exists, func, literal, literal_column, or_, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..config import get_settings
+from ..models.classroom import Classroom
+from ..models.student import Student
+from ..models.user import User
+from ..models.user_role import UserRole
+
+SEARCH_TYPES = ("students", "staff", "classrooms")
+SEARCH_MODES = ("search", "prefix")
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+_SIMPLE = literal_column("'simple'::regconfig")
+
+
+def prefix_tsquery(q: str) -> Optional[str]:
+    """'Jo Sm' -> 'jo:* & sm:*' (None when nothing searchable was typed)"""
+    tokens = _TOKEN_RE.findall(q.lower())
+    if not tokens:
+        return None
+    return " & ".join(f"{token}:*" for token in tokens)
+
+
+def _match(model, q: str, mode: str):
+    """Return (where clause, score expression) for one searchable model"""
+    if mode == "prefix":
+        tsquery = func.to_tsquery(_SIMPLE, prefix_tsquery(q))
+        return model.search_vector.op("@@")(tsquery), func.ts_rank(model.search_vector, tsquery)
+
+    needle = q.strip().lower()
+    tsquery = func.websearch_to_tsquery(_SIMPLE, q)
+    where = or_(
+        model.search_vector.op("@@")(tsquery),
+        literal(needle).op("<%")(model.search_text),
+    )
+    score = func.greatest(
+        func.ts_rank(model.search_vector, tsquery),
+        func.word_similarity(needle, model.search_text),
+    )
+    return where, score
+
+
+async def _search_students(session: AsyncSession, q: str, mode: str, limit: int, school_id: Optional[UUID]):
+    where, score = _match(Student, q, mode)
+    query = (
+        select(Student.id, Student.first_name, Student.last_name, Student.student_id,
+               Student.current_grade_level, score.label("score"))
+        .where(where, Student.is_active == True)
+        .order_by(score.desc(), Student.last_name, Student.first_name)
+        .limit(limit)
+    )
+    if school_id:
+        query = query.where(Student.school_id == school_id)
+
+    rows = (await session.execute(query)).all()
+    return [
+        {
+            "type": "student",
+            "id": row.id,
+            "label": f"{row.first_name} {row.last_name}",
+            "sublabel": " · ".join(filter(None, [row.student_id, f"Grade {row.current_grade_level}"])),
+            "score": float(row.score),
+        }
+        for row in rows
+    ]
+
+
+async def _search_staff(session: AsyncSession, q: str, mode: str, limit: int, school_id: Optional[UUID]):
+    where, score = _match(User, q, mode)
+    # Staff = users holding at least one active role (parents have none)
+    role_filter = [UserRole.user_id == User.id, UserRole.is_active == True]
+    if school_id:
+        role_filter.append(UserRole.school_id == school_id)
+
+    query = (
+        select(User.id, User.first_name, User.last_name, User.email, score.label("score"))
+        .where(where, User.is_active == True, exists().where(and_(*role_filter)))
+        .order_by(score.desc(), User.last_name, User.first_name)
+        .limit(limit)
+    )
+    rows = (await session.execute(query)).all()
+    return [
+        {
+            "type": "staff",
+            "id": row.id,
+            "label": f"{row.first_name} {row.last_name}",
+            "sublabel": row.email,
+            "score": float(row.score),
+        }
+        for row in rows
+    ]
+
+
+async def _search_classrooms(session: AsyncSession, q: str, mode: str, limit: int, school_id: Optional[UUID]):
+    where, score = _match(Classroom, q, mode)
+    query = (
+        select(Classroom.id, Classroom.name, Classroom.grade_level, score.label("score"))
+        .where(where)
+        .order_by(score.desc(), Classroom.name)
+        .limit(limit)
+    )
+    if school_id:
+        # District-wide classrooms (no school) match every school
+        query = query.where(or_(Classroom.school_id == school_id, Classroom.school_id.is_(None)))
+    rows = (await session.execute(query)).all()
+    return [
+        {
+            "type": "classroom",
+            "id": row.id,
+            "label": row.name,
+            "sublabel": f"Grade {row.grade_level}",
+            "score": float(row.score),
+        }
+        for row in rows
+    ]
+
+
+_SEARCHERS = {
+    "students": _search_students,
+    "staff": _search_staff,
+    "classrooms": _search_classrooms,
+}
+
+
+async def search(
+    session: AsyncSession,
+    q: str,
+    types: Sequence[str] = SEARCH_TYPES,
+    mode: str = "search",
+    limit: int = 10,
+    school_id: Optional[UUID] = None,
+) -> List[Dict]:
+    """Search the requested entity types and merge the results by score"""
+    if mode == "prefix" and prefix_tsquery(q) is None:
+        return []
+
+    if mode == "search":
+        # Transaction-local, so it never leaks into other requests on this connection
+        await session.execute(
+            text("SELECT set_config('pg_trgm.word_similarity_threshold', :threshold, true)"),
+            {"threshold": str(get_settings().search_similarity_threshold)},
+        )
+
+    results: List[Dict] = []
+    for search_type in types:
+        results.extend(await _SEARCHERS[search_type](session, q, mode, limit, school_id))
+
+    results.sort(key=lambda r: r["score"], reverse=True)
+    return results[:limit]
@@ -0,0 +1,189 @@
+# backend/app/services/slow_queries.py
+# Slow-query log with sampled EXPLAIN (ANALYZE, BUFFERS) capture
+
+"""
+Records every statement slower than ``slow_query_threshold_ms`` into an
+in-memory ring buffer. Each entry carries the normalized SQL, the shapes of its
+bind parameters, the route that issued it and the trace id. A sample of slow
+SELECTs is re-run under ``EXPLAIN (ANALYZE, BUFFERS)`` on a separate connection
+in the background, so the request that triggered it is not delayed.
+"""
+
+import asyncio
+import logging
+import random
+import re
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import event
+
+from ..config import get_settings
+from .tracing import current_route, current_span
+
+logger = logging.getLogger("app.slow_queries")
+
+MAX_STATEMENT_LENGTH = 2000
+SKIP_OPTION = "skip_slow_query_log"
+
+_STRING_RE = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_RE = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER_RE = re.compile(r"(\$\d+|%\(\w+\)s|(?<!:):(?!:)\w+|\?)")
+_IN_LIST_RE = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_WHITESPACE_RE = re.compile(r"\s+")
+_LOCKING_RE = re.compile(r"\bFOR\s+(?:UPDATE|NO\s+KEY\s+UPDATE|SHARE|KEY\s+SHARE)\b", re.IGNORECASE)
+
+
+def normalize_sql(statement: str) -> str:
+    """Collapse literals and placeholders so equivalent statements group together"""
+    sql = _STRING_RE.sub("?", statement)
+    sql = _PLACEHOLDER_RE.sub("?", sql)
+    sql = _NUMBER_RE.sub("?", sql)
+    sql = _IN_LIST_RE.sub("(?...)", sql)
+    return _WHITESPACE_RE.sub(" ", sql).strip()
+
+
+def parameter_shapes(parameters: Any, executemany: bool = False) -> Any:
+    """Describe bind parameters by type only - values may contain student data"""
+    if executemany and isinstance(parameters, (list, tuple)):
+        first = parameters[0] if parameters else None
+        return {"rows": len(parameters), "row": parameter_shapes(first)}
+    if isinstance(parameters, dict):
+        return {key: type(value).__name__ for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [type(value).__name__ for value in parameters]
+    return type(parameters).__name__ if parameters is not None else None
+
+
+class SlowQueryLog:
+    """Fixed-size, thread-safe ring buffer of slow statements"""
+
+    def __init__(self, size: int):
+        self._entries: deque = deque(maxlen=size)
+        self._lock = threading.Lock()
+        self._next_id = 1
+
+    def add(self, entry: Dict[str, Any]) -> Dict[str, Any]:
+        with self._lock:
+            entry["id"] = self._next_id
+            self._next_id += 1
+            self._entries.append(entry)
+        return entry
+
+    def entries(self, route: Optional[str] = None, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        with self._lock:
+            items = list(self._entries)
+        items.reverse()  # newest first
+        if route:
+            items = [e for e in items if e.get("route") == route]
+        return items[:limit] if limit else items
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_log: Optional[SlowQueryLog] = None
+_explain_tasks: set = set()
+
+
+def get_slow_query_log() -> SlowQueryLog:
+    global _log
+    if _log is None:
+        _log = SlowQueryLog(get_settings().slow_query_buffer_size)
+    return _log
+
+
+def _is_explainable(statement: str) -> bool:
+    # ANALYZE actually runs the statement, so only plain reads are re-executed.
+    # A locking read would wait on the locks its own transaction still holds
+    head = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else ""
+    return head == "SELECT" and not _LOCKING_RE.search(_STRING_RE.sub("''", statement))
+
+
+async def _capture_explain(engine, entry: Dict[str, Any], statement: str, parameters: Any) -> None:
+    settings = get_settings()
+    try:
+        async with engine.connect() as conn:
+            conn = await conn.execution_options(**{SKIP_OPTION: True})
+            # SET LOCAL scopes the timeout to this (never committed) transaction
+            await conn.exec_driver_sql(
+                f"SET LOCAL statement_timeout = {int(settings.slow_query_explain_timeout_ms)}"
+            )
+            result = await conn.exec_driver_sql(
+                "EXPLAIN (ANALYZE, BUFFERS) " + statement, parameters
+            )
+            entry["explain"] = "\n".join(row[0] for row in result.fetchall())
+            entry["explain_status"] = "captured"
+            await conn.rollback()
+    except Exception as exc:
+        entry["explain_status"] = f"failed: {type(exc).__name__}"
+        logger.warning("EXPLAIN capture failed for slow query %s: %s", entry.get("id"), exc)
+
+
+def _schedule_explain(engine, entry: Dict[str, Any], statement: str, parameters: Any) -> None:
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        entry["explain_status"] = "skipped: no event loop"
+        return
+    entry["explain_status"] = "pending"
+    task = loop.create_task(_capture_explain(engine, entry, statement, parameters))
+    _explain_tasks.add(task)
+    task.add_done_callback(_explain_tasks.discard)
+
+
+def instrument_engine(engine) -> None:
+    """Time every statement on ``engine`` and log the ones above the threshold"""
+    sync_engine = getattr(engine, "sync_engine", engine)
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("slow_query_start", []).append(time.perf_counter())
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        starts = conn.info.get("slow_query_start")
+        if not starts:
+            return
+        elapsed_ms = (time.perf_counter() - starts.pop()) * 1000
+        settings = get_settings()
+        if elapsed_ms < settings.slow_query_threshold_ms:
+            return
+        if conn.get_execution_options().get(SKIP_OPTION):
+            return
+
+        span = current_span()
+        entry = get_slow_query_log().add({
+            "recorded_at": datetime.now(timezone.utc).isoformat(),
+            "duration_ms": round(elapsed_ms, 2),
+            "normalized_sql": normalize_sql(statement),
+            "statement": statement[:MAX_STATEMENT_LENGTH],
+            "parameter_shapes": parameter_shapes(parameters, executemany),
+            "route": current_route(),
+            "trace_id": span.trace_id if span is not None else None,
+            "explain": None,
+            "explain_status": "not_sampled",
+        })
+        logger.warning(
+            "Slow query (%.1fms) on %s: %s",
+            elapsed_ms, entry["route"] or "-", entry["normalized_sql"][:200],
+        )
+
+        if (
+            not executemany
+            and settings.slow_query_explain_sample_rate > 0
+            and _is_explainable(statement)
+            and random.random() < settings.slow_query_explain_sample_rate
+        ):
+            _schedule_explain(engine, entry, statement, parameters)
+
+    @event.listens_for(sync_engine, "handle_error")
+    def _handle_error(exception_context):
+        conn = exception_context.connection
+        starts = conn.info.get("slow_query_start") if conn is not None else None
+        if starts:
+            starts.pop()
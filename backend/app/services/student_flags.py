@@ -0,0 +1,92 @@
+# backend/app/services/student_flags.py
+# Maintained per-student special-need/parent counts and batched tag counts
+
+"""
+Student lists show whether each student has special needs and how many
+parents are on file; the tag library shows how many students carry each tag.
+Counting these per row on every list request is what the old placeholders
+avoided. Instead:
+
+* ``student_flags`` holds both per-student counts. Every endpoint that writes
+  a ``StudentSpecialNeed`` or ``ParentStudentRelationship`` calls
+  ``refresh_flags`` for the students it touched before committing; the
+  refresh recounts those students in one ``INSERT ... SELECT ... ON CONFLICT``,
+  so it is idempotent and cannot drift the way +1/-1 updates can.
+* Lists left-join ``student_flags`` (a primary-key lookup per row); a student
+  with no row counts as zero.
+* Per-tag student counts are one ``GROUP BY`` over the page's tags, served by
+  the partial index on active assignments.
+
+``refresh_flags(session)`` with no ids recounts every student (backfills,
+repairs after bulk imports).
+"""
+
+from typing import Dict, Iterable, Optional
+from uuid import UUID
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models.parent_student_relationship import ParentStudentRelationship
+from ..models.student import Student
+from ..models.student_flags import StudentFlags
+from ..models.student_special_need import StudentSpecialNeed
+
+
+async def refresh_flags(session: AsyncSession, student_ids: Optional[Iterable[UUID]] = None) -> int:
+    """Recount the students' flags (all students if ``student_ids`` is None); returns rows written.
+
+    The caller commits.
+    """
+    need_count = (
+        select(func.count())
+        .where(StudentSpecialNeed.student_id == Student.id, StudentSpecialNeed.is_active == True)
+        .scalar_subquery()
+    )
+    parent_count = (
+        select(func.count())
+        .where(ParentStudentRelationship.student_id == Student.id, ParentStudentRelationship.is_active == True)
+        .scalar_subquery()
+    )
+    source = select(Student.id, need_count, parent_count, func.now())
+    if student_ids is not None:
+        student_ids = set(student_ids)
+        if not student_ids:
+            return 0
+        source = source.where(Student.id.in_(student_ids))
+
+    stmt = pg_insert(StudentFlags).from_select(
+        ["student_id", "special_need_count", "parent_count", "updated_at"], source
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["student_id"],
+        set_={
+            "special_need_count": stmt.excluded.special_need_count,
+            "parent_count": stmt.excluded.parent_count,
+            "updated_at": stmt.excluded.updated_at,
+        },
+    )
+    result = await session.execute(stmt)
+    return result.rowcount
+
+
+def flag_columns():
+    """(has_special_needs, parent_count) expressions for a query outer-joined to StudentFlags"""
+    return (
+        (func.coalesce(StudentFlags.special_need_count, 0) > 0).label("has_special_needs"),
+        func.coalesce(StudentFlags.parent_count, 0).label("parent_count"),
+    )
+
+
+async def tag_student_counts(session: AsyncSession, tag_ids: Iterable[UUID]) -> Dict[UUID, int]:
+    """Active students per tag for a page of tags, in one aggregate; tags with none are absent"""
+    tag_ids = set(tag_ids)
+    if not tag_ids:
+        return {}
+    result = await session.execute(
+        select(StudentSpecialNeed.tag_library_id, func.count(func.distinct(StudentSpecialNeed.student_id)))
+        .where(StudentSpecialNeed.tag_library_id.in_(tag_ids), StudentSpecialNeed.is_active == True)
+        .group_by(StudentSpecialNeed.tag_library_id)
+    )
+    return dict(result.all())
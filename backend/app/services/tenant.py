@@ -0,0 +1,103 @@
+# backend/app/services/tenant.py
+# Row-level tenant scoping: restrict a session's ORM reads to the caller's school
+
+"""
+Endpoints such as the classroom, enrollment and teacher lists used to return
+every school's rows and left filtering to the client. A request session can
+now carry a *school scope* - the school of the caller's ``UserRolePreference``
+(the school picked in the role switcher):
+
+* ``set_school_scope`` stores the school on ``session.info``. From then on a
+  ``do_orm_execute`` hook adds ``with_loader_criteria`` school predicates to
+  every ORM ``SELECT`` the session runs - including joined and lazy loads -
+  for students, rooms and classrooms. District-wide classrooms
+  (``school_id IS NULL``) stay visible to every school. The predicates lead
+  the ``(school_id, ...)`` indexes, so scoping narrows the scan rather than
+  filtering after it.
+* ``get_scoped_db`` (deps) is the request dependency that does this for the
+  current user. Callers with no preference stay unscoped, as before.
+* Core statements (``text()``, ``insert().from_select``) and statements run
+  with ``execution_options(skip_school_scope=True)`` are not rewritten.
+
+Defence in depth: migration ``tenant_scoping`` creates ``tenant_school``
+policies on the same tables that compare ``school_id`` with the
+``app.school_id`` setting. They do nothing until ``scripts/tenant_rls.py
+--enable`` turns row-level security on; with ``tenant_rls_enabled`` set, a
+scoped session also sets ``app.school_id`` for each transaction, so even raw
+SQL on that session only sees the school's rows. An unset ``app.school_id``
+(scripts, background jobs, unscoped sessions) sees everything.
+"""
+
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import event, or_, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, with_loader_criteria
+
+from ..config import get_settings
+from ..models.classroom import Classroom
+from ..models.room import Room
+from ..models.student import Student
+from ..models.user_role_preference import UserRolePreference
+
+# Tables carrying the tenant_school policy (migration tenant_scoping)
+RLS_TABLES = ("classrooms", "students", "rooms")
+
+_SCOPE_KEY = "tenant_school_id"
+SKIP_OPTION = "skip_school_scope"
+
+
+def school_scope(session: AsyncSession) -> Optional[UUID]:
+    """The school a session is scoped to, or None"""
+    return session.info.get(_SCOPE_KEY)
+
+
+async def preferred_school(session: AsyncSession, user_id: UUID) -> Optional[UUID]:
+    result = await session.execute(
+        select(UserRolePreference.school_id).where(UserRolePreference.user_id == user_id)
+    )
+    return result.scalar_one_or_none()
+
+
+async def set_school_scope(session: AsyncSession, school_id: Optional[UUID]) -> None:
+    """Scope the session's ORM reads (and, with RLS enabled, its transactions) to ``school_id``"""
+    session.info[_SCOPE_KEY] = school_id
+    if get_settings().tenant_rls_enabled and session.in_transaction():
+        # The transaction is already open, so after_begin will not fire for it
+        await session.execute(
+            text("SELECT set_config('app.school_id', :school_id, true)"),
+            {"school_id": str(school_id) if school_id else ""},
+        )
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _add_school_criteria(orm_execute_state) -> None:
+    school_id = orm_execute_state.session.info.get(_SCOPE_KEY)
+    if (
+        school_id is None
+        or not orm_execute_state.is_select
+        or orm_execute_state.is_column_load
+        or orm_execute_state.is_relationship_load
+        or orm_execute_state.execution_options.get(SKIP_OPTION, False)
+    ):
+        return
+    orm_execute_state.statement = orm_execute_state.statement.options(
+        with_loader_criteria(Student, Student.school_id == school_id, include_aliases=True),
+        with_loader_criteria(Room, Room.school_id == school_id, include_aliases=True),
+        with_loader_criteria(
+            Classroom,
+            or_(Classroom.school_id == school_id, Classroom.school_id.is_(None)),
+            include_aliases=True,
+        ),
+    )
+
+
+@event.listens_for(Session, "after_begin")
+def _set_rls_school(session, transaction, connection) -> None:
+    school_id = session.info.get(_SCOPE_KEY)
+    if school_id is not None and get_settings().tenant_rls_enabled:
+        # Transaction-local, so a pooled connection never carries it into another request
+        connection.execute(
+            text("SELECT set_config('app.school_id', :school_id, true)"), {"school_id": str(school_id)}
+        )
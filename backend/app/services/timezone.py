@@ -1,4 +1,19 @@
-from ..config import ALLOWED_TZS_US
+from datetime import date, datetime
+from typing import Optional
+from zoneinfo import ZoneInfo
+
+from ..config import ALLOWED_TZS_US, get_settings
 
 def allowed_timezones():
     return ALLOWED_TZS_US[:]
+
+def school_zone(tz: Optional[str]) -> ZoneInfo:
+    """Zone for a school's ``tz``, falling back to the configured default"""
+    return ZoneInfo(tz or get_settings().default_timezone)
+
+def school_now(tz: Optional[str]) -> datetime:
+    return datetime.now(school_zone(tz))
+
+def school_today(tz: Optional[str]) -> date:
+    """Today's date at the school (schedule and attendance dates are school-local)"""
+    return school_now(tz).date()
@@ -0,0 +1,347 @@
+# backend/app/services/tracing.py
+# Lightweight request tracing (spans for requests, dependencies, SQL and outbound calls)
+
+"""
+Minimal tracing layer.
+
+The current span lives in a contextvar, so every await made while serving a
+request (dependencies, SQL statements, outbound calls) attaches to that
+request's trace. Finished traces are handed to a pluggable exporter.
+
+Incoming W3C ``traceparent`` headers are honoured so browser requests can be
+correlated with the spans recorded here.
+"""
+
+import contextvars
+import json
+import logging
+import random
+import re
+import secrets
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import event
+
+from ..config import get_settings
+
+logger = logging.getLogger("app.tracing")
+
+TRACEPARENT_RE = re.compile(r"^([0-9a-f]{2})-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$")
+MAX_STATEMENT_LENGTH = 500
+
+_current_span: contextvars.ContextVar[Optional["Span"]] = contextvars.ContextVar("current_span", default=None)
+_request_scope: contextvars.ContextVar[Optional[dict]] = contextvars.ContextVar("request_scope", default=None)
+
+
+class Span:
+    """A single timed operation inside a trace"""
+
+    __slots__ = (
+        "name", "trace_id", "span_id", "parent_id", "sampled",
+        "start_ns", "end_ns", "attributes", "status", "_trace",
+    )
+
+    def __init__(self, name: str, trace_id: str, parent_id: Optional[str], sampled: bool, trace: "_Trace"):
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = secrets.token_hex(8)
+        self.parent_id = parent_id
+        self.sampled = sampled
+        self.start_ns = time.perf_counter_ns()
+        self.end_ns: Optional[int] = None
+        self.attributes: Dict[str, Any] = {}
+        self.status = "OK"
+        self._trace = trace
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        if self.sampled:
+            self.attributes[key] = value
+
+    def record_error(self, exc: BaseException) -> None:
+        self.status = "ERROR"
+        self.set_attribute("error.type", type(exc).__name__)
+        self.set_attribute("error.message", str(exc)[:200])
+
+    @property
+    def duration_ms(self) -> Optional[float]:
+        if self.end_ns is None:
+            return None
+        return (self.end_ns - self.start_ns) / 1_000_000
+
+    @property
+    def traceparent(self) -> str:
+        return f"00-{self.trace_id}-{self.span_id}-{'01' if self.sampled else '00'}"
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "start_offset_ms": round((self.start_ns - self._trace.start_ns) / 1_000_000, 3),
+            "duration_ms": round(self.duration_ms, 3) if self.duration_ms is not None else None,
+            "status": self.status,
+            "attributes": self.attributes,
+        }
+
+
+class _Trace:
+    """Spans collected for one root span; exported together when the root ends"""
+
+    __slots__ = ("start_ns", "spans", "root_span_id")
+
+    def __init__(self):
+        self.start_ns = time.perf_counter_ns()
+        self.spans: List[Span] = []
+        self.root_span_id: Optional[str] = None
+
+
+# ---------------------------------------------------------------------------
+# Exporters
+# ---------------------------------------------------------------------------
+
+class SpanExporter:
+    """Base exporter - subclasses receive every finished, sampled trace"""
+
+    def export(self, spans: List[Span]) -> None:
+        raise NotImplementedError
+
+    def shutdown(self) -> None:
+        pass
+
+
+class NoopSpanExporter(SpanExporter):
+    def export(self, spans: List[Span]) -> None:
+        pass
+
+
+class ConsoleSpanExporter(SpanExporter):
+    """Logs one line per span, indented by depth - handy while developing"""
+
+    def export(self, spans: List[Span]) -> None:
+        depth: Dict[Optional[str], int] = {}
+        for span in spans:
+            level = depth.get(span.parent_id, -1) + 1
+            depth[span.span_id] = level
+            logger.info(
+                "trace=%s %s%s %.2fms %s",
+                span.trace_id[:8],
+                "  " * level,
+                span.name,
+                span.duration_ms or 0.0,
+                span.status if span.status != "OK" else "",
+            )
+
+
+class FileSpanExporter(SpanExporter):
+    """Appends each span as a JSON line to a local file"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def export(self, spans: List[Span]) -> None:
+        lines = "".join(json.dumps(span.to_dict(), default=str) + "\n" for span in spans)
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as fh:
+                fh.write(lines)
+
+
+# ---------------------------------------------------------------------------
+# Tracer
+# ---------------------------------------------------------------------------
+
+class Tracer:
+    def __init__(self, exporter: SpanExporter, sample_rate: float = 0.0):
+        self.exporter = exporter
+        self.sample_rate = max(0.0, min(1.0, sample_rate))
+
+    def _should_sample(self, parent_sampled: Optional[bool]) -> bool:
+        # The browser has no exporter of its own, so an unsampled parent is not
+        # treated as a veto - only a sampled parent forces recording.
+        if parent_sampled:
+            return True
+        return self.sample_rate > 0 and random.random() < self.sample_rate
+
+    def start_span(self, name: str, traceparent: Optional[str] = None, **attributes) -> Span:
+        """Start a span under the current span, or a new trace if there is none"""
+        parent = _current_span.get()
+        if parent is not None:
+            span = Span(name, parent.trace_id, parent.span_id, parent.sampled, parent._trace)
+        else:
+            trace_id, parent_id, parent_sampled = None, None, None
+            parsed = parse_traceparent(traceparent)
+            if parsed:
+                trace_id, parent_id, parent_sampled = parsed
+            span = Span(
+                name,
+                trace_id or secrets.token_hex(16),
+                parent_id,
+                self._should_sample(parent_sampled),
+                _Trace(),
+            )
+            span._trace.root_span_id = span.span_id
+        for key, value in attributes.items():
+            span.set_attribute(key, value)
+        return span
+
+    def end_span(self, span: Span) -> None:
+        span.end_ns = time.perf_counter_ns()
+        if not span.sampled:
+            return
+        trace = span._trace
+        trace.spans.append(span)
+        # The span that opened the trace in this process flushes it
+        if span.span_id == trace.root_span_id:
+            spans = sorted(trace.spans, key=lambda s: s.start_ns)
+            trace.spans = []
+            try:
+                self.exporter.export(spans)
+            except Exception:
+                logger.exception("Span export failed")
+
+    @contextmanager
+    def span(self, name: str, traceparent: Optional[str] = None, **attributes):
+        """Context manager that makes the new span current for the enclosed block"""
+        span = self.start_span(name, traceparent=traceparent, **attributes)
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as exc:
+            span.record_error(exc)
+            raise
+        finally:
+            _current_span.reset(token)
+            self.end_span(span)
+
+
+def parse_traceparent(header: Optional[str]):
+    """Return (trace_id, parent_span_id, sampled) from a W3C traceparent header"""
+    if not header:
+        return None
+    match = TRACEPARENT_RE.match(header.strip().lower())
+    if not match:
+        return None
+    version, trace_id, parent_id, flags = match.groups()
+    if version == "ff" or trace_id == "0" * 32 or parent_id == "0" * 16:
+        return None
+    return trace_id, parent_id, bool(int(flags, 16) & 0x01)
+
+
+def _build_exporter(name: str, path: str) -> SpanExporter:
+    name = (name or "none").lower()
+    if name == "console":
+        return ConsoleSpanExporter()
+    if name == "file":
+        return FileSpanExporter(path)
+    return NoopSpanExporter()
+
+
+_tracer: Optional[Tracer] = None
+
+
+def get_tracer() -> Tracer:
+    global _tracer
+    if _tracer is None:
+        settings = get_settings()
+        _tracer = Tracer(
+            _build_exporter(settings.trace_exporter, settings.trace_file_path),
+            settings.trace_sample_rate,
+        )
+    return _tracer
+
+
+def set_exporter(exporter: SpanExporter) -> None:
+    """Swap the exporter at runtime (e.g. to plug in an OTLP shipper)"""
+    get_tracer().exporter = exporter
+
+
+def current_span() -> Optional[Span]:
+    return _current_span.get()
+
+
+@contextmanager
+def start_span(name: str, **attributes):
+    """Shorthand for ``get_tracer().span(...)``"""
+    with get_tracer().span(name, **attributes) as span:
+        yield span
+
+
+def inject_traceparent(headers: Dict[str, str]) -> Dict[str, str]:
+    """Add the current traceparent to outbound request headers"""
+    span = _current_span.get()
+    if span is not None:
+        headers["traceparent"] = span.traceparent
+    return headers
+
+
+@contextmanager
+def external_call(service: str, operation: str, **attributes):
+    """Span for a call leaving the process; yields headers carrying traceparent"""
+    with start_span(f"external.{service}.{operation}", **{"peer.service": service, **attributes}):
+        yield inject_traceparent({})
+
+
+# ---------------------------------------------------------------------------
+# Request context
+# ---------------------------------------------------------------------------
+
+def bind_request_scope(scope: dict):
+    return _request_scope.set(scope)
+
+
+def reset_request_scope(token) -> None:
+    _request_scope.reset(token)
+
+
+def current_route() -> Optional[str]:
+    """Route template of the request being served (falls back to the raw path)"""
+    scope = _request_scope.get()
+    if scope is None:
+        return None
+    route = scope.get("route")
+    if route is not None and getattr(route, "path", None):
+        return route.path
+    return scope.get("path")
+
+
+# ---------------------------------------------------------------------------
+# SQLAlchemy instrumentation
+# ---------------------------------------------------------------------------
+
+def instrument_engine(engine) -> None:
+    """Record a span for every statement executed through ``engine``"""
+    sync_engine = getattr(engine, "sync_engine", engine)
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if _current_span.get() is None:
+            return
+        span = get_tracer().start_span(
+            "sql." + (statement.split(None, 1)[0].upper() if statement else "QUERY"),
+            **{"db.statement": statement[:MAX_STATEMENT_LENGTH], "db.executemany": executemany},
+        )
+        conn.info.setdefault("trace_spans", []).append(span)
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        spans = conn.info.get("trace_spans")
+        if not spans:
+            return
+        span = spans.pop()
+        if cursor is not None and getattr(cursor, "rowcount", -1) >= 0:
+            span.set_attribute("db.rowcount", cursor.rowcount)
+        get_tracer().end_span(span)
+
+    @event.listens_for(sync_engine, "handle_error")
+    def _handle_error(exception_context):
+        conn = exception_context.connection
+        spans = conn.info.get("trace_spans") if conn is not None else None
+        if not spans:
+            return
+        span = spans.pop()
+        span.record_error(exception_context.original_exception)
+        get_tracer().end_span(span)
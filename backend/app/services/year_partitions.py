@@ -0,0 +1,175 @@
+# backend/app/services/year_partitions.py
+# Per-academic-year partitions of enrollments and attendance marks, and their archival
+
+"""
+``enrollments`` and ``attendance_marks`` grow every year while nearly every
+query reads one year. Both are declaratively partitioned ``BY LIST
+(academic_year_id)`` (migration ``year_partitions``): one partition per year
+plus a ``_default`` partition that catches rows for a year without one.
+
+Queries that pin ``academic_year_id`` to a value are pruned to that year's
+partition at plan time; the roster, attendance and enrollment paths pass the
+classroom's year for that reason. An enrollment's year is always its
+classroom's year.
+
+* ``ensure_year_partitions`` creates a year's partitions (called when a year
+  is created or activated and before a rollover writes into it). Rows that
+  already landed in ``_default`` for that year are moved into the new
+  partition before it is attached.
+* ``archive_year`` detaches a closed year's partitions and moves them to the
+  ``archive`` schema. The data stays queryable as plain tables (and can be
+  dumped and dropped), but no longer costs the live tables anything - indexes,
+  vacuum and planning only see open years.
+* ``restore_year`` attaches an archived year back.
+
+Partition DDL takes an ACCESS EXCLUSIVE lock on the parent table for the
+length of the transaction, so archive and restore belong in a maintenance window.
+"""
+
+import re
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models.academic_year import AcademicYear
+from .timezone import school_today
+
+PARTITIONED_TABLES = ("enrollments", "attendance_marks")
+ARCHIVE_SCHEMA = "archive"
+
+_YEAR_NAME = re.compile(r"^(\d{4})-(\d{4})$")
+
+
+class PartitionError(ValueError):
+    """A year cannot be archived or restored in its current state"""
+
+
+def partition_name(table: str, year: AcademicYear) -> str:
+    """``enrollments_y2024_2025``; years with a non-standard name use their id"""
+    match = _YEAR_NAME.match(year.name or "")
+    suffix = f"y{match.group(1)}_{match.group(2)}" if match else f"y{year.id.hex[:12]}"
+    return f"{table}_{suffix}"
+
+
+async def _partitions(session: AsyncSession, table: str, schema: Optional[str] = None) -> Dict[UUID, str]:
+    """academic_year_id -> partition name for a table's attached partitions"""
+    result = await session.execute(
+        text("""
+            SELECT child.relname, pg_get_expr(child.relpartbound, child.oid)
+            FROM pg_inherits
+            JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+            JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+            JOIN pg_namespace ns ON ns.oid = parent.relnamespace
+            WHERE parent.relname = :table AND ns.nspname = coalesce(:schema, current_schema())
+        """),
+        {"table": table, "schema": schema},
+    )
+    partitions = {}
+    for name, bound in result.all():
+        match = re.search(r"'([0-9a-f-]{36})'", bound or "")
+        if match:
+            partitions[UUID(match.group(1))] = name
+    return partitions
+
+
+async def _attach(session: AsyncSession, table: str, qualified_partition: str, academic_year_id: UUID) -> int:
+    """Move the year's rows out of the default partition into the table, then attach it; returns rows moved"""
+    year = str(academic_year_id)
+    moved = await session.execute(text(f"""
+        WITH moved AS (
+            DELETE FROM {table}_default WHERE academic_year_id = '{year}' RETURNING *
+        )
+        INSERT INTO {qualified_partition} SELECT * FROM moved
+    """))
+    await session.execute(text(
+        f"ALTER TABLE {table} ATTACH PARTITION {qualified_partition} FOR VALUES IN ('{year}')"
+    ))
+    return moved.rowcount
+
+
+async def ensure_year_partitions(session: AsyncSession, year: AcademicYear) -> List[str]:
+    """Create the year's partitions where missing; returns the partitions created. The caller commits."""
+    created = []
+    for table in PARTITIONED_TABLES:
+        if year.id in await _partitions(session, table):
+            continue
+        name = partition_name(table, year)
+        await session.execute(text(
+            f"CREATE TABLE {name} (LIKE {table} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+        ))
+        await _attach(session, table, name, year.id)
+        created.append(name)
+    return created
+
+
+async def list_partitions(session: AsyncSession) -> List[Dict[str, Any]]:
+    """Attached and archived partitions per year, with estimated row counts"""
+    years = {year.id: year for year in (await session.execute(select(AcademicYear.id, AcademicYear.name))).all()}
+    sizes = dict((await session.execute(text("""
+        SELECT ns.nspname || '.' || c.relname, greatest(c.reltuples, 0)::bigint
+        FROM pg_class c JOIN pg_namespace ns ON ns.oid = c.relnamespace
+        WHERE c.relkind = 'r' AND ns.nspname IN (current_schema(), :archive)
+    """), {"archive": ARCHIVE_SCHEMA})).all())
+    schema = (await session.execute(text("SELECT current_schema()"))).scalar()
+
+    rows = []
+    for table in PARTITIONED_TABLES:
+        attached = await _partitions(session, table)
+        for year_id, name in attached.items():
+            rows.append({
+                "table": table, "partition": name, "academic_year_id": year_id,
+                "academic_year": years[year_id].name if year_id in years else None,
+                "archived": False, "estimated_rows": sizes.get(f"{schema}.{name}"),
+            })
+        for year_id, year in years.items():
+            if year_id in attached:
+                continue
+            archived = f"{ARCHIVE_SCHEMA}.{partition_name(table, year)}"
+            if archived in sizes:
+                rows.append({
+                    "table": table, "partition": archived, "academic_year_id": year_id,
+                    "academic_year": year.name, "archived": True, "estimated_rows": sizes[archived],
+                })
+    return rows
+
+
+async def archive_year(session: AsyncSession, year: AcademicYear) -> List[str]:
+    """Detach a closed year's partitions into the archive schema; returns the archived tables. The caller commits."""
+    if year.is_active:
+        raise PartitionError("The active academic year cannot be archived")
+    if year.end_date >= school_today(None):
+        raise PartitionError("Only academic years that have ended can be archived")
+
+    await session.execute(text(f"CREATE SCHEMA IF NOT EXISTS {ARCHIVE_SCHEMA}"))
+    archived = []
+    for table in PARTITIONED_TABLES:
+        name = (await _partitions(session, table)).get(year.id)
+        if name is None:
+            continue
+        await session.execute(text(f"ALTER TABLE {table} DETACH PARTITION {name}"))
+        await session.execute(text(f"ALTER TABLE {name} SET SCHEMA {ARCHIVE_SCHEMA}"))
+        archived.append(f"{ARCHIVE_SCHEMA}.{name}")
+    if not archived:
+        raise PartitionError("This academic year has no attached partitions")
+    return archived
+
+
+async def restore_year(session: AsyncSession, year: AcademicYear) -> List[str]:
+    """Attach an archived year's partitions back; returns the restored partitions. The caller commits."""
+    schema = (await session.execute(text("SELECT current_schema()"))).scalar()
+    restored = []
+    for table in PARTITIONED_TABLES:
+        name = partition_name(table, year)
+        exists = (await session.execute(
+            text("SELECT to_regclass(:name) IS NOT NULL"), {"name": f"{ARCHIVE_SCHEMA}.{name}"}
+        )).scalar()
+        if not exists or year.id in await _partitions(session, table):
+            continue
+        await session.execute(text(f"ALTER TABLE {ARCHIVE_SCHEMA}.{name} SET SCHEMA {schema}"))
+        await _attach(session, table, name, year.id)
+        restored.append(name)
+    if not restored:
+        raise PartitionError("This academic year has no archived partitions")
+    return restored
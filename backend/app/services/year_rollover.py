@@ -0,0 +1,266 @@
+# backend/app/services/year_rollover.py
+# Academic-year rollover: clone classes, teachers and rooms into the next year
+
+"""
+Starting a year used to mean recreating every class by hand. ``rollover_year``
+copies a source year's classes into a target year as a few set-based
+statements, however many classes there are:
+
+1. classes - one ``INSERT ... SELECT`` of every source class with a fresh id,
+   the target year, and its room (dropped if the room was retired). Each copy
+   records ``cloned_from_id``; that column is the old -> new id map the later
+   steps join through.
+2. teacher assignments - active assignments of still-active teachers, copied
+   onto the new classes through the map, starting on the target year's first day.
+3. homeroom pre-enrollment (optional) - students in a source-year homeroom
+   move up a grade (``GRADE_PROGRESSION`` of their enrollment's grade) and are
+   spread alphabetically, round-robin, across the target year's homerooms for
+   that grade at their school. Graduates stay out; students with no matching
+   homeroom are counted as unplaced.
+
+The run is one transaction: a failure or cancellation leaves the target year
+as it was. Every step skips what already exists (the unique
+``(academic_year_id, cloned_from_id)`` index for classes, ``NOT EXISTS`` for
+assignments and enrollments), so re-running after a failure - or after
+adding classes to the source year - resumes rather than duplicates. A dry run
+performs the same statements and rolls back, so its counts are exact.
+"""
+
+from typing import Any, Dict
+from uuid import UUID
+
+from sqlalchemy import and_, case, exists, func, literal, null, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+
+from ..models.academic_year import AcademicYear
+from ..models.classroom import Classroom
+from ..models.classroom_teacher_assignment import ClassroomTeacherAssignment
+from ..models.enrollment import Enrollment
+from ..models.room import Room
+from ..models.student import GRADE_PROGRESSION, Student
+from ..models.user import User
+from . import roster_cache
+from .jobs import Job
+from .parent_summary import mark_students_changed
+from .year_partitions import ensure_year_partitions
+
+
+async def _clone_classrooms(session: AsyncSession, source: AcademicYear, target: AcademicYear, include_rooms: bool) -> int:
+    room_id = (
+        case((Room.is_active == True, Classroom.room_id), else_=None) if include_rooms else null()
+    )
+    source_rows = (
+        select(
+            func.gen_random_uuid(),
+            Classroom.name,
+            Classroom.subject_id,
+            Classroom.grade_level,
+            Classroom.classroom_type,
+            literal(target.id),
+            room_id,
+            Classroom.max_students,
+            Classroom.school_id,
+            Classroom.id,
+        )
+        .outerjoin(Room, Room.id == Classroom.room_id)
+        .where(Classroom.academic_year_id == source.id)
+    )
+    result = await session.execute(
+        pg_insert(Classroom)
+        .from_select(
+            ["id", "name", "subject_id", "grade_level", "classroom_type", "academic_year_id", "room_id",
+             "max_students", "school_id", "cloned_from_id"],
+            source_rows,
+        )
+        .on_conflict_do_nothing(
+            index_elements=["academic_year_id", "cloned_from_id"],
+            index_where=Classroom.cloned_from_id.isnot(None),
+        )
+    )
+    return result.rowcount
+
+
+async def _clone_teacher_assignments(session: AsyncSession, source: AcademicYear, target: AcademicYear) -> int:
+    old = ClassroomTeacherAssignment
+    new_class = aliased(Classroom)
+    existing = aliased(ClassroomTeacherAssignment)
+    source_rows = (
+        select(
+            func.gen_random_uuid(), new_class.id, old.teacher_user_id, old.role_name,
+            old.can_view_grades, old.can_modify_grades, old.can_take_attendance,
+            old.can_view_parent_contact, old.can_create_assignments,
+            literal(target.start_date), literal(True),
+        )
+        .join(Classroom, Classroom.id == old.classroom_id)
+        .join(new_class, and_(new_class.cloned_from_id == Classroom.id, new_class.academic_year_id == target.id))
+        .join(User, and_(User.id == old.teacher_user_id, User.is_active == True))
+        .where(
+            Classroom.academic_year_id == source.id,
+            old.is_active == True,
+            ~exists().where(
+                existing.classroom_id == new_class.id,
+                existing.teacher_user_id == old.teacher_user_id,
+                existing.role_name == old.role_name,
+            ),
+        )
+    )
+    result = await session.execute(
+        pg_insert(ClassroomTeacherAssignment).from_select(
+            ["id", "classroom_id", "teacher_user_id", "role_name", "can_view_grades", "can_modify_grades",
+             "can_take_attendance", "can_view_parent_contact", "can_create_assignments", "start_date", "is_active"],
+            source_rows,
+        )
+    )
+    return result.rowcount
+
+
+async def _pre_enroll_homerooms(
+    session: AsyncSession, source: AcademicYear, target: AcademicYear, enrolled_by
+) -> Dict[str, int]:
+    # Target homerooms per (school, grade), numbered 0..n-1 by name. A homeroom's school is its own,
+    # else its room's, else the school most of the source class's students attended.
+    source_school = (
+        select(Student.school_id)
+        .join(Enrollment, Enrollment.student_id == Student.id)
+        .where(Enrollment.academic_year_id == source.id, Enrollment.classroom_id == Classroom.cloned_from_id)
+        .group_by(Student.school_id)
+        .order_by(func.count().desc())
+        .limit(1)
+        .scalar_subquery()
+    )
+    homeroom_school = func.coalesce(Classroom.school_id, Room.school_id, source_school)
+    homerooms = (
+        select(
+            Classroom.id.label("classroom_id"),
+            Classroom.grade_level.label("grade_level"),
+            homeroom_school.label("school_id"),
+            (func.row_number().over(partition_by=(homeroom_school, Classroom.grade_level), order_by=(Classroom.name, Classroom.id)) - 1).label("slot"),
+            func.count().over(partition_by=(homeroom_school, Classroom.grade_level)).label("slots"),
+        )
+        .outerjoin(Room, Room.id == Classroom.room_id)
+        .where(Classroom.academic_year_id == target.id, Classroom.classroom_type == "HOMEROOM")
+        .cte("homerooms")
+    )
+
+    # Students in a source-year homeroom, with their next grade, once each
+    next_grade = case(GRADE_PROGRESSION, value=Enrollment.grade_level)
+    already_placed = aliased(Enrollment)
+    placed_class = aliased(Classroom)
+    movers = (
+        select(Student.id.label("student_id"), Student.school_id.label("school_id"), next_grade.label("next_grade"))
+        .distinct(Student.id)
+        .join(Enrollment, Enrollment.student_id == Student.id)
+        .join(Classroom, Classroom.id == Enrollment.classroom_id)
+        .where(
+            Enrollment.academic_year_id == source.id,
+            Classroom.academic_year_id == source.id,
+            Classroom.classroom_type == "HOMEROOM",
+            Enrollment.is_active == True,
+            Student.is_active == True,
+            Enrollment.grade_level.in_(GRADE_PROGRESSION),
+            next_grade != "GRADUATED",
+            ~exists()
+            .where(
+                already_placed.academic_year_id == target.id,
+                already_placed.student_id == Student.id,
+                already_placed.is_active == True,
+            )
+            .where(placed_class.id == already_placed.classroom_id)
+            .where(placed_class.academic_year_id == target.id, placed_class.classroom_type == "HOMEROOM"),
+        )
+        .order_by(Student.id, Enrollment.enrollment_date.desc().nulls_last())
+        .subquery("movers")
+    )
+    ranked = (
+        select(
+            movers.c.student_id, movers.c.school_id, movers.c.next_grade,
+            (func.row_number().over(
+                partition_by=(movers.c.school_id, movers.c.next_grade),
+                order_by=(Student.last_name, Student.first_name, Student.id),
+            ) - 1).label("position"),
+        )
+        .join(Student, Student.id == movers.c.student_id)
+        .cte("ranked")
+    )
+
+    placements = (
+        select(
+            func.gen_random_uuid(), ranked.c.student_id, homerooms.c.classroom_id, literal(target.id),
+            ranked.c.next_grade, literal(target.start_date), literal("ACTIVE"), literal(True),
+            literal(False), literal(False), literal(enrolled_by, Enrollment.enrolled_by.type),
+        )
+        .join(homerooms, and_(
+            homerooms.c.school_id == ranked.c.school_id,
+            homerooms.c.grade_level == ranked.c.next_grade,
+            homerooms.c.slot == ranked.c.position % homerooms.c.slots,
+        ))
+    )
+    result = await session.execute(
+        pg_insert(Enrollment).from_select(
+            ["id", "student_id", "classroom_id", "academic_year_id", "grade_level", "enrollment_date",
+             "enrollment_status", "is_active", "is_audit_only", "requires_accommodation", "enrolled_by"],
+            placements,
+        )
+        .returning(Enrollment.student_id, Enrollment.classroom_id)
+    )
+    inserted = result.all()
+    placed = [row.student_id for row in inserted]
+    # Core insert: parent summaries listing these children and target homeroom rosters
+    # cached before this run would not see the new enrollments otherwise
+    mark_students_changed(session, placed)
+    roster_cache.mark_classrooms_changed(session, {row.classroom_id for row in inserted})
+    # Placed students now fail the NOT EXISTS check, so whoever is still ranked found no homeroom
+    unplaced = (await session.execute(select(func.count()).select_from(ranked))).scalar_one()
+    return {"enrollments_created": len(placed), "students_unplaced": unplaced}
+
+
+async def rollover_year(
+    job: Job,
+    session: AsyncSession,
+    source_year_id: UUID,
+    target_year_id: UUID,
+    include_rooms: bool = True,
+    include_teachers: bool = True,
+    pre_enroll_homerooms: bool = False,
+    dry_run: bool = False,
+) -> Dict[str, Any]:
+    """Job body: clone the source year's classes into the target year (see module docstring)"""
+    source = await session.get(AcademicYear, source_year_id)
+    target = await session.get(AcademicYear, target_year_id)
+    if source is None or target is None:
+        raise ValueError("Academic year not found")
+
+    # Two rollovers into one year would race on the NOT EXISTS checks
+    locked = (await session.execute(
+        select(func.pg_try_advisory_xact_lock(func.hashtext(f"year_rollover:{target.id}")))
+    )).scalar()
+    if not locked:
+        job.report(0, 0, f"A rollover into {target.name} is already running")
+        return {"skipped": "locked"}
+
+    source_name, target_name = source.name, target.name
+    # New rows must land in the target year's partitions, not the default one
+    await ensure_year_partitions(session, target)
+    steps = 1 + int(include_teachers) + int(pre_enroll_homerooms)
+    job.report(0, steps, f"Cloning classes from {source_name} into {target_name}")
+    result: Dict[str, Any] = {"dry_run": dry_run, "source": source_name, "target": target_name}
+    result["classrooms_created"] = await _clone_classrooms(session, source, target, include_rooms)
+    done = 1
+    if include_teachers:
+        job.report(done, message="Copying teacher assignments")
+        result["teacher_assignments_created"] = await _clone_teacher_assignments(session, source, target)
+        done += 1
+    if pre_enroll_homerooms:
+        job.report(done, message="Pre-enrolling students into next-grade homerooms")
+        result.update(await _pre_enroll_homerooms(session, source, target, job.created_by))
+        done += 1
+
+    if dry_run:
+        await session.rollback()
+        job.report(done, message="Dry run - nothing was saved")
+    else:
+        await session.commit()
+        job.report(done, message=f"Rolled {source_name} over into {target_name}")
+    return result
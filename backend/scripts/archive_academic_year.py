@@ -0,0 +1,64 @@
+# backend/scripts/archive_academic_year.py
+
+"""
+Detach a closed academic year's enrollment and attendance partitions into the
+``archive`` schema (or attach them back), and list partitions.
+
+Archived years drop out of the live tables: rosters, attendance and
+enrollment queries no longer see them, and the tables can be dumped
+(``pg_dump -n archive``) and dropped. Run in a maintenance window - the
+parent tables are locked while partitions are detached.
+
+    python scripts/archive_academic_year.py --list
+    python scripts/archive_academic_year.py --year 2023-2024
+    python scripts/archive_academic_year.py --year 2023-2024 --restore
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import select
+
+from app.db import get_sessionmaker
+from app.models.academic_year import AcademicYear
+from app.services import year_partitions
+
+
+async def main(year_name, restore, list_only):
+    async with get_sessionmaker()() as session:
+        if list_only:
+            for row in await year_partitions.list_partitions(session):
+                state = "archived" if row["archived"] else "attached"
+                print(f"{row['academic_year'] or '?':<10} {row['table']:<17} {state:<9} ~{row['estimated_rows']} rows  {row['partition']}")
+            return 0
+
+        year = (await session.execute(select(AcademicYear).where(AcademicYear.name == year_name))).scalar_one_or_none()
+        if year is None:
+            print(f"❌ No academic year named {year_name}")
+            return 1
+        try:
+            if restore:
+                tables = await year_partitions.restore_year(session, year)
+            else:
+                tables = await year_partitions.archive_year(session, year)
+        except year_partitions.PartitionError as e:
+            print(f"❌ {e}")
+            return 1
+        await session.commit()
+    print(f"✅ {'Restored' if restore else 'Archived'} {year_name}: {', '.join(tables)}")
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--year", help="Academic year name, e.g. 2023-2024")
+    parser.add_argument("--restore", action="store_true", help="Attach an archived year back")
+    parser.add_argument("--list", action="store_true", help="List partitions and exit")
+    args = parser.parse_args()
+    if not args.list and not args.year:
+        parser.error("--year is required unless --list is given")
+    sys.exit(asyncio.run(main(args.year, args.restore, args.list)))
@@ -0,0 +1,183 @@
+# backend/scripts/benchmark_gradebook.py
+
+"""
+Benchmark the vectorized gradebook engine on a synthetic class and check it
+against a straightforward per-student reference implementation, then replay
+random single-cell edits through the incremental path and check it lands on
+the same averages as a full recompute.
+
+No database is needed. Default size is the spec's large class: 40 students x
+200 assignments across 6 categories, with drop-lowest, extra credit, weight
+overrides and a mix of missing / late / excused cells.
+
+    python scripts/benchmark_gradebook.py
+    python scripts/benchmark_gradebook.py --students 40 --assignments 200 --runs 200 --edits 2000
+"""
+
+import argparse
+import json
+import math
+import os
+import sys
+import time
+import uuid
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from app.services import gradebook_engine as engine
+from app.services.gradebook_incremental import category_key, states_from_result, StudentGradeState
+
+
+def synthetic_matrix(students: int, assignments: int, categories: int, seed: int) -> engine.GradebookMatrix:
+    rng = np.random.default_rng(seed)
+    category_rows = [
+        {"id": uuid.UUID(int=c + 1), "weight": float(rng.integers(5, 40)), "drop_lowest": int(rng.integers(0, 3))}
+        for c in range(categories)
+    ]
+    assignment_rows = []
+    for a in range(assignments):
+        assignment_rows.append({
+            "id": uuid.UUID(int=1000 + a),
+            # A few uncategorized assignments exercise the fallback bucket
+            "category_id": category_rows[a % categories]["id"] if a % 37 else None,
+            "points_possible": float(rng.choice([5, 10, 20, 25, 50, 100])),
+            "weight_override": float(rng.integers(1, 5)) if rng.random() < 0.1 else None,
+            "is_extra_credit": bool(rng.random() < 0.05),
+            "allow_late": bool(rng.random() < 0.9),
+            "late_penalty": float(rng.integers(0, 30)) if rng.random() < 0.2 else None,
+        })
+
+    student_ids = [uuid.UUID(int=100000 + s) for s in range(students)]
+    statuses = list(engine.STATUS_CODES)
+    grades = []
+    for sid in student_ids:
+        for a in assignment_rows:
+            roll = rng.random()
+            if roll < 0.05:
+                continue  # never entered
+            status = rng.choice(statuses, p=[0.8, 0.06, 0.07, 0.04, 0.03])
+            points = None if status in ("MISSING", "EXCUSED") else round(float(rng.uniform(0, 1.1)) * a["points_possible"], 2)
+            grades.append((sid, a["id"], points, str(status)))
+
+    return engine.build_matrix(
+        student_ids, assignment_rows, category_rows, grades,
+        late_policy_type=engine.LATE_PERCENT, late_penalty=10, missing_as_zero=True, decimals=2,
+    )
+
+
+def reference(m: engine.GradebookMatrix):
+    """Per-student loops over the same rules; used to check the vectorized result"""
+    overall = []
+    for i in range(len(m.student_ids)):
+        per_category = {}
+        for j in range(len(m.assignment_ids)):
+            code = m.status[i, j]
+            points = m.earned[i, j]
+            if code == engine.LATE and not math.isnan(points):
+                if not m.allow_late[j]:
+                    points = 0.0
+                elif m.late_policy_type == engine.LATE_POINTS:
+                    points = max(points - m.late_penalty[j], 0.0)
+                else:
+                    points = max(points * (1 - m.late_penalty[j] / 100), 0.0)
+            elif code == engine.MISSING and m.missing_as_zero:
+                points = 0.0
+            elif code != engine.GRADED:
+                continue
+            if math.isnan(points) or m.points_possible[j] <= 0:
+                continue
+            weight = m.points_possible[j] if math.isnan(m.weight_override[j]) else m.weight_override[j]
+            per_category.setdefault(m.category_index[j], []).append(
+                (points / m.points_possible[j], weight, bool(m.extra_credit[j]))
+            )
+
+        total = weight_sum = 0.0
+        for c, scores in per_category.items():
+            regular = sorted((s for s in scores if not s[2]), key=lambda s: (s[0], -s[1]))
+            drop = min(int(m.drop_lowest[c]), max(len(regular) - 1, 0))
+            kept = regular[drop:] + [s for s in scores if s[2]]
+            denominator = sum(w for _, w, ec in kept if not ec)
+            if denominator <= 0:
+                continue
+            average = sum(p * w for p, w, _ in kept) / denominator
+            total += average * m.category_weights[c]
+            weight_sum += m.category_weights[c]
+        overall.append(total / weight_sum * 100 if weight_sum > 0 else math.nan)
+    return np.array(overall)
+
+
+def main(args):
+    m = synthetic_matrix(args.students, args.assignments, args.categories, args.seed)
+    print(f"📚 {args.students} students x {args.assignments} assignments, {len(m.category_ids)} categories")
+
+    result = engine.compute(m)
+    expected = engine.round_half_up(reference(m), m.decimals)
+    if not np.allclose(result.overall, expected, equal_nan=True, atol=10 ** -m.decimals):
+        worst = np.nanmax(np.abs(result.overall - expected))
+        print(f"❌ Vectorized averages differ from the reference (max diff {worst})")
+        sys.exit(1)
+    print("✅ Matches reference implementation")
+
+    engine.compute(m)  # warm-up
+    timings = []
+    for _ in range(args.runs):
+        started = time.perf_counter()
+        engine.compute(m)
+        timings.append((time.perf_counter() - started) * 1000)
+    timings.sort()
+    p95 = timings[int(len(timings) * 0.95) - 1]
+    print(f"⏱️  compute: median {timings[len(timings) // 2]:.3f} ms, p95 {p95:.3f} ms over {args.runs} runs")
+
+    started = time.perf_counter()
+    reference(m)
+    print(f"🐢 reference loop: {(time.perf_counter() - started) * 1000:.1f} ms")
+
+    incremental(m, args.edits, args.seed)
+
+
+def incremental(m: engine.GradebookMatrix, edits: int, seed: int):
+    rng = np.random.default_rng(seed + 1)
+    states = states_from_result(m, engine.compute(m))
+    weights = engine.assignment_weights(m)
+    codes = {code: name for name, code in engine.STATUS_CODES.items()}
+    keys = [category_key(cid) for cid in m.category_ids]
+
+    elapsed = 0.0
+    for _ in range(edits):
+        i = int(rng.integers(len(m.student_ids)))
+        j = int(rng.integers(len(m.assignment_ids)))
+        code = int(rng.choice(list(codes), p=[0.75, 0.08, 0.08, 0.05, 0.04]))
+        points = None if code in (engine.MISSING, engine.EXCUSED) else round(float(rng.uniform(0, 1.1)) * m.points_possible[j], 2)
+        m.earned[i, j] = np.nan if points is None else points
+        m.status[i, j] = code
+
+        started = time.perf_counter()
+        fraction = engine.cell_fraction(
+            points, codes[code], float(m.points_possible[j]), bool(m.allow_late[j]),
+            float(m.late_penalty[j]), m.late_policy_type, m.missing_as_zero,
+        )
+        states[i].set_score(keys[m.category_index[j]], str(m.assignment_ids[j]), fraction, float(weights[j]), bool(m.extra_credit[j]))
+        elapsed += time.perf_counter() - started
+
+    # Stored state must survive a JSON round trip (it lives in a JSONB column)
+    states = [StudentGradeState.from_json(json.loads(json.dumps(state.to_json()))) for state in states]
+    expected = engine.compute(m).overall
+    actual = np.array([np.nan if s["overall"] is None else s["overall"] for s in (state.summary() for state in states)])
+    if not np.allclose(actual, expected, equal_nan=True, atol=10 ** -m.decimals):
+        worst = np.nanmax(np.abs(actual - expected))
+        print(f"❌ Incremental averages drifted from a full recompute after {edits} edits (max diff {worst})")
+        sys.exit(1)
+    print(f"✅ {edits} incremental edits match a full recompute; {elapsed / max(edits, 1) * 1e6:.1f} µs per edit")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--students", type=int, default=40)
+    parser.add_argument("--assignments", type=int, default=200)
+    parser.add_argument("--categories", type=int, default=6)
+    parser.add_argument("--runs", type=int, default=100)
+    parser.add_argument("--edits", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=7)
+    main(parser.parse_args())
@@ -0,0 +1,39 @@
+# backend/scripts/rebuild_attendance_stats.py
+
+"""
+Rebuild attendance streaks and rolling absence rates from attendance history.
+
+Stats are normally maintained incrementally as marks are written; run this
+after backfilling/importing marks or after changing alert thresholds.
+
+    python scripts/rebuild_attendance_stats.py                  # every classroom
+    python scripts/rebuild_attendance_stats.py --classroom-id <uuid> [...]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+import uuid
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.db import get_sessionmaker
+from app.services.attendance_stats import rebuild
+
+
+async def main(classroom_ids):
+    started = time.perf_counter()
+    async with get_sessionmaker()() as session:
+        written = await rebuild(session, classroom_ids or None)
+        await session.commit()
+    scope = f"{len(classroom_ids)} classroom(s)" if classroom_ids else "all classrooms"
+    print(f"✅ Rebuilt {written} student attendance stats rows for {scope} in {time.perf_counter() - started:.1f}s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--classroom-id", action="append", type=uuid.UUID, default=[], help="Limit to this classroom (repeatable)")
+    args = parser.parse_args()
+    asyncio.run(main(args.classroom_id))
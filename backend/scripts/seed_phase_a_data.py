@@ -345,6 +345,8 @@ async def seed_data():
                     id=uuid.uuid4(),
                     student_id=student.id,
                     classroom_id=classroom.id,
+                    academic_year_id=classroom.academic_year_id,
+                    grade_level=student.current_grade_level,
                     enrollment_date=academic_year.start_date,
                     enrollment_status="ACTIVE",
                     enrolled_by=admin_user.id
@@ -360,6 +362,8 @@ async def seed_data():
                     id=uuid.uuid4(),
                     student_id=student.id,
                     classroom_id=classroom.id,
+                    academic_year_id=classroom.academic_year_id,
+                    grade_level=student.current_grade_level,
                     enrollment_date=academic_year.start_date,
                     enrollment_status="ACTIVE",
                     enrolled_by=admin_user.id
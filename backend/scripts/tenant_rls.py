@@ -0,0 +1,66 @@
+# backend/scripts/tenant_rls.py
+
+"""
+Turn Postgres row-level security on (or off) for the school-scoped tables.
+
+Migration ``tenant_scoping`` creates a ``tenant_school`` policy on each table
+that only lets a transaction see rows of the school in ``app.school_id``; a
+transaction without that setting sees every row, so migrations, scripts and
+background jobs are unaffected. Enable RLS here and set
+``TENANT_RLS_ENABLED=true`` for the API so scoped request sessions set
+``app.school_id``. ``FORCE`` makes the policies apply to the table owner too,
+which is usually the role the API connects as.
+
+    python scripts/tenant_rls.py --status
+    python scripts/tenant_rls.py --enable
+    python scripts/tenant_rls.py --disable
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text
+
+from app.db import get_sessionmaker
+from app.services.tenant import RLS_TABLES
+
+
+async def main(enable):
+    async with get_sessionmaker()() as session:
+        if enable is not None:
+            for table in RLS_TABLES:
+                if enable:
+                    await session.execute(text(f"ALTER TABLE {table} ENABLE ROW LEVEL SECURITY"))
+                    await session.execute(text(f"ALTER TABLE {table} FORCE ROW LEVEL SECURITY"))
+                else:
+                    await session.execute(text(f"ALTER TABLE {table} NO FORCE ROW LEVEL SECURITY"))
+                    await session.execute(text(f"ALTER TABLE {table} DISABLE ROW LEVEL SECURITY"))
+            await session.commit()
+        rows = (await session.execute(
+            text("""
+                SELECT c.relname, c.relrowsecurity, c.relforcerowsecurity,
+                       EXISTS (SELECT 1 FROM pg_policy p WHERE p.polrelid = c.oid AND p.polname = 'tenant_school')
+                FROM pg_class c
+                WHERE c.oid = ANY(CAST(:tables AS regclass[]))
+                ORDER BY c.relname
+            """),
+            {"tables": list(RLS_TABLES)},
+        )).all()
+    for table, enabled, forced, has_policy in rows:
+        state = "forced" if forced else "enabled" if enabled else "off"
+        print(f"{table:<12} RLS {state:<8} {'policy ok' if has_policy else '❌ no tenant_school policy'}")
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    group = parser.add_mutually_exclusive_group(required=True)
+    group.add_argument("--enable", action="store_const", const=True, dest="enable", help="Enable and force RLS")
+    group.add_argument("--disable", action="store_const", const=False, dest="enable", help="Disable RLS")
+    group.add_argument("--status", action="store_const", const=None, dest="enable", help="Show RLS state only")
+    args = parser.parse_args()
+    sys.exit(asyncio.run(main(args.enable)))
@@ -62,4 +62,23 @@ export const queryKeys = {
     details: () => [...queryKeys.enrollments.all, 'detail'] as const,
     detail: (id: string) => [...queryKeys.enrollments.details(), id] as const,
   },
-};
\ No newline at end of file
+
+  // Dashboards
+  dashboard: {
+    all: ['dashboard'] as const,
+    overview: (kind: string) => [...queryKeys.dashboard.all, kind] as const,
+  },
+
+  // Attendance
+  attendance: {
+    all: ['attendance'] as const,
+    sheet: (classroomId: string, date?: string) => [...queryKeys.attendance.all, 'sheet', classroomId, date] as const,
+    classroom: (classroomId: string) => [...queryKeys.attendance.all, 'sheet', classroomId] as const,
+  },
+
+  // Search
+  search: {
+    all: ['search'] as const,
+    results: (params: any) => [...queryKeys.search.all, params] as const,
+  },
+};
@@ -22,10 +22,23 @@ function buildRequest(init: ApiInit): RequestInit {
 
 const BASE = import.meta.env.VITE_API_BASE ?? 'http://localhost:8000';
 
+function randomHex(bytes: number): string {
+  const buf = new Uint8Array(bytes);
+  crypto.getRandomValues(buf);
+  return Array.from(buf, (b) => b.toString(16).padStart(2, '0')).join('');
+}
+
+// W3C trace context - lets the backend correlate its spans with this request.
+// Sampling is decided server-side, so the sampled flag is left unset.
+function newTraceparent(): string {
+  return `00-${randomHex(16)}-${randomHex(8)}-00`;
+}
+
 export async function apiFetch<T>(path: string, init?: ApiInit): Promise<T> {
   const token = localStorage.getItem('token');
   const headers = new Headers((init as RequestInit | undefined)?.headers);
   if (token) headers.set('Authorization', `Bearer ${token}`);
+  if (!headers.has('traceparent')) headers.set('traceparent', newTraceparent());
 
   const res = await fetch(`${BASE}${path}`, buildRequest({ ...init, headers }));
   if (res.status === 401) {
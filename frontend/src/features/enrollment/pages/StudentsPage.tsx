@@ -60,6 +60,7 @@ import {
 } from '@/features/enrollment/hooks/useStudents';
 import { useClassrooms } from '@/features/academics/hooks/useClassrooms';
 import { useYears } from '@/features/academics/hooks/useYears';
+import { useSearch } from '@/features/search/hooks/useSearch';
 import {
   StudentCreate,
   StudentUpdate,
@@ -70,6 +71,9 @@ import {
   Enrollment,
 } from '@/schemas/students';
 
+// Matches per /search request (the endpoint's maximum)
+const SEARCH_LIMIT = 50;
+
 export default function StudentsPage() {
   const { user, activeSchool } = useAuth();
   
@@ -79,6 +83,15 @@ export default function StudentsPage() {
   const [selectedStudent, setSelectedStudent] = useState<Student | null>(null);
   const [deleteConfirmOpen, setDeleteConfirmOpen] = useState(false);
   const [expandedRows, setExpandedRows] = useState<Set<string>>(new Set());
+  const [studentSearchInput, setStudentSearchInput] = useState('');
+  const [studentQuery, setStudentQuery] = useState('');
+  const [classroomQuery, setClassroomQuery] = useState('');
+
+  // Debounce the search box so each pause sends one request
+  useEffect(() => {
+    const timer = setTimeout(() => setStudentQuery(studentSearchInput), 300);
+    return () => clearTimeout(timer);
+  }, [studentSearchInput]);
 
   const schoolId = activeSchool?.id;
   
@@ -106,6 +119,36 @@ export default function StudentsPage() {
   // Filter classrooms by active academic year
   // TEMP: Show all classrooms for debugging
   const availableClassrooms = classrooms; // classrooms.filter(c => c.academic_year_id === activeYear?.id);
+
+  // Name/ID matching and ranking happen on the server (/search); the page only maps ids back to rows.
+  // /search returns at most SEARCH_LIMIT matches, so a full page of results is flagged as truncated
+  const studentSearch = useSearch({ q: studentQuery, types: ['students'], mode: 'prefix', school_id: schoolId, limit: SEARCH_LIMIT });
+  const classroomSearch = useSearch({ q: classroomQuery, types: ['classrooms'], mode: 'prefix', school_id: schoolId, limit: SEARCH_LIMIT });
+  const studentSearchActive = studentQuery.trim().length > 0;
+  const classroomSearchActive = classroomQuery.trim().length > 0;
+  // keepPreviousData would show the last query's matches until this one answers
+  const studentResults = studentSearch.isPlaceholderData ? undefined : studentSearch.data?.results;
+  const classroomResults = classroomSearch.isPlaceholderData ? undefined : classroomSearch.data?.results;
+  const studentsTruncated = studentSearchActive && (studentResults?.length ?? 0) >= SEARCH_LIMIT;
+  const classroomsTruncated = classroomSearchActive && (classroomResults?.length ?? 0) >= SEARCH_LIMIT;
+
+  const visibleStudents = useMemo(() => {
+    if (!studentSearchActive) return students;
+    if (!studentResults) return [];
+    const byId = new Map(students.map((s) => [s.id, s]));
+    return studentResults
+      .map((r) => byId.get(r.id))
+      .filter((s): s is Student => !!s);
+  }, [students, studentSearchActive, studentResults]);
+
+  const pickerClassrooms = useMemo(() => {
+    if (!classroomSearchActive) return availableClassrooms;
+    if (!classroomResults) return [];
+    const byId = new Map(availableClassrooms.map((c) => [c.id, c]));
+    return classroomResults
+      .map((r) => byId.get(r.id))
+      .filter((c): c is (typeof availableClassrooms)[number] => !!c);
+  }, [availableClassrooms, classroomSearchActive, classroomResults]);
   
   // Debug: Log academic years data
   console.log('Academic Years:', academicYears);
@@ -432,6 +475,14 @@ export default function StudentsPage() {
       <Paper sx={{ p: 2, mb: 2 }}>
         <Stack direction="row" justifyContent="space-between" alignItems="center">
           <Typography variant="h5">Students</Typography>
+          <TextField
+            size="small"
+            label="Search students"
+            placeholder="Name or student ID"
+            value={studentSearchInput}
+            onChange={(e) => setStudentSearchInput(e.target.value)}
+            sx={{ ml: 'auto', mr: 2, minWidth: 280 }}
+          />
           <Button
             variant="contained"
             startIcon={<AddIcon />}
@@ -445,11 +496,17 @@ export default function StudentsPage() {
         </Stack>
       </Paper>
 
+      {studentsTruncated && (
+        <Alert severity="info" sx={{ mb: 2 }}>
+          Showing the first {SEARCH_LIMIT} matches. Type more of the name or student ID to narrow the search.
+        </Alert>
+      )}
+
       <Paper sx={{ height: 600 }}>
         <DataGrid
-          rows={students}
+          rows={visibleStudents}
           columns={columns}
-          loading={isLoading}
+          loading={isLoading || studentSearch.isFetching}
           pageSizeOptions={[10, 25, 50]}
           initialState={{
             pagination: { paginationModel: { pageSize: 10 } },
@@ -459,8 +516,7 @@ export default function StudentsPage() {
           }}
           slotProps={{
             toolbar: {
-              showQuickFilter: true,
-              quickFilterProps: { debounceMs: 500 },
+              showQuickFilter: false,
             },
           }}
           getRowHeight={() => 'auto'}
@@ -758,6 +814,19 @@ export default function StudentsPage() {
                   <SchoolIcon color="primary" />
                   Select Classroom
                 </Typography>
+                <TextField
+                  size="small"
+                  label="Search classrooms"
+                  value={classroomQuery}
+                  onChange={(e) => setClassroomQuery(e.target.value)}
+                  helperText={
+                    classroomsTruncated
+                      ? `Showing the first ${SEARCH_LIMIT} matches. Type more to narrow the list.`
+                      : undefined
+                  }
+                  fullWidth
+                  sx={{ mb: 2 }}
+                />
                 <Controller
                   name="classroom_id"
                   control={enrollForm.control}
@@ -773,7 +842,7 @@ export default function StudentsPage() {
                             </Typography>
                           </MenuItem>
                         )}
-                        {availableClassrooms.map((classroom) => (
+                        {pickerClassrooms.map((classroom) => (
                           <MenuItem key={classroom.id} value={classroom.id}>
                             <Stack direction="column" spacing={0}>
                               <Typography variant="body1" fontWeight="medium">
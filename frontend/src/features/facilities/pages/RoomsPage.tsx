@@ -37,42 +37,58 @@ import { Room, RoomCreate, RoomUpdate, RoomTypes } from '@/schemas/facilities';
 import { useAuth } from '@/auth/AuthContext';
 import { apiFetch } from '@/api/requestHelper';
 
-// Type for room usage data
-interface RoomUsageInfo {
-  room: {
-    id: string;
-    name: string;
-    code: string;
-    type: string;
-    capacity: number;
-  };
-  is_available: boolean;
+// School-wide utilization report (one request for every room on the page)
+interface RoomUtilizationInfo {
+  room_id: string;
+  name: string;
+  code: string;
+  type: string;
+  capacity: number | null;
   assigned_classrooms: Array<{
     id: string;
     name: string;
     grade_level: string | null;
     subject: string | null;
+    enrolled: number;
+    max_students: number | null;
   }>;
-  usage_count: number;
+  peak_enrollment: number;
+  utilization: number;
+  over_capacity: boolean;
+  warnings: string[];
+}
+
+interface RoomUtilizationReport {
+  school_id: string;
+  academic_year_id: string | null;
+  summary: {
+    rooms: number;
+    rooms_in_use: number;
+    rooms_over_capacity: number;
+    average_utilization: number;
+  };
+  rooms: RoomUtilizationInfo[];
 }
 
-// Hook to fetch usage for a specific room
-function useRoomUsage(roomId: string) {
+// Hook to fetch utilization for all rooms at a school
+function useRoomUtilization(schoolId?: string) {
   return useQuery({
-    queryKey: ['room-usage', roomId],
+    queryKey: ['room-utilization', schoolId],
     queryFn: async () => {
-      const data = await apiFetch<RoomUsageInfo>(`/rooms/${roomId}/usage`);
+      const data = await apiFetch<RoomUtilizationReport>(`/rooms/utilization?school_id=${schoolId}`);
       return data;
     },
-    enabled: !!roomId,
+    enabled: !!schoolId,
     staleTime: 30_000, // 30 seconds
   });
 }
 
 // Usage Cell Component
-function UsageCell({ roomId }: { roomId: string }) {
-  const { data: usage, isLoading, error } = useRoomUsage(roomId);
-
+function UsageCell({ usage, isLoading, error }: {
+  usage?: RoomUtilizationInfo;
+  isLoading: boolean;
+  error: unknown;
+}) {
   if (isLoading) {
     return (
       <Box display="flex" alignItems="center" gap={1}>
@@ -93,20 +109,9 @@ function UsageCell({ roomId }: { roomId: string }) {
     );
   }
 
-  if (!usage || usage.is_available) {
-    return (
-      <Chip 
-        label="Available" 
-        color="success" 
-        size="small" 
-        variant="outlined"
-      />
-    );
-  }
-
   // Show first classroom assignment (most common case)
-  const firstClassroom = usage.assigned_classrooms[0];
-  if (!firstClassroom) {
+  const firstClassroom = usage?.assigned_classrooms[0];
+  if (!usage || !firstClassroom) {
     return (
       <Chip 
         label="Available" 
@@ -122,18 +127,21 @@ function UsageCell({ roomId }: { roomId: string }) {
     : firstClassroom.name;
 
   const hasMultiple = usage.assigned_classrooms.length > 1;
+  const seats = usage.capacity ? ` - ${usage.peak_enrollment}/${usage.capacity} seats` : '';
 
   return (
     <Tooltip 
       title={
-        hasMultiple 
-          ? `${usage.assigned_classrooms.length} classrooms assigned`
-          : `Subject: ${firstClassroom.subject || 'N/A'}`
+        usage.over_capacity
+          ? usage.warnings.join('; ')
+          : hasMultiple 
+            ? `${usage.assigned_classrooms.length} classrooms assigned${seats}`
+            : `Subject: ${firstClassroom.subject || 'N/A'}${seats}`
       }
     >
       <Chip 
         label={hasMultiple ? `${displayText} +${usage.assigned_classrooms.length - 1}` : displayText}
-        color="primary" 
+        color={usage.over_capacity ? 'warning' : 'primary'}
         size="small" 
         variant="filled"
       />
@@ -183,6 +191,12 @@ export default function RoomsPage() {
 
   const rooms = list.data || [];
 
+  const utilization = useRoomUtilization(user?.school_id);
+  const usageByRoom = React.useMemo(
+    () => new Map((utilization.data?.rooms || []).map(room => [room.room_id, room])),
+    [utilization.data]
+  );
+
   const handleCreateRoom = () => {
     setSelectedRoom(null);
     setFormOpen(true);
@@ -282,7 +296,11 @@ export default function RoomsPage() {
       width: 200,
       sortable: false,
       renderCell: (params: GridRenderCellParams) => (
-        <UsageCell roomId={params.row.id} />
+        <UsageCell
+          usage={usageByRoom.get(params.row.id)}
+          isLoading={utilization.isLoading}
+          error={utilization.error}
+        />
       )
     },
     {
@@ -0,0 +1,16 @@
+// src/features/search/hooks/useSearch.ts
+import { useQuery, keepPreviousData } from '@tanstack/react-query';
+import { search, type SearchParams } from '../services/search';
+import { queryKeys } from '@/api/queryKeys';
+
+// Hook for search boxes - use mode 'prefix' while typing, 'search' on submit
+export function useSearch(params: SearchParams) {
+  const q = params.q.trim();
+  return useQuery({
+    queryKey: queryKeys.search.results({ ...params, q }),
+    queryFn: () => search({ ...params, q }),
+    enabled: q.length > 0,
+    placeholderData: keepPreviousData,
+    staleTime: 30 * 1000,
+  });
+}
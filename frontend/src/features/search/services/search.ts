@@ -0,0 +1,40 @@
+// src/features/search/services/search.ts
+import { apiFetch } from "@/api/requestHelper";
+import { z } from "zod";
+
+export const SearchResultSchema = z.object({
+  type: z.enum(["student", "staff", "classroom"]),
+  id: z.string().uuid(),
+  label: z.string(),
+  sublabel: z.string().nullable().optional(),
+  score: z.number(),
+});
+
+export const SearchResponseSchema = z.object({
+  query: z.string(),
+  mode: z.enum(["search", "prefix"]),
+  results: z.array(SearchResultSchema),
+});
+
+export type SearchResult = z.infer<typeof SearchResultSchema>;
+export type SearchResponse = z.infer<typeof SearchResponseSchema>;
+
+export type SearchParams = {
+  q: string;
+  types?: Array<"students" | "staff" | "classrooms">;
+  mode?: "search" | "prefix";
+  school_id?: string;
+  limit?: number;
+};
+
+// Server-side ranked search (replaces downloading full lists to filter them)
+export async function search(params: SearchParams): Promise<SearchResponse> {
+  const searchParams = new URLSearchParams({ q: params.q });
+  if (params.types?.length) searchParams.append("types", params.types.join(","));
+  if (params.mode) searchParams.append("mode", params.mode);
+  if (params.school_id) searchParams.append("school_id", params.school_id);
+  if (params.limit) searchParams.append("limit", params.limit.toString());
+
+  const data = await apiFetch<unknown>(`/search?${searchParams.toString()}`);
+  return SearchResponseSchema.parse(data);
+}
@@ -0,0 +1,62 @@
+// src/features/shared/useLiveUpdates.ts
+import { useEffect } from 'react';
+import { useQueryClient, type QueryKey } from '@tanstack/react-query';
+import { env } from '@/config/env';
+import { queryKeys } from '@/api/queryKeys';
+
+// Payloads from GET /events/stream - ids only; data is refetched through the normal endpoints
+type LiveEvent = {
+  topic: string | null;
+  at: string;
+  classroom_id?: string;
+  student_id?: string;
+  user_id?: string;
+  school_id?: string;
+};
+
+// Which React Query keys each server event makes stale
+const invalidations: Record<string, (e: LiveEvent) => QueryKey[]> = {
+  'enrollment.changed': (e) => [
+    ...(e.classroom_id ? [queryKeys.classrooms.roster(e.classroom_id)] : []),
+    ...(e.student_id ? [queryKeys.students.enrollments(e.student_id)] : []),
+    queryKeys.enrollments.all,
+    queryKeys.dashboard.all,
+  ],
+  'attendance.submitted': (e) => [
+    ...(e.classroom_id ? [queryKeys.attendance.classroom(e.classroom_id)] : []),
+    queryKeys.dashboard.all,
+  ],
+  'roles.changed': () => [queryKeys.auth.context, queryKeys.dashboard.all],
+  'assignments.changed': () => [queryKeys.classrooms.all, queryKeys.dashboard.all],
+};
+
+/**
+ * Keeps cached queries fresh from the server's change stream instead of polling.
+ * On (re)connect and on "resync" everything is invalidated, since events sent
+ * while disconnected are not replayed.
+ */
+export function useLiveUpdates(token: string | null) {
+  const qc = useQueryClient();
+
+  useEffect(() => {
+    if (!token || typeof EventSource === 'undefined') return;
+
+    const source = new EventSource(`${env.apiBase}/events/stream?access_token=${encodeURIComponent(token)}`);
+    let connectedBefore = false;
+
+    source.addEventListener('ready', () => {
+      if (connectedBefore) qc.invalidateQueries();
+      connectedBefore = true;
+    });
+    source.addEventListener('resync', () => qc.invalidateQueries());
+
+    Object.entries(invalidations).forEach(([type, keysFor]) => {
+      source.addEventListener(type, (msg) => {
+        const event = JSON.parse((msg as MessageEvent).data) as LiveEvent;
+        keysFor(event).forEach((queryKey) => qc.invalidateQueries({ queryKey }));
+      });
+    });
+
+    return () => source.close();
+  }, [token, qc]);
+}
@@ -2,9 +2,11 @@ import * as React from 'react';
 import { AppBar, Box, Button, Toolbar, Typography } from '@mui/material';
 import { Link, Outlet } from '@tanstack/react-router';
 import { useAuth } from '@/auth/AuthContext';
+import { useLiveUpdates } from '@/features/shared/useLiveUpdates';
 
 export function AppShell() {
-  const { logout } = useAuth();
+  const { logout, token } = useAuth();
+  useLiveUpdates(token);
 
   return (
     <Box sx={{ minHeight: '100vh' }}>